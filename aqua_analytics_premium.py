@@ -21,6 +21,8 @@ sys.path.insert(0, str(project_root / "src" / "components"))
 sys.path.insert(0, str(project_root / "src" / "core"))
 sys.path.insert(0, str(project_root / "src" / "utils"))
 
+from src.utils.upload_session import UploadSession
+
 st.set_page_config(
     page_title="Aqua-Analytics | 환경 데이터 인사이트 플랫폼",
     page_icon="💧",
@@ -480,7 +482,8 @@ class AquaAnalyticsPremium:
             'reports': self.base_folder / "reports",
             'dashboard_reports': self.base_folder / "reports" / "dashboard",
             'integrated_reports': self.base_folder / "reports" / "integrated",
-            'database': self.base_folder / "database"
+            'database': self.base_folder / "database",
+            'cache': self.base_folder / "cache"
         }
         
         # 모든 폴더 생성
@@ -518,17 +521,29 @@ class AquaAnalyticsPremium:
             from dynamic_dashboard_engine import DynamicDashboardEngine
             from report_generator import ReportGenerator
             from standards_manager import standards_manager
-            from database_manager import db_manager
-            
-            self.data_processor = DataProcessor()
+            from database_manager import open_configured_database
+            from parse_cache import ParseCache
+            from incremental_ingest import IncrementalIngestor
+            from src.utils.header_schema_cache import configure_header_schema_cache
+            
+            # 같은 양식(헤더)의 파일은 컬럼 매핑/검증 결과를 디스크 캐시에서 재사용
+            configure_header_schema_cache(self.get_folder_path('cache') / "header_schema.json")
+            
+            # 세션에 여러 파일 결과를 보관하므로 메모리 절약형 결과 객체 사용
+            # 같은 파일 재업로드 시 파싱 캐시(내용 해시 기반)에서 바로 반환
+            self.data_processor = DataProcessor(
+                compact_results=True,
+                parse_cache=ParseCache(self.get_folder_path('cache') / "parse")
+            )
             self.dashboard_engine = DynamicDashboardEngine(self.data_processor)
             self.report_generator = ReportGenerator()
             self.standards_manager = standards_manager
-            self.db_manager = db_manager
             
-            # 데이터베이스 경로를 새로운 구조로 설정
-            self.db_manager.db_path = self.get_folder_path('database') / "analysis_database.json"
-            self.db_manager.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # 저장 폴더의 데이터베이스 (DB_TYPE=sqlite면 기존 JSON 데이터베이스를 처음 한 번 이전)
+            self.db_manager = open_configured_database(self.get_folder_path('database'))
+            
+            # 누적 내보내기 재업로드 시 신규/변경 행만 반영
+            self.incremental_ingestor = IncrementalIngestor(self.data_processor, self.db_manager)
             
             # 통합 분석 엔진과 기간 컨트롤러는 직접 구현
             self.integrated_analysis_engine = self.create_integrated_analysis_engine()
@@ -555,7 +570,7 @@ class AquaAnalyticsPremium:
                     self.db_manager = db_manager
             
                 def analyze_period(self, start_date, end_date):
-                    return self.db_manager.get_integrated_analysis_data(start_date, end_date)
+                    return self.db_manager.get_integrated_analysis_data(start_date, end_date, include_files=False)
                 
                 def create_conforming_chart(self, conforming_items):
                     if not conforming_items:
@@ -1543,18 +1558,19 @@ class AquaAnalyticsPremium:
                 파일을 드래그하거나 클릭하여 업로드
             </h3>
             <p style="color: var(--gray-500); font-size: 0.875rem;">
-                Excel 파일(.xlsx, .xls)을 지원합니다 • 최대 50MB
+                Excel 파일(.xlsx, .xls)과 CSV 파일(.csv)을 지원합니다 • 최대 50MB
             </p>
         </div>
         """, unsafe_allow_html=True)
         
-        uploaded_file = st.file_uploader("파일 선택", type=['xlsx', 'xls'], label_visibility="collapsed")
+        uploaded_file = st.file_uploader("파일 선택", type=['xlsx', 'xls', 'csv'], label_visibility="collapsed")
         
         if uploaded_file:
             with st.spinner("파일을 처리하고 있습니다..."):
                 try:
-                    df = pd.read_excel(uploaded_file)
-                    test_results = self.data_processor.process_excel_data(df)
+                    # 업로드 바이트/워크북은 세션에서 한 번만 읽고 처리·저장 단계가 공유
+                    upload_session = UploadSession.from_uploaded_file(uploaded_file)
+                    test_results = self.data_processor.parse_upload(upload_session)
                     
                     from datetime import datetime
                     st.session_state.uploaded_files[uploaded_file.name] = {
@@ -1569,7 +1585,9 @@ class AquaAnalyticsPremium:
                     
                     # 데이터베이스에 영구 저장
                     client_name = st.text_input("의뢰 기관명 (선택사항)", placeholder="예: 한국환경공단, A환경연구소")
-                    file_id = self.db_manager.save_analysis_result(uploaded_file.name, test_results, client_name)
+                    file_id = self.db_manager.save_analysis_result(
+                        uploaded_file.name, test_results, client_name, upload_session=upload_session
+                    )
                     
                     st.success(f"✅ 파일 '{uploaded_file.name}' 처리 완료!")
                     st.info(f"📊 데이터가 영구 저장되었습니다 (ID: {file_id[:8]}...)")
@@ -1744,7 +1762,7 @@ class AquaAnalyticsPremium:
         with tab1:
             # 파일 업로드 영역
             st.markdown("### 📁 새 파일 분석")
-            uploaded_file = st.file_uploader("Excel 파일을 업로드하여 새로운 분석을 시작하세요", type=['xlsx', 'xls'])
+            uploaded_file = st.file_uploader("Excel/CSV 파일을 업로드하여 새로운 분석을 시작하세요", type=['xlsx', 'xls', 'csv'])
             
             if uploaded_file:
                 # 업로드 일자 설정
@@ -1768,22 +1786,27 @@ class AquaAnalyticsPremium:
                         key="client_input",
                         help="의뢰 기관명을 입력하세요"
                     )
+                    incremental = st.checkbox(
+                        "증분 반영 (누적 내보내기)",
+                        value=False,
+                        key="incremental_ingest_input",
+                        help="같은 접수번호의 기존 분석에 신규/변경 행만 병합합니다"
+                    )
                 
                 if st.button("📊 파일 분석 시작", type="primary", use_container_width=True):
                     with st.spinner("파일을 처리하고 있습니다..."):
                         try:
+                            # 업로드 바이트/워크북은 세션에서 한 번만 읽고 처리·저장 단계가 공유
+                            upload_session = UploadSession.from_uploaded_file(uploaded_file)
+                            
                             # 업로드된 파일을 uploads 폴더에 저장
                             uploads_folder = self.get_folder_path('uploads')
                             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                             saved_filename = f"{timestamp}_{uploaded_file.name}"
-                            saved_file_path = uploads_folder / saved_filename
-                            
-                            with open(saved_file_path, 'wb') as f:
-                                f.write(uploaded_file.getbuffer())
+                            upload_session.save_to(uploads_folder / saved_filename)
                             
                             # 파일 처리
-                            df = pd.read_excel(uploaded_file)
-                            test_results = self.data_processor.process_excel_data(df)
+                            test_results = self.data_processor.parse_upload(upload_session)
                             
                             # 업로드 시간 조합
                             upload_datetime = datetime.combine(upload_date, upload_time_input)
@@ -1808,8 +1831,7 @@ class AquaAnalyticsPremium:
                                 processed_path = processed_folder / processed_filename
                                 
                                 # 파일 저장
-                                with open(processed_path, 'wb') as f:
-                                    f.write(uploaded_file.getvalue())
+                                upload_session.save_to(processed_path)
                                 
                                 st.success(f"✅ 원본 파일이 processed 폴더에 저장되었습니다: {processed_filename}")
                                 
@@ -1818,12 +1840,23 @@ class AquaAnalyticsPremium:
                             
                             # 데이터베이스 반영
                             try:
-                                file_id = self.db_manager.save_analysis_result(
-                                    file_name=uploaded_file.name,
-                                    test_results=test_results,
-                                    client=client,
-                                    upload_time=upload_datetime
-                                )
+                                if incremental:
+                                    ingest_report = self.incremental_ingestor.ingest(
+                                        upload_session, client=client, upload_time=upload_datetime
+                                    )
+                                    file_id = ingest_report.file_id
+                                    st.info(
+                                        f"🔁 증분 반영: 신규 {ingest_report.inserted}건 · "
+                                        f"변경 {ingest_report.updated}건 · 동일 {ingest_report.unchanged}건"
+                                    )
+                                else:
+                                    file_id = self.db_manager.save_analysis_result(
+                                        file_name=uploaded_file.name,
+                                        test_results=test_results,
+                                        client=client,
+                                        upload_time=upload_datetime,
+                                        upload_session=upload_session
+                                    )
                                 
                                 # 세션 상태에 file_id 추가
                                 st.session_state.uploaded_files[uploaded_file.name]['file_id'] = file_id
@@ -1851,7 +1884,7 @@ class AquaAnalyticsPremium:
             
             # 데이터베이스에서 실제 데이터 로드 (세션 상태와 동기화)
             try:
-                db_files = self.db_manager.get_all_files()
+                db_files = self.db_manager.get_all_files(include_results=False)
                 
                 # 세션 상태 업데이트 (데이터베이스 기준)
                 if db_files:
@@ -1862,10 +1895,10 @@ class AquaAnalyticsPremium:
                             'filename': file_data.get('filename', ''),
                             'project_name': file_data.get('project_name', ''),
                             'upload_time': datetime.fromisoformat(file_data.get('upload_time', datetime.now().isoformat())),
-                            'total_tests': len(file_data.get('test_results', [])),
-                            'violations': len([r for r in file_data.get('test_results', []) if r.get('is_non_conforming', False)]),
+                            'total_tests': file_data.get('summary', {}).get('total_items', 0),
+                            'violations': file_data.get('summary', {}).get('fail_items', 0),
                             'violation_rate': 0,
-                            'test_results': file_data.get('test_results', []),
+                            'test_results': None,  # 보기 선택 시 행 로드
                             'file_id': file_data.get('file_id', '')
                         }
                         # 부적합률 계산
@@ -1925,8 +1958,11 @@ class AquaAnalyticsPremium:
                         with col4:
                             if st.button("📊 보기", key=f"view_report_{i}"):
                                 # 해당 보고서를 활성화하고 대시보드로 이동
+                                test_results = report['test_results']
+                                if test_results is None:
+                                    test_results = self.db_manager.get_file_rows(report['file_id'])
                                 st.session_state.uploaded_files[report['filename']] = {
-                                    'test_results': report['test_results'],
+                                    'test_results': test_results,
                                     'processed': True,
                                     'upload_time': report['upload_time']
                                 }
@@ -1960,17 +1996,17 @@ class AquaAnalyticsPremium:
                                                 if hasattr(st.session_state, 'report_history'):
                                                     # 데이터베이스에서 다시 로드
                                                     try:
-                                                        db_files = self.db_manager.get_all_files()
+                                                        db_files = self.db_manager.get_all_files(include_results=False)
                                                         st.session_state.report_history = []
                                                         for file_data in db_files:
                                                             report_item = {
                                                                 'filename': file_data.get('filename', ''),
                                                                 'project_name': file_data.get('project_name', ''),
                                                                 'upload_time': datetime.fromisoformat(file_data.get('upload_time', datetime.now().isoformat())),
-                                                                'total_tests': len(file_data.get('test_results', [])),
-                                                                'violations': len([r for r in file_data.get('test_results', []) if r.get('is_non_conforming', False)]),
+                                                                'total_tests': file_data.get('summary', {}).get('total_items', 0),
+                                                                'violations': file_data.get('summary', {}).get('fail_items', 0),
                                                                 'violation_rate': 0,
-                                                                'test_results': file_data.get('test_results', []),
+                                                                'test_results': None,  # 보기 선택 시 행 로드
                                                                 'file_id': file_data.get('file_id', '')
                                                             }
                                                             if report_item['total_tests'] > 0:
@@ -2066,7 +2102,7 @@ class AquaAnalyticsPremium:
     def sync_report_history_with_database(self):
         """보고서 이력을 데이터베이스와 동기화"""
         try:
-            db_files = self.db_manager.get_all_files()
+            db_files = self.db_manager.get_all_files(include_results=False)
             st.session_state.report_history = []
             
             for file_data in db_files:
@@ -2074,10 +2110,10 @@ class AquaAnalyticsPremium:
                     'filename': file_data.get('filename', ''),
                     'project_name': file_data.get('project_name', ''),
                     'upload_time': datetime.fromisoformat(file_data.get('upload_time', datetime.now().isoformat())),
-                    'total_tests': len(file_data.get('test_results', [])),
-                    'violations': len([r for r in file_data.get('test_results', []) if r.get('is_non_conforming', False)]),
+                    'total_tests': file_data.get('summary', {}).get('total_items', 0),
+                    'violations': file_data.get('summary', {}).get('fail_items', 0),
                     'violation_rate': 0,
-                    'test_results': file_data.get('test_results', []),
+                    'test_results': None,  # 보기 선택 시 행 로드
                     'file_id': file_data.get('file_id', '')
                 }
                 
@@ -2493,7 +2529,7 @@ class AquaAnalyticsPremium:
                 with chart_col2:
                     st.markdown("**🧪 실험별 오염수준 분포**")
                     contamination_fig = self.integrated_analysis_engine.create_contamination_level_chart(
-                        analysis_data.get('files', [])
+                        analysis_data.get('files', []), analysis_data.get('violation_rows')
                     )
                     st.plotly_chart(contamination_fig, use_container_width=True, key="contamination_levels")
                 
@@ -2502,7 +2538,9 @@ class AquaAnalyticsPremium:
                 if files_data:
                     try:
                         st.markdown("#### 📈 시험/시료별 추이")
-                        file_trend_fig = self.integrated_analysis_engine.create_file_trend_chart(files_data)
+                        file_trend_fig = self.integrated_analysis_engine.create_file_trend_chart(
+                            files_data, analysis_data.get('violation_rows')
+                        )
                         st.plotly_chart(file_trend_fig, use_container_width=True, key="file_trend")
                     except Exception as chart_error:
                         st.error(f"시험/시료별 추이 차트 생성 오류: {str(chart_error)}")
@@ -2750,14 +2788,16 @@ class AquaAnalyticsPremium:
                 
                 # 실험별 오염수준 분포 차트
                 contamination_fig = self.integrated_analysis_engine.create_contamination_level_chart(
-                    analysis_data.get('files', [])
+                    analysis_data.get('files', []), analysis_data.get('violation_rows')
                 )
                 
                 # 시험/시료별 추이 차트
                 files_data = analysis_data.get('files', [])
                 file_trend_fig = None
                 if files_data:
-                    file_trend_fig = self.integrated_analysis_engine.create_file_trend_chart(files_data)
+                    file_trend_fig = self.integrated_analysis_engine.create_file_trend_chart(
+                        files_data, analysis_data.get('violation_rows')
+                    )
                 
                 # 차트를 HTML로 변환
                 non_conforming_html = non_conforming_fig.to_html(include_plotlyjs='inline', div_id="non_conforming_chart")
@@ -3557,7 +3597,7 @@ class AquaAnalyticsPremium:
                 st.metric("총 폴더 수", f"{total_dirs}개")
             with col3:
                 # 데이터베이스 파일 수
-                db_files_count = len(self.db_manager.get_all_files())
+                db_files_count = len(self.db_manager.get_all_files(include_results=False))
                 st.metric("DB 저장 파일", f"{db_files_count}개")
         
         # 폴더별 바로가기 버튼
@@ -4086,9 +4126,9 @@ class AquaAnalyticsPremium:
                 # TestResult 객체 재구성
                 test_results = []
                 for result_data in file_record.get('test_results', []):
-                    # 딕셔너리에서 TestResult 객체로 변환
-                    from data_models import TestResult
-                    test_result = TestResult(
+                    # 딕셔너리에서 TestResult 객체로 변환 (메모리 절약형)
+                    from data_models import CompactTestResult
+                    test_result = CompactTestResult(
                         no=result_data.get('no', 0),
                         sample_name=result_data.get('sample_name', ''),
                         analysis_number=result_data.get('analysis_number', ''),
@@ -4157,13 +4197,13 @@ class AquaAnalyticsPremium:
             for file_record in all_files:
                 file_name = file_record['file_name']
                 
-                # TestResult 객체로 복원 (원본 클래스 사용)
-                from data_models import TestResult
+                # TestResult 객체로 복원 (필드/메서드가 동일한 메모리 절약형 클래스 사용)
+                from data_models import CompactTestResult
                 
                 test_results = []
                 for result_data in file_record['test_results']:
-                    # 원본 TestResult 클래스로 완전한 객체 생성
-                    test_result = TestResult(
+                    # 원본 TestResult와 동일한 필드로 완전한 객체 생성
+                    test_result = CompactTestResult(
                         no=result_data.get('no', 0),
                         sample_name=result_data.get('sample_name', ''),
                         analysis_number=result_data.get('analysis_number', ''),
@@ -10,7 +10,7 @@ Task 13.1: 환경 변수 설정 구현
 
 import os
 import json
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -30,7 +30,7 @@ class Environment(Enum):
 @dataclass
 class DatabaseConfig:
     """데이터베이스 설정"""
-    type: str = "sqlite"
+    type: str = "sqlite"            # sqlite | json | journal (JSON + 추가 전용 저널)
     path: str = "data/lab_dashboard.db"
     backup_enabled: bool = True
     connection_timeout: int = 30
@@ -95,8 +95,12 @@ class FileProcessingConfig:
     supported_formats: list = field(default_factory=lambda: ['xlsx', 'xls'])
     upload_path: str = "uploads/pending"
     processed_path: str = "data/processed"
+    failed_path: str = "uploads/failed"
     standards_path: str = "data/standards"
     auto_cleanup_enabled: bool = True
+    watch_interval: float = 5.0
+    watch_workers: int = 2
+    watch_queue_size: int = 32
 
 
 class AppConfig:
@@ -223,8 +227,12 @@ class AppConfig:
             supported_formats=os.getenv('SUPPORTED_FORMATS', 'xlsx,xls').split(','),
             upload_path=os.getenv('UPLOAD_PATH', 'uploads/pending'),
             processed_path=os.getenv('PROCESSED_PATH', 'data/processed'),
+            failed_path=os.getenv('FAILED_PATH', 'uploads/failed'),
             standards_path=os.getenv('STANDARDS_PATH', 'data/standards'),
-            auto_cleanup_enabled=self._get_bool_env('AUTO_CLEANUP_ENABLED', True)
+            auto_cleanup_enabled=self._get_bool_env('AUTO_CLEANUP_ENABLED', True),
+            watch_interval=float(os.getenv('WATCH_INTERVAL', '5.0')),
+            watch_workers=int(os.getenv('WATCH_WORKERS', '2')),
+            watch_queue_size=int(os.getenv('WATCH_QUEUE_SIZE', '32'))
         )
     
     def _get_bool_env(self, key: str, default: bool = False) -> bool:
@@ -240,6 +248,7 @@ class AppConfig:
         required_dirs = [
             self.file_processing.upload_path,
             self.file_processing.processed_path,
+            self.file_processing.failed_path,
             self.file_processing.standards_path,
             Path(self.logging.file_path).parent
         ]
@@ -10,7 +10,7 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 from collections import Counter
 import logging
 from dataclasses import dataclass
-from src.core.data_models import TestResult
+from src.core.data_models import TestResult, TestResultBatch
 from src.utils.performance_optimizer import optimize_performance, cache_result
 
 # 로깅 설정
@@ -91,12 +91,13 @@ class OptimizedChartRenderer:
         }
     
     @optimize_performance("optimize_data_for_chart")
-    def _optimize_data_for_chart(self, data: List[TestResult], chart_type: str) -> Tuple[List, List]:
+    def _optimize_data_for_chart(self, data: Union[List[TestResult], TestResultBatch],
+                                 chart_type: str) -> Tuple[List, List]:
         """
         차트용 데이터 최적화
         
         Args:
-            data: 원본 데이터
+            data: 원본 데이터 (리스트 또는 TestResultBatch)
             chart_type: 차트 타입
             
         Returns:
@@ -105,18 +106,28 @@ class OptimizedChartRenderer:
         if not data:
             return [], []
         
-        # 부적합 항목만 필터링
-        non_conforming_items = [
-            result for result in data 
-            if result.is_non_conforming()
-        ]
-        
-        if not non_conforming_items:
-            return [], []
+        if isinstance(data, TestResultBatch):
+            # 컬럼형 배치는 부적합 마스크와 코드 배열로 집계
+            if not data.is_non_conforming.any():
+                return [], []
+            non_conforming_counts = data.value_counts('test_item', data.is_non_conforming)
+            item_totals = data.value_counts('test_item')
+        else:
+            # 부적합 항목만 필터링
+            non_conforming_items = [
+                result for result in data 
+                if result.is_non_conforming()
+            ]
+            
+            if not non_conforming_items:
+                return [], []
+            
+            non_conforming_counts = Counter([result.test_item for result in non_conforming_items])
+            item_totals = None
         
         if chart_type == 'donut':
             # 시험항목별 부적합 개수 계산
-            item_counts = Counter([result.test_item for result in non_conforming_items])
+            item_counts = Counter(non_conforming_counts)
             
             # 데이터 포인트 수 제한
             if len(item_counts) > self.config.max_data_points:
@@ -142,14 +153,18 @@ class OptimizedChartRenderer:
         elif chart_type == 'bar':
             # 시험항목별 부적합 비율 계산
             item_stats = {}
-            for result in data:
-                item = result.test_item
-                if item not in item_stats:
-                    item_stats[item] = {'total': 0, 'non_conforming': 0}
-                
-                item_stats[item]['total'] += 1
-                if result.is_non_conforming():
-                    item_stats[item]['non_conforming'] += 1
+            if item_totals is not None:
+                for item, total in item_totals.items():
+                    item_stats[item] = {'total': total, 'non_conforming': non_conforming_counts.get(item, 0)}
+            else:
+                for result in data:
+                    item = result.test_item
+                    if item not in item_stats:
+                        item_stats[item] = {'total': 0, 'non_conforming': 0}
+                    
+                    item_stats[item]['total'] += 1
+                    if result.is_non_conforming():
+                        item_stats[item]['non_conforming'] += 1
             
             # 부적합 비율 계산
             item_ratios = []
@@ -71,6 +71,7 @@ class ValidationUI:
             
             return {
                 'file': uploaded_file,
+                'upload_session': validation_result.get('upload_session'),
                 'validation_result': validation_result,
                 'can_proceed': validation_result.get('can_proceed', False)
             }
@@ -391,7 +392,12 @@ def test_validation_ui():
             # 실제 데이터 미리보기 (선택사항)
             if st.checkbox("데이터 미리보기"):
                 try:
-                    df = pd.read_excel(upload_result['file'], nrows=10)
+                    # 검증 단계에서 디코딩한 워크북 재사용
+                    upload_session = upload_result.get('upload_session')
+                    if upload_session is not None:
+                        df = upload_session.preview(10)
+                    else:
+                        df = pd.read_excel(upload_result['file'], nrows=10)
                     st.dataframe(df)
                 except Exception as e:
                     st.error(f"데이터 미리보기 실패: {e}")
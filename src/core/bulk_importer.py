@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+대량 가져오기 (Bulk Import)
+폴더/ZIP 묶음으로 전달된 시험 결과 엑셀/CSV 파일을 프로세스 풀로 병렬 파싱하고
+DatabaseManager에 한 번에 저장한다.
+
+사용 예:
+    python -m src.core.bulk_importer "data/개별파일 뭉탱이 전달" "data/개별파일 뭉탱이 전달.zip"
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path, PurePosixPath
+from typing import Iterable, List, Optional
+
+from src.core.data_models import TestResultBatch
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DEFAULT_DATABASE_FOLDER, DatabaseManager, open_configured_database
+from src.utils.upload_session import UploadSession
+
+logger = logging.getLogger(__name__)
+
+# 가져오기 대상 확장자
+EXCEL_SUFFIXES = ('.xlsx', '.xls')
+IMPORT_SUFFIXES = EXCEL_SUFFIXES + UploadSession.CSV_SUFFIXES
+
+
+@dataclass(frozen=True)
+class ImportSource:
+    """가져올 엑셀/CSV 파일 하나 (일반 파일 또는 ZIP 멤버)"""
+    path: str                       # 파일 경로 또는 ZIP 경로
+    member: Optional[str] = None    # ZIP 내부 멤버명 (일반 파일이면 None)
+    file_name: str = ""             # 저장에 사용할 파일명
+
+    @property
+    def label(self) -> str:
+        """요약 출력용 이름"""
+        return f"{Path(self.path).name}:{self.file_name}" if self.member else self.file_name
+
+    def read_bytes(self) -> bytes:
+        """파일 내용 읽기 (ZIP 멤버는 압축 해제 없이 메모리에서 읽음)"""
+        if self.member is None:
+            return Path(self.path).read_bytes()
+        with zipfile.ZipFile(self.path) as archive:
+            return archive.read(self.member)
+
+
+@dataclass
+class FileImportResult:
+    """파일별 파싱 결과 및 소요 시간"""
+    source: ImportSource
+    batch: Optional[TestResultBatch] = None
+    error: Optional[str] = None
+    read_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    file_id: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+    @property
+    def rows(self) -> int:
+        return len(self.batch) if self.batch is not None else 0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.read_seconds + self.parse_seconds
+
+
+@dataclass
+class BulkImportReport:
+    """대량 가져오기 결과 요약"""
+    results: List[FileImportResult] = field(default_factory=list)
+    parse_seconds: float = 0.0      # 병렬 파싱 전체 경과 시간
+    save_seconds: float = 0.0       # 데이터베이스 일괄 저장 시간
+    workers: int = 1
+
+    @property
+    def succeeded(self) -> List[FileImportResult]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[FileImportResult]:
+        return [result for result in self.results if not result.success]
+
+    @property
+    def total_rows(self) -> int:
+        return sum(result.rows for result in self.results)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return self.parse_seconds + self.save_seconds
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    """ZIP 멤버 표시명 (UTF-8 플래그가 없는 한글 윈도우 압축은 cp949로 복원)"""
+    name = info.filename
+    if not info.flag_bits & 0x800:
+        try:
+            name = name.encode('cp437').decode('cp949')
+        except (UnicodeEncodeError, UnicodeDecodeError):
+            pass
+    return name
+
+
+def collect_sources(paths: Iterable) -> List[ImportSource]:
+    """경로 목록(폴더, ZIP, 엑셀/CSV 파일)에서 가져올 파일 목록 수집"""
+    sources = []
+
+    for raw_path in paths:
+        path = Path(raw_path)
+        if path.is_dir():
+            for file_path in sorted(path.rglob('*')):
+                if file_path.suffix.lower() in IMPORT_SUFFIXES and not file_path.name.startswith('~$'):
+                    sources.append(ImportSource(path=str(file_path), file_name=file_path.name))
+        elif zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    name = PurePosixPath(_zip_member_name(info))
+                    if info.is_dir() or name.parts[0] == '__MACOSX' or name.name.startswith('~$'):
+                        continue
+                    if name.suffix.lower() in IMPORT_SUFFIXES:
+                        sources.append(ImportSource(path=str(path), member=info.filename, file_name=name.name))
+        elif path.suffix.lower() in IMPORT_SUFFIXES and path.exists():
+            sources.append(ImportSource(path=str(path), file_name=path.name))
+        else:
+            logger.warning(f"가져올 수 없는 경로 무시: {path}")
+
+    return sources
+
+
+def parse_session(session: UploadSession, processor: Optional[DataProcessor] = None) -> TestResultBatch:
+    """업로드 세션 하나를 검증 후 TestResultBatch로 변환 (검증 실패 시 ValueError)"""
+    processor = processor or DataProcessor()
+    df = processor.upload_frame(session)
+    validation = processor.validate_data_structure(df)
+    if not validation['is_valid']:
+        raise ValueError(f"데이터 구조 검증 실패: {validation['errors']}")
+    # 파일마다 성능 모니터 스레드를 띄우지 않도록 데코레이터 없는 변환 경로 사용
+    if not len(df):
+        return TestResultBatch.from_test_results([])
+    return TestResultBatch.from_columns(processor._convert_dataframe_to_columns(df, datetime_arrays=True))
+
+
+def parse_source(source: ImportSource) -> FileImportResult:
+    """엑셀/CSV 파일 하나를 파싱하여 TestResultBatch로 변환 (프로세스 풀 작업 함수)"""
+    result = FileImportResult(source=source)
+    try:
+        start = time.perf_counter()
+        content = source.read_bytes()
+        result.read_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result.batch = parse_session(UploadSession(content, source.file_name))
+        result.parse_seconds = time.perf_counter() - start
+    except Exception as e:
+        result.error = str(e)
+    return result
+
+
+def bulk_import(paths: Iterable, db_manager: Optional[DatabaseManager] = None, workers: Optional[int] = None,
+                client: str = "미지정", upload_time: Optional[datetime] = None,
+                dry_run: bool = False) -> BulkImportReport:
+    """
+    폴더/ZIP/엑셀/CSV 파일을 병렬 파싱 후 데이터베이스에 일괄 저장
+
+    Args:
+        paths: 폴더, ZIP, 엑셀/CSV 파일 경로 목록
+        db_manager: 저장 대상 DatabaseManager (None이면 앱과 같은 설정으로 기본 폴더의 데이터베이스 사용)
+        workers: 파싱 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 처리)
+        client: 의뢰 기관명
+        upload_time: 처리 시각 (None이면 현재 시각)
+        dry_run: True이면 파싱만 하고 저장하지 않음
+
+    Returns:
+        BulkImportReport
+    """
+    sources = collect_sources(paths)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(sources) or 1))
+    report = BulkImportReport(workers=workers)
+
+    logger.info(f"대량 가져오기 시작: {len(sources)}개 파일, 워커 {workers}개")
+
+    start = time.perf_counter()
+    if workers == 1:
+        report.results = [parse_source(source) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            report.results = list(executor.map(parse_source, sources, chunksize=4))
+    report.parse_seconds = time.perf_counter() - start
+
+    succeeded = [result for result in report.succeeded if result.rows > 0]
+    if dry_run or not succeeded:
+        return report
+
+    # 모든 결과를 한 번의 로드/저장으로 반영
+    start = time.perf_counter()
+    db_manager = db_manager or open_configured_database()
+    upload_time = upload_time or datetime.now()
+    file_ids = db_manager.save_analysis_results([
+        {
+            "file_name": result.source.file_name,
+            "test_results": result.batch,
+            "client": client,
+            "upload_time": upload_time,
+        }
+        for result in succeeded
+    ])
+    for result, file_id in zip(succeeded, file_ids):
+        result.file_id = file_id
+    report.save_seconds = time.perf_counter() - start
+
+    return report
+
+
+def format_import_summary(report: BulkImportReport) -> str:
+    """파일별 소요 시간 및 처리량 요약 문자열"""
+    name_width = max([len(result.source.label) for result in report.results] + [10])
+    lines = [f"{'파일':<{name_width}}  {'행':>7}  {'읽기(초)':>8}  {'파싱(초)':>8}  {'행/초':>9}  상태"]
+
+    for result in report.results:
+        rate = result.rows / result.total_seconds if result.total_seconds > 0 else 0
+        status = "OK" if result.success else f"실패: {result.error}"
+        lines.append(f"{result.source.label:<{name_width}}  {result.rows:>7}  {result.read_seconds:>8.3f}  "
+                     f"{result.parse_seconds:>8.3f}  {rate:>9.0f}  {status}")
+
+    elapsed = report.elapsed_seconds
+    lines.append("-" * len(lines[0]))
+    lines.append(
+        f"총 {len(report.results)}개 파일 (성공 {len(report.succeeded)}, 실패 {len(report.failed)}), "
+        f"{report.total_rows}행, 워커 {report.workers}개"
+    )
+    lines.append(
+        f"파싱 {report.parse_seconds:.2f}초 + 저장 {report.save_seconds:.2f}초 = {elapsed:.2f}초 "
+        f"({report.total_rows / elapsed if elapsed > 0 else 0:.0f}행/초, "
+        f"{len(report.results) / elapsed if elapsed > 0 else 0:.1f}파일/초)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="시험 결과 엑셀/CSV 파일 대량 가져오기 (폴더/ZIP)")
+    parser.add_argument("paths", nargs="+", help="폴더, ZIP 또는 엑셀/CSV 파일 경로")
+    parser.add_argument("--db-folder", default=str(DEFAULT_DATABASE_FOLDER), help="데이터베이스 저장 폴더")
+    parser.add_argument("--backend", choices=("sqlite", "json", "journal"), default=None,
+                        help="데이터베이스 종류 (sqlite | json | journal, 기본: 설정의 DB_TYPE)")
+    parser.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--client", default="미지정", help="의뢰 기관명")
+    parser.add_argument("--dry-run", action="store_true", help="파싱만 하고 저장하지 않음")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    report = bulk_import(
+        args.paths,
+        db_manager=None if args.dry_run else open_configured_database(args.db_folder, args.backend),
+        workers=args.workers,
+        client=args.client,
+        dry_run=args.dry_run,
+    )
+    print(format_import_summary(report))
+    return 0 if not report.failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,360 @@
+"""
+컬럼 해석 계획 (Column Plan)
+엑셀 헤더 → TestResult 필드 매핑을 파일당 한 번만 해석하여 재사용
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+from pandas.api.types import is_bool_dtype, is_integer_dtype, is_numeric_dtype
+from src.core.data_models import (
+    NUMERIC_FIELDS, DATETIME_FIELDS, parse_datetime, parse_datetime_series, datetime_array_to_objects,
+    clean_numeric_value
+)
+
+# TestResult 필드별 후보 컬럼명 (우선순위 순)
+# 각 후보는 정확 일치를 먼저 확인하고, 없으면 대소문자 무시 부분 일치로 찾는다
+FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'no': ('No.', 'no', '번호', 'number'),
+    'sample_name': ('시료명', '시료', 'sample', 'Sample Name', '샘플명', '샘플'),
+    'analysis_number': ('분석번호', '분석 번호', 'analysis', 'Analysis Number'),
+    'test_item': ('시험항목', '항목', '시험', 'test', 'Test Item', '분석항목', '검사항목'),
+    'test_unit': ('시험단위', '단위', 'unit', 'Unit'),
+    'result_report': ('결과(성적서)', '결과', 'result', 'Result', '측정값', '분석결과', '시험결과'),
+    'tester_input_value': ('시험자입력값', '입력값', 'input', 'Input Value'),
+    'standard_excess': ('기준대비 초과여부\n(성적서)', '기준대비 초과여부 (성적서)', '기준대비 초과여부', '판정', '적합성', 'judgment'),
+    'tester': ('시험자', '분석자', '검사자', 'tester', 'Tester', '담당자', '실험자'),
+    'test_standard': ('시험표준', '표준', 'standard', 'Standard', '방법'),
+    'standard_criteria': ('기준 텍스트', '기준', 'criteria', 'Criteria', '허용기준'),
+    'text_digits': ('자리수\n처리방식', '텍스트 자리수', '자리수', 'digits'),
+    'processing_method': ('처리방식', '방식', 'method', 'Method'),
+    'result_display_digits': ('시험결과\n표시자리수', '시험결과 표시자리수', '표시자리수'),
+    'result_type': ('결과유형', '유형', 'type', 'Type'),
+    'tester_group': ('시험자그룹', '그룹', 'group', 'Group'),
+    'input_datetime': ('입력일시', '일시', 'datetime', 'Date Time', '날짜'),
+    'approval_request': ('승인요청여부', '승인요청', 'approval', 'Approval'),
+    'approval_request_datetime': ('승인요청일시', '승인일시'),
+    'test_result_display_limit': ('시험결과 표시한계\n(정량한계)(성적서)', '시험결과 표시한계 (정량한계)(성적서)', '표시한계', '정량한계'),
+    'quantitative_limit_processing': ('정량한계미만처리\n(성적서)', '정량한계미만처리 (성적서)', '정량한계미만처리'),
+    'test_equipment': ('시험기기\n(RDMS)', '시험기기 (RDMS)', '시험기기', '기기', 'equipment'),
+    'judgment_status': ('판정 여부', '판정여부', '판정', 'judgment'),
+    'report_output': ('성적서\n출력여부', '성적서 출력여부', '출력여부', 'output'),
+    'kolas_status': ('KOLAS 여부', 'KOLAS', 'kolas'),
+    'test_lab_group': ('시험소그룹', '시험소', 'lab', 'Lab'),
+    'test_set': ('시험Set', '시험세트', 'set', 'Set'),
+}
+
+# LIMS 내보내기 실제 컬럼명 → 필드 (줄바꿈 포함)
+LIMS_COLUMNS: Dict[str, str] = {
+    'No.': 'no',
+    '시료명': 'sample_name',
+    '분석번호': 'analysis_number',
+    '시험항목': 'test_item',
+    '시험단위': 'test_unit',
+    '결과(성적서)': 'result_report',
+    '시험자입력값': 'tester_input_value',
+    '기준대비 초과여부 (성적서)': 'standard_excess',
+    '기준대비 초과여부\n(성적서)': 'standard_excess',  # 줄바꿈 버전
+    '시험자': 'tester',
+    '시험표준': 'test_standard',
+    '기준': 'standard_criteria',
+    '기준 텍스트': 'standard_criteria',  # 실제 컬럼명
+    '텍스트 자리수': 'text_digits',
+    '자리수\n처리방식': 'text_digits',  # 줄바꿈 버전
+    '처리방식': 'processing_method',
+    '시험결과 표시자리수': 'result_display_digits',
+    '시험결과\n표시자리수': 'result_display_digits',  # 줄바꿈 버전
+    '결과유형': 'result_type',
+    '시험자그룹': 'tester_group',
+    '입력일시': 'input_datetime',
+    '승인요청여부': 'approval_request',
+    '승인요청일시': 'approval_request_datetime',
+    '시험결과 표시한계 (정량한계)(성적서)': 'test_result_display_limit',
+    '시험결과 표시한계\n(정량한계)(성적서)': 'test_result_display_limit',  # 줄바꿈 버전
+    '정량한계미만처리 (성적서)': 'quantitative_limit_processing',
+    '정량한계미만처리\n(성적서)': 'quantitative_limit_processing',  # 줄바꿈 버전
+    '시험기기 (RDMS)': 'test_equipment',
+    '시험기기\n(RDMS)': 'test_equipment',  # 줄바꿈 버전
+    '판정 여부': 'judgment_status',
+    '성적서 출력여부': 'report_output',
+    '성적서\n출력여부': 'report_output',  # 줄바꿈 버전
+    'KOLAS 여부': 'kolas_status',
+    '시험소그룹': 'test_lab_group',
+    '시험Set': 'test_set'
+}
+
+# 값이 비어 있을 때 사용하는 기본값 (명시되지 않은 필드는 빈 문자열)
+FIELD_DEFAULTS: Dict[str, object] = {
+    'no': 0,
+    'result_report': '',
+    'tester_input_value': 0,
+    'standard_excess': '-',
+    'result_display_digits': 2,
+    'approval_request': 'N',
+    'test_result_display_limit': 0,
+    'judgment_status': 'N',
+    'report_output': 'N',
+    'kolas_status': 'N',
+}
+
+# 원본 유지 필드 (수치/일시 필드 구분은 data_models 참조)
+RAW_FIELDS = ('result_report',)  # 원본 값을 그대로 유지 ("불검출" 또는 수치)
+
+# 읽기 시점 dtype 계획 (LIMS_COLUMNS 기준, 나머지 컬럼은 읽은 그대로)
+# - 고유값이 적은 텍스트: 카테고리
+# - 행마다 다른 텍스트(시료명/분석번호): Arrow 문자열 (결측은 NaN)
+# - 정수: 범위에 맞게 다운캐스트 (실수는 결과값이 바뀌므로 float64 유지)
+CATEGORY_FIELDS = (
+    'test_item', 'test_unit', 'standard_excess', 'tester', 'test_standard', 'standard_criteria',
+    'text_digits', 'processing_method', 'result_type', 'tester_group', 'approval_request',
+    'quantitative_limit_processing', 'test_equipment', 'judgment_status', 'report_output',
+    'kolas_status', 'test_lab_group', 'test_set',
+)
+STRING_FIELDS = ('sample_name', 'analysis_number')
+INTEGER_FIELDS = ('no', 'result_display_digits')
+
+
+@dataclass(frozen=True)
+class ColumnResolution:
+    """필드 하나의 컬럼 해석 결과"""
+    field: str
+    alias: Optional[str] = None       # 매칭된 후보 컬럼명
+    exact: Optional[str] = None       # 정확히 일치하는 컬럼 (값이 비어 있으면 partial로 대체)
+    partial: Optional[str] = None     # 부분 일치하는 첫 번째 컬럼
+
+    @property
+    def is_resolved(self) -> bool:
+        return self.partial is not None
+
+
+class ColumnPlan:
+    """헤더 → 필드 매핑 계획
+
+    행마다 후보 컬럼명을 검색하던 방식을 대체한다. 후보 우선순위와
+    부분 일치 규칙은 기존 행 단위 매칭과 동일하며, 정확히 일치하는 컬럼의
+    값이 비어 있는 행은 부분 일치 컬럼의 값으로 대체된다.
+    """
+
+    # to_spec 형식 버전 (헤더 스키마 캐시 키에 포함)
+    SPEC_VERSION = "1"
+
+    def __init__(self, columns: Iterable, resolutions: Dict[str, ColumnResolution]):
+        self.columns = tuple(columns)
+        self.resolutions = resolutions
+
+    @classmethod
+    def from_columns(cls, columns: Iterable) -> 'ColumnPlan':
+        """헤더 목록으로부터 매핑 계획 생성"""
+        columns = tuple(columns)
+        lowered = [(col, str(col).lower()) for col in columns]
+        resolutions = {}
+
+        for field, aliases in FIELD_ALIASES.items():
+            resolution = ColumnResolution(field=field)
+            for alias in aliases:
+                # 부분 일치는 정확 일치 컬럼 자신도 포함하므로,
+                # 부분 일치가 하나라도 있는 첫 번째 후보에서 해석이 끝난다
+                needle = alias.lower()
+                partial = next((col for col, low in lowered if needle in low), None)
+                if partial is not None:
+                    exact = alias if alias in columns else None
+                    resolution = ColumnResolution(field=field, alias=alias, exact=exact, partial=partial)
+                    break
+            resolutions[field] = resolution
+
+        return cls(columns, resolutions)
+
+    def to_spec(self) -> Dict[str, Optional[List]]:
+        """JSON 저장용 해석 결과 (필드 → [후보명, 정확 일치 여부, 부분 일치 컬럼 인덱스])"""
+        spec = {}
+        for field, resolution in self.resolutions.items():
+            if not resolution.is_resolved:
+                spec[field] = None
+                continue
+            spec[field] = [
+                resolution.alias,
+                resolution.exact is not None,
+                self.columns.index(resolution.partial),
+            ]
+        return spec
+
+    @classmethod
+    def from_spec(cls, columns: Iterable, spec: Dict[str, Optional[List]]) -> 'ColumnPlan':
+        """to_spec 결과와 같은 헤더로부터 매핑 계획 복원"""
+        columns = tuple(columns)
+        resolutions = {}
+        for field, entry in spec.items():
+            if entry is None:
+                resolutions[field] = ColumnResolution(field=field)
+                continue
+            alias, has_exact, partial_index = entry
+            resolutions[field] = ColumnResolution(
+                field=field, alias=alias, exact=alias if has_exact else None, partial=columns[partial_index]
+            )
+        return cls(columns, resolutions)
+
+    def column_for(self, field: str) -> Optional[str]:
+        """필드에 주로 사용되는 컬럼명 반환"""
+        resolution = self.resolutions.get(field)
+        if resolution is None or not resolution.is_resolved:
+            return None
+        return resolution.exact or resolution.partial
+
+    @property
+    def missing_fields(self) -> List[str]:
+        """매핑되지 않은 필드 목록"""
+        return [field for field, res in self.resolutions.items() if not res.is_resolved]
+
+    def resolve(self, df: pd.DataFrame, field: str) -> Optional[pd.Series]:
+        """필드 값 Series 반환 (매핑되지 않은 경우 None)"""
+        resolution = self.resolutions[field]
+        if not resolution.is_resolved:
+            return None
+
+        partial = df[resolution.partial]
+        if resolution.exact is None or resolution.exact == resolution.partial:
+            return partial
+
+        exact = df[resolution.exact]
+        if isinstance(exact.dtype, pd.CategoricalDtype) or isinstance(partial.dtype, pd.CategoricalDtype):
+            exact = exact.astype(object)
+            partial = partial.astype(object)
+        return exact.where(exact.notna(), partial)
+
+    def resolve_row(self, row: pd.Series, field: str):
+        """단일 행에서 필드 값 반환 (비어 있으면 None)"""
+        resolution = self.resolutions[field]
+        if not resolution.is_resolved:
+            return None
+
+        value = None
+        if resolution.exact is not None:
+            value = row.get(resolution.exact)
+        if value is None or pd.isna(value):
+            value = row.get(resolution.partial)
+        if value is None or pd.isna(value):
+            return None
+        return value
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """필드 → 컬럼명 매핑 딕셔너리"""
+        return {field: self.column_for(field) for field in self.resolutions}
+
+
+def convert_value(field: str, value: Any) -> Any:
+    """필드 유형에 맞게 단일 값 변환 (None/NaN은 빈 값으로 처리)"""
+    if value is not None and not isinstance(value, str) and pd.isna(value):
+        value = None
+    default = FIELD_DEFAULTS.get(field, '')
+
+    if field in DATETIME_FIELDS:
+        return parse_datetime(value)
+    if field in NUMERIC_FIELDS:
+        return clean_numeric_value(value or default)
+    if field in RAW_FIELDS:
+        return value or default
+    return str(value or default).strip()
+
+
+def restore_numeric_text(series: pd.Series) -> pd.Series:
+    """문자열로 읽은 컬럼(CSV)의 수치 값을 float로 복원 ("불검출" 등 문자열은 유지)
+
+    엑셀은 셀 타입이 보존되어 결과 컬럼이 수치/문자열 혼합으로 읽히므로,
+    CSV도 같은 형태로 맞춘다.
+    """
+    numbers = pd.to_numeric(series, errors='coerce')
+    mask = numbers.notna().to_numpy()
+    if not mask.any():
+        return series
+    values = series.to_numpy(dtype=object, copy=True)
+    values[mask] = numbers.to_numpy()[mask]
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
+def _text_dtype():
+    """결측을 NaN으로 다루는 Arrow 문자열 dtype (pyarrow가 없으면 None → object 유지)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    for make in (lambda: pd.StringDtype('pyarrow', na_value=np.nan),   # pandas 3 ('str')
+                 lambda: pd.StringDtype('pyarrow_numpy')):              # pandas 2.1 ~ 2.x
+        try:
+            return make()
+        except (TypeError, ValueError, ImportError):
+            continue
+    return None
+
+
+TEXT_DTYPE = _text_dtype()
+
+
+def read_dtypes() -> Dict[str, Any]:
+    """읽기 함수(pd.read_excel 등)에 넘길 컬럼 → dtype (텍스트 컬럼만, 없는 컬럼은 무시됨)"""
+    if TEXT_DTYPE is None:
+        return {}
+    return {column: TEXT_DTYPE for column, field in LIMS_COLUMNS.items()
+            if field in CATEGORY_FIELDS or field in STRING_FIELDS}
+
+
+def apply_read_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """방금 읽은 DataFrame에 dtype 계획 적용 (컬럼 단위 교체, 전체 복사/고유값 스캔 없음)"""
+    for column in df.columns:
+        field = LIMS_COLUMNS.get(column)
+        if field is None:
+            continue
+        series = df[column]
+        if field in CATEGORY_FIELDS:
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                continue
+            if TEXT_DTYPE is not None and series.dtype != TEXT_DTYPE:
+                series = series.astype(TEXT_DTYPE)
+            elif TEXT_DTYPE is None and series.dtype == object:
+                # 수치/문자열 혼합 셀은 문자열로 맞춘 뒤 카테고리화 (정렬 가능한 카테고리)
+                series = series.where(series.isna(), series.astype(str))
+            df[column] = series.astype('category')
+        elif field in STRING_FIELDS:
+            if TEXT_DTYPE is not None and series.dtype != TEXT_DTYPE:
+                df[column] = series.astype(TEXT_DTYPE)
+        elif field in INTEGER_FIELDS and is_integer_dtype(series.dtype):
+            df[column] = pd.to_numeric(series, downcast='integer')
+    return df
+
+
+def convert_datetime_series(series: Optional[pd.Series], length: int) -> np.ndarray:
+    """일시 필드 Series를 datetime64[ns] 배열로 변환 (빈 값/해석 불가 값은 NaT)"""
+    if series is None:
+        return np.full(length, np.datetime64('NaT'), dtype='datetime64[ns]')
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    return parse_datetime_series(series)
+
+
+def convert_series(field: str, series: Optional[pd.Series], length: int) -> np.ndarray:
+    """필드 Series 전체를 변환하여 object 배열로 반환
+
+    수치형 컬럼은 벡터 연산으로, 일시 컬럼은 형식별 벡터 파싱으로, 그 외
+    컬럼은 고유값 단위로 한 번씩만 변환한 뒤 코드 배열로 펼친다.
+    반복되는 문자열은 같은 객체를 공유한다.
+    """
+    if field in DATETIME_FIELDS:
+        return datetime_array_to_objects(convert_datetime_series(series, length))
+
+    if series is None:
+        out = np.empty(length, dtype=object)
+        out[:] = [convert_value(field, None)] * length
+        return out
+
+    if field in NUMERIC_FIELDS and is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+        default = FIELD_DEFAULTS.get(field, 0)
+        values = series.mask(series.isna() | (series == 0), default)
+        out = np.empty(length, dtype=object)
+        out[:] = values.tolist()
+        return out
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    lookup = np.empty(len(uniques) + 1, dtype=object)
+    lookup[:-1] = [convert_value(field, value) for value in uniques]
+    lookup[-1] = convert_value(field, None)  # 코드 -1 (NaN)
+    return lookup[codes]
@@ -0,0 +1,157 @@
+"""
+기준 텍스트 해석 (Criteria Parser)
+"0.0006 mg/L 이하", "5.8 ~ 8.5", "1 이상 10 미만" 같은 기준 텍스트를
+하한/상한/단위로 해석한다. 파일당 고유 기준 텍스트는 수십 개뿐이므로
+텍스트별로 한 번만 해석해 메모이즈하고, 컬럼 단위 조회는 고유값만 해석해 펼친다.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# 수치 (천 단위 콤마 허용, "CFU/100 mL"처럼 단위 안의 숫자는 제외)
+# 부호(-, −)는 텍스트 처음이나 공백/괄호/물결표 바로 뒤에서 수치에 붙어 있을 때만 ("5.8-8.5"의 -는 범위 구분자)
+_NUMBER_RE = re.compile(r'(?<![/\w.])(?:(?<![^\s(~～〜])([-−]))?'
+                        r'(\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d*)?|\.\d+)(?:[eE]([-+]?\d+))?')
+
+# 수치 뒤의 한정어 → (경계, 포함 여부)
+_QUALIFIERS = {
+    '이하': ('upper', True),
+    '미만': ('upper', False),
+    '이상': ('lower', True),
+    '초과': ('lower', False),
+    '≤': ('upper', True),
+    '<': ('upper', False),
+    '≥': ('lower', True),
+    '>': ('lower', False),
+}
+_QUALIFIER_RE = re.compile('|'.join(re.escape(word) for word in sorted(_QUALIFIERS, key=len, reverse=True)))
+
+# 범위 구분자 ("5.8 ~ 8.5", "5.8-8.5")
+_RANGE_RE = re.compile(r'^\s*[~～〜\-–—]\s*')
+
+# 불검출 기준 ("불검출", "검출되지 아니할 것")
+_NOT_DETECTED_RE = re.compile(r'불검출|검출되지\s*(?:아니|않)')
+
+
+@dataclass(frozen=True)
+class Criteria:
+    """해석된 기준 (경계가 없으면 NaN)"""
+    text: str
+    lower: float = math.nan
+    upper: float = math.nan
+    lower_inclusive: bool = True
+    upper_inclusive: bool = True
+    unit: str = ''
+
+    @property
+    def limit_value(self) -> float:
+        """대표 기준값 (상한 우선, 없으면 하한, 해석 실패 시 0.0)"""
+        if not math.isnan(self.upper):
+            return self.upper
+        if not math.isnan(self.lower):
+            return self.lower
+        return 0.0
+
+    def is_within(self, value: Optional[float]) -> Optional[bool]:
+        """값이 기준 범위 안인지 여부 (값이 없으면 None)"""
+        if value is None or value != value:
+            return None
+        if not math.isnan(self.lower):
+            if value < self.lower or (value == self.lower and not self.lower_inclusive):
+                return False
+        if not math.isnan(self.upper):
+            if value > self.upper or (value == self.upper and not self.upper_inclusive):
+                return False
+        return True
+
+
+def _to_float(match: re.Match, signed: bool = True) -> float:
+    number = float(match.group(2).replace(',', ''))
+    if match.group(3):
+        number *= 10 ** int(match.group(3))
+    return -number if signed and match.group(1) else number
+
+
+def _numbers(text: str):
+    """텍스트의 수치 → (시작, 끝, 값) 목록
+
+    앞 수치와 공백만 사이에 둔 부호("5.8 -8.5")는 음수가 아니라 범위 구분자로 본다.
+    """
+    numbers = []
+    for match in _NUMBER_RE.finditer(text):
+        start, signed = match.start(), bool(match.group(1))
+        if signed and numbers and not text[numbers[-1][1]:start].strip():
+            start, signed = match.start(2), False
+        numbers.append((start, match.end(), _to_float(match, signed)))
+    return numbers
+
+
+def _clean_unit(segment: str) -> str:
+    """수치 사이 구간에서 한정어/구분자를 제거한 단위 문자열"""
+    segment = _QUALIFIER_RE.sub(' ', segment)
+    segment = _RANGE_RE.sub('', segment)
+    return ' '.join(segment.split()).strip(' ,~～〜-–—()')
+
+
+@lru_cache(maxsize=4096)
+def parse_criteria(text) -> Criteria:
+    """기준 텍스트 해석 (같은 텍스트는 한 번만 해석)"""
+    if not isinstance(text, str):
+        if text is None or (isinstance(text, float) and math.isnan(text)):
+            return Criteria(text='')
+        text = str(text)
+    if not text.strip():
+        return Criteria(text=text)
+
+    matches = _numbers(text)
+    if not matches:
+        if _NOT_DETECTED_RE.search(text):
+            return Criteria(text=text, upper=0.0)
+        return Criteria(text=text)
+
+    bounds = {}
+    unit = ''
+    ranged = False
+    for index, (start, end, value) in enumerate(matches):
+        segment_end = matches[index + 1][0] if index + 1 < len(matches) else len(text)
+        segment = text[end:segment_end]
+        if not unit:
+            unit = _clean_unit(segment)
+
+        # 부등호가 수치 앞에 오는 형태 ("≤ 0.5", "< 10")
+        prefix = text[matches[index - 1][1] if index else 0:start].strip()
+        qualifier = _QUALIFIER_RE.search(segment)
+        if prefix and prefix[-1] in '≤<≥>':
+            bound, inclusive = _QUALIFIERS[prefix[-1]]
+        elif qualifier:
+            bound, inclusive = _QUALIFIERS[qualifier.group(0)]
+        elif index == 0 and len(matches) > 1 and _RANGE_RE.match(segment.replace(unit, '', 1)):
+            bound, inclusive = 'lower', True
+            ranged = True
+        else:
+            bound, inclusive = 'upper', True
+        bounds.setdefault(bound, (value, inclusive))
+
+    lower, lower_inclusive = bounds.get('lower', (math.nan, True))
+    upper, upper_inclusive = bounds.get('upper', (math.nan, True))
+    if ranged and lower > upper:
+        # 큰 값을 먼저 쓴 범위 ("8.5 ~ 5.8")
+        lower, upper = upper, lower
+    return Criteria(text=text, lower=lower, upper=upper,
+                    lower_inclusive=lower_inclusive, upper_inclusive=upper_inclusive, unit=unit)
+
+
+def limits_for(series) -> Tuple[np.ndarray, np.ndarray]:
+    """기준 텍스트 컬럼 → (하한, 상한) float64 배열 (고유값만 해석)"""
+    values = series.to_numpy(dtype=object) if isinstance(series, pd.Series) else np.asarray(series, dtype=object)
+    codes, uniques = pd.factorize(values.reshape(-1), use_na_sentinel=False)
+    parsed = [parse_criteria(value) for value in uniques]
+    lower = np.array([criteria.lower for criteria in parsed], dtype=np.float64)
+    upper = np.array([criteria.upper for criteria in parsed], dtype=np.float64)
+    return lower[codes], upper[codes]
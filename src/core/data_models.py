@@ -3,12 +3,21 @@
 실제 엑셀 데이터 구조에 맞춘 데이터 클래스들
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional, Union
+from enum import IntEnum
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import hashlib
+import re
+import sys
 import pandas as pd
 import numpy as np
 
+try:
+    from src.core.criteria_parser import Criteria, limits_for, parse_criteria
+except ImportError:
+    from criteria_parser import Criteria, limits_for, parse_criteria
+
 @dataclass
 class TestResult:
     """시험 결과 데이터 모델"""
@@ -45,19 +54,284 @@ class TestResult:
         return self.standard_excess == "부적합"
     
     def get_numeric_result(self) -> Optional[float]:
-        """수치 결과값 반환 (불검출인 경우 None)"""
-        if isinstance(self.result_report, str) and "불검출" in self.result_report:
-            return None
-        try:
-            return float(self.result_report)
-        except (ValueError, TypeError):
-            return None
+        """수치 결과값 반환 (불검출/정량한계 미만/해석 불가인 경우 None)"""
+        value, status, _ = decode_result_value(self.result_report)
+        return value if status == DetectionStatus.DETECTED else None
     
     def get_display_result(self) -> str:
         """화면 표시용 결과값"""
-        if isinstance(self.result_report, str) and "불검출" in self.result_report:
-            return "불검출"
-        return str(self.result_report)
+        return decode_result_value(self.result_report)[2]
+    
+    def get_detection_status(self) -> 'DetectionStatus':
+        """결과(성적서) 검출 상태"""
+        return decode_result_value(self.result_report)[1]
+
+# TestResult 필드 구분 (생성자 인자 순서 / 수치 / 일시)
+TEST_RESULT_FIELDS = [f.name for f in fields(TestResult)]
+NUMERIC_FIELDS = ('no', 'tester_input_value', 'result_display_digits', 'test_result_display_limit')
+DATETIME_FIELDS = ('input_datetime', 'approval_request_datetime')
+
+# 파일 간 반복이 많은 문자열 필드 (분석번호/결과값은 행마다 달라 제외)
+INTERNED_FIELDS = (
+    'sample_name', 'test_item', 'test_unit', 'standard_excess', 'tester', 'test_standard',
+    'standard_criteria', 'text_digits', 'processing_method', 'result_type', 'tester_group',
+    'approval_request', 'quantitative_limit_processing', 'test_equipment', 'judgment_status',
+    'report_output', 'kolas_status', 'test_lab_group', 'test_set',
+)
+
+
+@dataclass
+class CompactTestResult:
+    """메모리 절약형 시험 결과 (__slots__ + 문자열 인터닝)
+
+    필드/메서드는 TestResult와 동일하다. 인스턴스 __dict__가 없고,
+    반복되는 범주형 문자열은 sys.intern으로 프로세스 전체에서 하나의
+    객체를 공유하므로 세션에 여러 파일의 결과를 보관할 때 메모리가 줄어든다.
+    """
+    __slots__ = tuple(TEST_RESULT_FIELDS)
+    __annotations__ = dict(TestResult.__annotations__)
+
+    is_non_conforming = TestResult.is_non_conforming
+    get_numeric_result = TestResult.get_numeric_result
+    get_display_result = TestResult.get_display_result
+    get_detection_status = TestResult.get_detection_status
+
+    def __post_init__(self):
+        for field in INTERNED_FIELDS:
+            value = getattr(self, field)
+            if type(value) is str:
+                setattr(self, field, sys.intern(value))
+
+    @classmethod
+    def from_test_result(cls, result: TestResult) -> 'CompactTestResult':
+        """TestResult → CompactTestResult 변환"""
+        return cls(*(getattr(result, field) for field in TEST_RESULT_FIELDS))
+
+    def to_test_result(self) -> TestResult:
+        """CompactTestResult → TestResult 변환"""
+        return TestResult(*(getattr(self, field) for field in TEST_RESULT_FIELDS))
+
+
+class TestResultBatch:
+    """시험 결과 컬럼형 컨테이너 (struct-of-arrays)
+
+    문자열 필드는 사전 인코딩(코드 배열 + 카테고리)하고, 수치/일시 필드는
+    NumPy 배열로 보관한다. 부적합 여부와 결과(성적서) 해석값(수치, 검출 상태,
+    표시 문자열)은 생성 시 한 번만 계산해 배열로 제공한다. 인덱싱/반복 시에는 TestResult 객체를 돌려주므로
+    List[TestResult]를 받던 기존 코드에 그대로 전달할 수 있다.
+    """
+
+    FIELDS = TEST_RESULT_FIELDS
+    NUMERIC_FIELDS = NUMERIC_FIELDS
+    DATETIME_FIELDS = DATETIME_FIELDS
+    CATEGORICAL_FIELDS = tuple(f for f in TEST_RESULT_FIELDS if f not in NUMERIC_FIELDS + DATETIME_FIELDS)
+
+    def __init__(self, codes: Dict[str, np.ndarray], categories: Dict[str, np.ndarray],
+                 numeric: Dict[str, np.ndarray], datetimes: Dict[str, np.ndarray]):
+        self._codes = codes
+        self._categories = categories
+        self._numeric = numeric
+        self._datetimes = datetimes
+        self._length = len(numeric['no'])
+        self._fingerprint = None
+
+        # 부적합 여부 / 결과 해석은 카테고리 단위로 계산 후 펼침
+        excess_categories = categories['standard_excess']
+        self.is_non_conforming = (excess_categories == "부적합")[codes['standard_excess']] \
+            if len(excess_categories) else np.zeros(self._length, dtype=bool)
+        self._decoded_categories = decode_result_values(categories['result_report'])
+        report_codes = codes['result_report']
+        self.numeric_result = self._decoded_categories.value[report_codes]
+        self.detection_status = self._decoded_categories.status[report_codes]
+
+    @property
+    def result_display(self) -> np.ndarray:
+        """화면 표시용 결과값 배열 (get_display_result와 동일)"""
+        return self._decoded_categories.display[self._codes['result_report']]
+
+    def criteria_limits(self) -> Tuple[np.ndarray, np.ndarray]:
+        """행 단위 기준 (하한, 상한) 배열 (고유 기준 텍스트만 해석)"""
+        lower, upper = limits_for(self._categories['standard_criteria'])
+        codes = self._codes['standard_criteria']
+        return lower[codes], upper[codes]
+
+    def decoded_results(self) -> 'DecodedResults':
+        """행 단위 결과(성적서) 해석값"""
+        return DecodedResults(self.numeric_result, self.detection_status, self.result_display)
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence]) -> 'TestResultBatch':
+        """필드별 값 배열로부터 배치 생성"""
+        codes, categories, numeric, datetimes = {}, {}, {}, {}
+
+        for field in cls.CATEGORICAL_FIELDS:
+            field_codes, uniques = pd.factorize(np.asarray(columns[field], dtype=object), use_na_sentinel=False)
+            # 카테고리 수에 맞는 최소 정수형 코드 사용
+            codes[field] = field_codes.astype(np.min_scalar_type(max(len(uniques) - 1, 0)))
+            categories[field] = np.asarray(uniques, dtype=object)
+
+        for field in cls.NUMERIC_FIELDS:
+            values = np.asarray(list(columns[field]))
+            if values.dtype.kind not in 'iuf':
+                values = pd.to_numeric(pd.Series(values), errors='coerce').fillna(0).to_numpy()
+            numeric[field] = values.astype(np.int64) if values.dtype.kind in 'iu' else values.astype(np.float64)
+
+        for field in cls.DATETIME_FIELDS:
+            values = columns[field]
+            if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+                # 컬럼 단위 일시 파싱 결과(datetime64)는 그대로 사용
+                datetimes[field] = values.astype('datetime64[ns]')
+            else:
+                datetimes[field] = pd.to_datetime(pd.Series(list(values), dtype=object),
+                                                  errors='coerce').to_numpy(dtype='datetime64[ns]')
+
+        return cls(codes, categories, numeric, datetimes)
+
+    @classmethod
+    def from_test_results(cls, test_results) -> 'TestResultBatch':
+        """TestResult 리스트로부터 배치 생성"""
+        if isinstance(test_results, cls):
+            return test_results
+        test_results = list(test_results)
+        return cls.from_columns({
+            field: [getattr(result, field) for result in test_results]
+            for field in cls.FIELDS
+        })
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __iter__(self) -> Iterator[TestResult]:
+        for index in range(self._length):
+            yield self._row(index)
+
+    def __getitem__(self, key) -> Union[TestResult, 'TestResultBatch']:
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._length
+            if not 0 <= key < self._length:
+                raise IndexError("TestResultBatch index out of range")
+            return self._row(int(key))
+        if isinstance(key, slice):
+            return self.take(np.arange(self._length)[key])
+        key = np.asarray(key)
+        if key.dtype == bool:
+            return self.filter(key)
+        return self.take(key)
+
+    def __repr__(self) -> str:
+        # 캐시 키로도 쓰이므로 내용이 다르면 다른 문자열이 되도록 지문 포함
+        return f"TestResultBatch(rows={self._length}, fingerprint={self.fingerprint})"
+
+    def _row(self, index: int) -> TestResult:
+        """index 행을 TestResult 객체로 구성"""
+        values = {}
+        for field in self.CATEGORICAL_FIELDS:
+            values[field] = self._categories[field][self._codes[field][index]]
+        for field in self.NUMERIC_FIELDS:
+            values[field] = self._numeric[field][index].item()
+        for field in self.DATETIME_FIELDS:
+            value = self._datetimes[field][index]
+            values[field] = None if np.isnat(value) else pd.Timestamp(value).to_pydatetime()
+        return TestResult(**values)
+
+    @property
+    def fingerprint(self) -> str:
+        """배치 내용의 해시 (캐시 키용)"""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=12)
+            for field in self.CATEGORICAL_FIELDS:
+                digest.update(self._codes[field].tobytes())
+                digest.update(repr(self._categories[field].tolist()).encode('utf-8'))
+            for field in self.NUMERIC_FIELDS:
+                digest.update(self._numeric[field].tobytes())
+            for field in self.DATETIME_FIELDS:
+                digest.update(self._datetimes[field].tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def codes(self, field: str) -> np.ndarray:
+        """사전 인코딩 코드 배열"""
+        return self._codes[field]
+
+    def categories(self, field: str) -> np.ndarray:
+        """사전 인코딩 카테고리 배열"""
+        return self._categories[field]
+
+    def column(self, field: str) -> np.ndarray:
+        """필드 값 배열 (문자열 필드는 디코딩된 object 배열)"""
+        if field in self._codes:
+            return self._categories[field][self._codes[field]]
+        if field in self._numeric:
+            return self._numeric[field]
+        return self._datetimes[field]
+
+    def value_counts(self, field: str, mask: Optional[np.ndarray] = None) -> Dict[Any, int]:
+        """카테고리 필드의 값별 개수 (처음 등장한 순서 유지)"""
+        codes = self._codes[field] if mask is None else self._codes[field][mask]
+        if len(codes) == 0:
+            return {}
+        unique_codes, first_index, counts = np.unique(codes, return_index=True, return_counts=True)
+        order = np.argsort(first_index, kind='stable')
+        labels = self._categories[field][unique_codes[order]]
+        return dict(zip(labels.tolist(), counts[order].tolist()))
+
+    def nunique(self, field: str, mask: Optional[np.ndarray] = None) -> int:
+        """카테고리 필드의 고유값 개수"""
+        codes = self._codes[field] if mask is None else self._codes[field][mask]
+        return int(len(np.unique(codes)))
+
+    def take(self, indices) -> 'TestResultBatch':
+        """지정한 행들로 새 배치 생성 (카테고리는 공유)"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return TestResultBatch(
+            {field: values[indices] for field, values in self._codes.items()},
+            self._categories,
+            {field: values[indices] for field, values in self._numeric.items()},
+            {field: values[indices] for field, values in self._datetimes.items()},
+        )
+
+    def filter(self, mask: np.ndarray) -> 'TestResultBatch':
+        """불리언 마스크로 행 필터링"""
+        return self.take(np.flatnonzero(mask))
+
+    def to_test_results(self, result_class=TestResult) -> List[TestResult]:
+        """TestResult 리스트로 변환 (result_class로 CompactTestResult 등 지정 가능)"""
+        columns = []
+        for field in self.FIELDS:
+            if field in self._datetimes:
+                columns.append(datetime_array_to_objects(self._datetimes[field]).tolist())
+            else:
+                columns.append(self.column(field).tolist())
+        return [result_class(*values) for values in zip(*columns)]
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """필드명을 컬럼으로 하는 DataFrame (문자열 필드는 category dtype)"""
+        data = {}
+        for field in self.FIELDS:
+            if field in self._codes:
+                data[field] = pd.Categorical.from_codes(
+                    self._codes[field], categories=pd.Index(self._categories[field], dtype=object)
+                )
+            else:
+                data[field] = self.column(field)
+        data['is_non_conforming'] = self.is_non_conforming
+        data['numeric_result'] = self.numeric_result
+        data['detection_status'] = self.detection_status
+        return pd.DataFrame(data)
+
+    def memory_usage(self) -> int:
+        """배치가 차지하는 대략적인 메모리 (bytes)"""
+        total = self.is_non_conforming.nbytes + self.numeric_result.nbytes + self.detection_status.nbytes
+        for values in list(self._codes.values()) + list(self._numeric.values()) + list(self._datetimes.values()):
+            total += values.nbytes
+        for values in self._categories.values():
+            total += values.nbytes + sum(sys.getsizeof(value) for value in values)
+        return total
+
 
 @dataclass
 class Standard:
@@ -84,18 +358,15 @@ class Standard:
             test_method=test_result.test_standard
         )
     
+    @property
+    def criteria(self) -> Criteria:
+        """해석된 기준 (하한/상한/단위)"""
+        return parse_criteria(self.limit_text)
+    
     @staticmethod
     def _extract_limit_value(criteria_text: str) -> float:
-        """기준 텍스트에서 수치값 추출"""
-        if not criteria_text or criteria_text.strip() == "":
-            return 0.0
-        
-        # "0.0006 mg/L 이하" 형태에서 숫자 추출
-        import re
-        numbers = re.findall(r'\d+\.?\d*', criteria_text)
-        if numbers:
-            return float(numbers[0])
-        return 0.0
+        """기준 텍스트에서 대표 기준값 추출 (상한 우선)"""
+        return parse_criteria(criteria_text).limit_value
 
 @dataclass
 class ProjectSummary:
@@ -113,6 +384,9 @@ class ProjectSummary:
     @classmethod
     def from_test_results(cls, project_name: str, test_results: list[TestResult]) -> 'ProjectSummary':
         """TestResult 리스트에서 프로젝트 요약 정보 생성"""
+        if isinstance(test_results, TestResultBatch):
+            return cls.from_batch(project_name, test_results)
+        
         total_tests = len(test_results)
         violation_tests = sum(1 for result in test_results if result.is_non_conforming())
         violation_rate = (violation_tests / total_tests * 100) if total_tests > 0 else 0.0
@@ -184,6 +458,60 @@ class ProjectSummary:
             sample_summary=sample_summary
         )
 
+    @classmethod
+    def from_batch(cls, project_name: str, batch: TestResultBatch) -> 'ProjectSummary':
+        """TestResultBatch에서 프로젝트 요약 정보 생성 (벡터 연산)"""
+        total_tests = len(batch)
+        violation_mask = batch.is_non_conforming
+        violation_tests = int(violation_mask.sum())
+        violation_rate = (violation_tests / total_tests * 100) if total_tests > 0 else 0.0
+        
+        # 분석 기간 계산
+        dates = batch.column('input_datetime')
+        dates = dates[~np.isnat(dates)]
+        if len(dates):
+            min_date = pd.Timestamp(dates.min()).strftime('%Y.%m.%d')
+            max_date = pd.Timestamp(dates.max()).strftime('%Y.%m.%d')
+            analysis_period = f"{min_date} – {max_date} 분석"
+        else:
+            analysis_period = "분석 기간 정보 없음"
+        
+        def summarize(field: str) -> dict:
+            totals = batch.value_counts(field)
+            violations = batch.value_counts(field, violation_mask)
+            return {
+                key: {
+                    'total': total,
+                    'violation': violations.get(key, 0),
+                    'rate': violations.get(key, 0) / total * 100 if total > 0 else 0.0
+                }
+                for key, total in totals.items()
+            }
+        
+        return cls(
+            project_name=project_name,
+            analysis_period=analysis_period,
+            total_samples=batch.nunique('sample_name'),
+            total_tests=total_tests,
+            violation_tests=violation_tests,
+            violation_samples=batch.nunique('sample_name', violation_mask),
+            violation_rate=violation_rate,
+            test_items_summary=summarize('test_item'),
+            sample_summary=summarize('sample_name')
+        )
+
+# 입력일시/승인요청일시 문자열 형식 (parse_datetime 시도 순서)
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M",   # "2025-01-23 09:56" 형태
+    "%Y-%m-%d",         # "2025-01-23" 형태
+    "%Y/%m/%d %H:%M",   # "2025/01/23 09:56" 형태
+    "%Y/%m/%d",         # "2025/01/23" 형태
+)
+
+# 컬럼 단위 파싱 시 주 형식 판별에 사용하는 표본 크기
+DATETIME_SAMPLE_SIZE = 200
+
+
 def parse_datetime(date_str) -> Optional[datetime]:
     """날짜 문자열을 datetime 객체로 변환"""
     if not date_str or pd.isna(date_str) or str(date_str).strip() == '':
@@ -196,23 +524,166 @@ def parse_datetime(date_str) -> Optional[datetime]:
     # 문자열로 변환
     date_str = str(date_str).strip()
     
-    try:
-        # "2025-01-23 09:56" 형태
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M")
-    except ValueError:
+    for date_format in DATETIME_FORMATS:
         try:
-            # "2025-01-23" 형태
-            return datetime.strptime(date_str, "%Y-%m-%d")
+            return datetime.strptime(date_str, date_format)
         except ValueError:
-            try:
-                # "2025/01/23 09:56" 형태
-                return datetime.strptime(date_str, "%Y/%m/%d %H:%M")
-            except ValueError:
-                try:
-                    # "2025/01/23" 형태
-                    return datetime.strptime(date_str, "%Y/%m/%d")
-                except ValueError:
-                    return None
+            continue
+    return None
+
+
+def _to_ns_array(parsed: pd.Series) -> np.ndarray:
+    """datetime Series → datetime64[ns] 배열 (ns 범위를 벗어난 값은 NaT)"""
+    in_range = (parsed >= pd.Timestamp.min) & (parsed <= pd.Timestamp.max)
+    return parsed.where(in_range).to_numpy(dtype='datetime64[ns]')
+
+
+def parse_datetime_series(values, sample_size: int = DATETIME_SAMPLE_SIZE) -> np.ndarray:
+    """일시 컬럼 전체를 datetime64[ns] 배열로 변환 (해석 불가 값은 NaT)
+    
+    표본에서 많이 쓰인 형식 순으로 컬럼 전체를 한 번씩 벡터 변환하고,
+    어느 형식에도 맞지 않은 나머지 값만 parse_datetime으로 행 단위 처리한다.
+    결과는 parse_datetime을 행마다 적용한 것과 같다.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    if pd.api.types.is_datetime64_dtype(series.dtype):
+        return series.to_numpy(dtype='datetime64[ns]')
+    
+    raw = series.to_numpy(dtype=object)
+    result = np.full(len(raw), np.datetime64('NaT'), dtype='datetime64[ns]')
+    if len(raw) == 0:
+        return result
+    
+    # datetime 객체는 그대로 사용
+    is_datetime = np.fromiter((isinstance(value, datetime) for value in raw), dtype=bool, count=len(raw))
+    if is_datetime.any():
+        result[is_datetime] = _to_ns_array(pd.to_datetime(pd.Series(raw[is_datetime]), errors='coerce'))
+    
+    # 나머지는 문자열로 변환 후 형식별 벡터 파싱 (빈 값은 NaT 유지)
+    pending_mask = ~is_datetime & ~pd.isna(raw)
+    text = pd.Series(raw[pending_mask], dtype=object).astype(str).str.strip()
+    pending_index = np.flatnonzero(pending_mask)
+    non_empty = (text != '').to_numpy()
+    text, pending_index = text[non_empty], pending_index[non_empty]
+    if len(text) == 0:
+        return result
+    
+    # 표본에서 성공 건수가 많은 형식부터 적용
+    sample = text.iloc[:sample_size]
+    hits = {
+        date_format: int(pd.to_datetime(sample, format=date_format, errors='coerce').notna().sum())
+        for date_format in DATETIME_FORMATS
+    }
+    ranked = sorted((f for f in DATETIME_FORMATS if hits[f] > 0), key=lambda f: -hits[f])
+    
+    for date_format in ranked:
+        parsed = pd.to_datetime(text, format=date_format, errors='coerce')
+        matched = parsed.notna().to_numpy()
+        if matched.any():
+            result[pending_index[matched]] = _to_ns_array(parsed[matched])
+            text, pending_index = text[~matched], pending_index[~matched]
+        if len(text) == 0:
+            return result
+    
+    # 표본에 없던 형식 등 남은 값만 행 단위 처리
+    for index, value in zip(pending_index, text.tolist()):
+        parsed_value = parse_datetime(value)
+        # datetime64[ns] 범위 밖의 일시는 NaT
+        if parsed_value is not None and pd.Timestamp.min <= parsed_value <= pd.Timestamp.max:
+            result[index] = np.datetime64(parsed_value, 'ns')
+    return result
+
+
+def datetime_array_to_objects(values: np.ndarray) -> np.ndarray:
+    """datetime64 배열 → datetime 객체 배열 (NaT는 None)"""
+    out = pd.DatetimeIndex(values).to_pydatetime().astype(object)
+    out[np.isnat(values)] = None
+    return out
+
+
+class DetectionStatus(IntEnum):
+    """결과(성적서) 검출 상태 코드"""
+    DETECTED = 0        # 수치 결과
+    NOT_DETECTED = 1    # 불검출, N.D.
+    BELOW_LOQ = 2       # 정량한계 미만 (<0.001, 0.001 미만 등)
+    NON_NUMERIC = 3     # 빈 값 또는 해석할 수 없는 값
+
+
+# 결과(성적서) 문자열 판정 패턴
+_NOT_DETECTED_RE = re.compile(r'불검출|^\s*N\.?\s*D\.?\s*$', re.IGNORECASE)
+_BELOW_LOQ_RE = re.compile(r'^\s*[<＜]|미만|LOQ', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class DecodedResults:
+    """결과(성적서) 해석 결과 (행 단위 배열)"""
+    value: np.ndarray    # float64 수치 (검출이 아니면 NaN)
+    status: np.ndarray   # int8 DetectionStatus 코드
+    display: np.ndarray  # 화면 표시용 문자열 (object)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def detected(self) -> np.ndarray:
+        """검출(수치) 결과 마스크"""
+        return self.status == DetectionStatus.DETECTED
+
+
+def decode_result_value(value) -> Tuple[Optional[float], DetectionStatus, str]:
+    """결과(성적서) 값 하나 해석 → (수치 또는 None, 검출 상태, 표시 문자열)"""
+    if isinstance(value, str):
+        if _NOT_DETECTED_RE.search(value):
+            return None, DetectionStatus.NOT_DETECTED, "불검출" if "불검출" in value else value
+        if _BELOW_LOQ_RE.search(value):
+            return None, DetectionStatus.BELOW_LOQ, value
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None, DetectionStatus.NON_NUMERIC, str(value)
+    if number != number:
+        return None, DetectionStatus.NON_NUMERIC, str(value)
+    return number, DetectionStatus.DETECTED, str(value)
+
+
+def decode_result_values(values) -> DecodedResults:
+    """결과(성적서) 컬럼 전체를 한 번에 해석 (decode_result_value와 동일한 규칙)
+
+    수치 값은 배열 단위로 변환하고, 문자열은 고유값마다 한 번만 해석해 펼친다.
+    """
+    raw = values.to_numpy(dtype=object) if isinstance(values, pd.Series) else np.asarray(values, dtype=object)
+    raw = raw.reshape(-1)
+    size = len(raw)
+
+    value = np.full(size, np.nan)
+    status = np.full(size, DetectionStatus.NON_NUMERIC, dtype=np.int8)
+    display = np.empty(size, dtype=object)
+
+    is_text = np.fromiter((isinstance(item, str) for item in raw), dtype=bool, count=size)
+
+    # 수치/빈 값: 배열 단위 변환
+    others = np.flatnonzero(~is_text)
+    if len(others):
+        numbers = pd.to_numeric(pd.Series(raw[others], dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+        detected = ~np.isnan(numbers)
+        value[others[detected]] = numbers[detected]
+        status[others[detected]] = DetectionStatus.DETECTED
+        display[others] = [str(item) for item in raw[others]]
+
+    # 문자열: 고유값 단위 해석 ("불검출" 등 반복 값이 대부분)
+    texts = np.flatnonzero(is_text)
+    if len(texts):
+        codes, uniques = pd.factorize(raw[texts])
+        decoded = [decode_result_value(item) for item in uniques]
+        unique_values = np.array([np.nan if number is None else number for number, _, _ in decoded], dtype=np.float64)
+        unique_status = np.array([code for _, code, _ in decoded], dtype=np.int8)
+        unique_display = np.empty(len(decoded), dtype=object)
+        unique_display[:] = [text for _, _, text in decoded]
+        value[texts] = unique_values[codes]
+        status[texts] = unique_status[codes]
+        display[texts] = unique_display[codes]
+
+    return DecodedResults(value, status, display)
+
 
 def clean_numeric_value(value) -> Union[float, int, None]:
     """수치값 정리 (NaN, 빈 문자열 등 처리)"""
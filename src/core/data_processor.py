@@ -6,11 +6,21 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from pathlib import Path
 import logging
-from src.core.data_models import TestResult, Standard, ProjectSummary, parse_datetime, clean_numeric_value
-from src.utils.performance_optimizer import optimize_performance, cache_result, global_optimizer
+from src.core.data_models import (
+    TestResult, CompactTestResult, TestResultBatch, Standard, ProjectSummary, TEST_RESULT_FIELDS, DATETIME_FIELDS,
+    parse_datetime, clean_numeric_value
+)
+from src.core.column_plan import (
+    ColumnPlan, FIELD_ALIASES, LIMS_COLUMNS, RAW_FIELDS, apply_read_dtypes, convert_datetime_series, convert_series,
+    convert_value, read_dtypes, restore_numeric_text
+)
+from src.core.parse_cache import ParseCache, content_key, file_key
+from src.utils.performance_optimizer import optimize_performance, cache_result, global_optimizer, log_memory_usage
+from src.utils.header_schema_cache import header_schema_cache
+from src.utils.upload_session import UploadSession
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -19,55 +29,93 @@ logger = logging.getLogger(__name__)
 class DataProcessor:
     """실험실 데이터 처리 클래스"""
     
-    # 실제 엑셀 컬럼명 매핑 (줄바꿈 포함)
-    COLUMN_MAPPING = {
-        'No.': 'no',
-        '시료명': 'sample_name',
-        '분석번호': 'analysis_number',
-        '시험항목': 'test_item',
-        '시험단위': 'test_unit',
-        '결과(성적서)': 'result_report',
-        '시험자입력값': 'tester_input_value',
-        '기준대비 초과여부 (성적서)': 'standard_excess',
-        '기준대비 초과여부\n(성적서)': 'standard_excess',  # 줄바꿈 버전
-        '시험자': 'tester',
-        '시험표준': 'test_standard',
-        '기준': 'standard_criteria',
-        '기준 텍스트': 'standard_criteria',  # 실제 컬럼명
-        '텍스트 자리수': 'text_digits',
-        '자리수\n처리방식': 'text_digits',  # 줄바꿈 버전
-        '처리방식': 'processing_method',
-        '시험결과 표시자리수': 'result_display_digits',
-        '시험결과\n표시자리수': 'result_display_digits',  # 줄바꿈 버전
-        '결과유형': 'result_type',
-        '시험자그룹': 'tester_group',
-        '입력일시': 'input_datetime',
-        '승인요청여부': 'approval_request',
-        '승인요청일시': 'approval_request_datetime',
-        '시험결과 표시한계 (정량한계)(성적서)': 'test_result_display_limit',
-        '시험결과 표시한계\n(정량한계)(성적서)': 'test_result_display_limit',  # 줄바꿈 버전
-        '정량한계미만처리 (성적서)': 'quantitative_limit_processing',
-        '정량한계미만처리\n(성적서)': 'quantitative_limit_processing',  # 줄바꿈 버전
-        '시험기기 (RDMS)': 'test_equipment',
-        '시험기기\n(RDMS)': 'test_equipment',  # 줄바꿈 버전
-        '판정 여부': 'judgment_status',
-        '성적서 출력여부': 'report_output',
-        '성적서\n출력여부': 'report_output',  # 줄바꿈 버전
-        'KOLAS 여부': 'kolas_status',
-        '시험소그룹': 'test_lab_group',
-        '시험Set': 'test_set'
-    }
+    # 실제 엑셀 컬럼명 매핑 (줄바꿈 포함, 읽기 dtype 계획과 공유)
+    COLUMN_MAPPING = LIMS_COLUMNS
+    
+    # 변환 규칙(컬럼 매핑, 값 변환)이 바뀌면 올려서 기존 파싱 캐시를 무효화
+    PARSER_VERSION = "2"
     
-    def __init__(self):
+    def __init__(self, compact_results: bool = False, parse_cache: Optional[ParseCache] = None):
         self.standards_cache = {}  # 기준값 캐시
         self.performance_optimizer = global_optimizer
+        # compact_results=True이면 슬롯/인터닝 기반 CompactTestResult 생성 (세션 메모리 절감)
+        self.result_class = CompactTestResult if compact_results else TestResult
+        # 파일 내용 해시 기반 파싱 결과 디스크 캐시 (None이면 사용 안 함)
+        self.parse_cache = parse_cache
+    
+    def _cached_results(self, key: Optional[str], as_batch: bool):
+        """파싱 캐시 조회 (없으면 None)"""
+        if key is None:
+            return None
+        batch = self.parse_cache.get(key)
+        if batch is None:
+            return None
+        logger.info(f"파싱 캐시 적중: {len(batch)}개 결과")
+        return batch if as_batch else batch.to_test_results(self.result_class)
+    
+    def _store_results(self, key: Optional[str], test_results, source_name: Optional[str] = None):
+        """파싱 결과를 캐시에 저장"""
+        if key is not None:
+            self.parse_cache.put(key, TestResultBatch.from_test_results(test_results), source_name)
+    
+    def parse_excel_bytes(self, content: bytes, file_name: Optional[str] = None,
+                          as_batch: bool = False) -> Union[List[TestResult], TestResultBatch]:
+        """업로드된 엑셀 파일 내용을 파싱 (같은 내용은 파싱 캐시에서 반환)"""
+        return self.parse_upload(UploadSession(content, file_name or 'upload.xlsx'), as_batch=as_batch)
+    
+    def parse_upload(self, session: UploadSession,
+                     as_batch: bool = False) -> Union[List[TestResult], TestResultBatch]:
+        """업로드 세션 파싱 (검증 단계에서 이미 디코딩한 DataFrame 재사용, 같은 내용은 파싱 캐시에서 반환)"""
+        key = content_key(session.content, self.PARSER_VERSION) if self.parse_cache else None
+        cached = self._cached_results(key, as_batch)
+        if cached is not None:
+            return cached
         
+        test_results = self.process_excel_data(self.upload_frame(session), as_batch=True)
+        self._store_results(key, test_results, session.name)
+        return test_results if as_batch else test_results.to_test_results(self.result_class)
+    
+    def parse_csv_bytes(self, content: bytes, file_name: Optional[str] = None,
+                        as_batch: bool = False) -> Union[List[TestResult], TestResultBatch]:
+        """업로드된 CSV 파일 내용을 파싱 (인코딩 자동 판별, 같은 내용은 파싱 캐시에서 반환)"""
+        return self.parse_upload(UploadSession(content, file_name or 'upload.csv'), as_batch=as_batch)
+    
+    def parse_csv_file(self, file_path: Union[str, Path],
+                       as_batch: bool = False) -> Union[List[TestResult], TestResultBatch]:
+        """CSV 파일을 파싱 (인코딩 자동 판별, 멀티스레드 CSV 파서 사용)"""
+        logger.info(f"CSV 파일 파싱 시작: {file_path}")
+        return self.parse_upload(UploadSession.from_path(file_path), as_batch=as_batch)
+    
+    def upload_frame(self, session: UploadSession) -> pd.DataFrame:
+        """업로드 세션 → 변환 입력 DataFrame
+        
+        CSV는 모든 컬럼을 문자열로 읽으므로 원본 유지 필드(결과)의 수치 값만
+        엑셀과 같이 float로 복원한다. 수치/일시 필드는 컬럼 단위 변환에서 처리된다.
+        """
+        df = session.frame
+        if not session.is_csv:
+            return df
+        
+        plan = self.build_column_plan(df.columns)
+        restored = {}
+        for field in RAW_FIELDS:
+            resolution = plan.resolutions[field]
+            for column in {resolution.exact, resolution.partial} - {None}:
+                restored[column] = restore_numeric_text(df[column])
+        return df.assign(**restored) if restored else df
+    
     @optimize_performance("parse_excel_file")
     def parse_excel_file(self, file_path: str) -> List[TestResult]:
         """엑셀 파일을 파싱하여 TestResult 리스트 반환 (성능 최적화 적용)"""
         try:
             logger.info(f"파일 파싱 시작: {file_path}")
             
+            # 같은 내용의 파일을 이미 파싱했으면 캐시에서 반환
+            key = file_key(file_path, self.PARSER_VERSION) if self.parse_cache else None
+            cached = self._cached_results(key, as_batch=False)
+            if cached is not None:
+                return cached
+            
             # 파일 크기 확인
             file_size = Path(file_path).stat().st_size / 1024 / 1024  # MB
             logger.info(f"파일 크기: {file_size:.1f}MB")
@@ -75,13 +123,13 @@ class DataProcessor:
             # 대용량 파일인 경우 청크 처리
             if file_size > 10:  # 10MB 이상
                 logger.info("대용량 파일 감지 - 청크 처리 모드")
-                return self._parse_large_file_chunked(file_path)
+                test_results = self._parse_large_file_chunked(file_path)
+                self._store_results(key, test_results, Path(file_path).name)
+                return test_results
             
-            # 일반 파일 처리
-            df = pd.read_excel(file_path, sheet_name=0)
-            
-            # 메모리 최적화
-            df = self.performance_optimizer.optimize_dataframe_memory(df)
+            # 일반 파일 처리 (읽기 시점 dtype 계획 적용)
+            df = apply_read_dtypes(pd.read_excel(file_path, sheet_name=0, dtype=read_dtypes()))
+            log_memory_usage(df, "업로드 DataFrame")
             
             logger.info(f"데이터 행 수: {len(df)}")
             logger.info(f"컬럼 수: {len(df.columns)}")
@@ -94,6 +142,7 @@ class DataProcessor:
             
             # TestResult 객체 리스트 생성 (벡터화 처리)
             test_results = self._convert_dataframe_to_test_results(df)
+            self._store_results(key, test_results, Path(file_path).name)
             
             logger.info(f"파싱 완료: {len(test_results)}개 결과")
             return test_results
@@ -103,11 +152,17 @@ class DataProcessor:
             raise
     
     def _parse_large_file_chunked(self, file_path: str) -> List[TestResult]:
-        """대용량 파일 청크 처리"""
+        """대용량 파일 청크 처리 (읽기 전용 스트리밍 - 청크 크기만큼만 메모리에 유지)"""
+        column_plans = {}
+
         def process_chunk(chunk_df):
-            # 메모리 최적화
-            chunk_df = self.performance_optimizer.optimize_dataframe_memory(chunk_df)
-            return self._convert_dataframe_to_test_results(chunk_df)
+            # 컬럼 매핑 계획은 헤더가 같으면 재사용
+            header = tuple(chunk_df.columns)
+            if header not in column_plans:
+                column_plans[header] = self.build_column_plan(chunk_df.columns)
+            # 스트리밍 청크에도 같은 dtype 계획 적용
+            chunk_df = apply_read_dtypes(chunk_df)
+            return self._convert_dataframe_to_test_results(chunk_df, column_plans[header])
         
         def combine_results(results_list):
             combined = []
@@ -119,102 +174,114 @@ class DataProcessor:
             file_path, process_chunk, combine_results
         )
     
-    @optimize_performance("convert_dataframe_to_test_results")
-    def _convert_dataframe_to_test_results(self, df: pd.DataFrame) -> List[TestResult]:
-        """DataFrame을 TestResult 리스트로 변환 (벡터화 처리)"""
-        test_results = []
+    def build_column_plan(self, columns) -> ColumnPlan:
+        """헤더 → TestResult 필드 매핑 계획 생성 (같은 헤더는 헤더 스키마 캐시에서 재사용)"""
+        columns = tuple(columns)
+        spec, cached = header_schema_cache.get_or_compute(
+            f"column_plan:{ColumnPlan.SPEC_VERSION}", columns,
+            lambda: ColumnPlan.from_columns(columns).to_spec()
+        )
+        plan = ColumnPlan.from_spec(columns, spec)
+        if not cached:
+            logger.info(f"컬럼 매핑 계획: {plan.to_dict()}")
+        return plan
+    
+    def _convert_dataframe_to_columns(self, df: pd.DataFrame,
+                                      column_plan: Optional[ColumnPlan] = None,
+                                      datetime_arrays: bool = False) -> Dict[str, np.ndarray]:
+        """DataFrame을 TestResult 필드별 값 배열로 변환 (컬럼 단위 벡터화 처리)
         
-        # 병렬 처리를 위한 청크 분할
-        if len(df) > 1000:
-            def process_chunk(chunk_df):
-                chunk_results = []
-                for _, row in chunk_df.iterrows():
-                    try:
-                        test_result = self._row_to_test_result(row)
-                        if test_result:
-                            chunk_results.append(test_result)
-                    except Exception as e:
-                        logger.warning(f"행 변환 실패: {e}")
-                        continue
-                return chunk_results
-            
-            def combine_results(results_list):
-                combined = []
-                for results in results_list:
-                    combined.extend(results)
-                return combined
-            
-            test_results = self.performance_optimizer.chunked_processor.process_dataframe_chunks(
-                df, process_chunk, combine_results
-            )
-        else:
-            # 소량 데이터는 순차 처리
-            for index, row in df.iterrows():
-                try:
-                    test_result = self._row_to_test_result(row)
-                    if test_result:
-                        test_results.append(test_result)
-                except Exception as e:
-                    logger.warning(f"행 {index} 파싱 실패: {e}")
-                    continue
+        datetime_arrays=True이면 일시 필드를 datetime 객체 대신 datetime64[ns] 배열로 반환
+        """
+        plan = column_plan or self.build_column_plan(df.columns)
         
-        return test_results
-    
-    def validate_data_structure(self, df: pd.DataFrame) -> Dict:
-        """데이터 구조 검증 (유연한 컬럼명 매칭)"""
-        errors = []
-        warnings = []
+        # 필드별로 컬럼 전체를 한 번에 변환
+        columns = {}
+        for field in FIELD_ALIASES:
+            if datetime_arrays and field in DATETIME_FIELDS:
+                columns[field] = convert_datetime_series(plan.resolve(df, field), len(df))
+            else:
+                columns[field] = convert_series(field, plan.resolve(df, field), len(df))
         
-        # 실제 컬럼명 로깅
-        logger.info(f"업로드된 파일의 컬럼명: {list(df.columns)}")
+        # 시료명/시험항목이 없는 행 제외
+        valid = (columns['sample_name'] != '') & (columns['test_item'] != '')
+        if not valid.all():
+            logger.warning(f"시료명 또는 시험항목이 없는 {int((~valid).sum())}개 행 제외")
+            columns = {field: values[valid] for field, values in columns.items()}
         
-        # 필수 컬럼 패턴 정의 (유연한 매칭)
-        required_patterns = {
-            '시료명': ['시료명', '시료', 'sample', 'Sample Name', '샘플명', '샘플'],
-            '시험항목': ['시험항목', '항목', '시험', 'test', 'Test Item', '분석항목', '검사항목'],
-            '결과': ['결과(성적서)', '결과', 'result', 'Result', '측정값', '분석결과', '시험결과'],
-            '시험자': ['시험자', '분석자', '검사자', 'tester', 'Tester', '담당자', '실험자']
-        }
+        return columns
+    
+    @optimize_performance("convert_dataframe_to_test_results")
+    def _convert_dataframe_to_test_results(self, df: pd.DataFrame,
+                                           column_plan: Optional[ColumnPlan] = None) -> List[TestResult]:
+        """DataFrame을 TestResult 리스트로 변환 (컬럼 단위 벡터화 처리)"""
+        if len(df) == 0:
+            return []
         
-        # 컬럼 매칭 결과
-        matched_columns = {}
+        columns = self._convert_dataframe_to_columns(df, column_plan)
+        field_order = [columns[field].tolist() for field in TEST_RESULT_FIELDS]
+        result_class = self.result_class
+        return [result_class(*values) for values in zip(*field_order)]
+    
+    @optimize_performance("convert_dataframe_to_batch")
+    def convert_dataframe_to_batch(self, df: pd.DataFrame,
+                                   column_plan: Optional[ColumnPlan] = None) -> TestResultBatch:
+        """DataFrame을 컬럼형 TestResultBatch로 변환 (TestResult 객체 생성 없음)"""
+        if len(df) == 0:
+            return TestResultBatch.from_test_results([])
+        return TestResultBatch.from_columns(self._convert_dataframe_to_columns(df, column_plan, datetime_arrays=True))
+    
+    # 헤더 검증 규칙 버전 (규칙을 바꾸면 올려서 헤더 스키마 캐시 무효화)
+    HEADER_VALIDATION_VERSION = "1"
+    
+    # 필수 컬럼 패턴 정의 (유연한 매칭)
+    REQUIRED_COLUMN_PATTERNS = {
+        '시료명': ['시료명', '시료', 'sample', 'Sample Name', '샘플명', '샘플'],
+        '시험항목': ['시험항목', '항목', '시험', 'test', 'Test Item', '분석항목', '검사항목'],
+        '결과': ['결과(성적서)', '결과', 'result', 'Result', '측정값', '분석결과', '시험결과'],
+        '시험자': ['시험자', '분석자', '검사자', 'tester', 'Tester', '담당자', '실험자']
+    }
+    
+    def _validate_header(self, columns: Tuple) -> Dict:
+        """헤더만으로 결정되는 검증 결과 (헤더 스키마 캐시 대상, 컬럼은 인덱스로 기록)"""
+        errors = []
+        lowered = [str(col).lower() for col in columns]
+        
+        # 컬럼 매칭 결과 (필수 키 → 컬럼 인덱스)
+        matched = {}
         
-        for required_key, patterns in required_patterns.items():
-            matched = False
+        for required_key, patterns in self.REQUIRED_COLUMN_PATTERNS.items():
             for pattern in patterns:
-                # 대소문자 구분 없이 부분 매칭
-                matching_cols = [col for col in df.columns if pattern.lower() in col.lower()]
-                if matching_cols:
-                    matched_columns[required_key] = matching_cols[0]  # 첫 번째 매칭 컬럼 사용
-                    matched = True
-                    logger.info(f"'{required_key}' 매칭됨: {matching_cols[0]}")
+                # 대소문자 구분 없이 부분 매칭 (첫 번째 매칭 컬럼 사용)
+                needle = pattern.lower()
+                index = next((i for i, low in enumerate(lowered) if needle in low), None)
+                if index is not None:
+                    matched[required_key] = index
                     break
             
-            if not matched:
+            if required_key not in matched:
                 # 정확히 일치하는 컬럼 찾기
-                exact_matches = [col for col in df.columns if col in patterns]
-                if exact_matches:
-                    matched_columns[required_key] = exact_matches[0]
-                    matched = True
-                    logger.info(f"'{required_key}' 정확 매칭됨: {exact_matches[0]}")
+                index = next((i for i, col in enumerate(columns) if col in patterns), None)
+                if index is not None:
+                    matched[required_key] = index
         
         # 누락된 필수 컬럼 확인
-        missing_required = [key for key in required_patterns.keys() if key not in matched_columns]
+        missing_required = [key for key in self.REQUIRED_COLUMN_PATTERNS if key not in matched]
         
         if missing_required:
             # 사용 가능한 컬럼 제안
-            available_cols = list(df.columns)[:10]  # 처음 10개 컬럼만 표시
+            available_cols = list(columns)[:10]  # 처음 10개 컬럼만 표시
             errors.append(f"필수 컬럼을 찾을 수 없습니다: {missing_required}")
             errors.append(f"사용 가능한 컬럼: {available_cols}")
             
             # 유사한 컬럼명 제안
             suggestions = {}
             for missing in missing_required:
-                patterns = required_patterns[missing]
+                patterns = [pattern.lower() for pattern in self.REQUIRED_COLUMN_PATTERNS[missing]]
                 similar_cols = []
-                for col in df.columns:
+                for col, low in zip(columns, lowered):
                     for pattern in patterns:
-                        if pattern.lower() in col.lower() or col.lower() in pattern.lower():
+                        if pattern in low or low in pattern:
                             similar_cols.append(col)
                 if similar_cols:
                     suggestions[missing] = similar_cols[:3]  # 최대 3개 제안
@@ -222,6 +289,29 @@ class DataProcessor:
             if suggestions:
                 errors.append(f"유사한 컬럼명 제안: {suggestions}")
         
+        return {'matched': matched, 'missing_required': missing_required, 'errors': errors}
+    
+    def validate_data_structure(self, df: pd.DataFrame) -> Dict:
+        """데이터 구조 검증 (유연한 컬럼명 매칭)
+        
+        헤더 매칭/제안은 헤더 지문별로 한 번만 계산하고(헤더 스키마 캐시),
+        행 수/빈 값 검사만 파일마다 수행한다.
+        """
+        warnings = []
+        columns = tuple(df.columns)
+        
+        # 실제 컬럼명 로깅
+        logger.info(f"업로드된 파일의 컬럼명: {list(columns)}")
+        
+        header, cached = header_schema_cache.get_or_compute(
+            f"validate_data_structure:{self.HEADER_VALIDATION_VERSION}", columns,
+            lambda: self._validate_header(columns)
+        )
+        matched_columns = {key: columns[index] for key, index in header['matched'].items()}
+        missing_required = header['missing_required']
+        errors = list(header['errors'])
+        logger.info(f"필수 컬럼 매칭{' (캐시)' if cached else ''}: {matched_columns}")
+        
         # 데이터 행 수 확인
         if len(df) == 0:
             errors.append("데이터가 없습니다")
@@ -248,57 +338,21 @@ class DataProcessor:
             'available_columns': list(df.columns)
         }
     
-    def _row_to_test_result(self, row: pd.Series) -> Optional[TestResult]:
+    def _row_to_test_result(self, row: pd.Series,
+                            column_plan: Optional[ColumnPlan] = None) -> Optional[TestResult]:
         """DataFrame 행을 TestResult 객체로 변환 (유연한 컬럼명 매칭)"""
         try:
-            # 컬럼명 매칭 함수
-            def find_column_value(row, *possible_names):
-                """여러 가능한 컬럼명 중에서 값을 찾아 반환"""
-                for name in possible_names:
-                    if name in row.index and not pd.isna(row.get(name)):
-                        return row.get(name)
-                    # 부분 매칭도 시도
-                    for col in row.index:
-                        if name.lower() in col.lower():
-                            return row.get(col)
-                return None
+            plan = column_plan or ColumnPlan.from_columns(row.index)
+            values = {
+                field: convert_value(field, plan.resolve_row(row, field))
+                for field in TEST_RESULT_FIELDS
+            }
             
-            # 필수 필드 확인 (유연한 매칭)
-            sample_name = find_column_value(row, '시료명', '시료', 'sample', 'Sample Name', '샘플명', '샘플')
-            test_item = find_column_value(row, '시험항목', '항목', '시험', 'test', 'Test Item', '분석항목', '검사항목')
-            
-            if not sample_name or not test_item:
+            # 필수 필드 확인
+            if not values['sample_name'] or not values['test_item']:
                 return None
             
-            return TestResult(
-                no=clean_numeric_value(find_column_value(row, 'No.', 'no', '번호', 'number') or 0),
-                sample_name=str(sample_name or '').strip(),
-                analysis_number=str(find_column_value(row, '분석번호', '분석 번호', 'analysis', 'Analysis Number') or '').strip(),
-                test_item=str(test_item or '').strip(),
-                test_unit=str(find_column_value(row, '시험단위', '단위', 'unit', 'Unit') or '').strip(),
-                result_report=find_column_value(row, '결과(성적서)', '결과', 'result', 'Result', '측정값', '분석결과', '시험결과') or '',
-                tester_input_value=clean_numeric_value(find_column_value(row, '시험자입력값', '입력값', 'input', 'Input Value') or 0),
-                standard_excess=str(find_column_value(row, '기준대비 초과여부\n(성적서)', '기준대비 초과여부 (성적서)', '기준대비 초과여부', '판정', '적합성', 'judgment') or '-').strip(),
-                tester=str(find_column_value(row, '시험자', '분석자', '검사자', 'tester', 'Tester', '담당자', '실험자') or '').strip(),
-                test_standard=str(find_column_value(row, '시험표준', '표준', 'standard', 'Standard', '방법') or '').strip(),
-                standard_criteria=str(find_column_value(row, '기준 텍스트', '기준', 'criteria', 'Criteria', '허용기준') or '').strip(),
-                text_digits=str(find_column_value(row, '자리수\n처리방식', '텍스트 자리수', '자리수', 'digits') or '').strip(),
-                processing_method=str(find_column_value(row, '처리방식', '방식', 'method', 'Method') or '').strip(),
-                result_display_digits=clean_numeric_value(find_column_value(row, '시험결과\n표시자리수', '시험결과 표시자리수', '표시자리수') or 2),
-                result_type=str(find_column_value(row, '결과유형', '유형', 'type', 'Type') or '').strip(),
-                tester_group=str(find_column_value(row, '시험자그룹', '그룹', 'group', 'Group') or '').strip(),
-                input_datetime=parse_datetime(find_column_value(row, '입력일시', '일시', 'datetime', 'Date Time', '날짜')),
-                approval_request=str(find_column_value(row, '승인요청여부', '승인요청', 'approval', 'Approval') or 'N').strip(),
-                approval_request_datetime=parse_datetime(find_column_value(row, '승인요청일시', '승인일시')),
-                test_result_display_limit=clean_numeric_value(find_column_value(row, '시험결과 표시한계\n(정량한계)(성적서)', '시험결과 표시한계 (정량한계)(성적서)', '표시한계', '정량한계') or 0),
-                quantitative_limit_processing=str(find_column_value(row, '정량한계미만처리\n(성적서)', '정량한계미만처리 (성적서)', '정량한계미만처리') or '').strip(),
-                test_equipment=str(find_column_value(row, '시험기기\n(RDMS)', '시험기기 (RDMS)', '시험기기', '기기', 'equipment') or '').strip(),
-                judgment_status=str(find_column_value(row, '판정 여부', '판정여부', '판정', 'judgment') or 'N').strip(),
-                report_output=str(find_column_value(row, '성적서\n출력여부', '성적서 출력여부', '출력여부', 'output') or 'N').strip(),
-                kolas_status=str(find_column_value(row, 'KOLAS 여부', 'KOLAS', 'kolas') or 'N').strip(),
-                test_lab_group=str(find_column_value(row, '시험소그룹', '시험소', 'lab', 'Lab') or '').strip(),
-                test_set=str(find_column_value(row, '시험Set', '시험세트', 'set', 'Set') or '').strip()
-            )
+            return self.result_class(**values)
         except Exception as e:
             logger.warning(f"행 변환 실패: {e}")
             return None
@@ -343,21 +397,30 @@ class DataProcessor:
         """시험자 목록 반환"""
         return list(set(result.tester for result in test_results if result.tester))
     
-    def process_excel_data(self, df: pd.DataFrame) -> List[TestResult]:
-        """DataFrame을 처리하여 TestResult 리스트 반환 (app.py에서 호출되는 메서드)"""
+    def process_excel_data(self, df: Union[pd.DataFrame, UploadSession],
+                           as_batch: bool = False) -> Union[List[TestResult], TestResultBatch]:
+        """DataFrame을 처리하여 TestResult 리스트 반환 (app.py에서 호출되는 메서드)
+        
+        as_batch=True이면 컬럼형 TestResultBatch로 반환
+        df 대신 UploadSession을 넘기면 세션에 캐시된 DataFrame을 사용
+        """
         try:
-            logger.info(f"DataFrame 처리 시작: {len(df)}행, {len(df.columns)}컬럼")
+            if isinstance(df, UploadSession):
+                df = self.upload_frame(df)
             
-            # 메모리 최적화
-            df = self.performance_optimizer.optimize_dataframe_memory(df)
+            logger.info(f"DataFrame 처리 시작: {len(df)}행, {len(df.columns)}컬럼")
+            log_memory_usage(df, "업로드 DataFrame")
             
             # 데이터 검증
             validation_result = self.validate_data_structure(df)
             if not validation_result['is_valid']:
                 raise ValueError(f"데이터 구조 검증 실패: {validation_result['errors']}")
             
-            # TestResult 객체 리스트 생성
-            test_results = self._convert_dataframe_to_test_results(df)
+            # TestResult 객체 리스트(또는 배치) 생성
+            if as_batch:
+                test_results = self.convert_dataframe_to_batch(df)
+            else:
+                test_results = self._convert_dataframe_to_test_results(df)
             
             logger.info(f"DataFrame 처리 완료: {len(test_results)}개 결과")
             return test_results
@@ -372,28 +435,23 @@ class DataProcessor:
         if not test_results:
             return pd.DataFrame()
         
-        # 벡터화된 데이터 변환
+        # 벡터화된 데이터 변환 (반복이 많은 컬럼은 생성 시점에 카테고리로)
         data = {
             '시료명': [result.sample_name for result in test_results],
             '분석번호': [result.analysis_number for result in test_results],
-            '시험항목': [result.test_item for result in test_results],
-            '시험단위': [result.test_unit for result in test_results],
+            '시험항목': pd.Categorical([result.test_item for result in test_results]),
+            '시험단위': pd.Categorical([result.test_unit for result in test_results]),
             '결과': [result.get_display_result() for result in test_results],
-            '판정': [result.standard_excess for result in test_results],
-            '시험자': [result.tester for result in test_results],
+            '판정': pd.Categorical([result.standard_excess for result in test_results]),
+            '시험자': pd.Categorical([result.tester for result in test_results]),
             '입력일시': [
                 result.input_datetime.strftime('%Y-%m-%d %H:%M') if result.input_datetime and hasattr(result.input_datetime, 'strftime') else str(result.input_datetime) if result.input_datetime else ''
                 for result in test_results
             ],
-            '기준': [result.standard_criteria for result in test_results]
+            '기준': pd.Categorical([result.standard_criteria for result in test_results])
         }
         
-        df = pd.DataFrame(data)
-        
-        # 메모리 최적화
-        df = self.performance_optimizer.optimize_dataframe_memory(df)
-        
-        return df
+        return pd.DataFrame(data)
 
 # 사용 예시 및 테스트 함수
 def test_data_processor():
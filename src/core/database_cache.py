@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+로드된 데이터베이스 캐시 (프로세스 전체 공유)
+JSON 데이터베이스는 조회할 때마다 파일 전체를 다시 읽고 파싱한다. 한 화면을
+그리는 동안 get_all_files/get_files_by_period/get_file_by_id가 여러 번 불리고,
+Streamlit 세션마다 DatabaseManager가 따로 있으므로 같은 파일을 몇 번씩 파싱하게 된다.
+
+파싱 결과를 경로별로 하나만 두고 다음 두 가지로 유효성을 확인한다.
+- 파일 서명: 대상 파일들의 (mtime_ns, 크기, inode) - 다른 프로세스가 쓴 변경 감지
+- 세대 번호: 이 프로세스에서 쓸 때마다 증가 - mtime 해상도와 무관하게 즉시 무효화
+
+적중 시 비용은 stat() 몇 번이다. 캐시된 데이터는 모든 호출자가 공유하므로
+수정하면 안 된다 (수정이 필요하면 복사본을 만들어 저장 후 invalidate/store).
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# 파일 하나의 서명 (없는 파일은 None)
+FileSignature = Optional[Tuple[int, int, int]]
+
+
+def file_signature(path) -> FileSignature:
+    """(mtime_ns, 크기, inode) - os.replace로 교체되면 inode가 바뀌어 같은 틱 안의 교체도 감지"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class LoadedDatabaseCache:
+    """경로 → (세대, 파일 서명, 파싱된 데이터)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._entries: Dict[str, Tuple[int, Tuple[FileSignature, ...], Dict[str, Any]]] = {}
+        self._generations: Dict[str, int] = {}
+        # (경로, 이름) → (원본 데이터, 파생 구조)
+        self._derived: Dict[Tuple[str, str], Tuple[Dict[str, Any], Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path) -> str:
+        return str(Path(path).resolve())
+
+    @staticmethod
+    def signature(paths: Iterable) -> Tuple[FileSignature, ...]:
+        return tuple(file_signature(path) for path in paths)
+
+    def get(self, key: str, paths: Iterable, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """유효한 캐시 데이터 반환, 없거나 바뀌었으면 loader()로 다시 로드
+
+        같은 경로를 동시에 로드하면 한 번만 파싱하고 나머지는 그 결과를 공유한다.
+        서명은 로드 전에 읽으므로 로드 도중 파일이 바뀌면 다음 조회에서 다시 로드된다.
+        """
+        paths = tuple(paths)
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                generation = self._generations.get(key, 0)
+                entry = self._entries.get(key)
+            signature = self.signature(paths)
+            if entry is not None and entry[0] == generation and entry[1] == signature:
+                with self._lock:
+                    self.hits += 1
+                return entry[2]
+
+            data = loader()
+            with self._lock:
+                self.misses += 1
+                if self._generations.get(key, 0) == generation:
+                    self._entries[key] = (generation, signature, data)
+            return data
+
+    def derived(self, key: str, name: str, data: Dict[str, Any], builder: Callable[[Dict[str, Any]], Any]) -> Any:
+        """캐시된 data에서 만든 파생 구조 (인덱스 등) - data가 캐시에 있는 동안 재사용"""
+        with self._lock:
+            memo = self._derived.get((key, name))
+        if memo is not None and memo[0] is data:
+            return memo[1]
+        value = builder(data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is data:
+                self._derived[(key, name)] = (data, value)
+        return value
+
+    def store(self, key: str, signature: Tuple[FileSignature, ...], data: Dict[str, Any]) -> None:
+        """방금 쓴 내용을 캐시에 넣음
+
+        signature는 data를 읽기 전에 구한 서명이어야 하고 (그 사이 바뀌면 다음 조회에서 다시 로드),
+        data는 호출자가 더 이상 수정하지 않는 독립 사본이어야 한다.
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            self._entries[key] = (generation, signature, data)
+            self._drop_derived(key)
+
+    def invalidate(self, key: str) -> None:
+        """이 프로세스에서 쓴 뒤 호출 - 세대를 올려 진행 중인 로드 결과도 버리게 함"""
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.pop(key, None)
+            self._drop_derived(key)
+
+    def _drop_derived(self, key: str) -> None:
+        for derived_key in [derived_key for derived_key in self._derived if derived_key[0] == key]:
+            del self._derived[derived_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._entries.clear()
+            self._derived.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# DatabaseManager 인스턴스(세션) 전체가 공유하는 캐시
+shared_cache = LoadedDatabaseCache()
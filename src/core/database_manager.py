@@ -5,50 +5,236 @@
 
 import json
 import os
+import pandas as pd
 import sqlite3
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 import uuid
 
+try:
+    from src.core.data_models import DetectionStatus, TestResultBatch, decode_result_value
+except ImportError:
+    from data_models import DetectionStatus, TestResultBatch, decode_result_value
+
+try:
+    from src.core.incremental_ingest import analysis_prefixes
+except ImportError:
+    from incremental_ingest import analysis_prefixes
+
+try:
+    from src.core.sqlite_store import SQLiteStore
+except ImportError:
+    from sqlite_store import SQLiteStore
+
+try:
+    from src.core.json_journal import JsonJournal
+except ImportError:
+    from json_journal import JsonJournal
+
+try:
+    from src.core.row_shards import RowShardStore
+except ImportError:
+    from row_shards import RowShardStore
+
+try:
+    from src.core.database_cache import shared_cache
+except ImportError:
+    from database_cache import shared_cache
+
+try:
+    from src.core.rollups import ROLLUP_FIELD, DailyRollups, item_rollup
+except ImportError:
+    from rollups import ROLLUP_FIELD, DailyRollups, item_rollup
+
+try:
+    from src.core.time_index import TimeIndex
+except ImportError:
+    from time_index import TimeIndex
+
+try:
+    from src.core.search_index import SearchIndex
+except ImportError:
+    from search_index import SearchIndex
+
+try:
+    from src.core.parquet_archive import read_archive, read_manifest, write_archive
+except ImportError:
+    from parquet_archive import read_archive, read_manifest, write_archive
+
+try:
+    from src.core.result_query import (VALUE_SETS_FIELD, FileValueIndex, ResultPage, ResultQuery,
+                                       value_sets, with_file_context)
+except ImportError:
+    from result_query import (VALUE_SETS_FIELD, FileValueIndex, ResultPage, ResultQuery,
+                              value_sets, with_file_context)
+
+try:
+    from src.core.write_coordinator import (DEFAULT_WRITE_WINDOW, PendingChanges, WriteCoalescer,
+                                            shared_coalescer, shared_lock)
+except ImportError:
+    from write_coordinator import (DEFAULT_WRITE_WINDOW, PendingChanges, WriteCoalescer,
+                                   shared_coalescer, shared_lock)
+
+# 이 확장자의 경로는 SQLite 백엔드로 연다
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+# 앱(aqua_analytics_premium)의 데이터베이스 저장 폴더
+DEFAULT_DATABASE_FOLDER = Path("aqua_analytics_data") / "database"
+
+
 class DatabaseManager:
-    """데이터베이스 관리 클래스"""
+    """데이터베이스 관리 클래스
+    
+    backend가 "sqlite"이면 (기본값: 경로 확장자로 판단) SQLiteStore에 정규화된
+    테이블로 저장하고, 아니면 JSON 파일 하나에 저장한다. 공개 메서드는 같다.
+    JSON 백엔드에서 journal=True이면 변경을 전체 재작성 대신 저널에 덧붙이고,
+    shards=True이면 행은 파일별 압축 샤드에 두고 JSON에는 요약 인덱스만 둔다
+    (이때 load_database()는 행 없는 인덱스를 반환).
+    JSON 백엔드의 로드 결과는 프로세스 전체 캐시(shared_cache)를 공유하므로
+    load_database()와 조회 메서드가 반환한 레코드는 수정하지 않는다.
+    변경은 <db>.lock 파일 잠금 안에서 최신 내용을 읽어 적용하고 (여러 세션/프로세스의
+    동시 저장에서 변경 유실 방지), JSON 백엔드는 write_window초 안에 들어온 변경을
+    한 번의 저장으로 묶는다 (write_coordinator 참고).
+    """
     
-    def __init__(self, db_path: str = "data/analysis_database.json"):
+    def __init__(self, db_path: str = "data/analysis_database.json", backend: str = None,
+                 timeout: float = 30.0, journal: bool = False, shards: bool = False,
+                 write_window: float = DEFAULT_WRITE_WINDOW):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.backend = backend or ("sqlite" if self.db_path.suffix.lower() in SQLITE_SUFFIXES else "json")
+        self.store = SQLiteStore(self.db_path, timeout=timeout) if self.backend == "sqlite" else None
+        self.journal = JsonJournal(self.db_path) if journal and self.store is None else None
+        # 샤드가 있는 레코드는 shards 설정과 무관하게 읽을 수 있도록 항상 생성
+        self.row_shards = RowShardStore(self.db_path.parent / f"{self.db_path.stem}_shards")
+        self.shards = shards and self.store is None
+        # JSON 백엔드의 부분 문자열 검색 인덱스 보조 파일 (SQLite 백엔드는 저장소 안에 둠)
+        self.search_index = SearchIndex(self.db_path.parent / f"{self.db_path.stem}_search.db") \
+            if self.store is None else None
+        self.cache = shared_cache
+        self._cache_key = self.cache.key(self.db_path) + ("#journal" if self.journal is not None else "")
+        self._cache_paths = (self.db_path,) if self.journal is None else (self.db_path, self.journal.journal_path)
+        # 같은 프로세스의 인스턴스끼리는 경로별 잠금과 쓰기 병합기를 공유
+        self.write_lock = shared_lock(self.db_path.with_name(self.db_path.name + '.lock'), timeout)
+        self.writer = shared_coalescer(self._cache_key + ("#shards" if self.shards else ""),
+                                       lambda: WriteCoalescer(self.write_lock, write_window)) \
+            if self.store is None else None
         self.ensure_database_exists()
     
+    @staticmethod
+    def _empty_database() -> Dict[str, Any]:
+        return {
+            "files": {},
+            "reports": {},
+            "metadata": {
+                "created_at": datetime.now().isoformat(),
+                "version": "1.0"
+            }
+        }
+    
     def ensure_database_exists(self):
         """데이터베이스 파일이 존재하지 않으면 생성"""
+        if self.store is not None:
+            return  # 스키마는 SQLiteStore가 생성
         if not self.db_path.exists():
-            initial_data = {
-                "files": {},
-                "reports": {},
-                "metadata": {
-                    "created_at": datetime.now().isoformat(),
-                    "version": "1.0"
-                }
-            }
-            self.save_database(initial_data)
+            self.save_database(self._empty_database())
     
     def load_database(self) -> Dict[str, Any]:
-        """데이터베이스 로드"""
+        """데이터베이스 로드 (JSON은 파일이 그대로면 캐시된 데이터를 공유, 수정 금지)"""
+        if self.store is not None:
+            return self.store.load_all()
+        return self.cache.get(self._cache_key, self._cache_paths, self._read_database)
+    
+    def _read_database(self) -> Dict[str, Any]:
+        if self.journal is not None:
+            return self.journal.load(self._empty_database)
         try:
             with open(self.db_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except (FileNotFoundError, json.JSONDecodeError):
-            return {
-                "files": {},
-                "reports": {},
-                "metadata": {
-                    "created_at": datetime.now().isoformat(),
-                    "version": "1.0"
-                }
-            }
+            return self._empty_database()
+    
+    def _load_for_update(self) -> Dict[str, Any]:
+        """수정용 로드 - 캐시된 데이터는 공유되므로 최상위와 files 맵만 복사 (레코드는 교체만 함)"""
+        db = self.load_database()
+        return dict(db, files=dict(db.get("files", {})))
+    
+    def _journal_put(self, records: List[Dict[str, Any]]) -> None:
+        try:
+            self.journal.put(records)
+        finally:
+            self.cache.invalidate(self._cache_key)
+    
+    def _journal_delete(self, file_id: str) -> None:
+        try:
+            self.journal.delete(file_id)
+        finally:
+            self.cache.invalidate(self._cache_key)
+    
+    def _submit(self, mutation):
+        """파일 레코드 변경 함수를 쓰기 병합기로 커밋하고 그 반환값을 돌려줌 (JSON 백엔드)"""
+        return self.writer.submit(mutation, self._commit_changes)
+    
+    def _commit_changes(self, apply) -> None:
+        """쓰기 잠금 안에서 최신 내용을 읽어 모인 변경을 적용하고 한 번에 저장"""
+        db = self._load_for_update()
+        changes = PendingChanges(db["files"])
+        apply(changes)
+        if not changes:
+            return
+        full_records, deletes = changes.puts, changes.deletes
+        stored = [self.row_shards.split(record) for record in full_records] if self.shards else full_records
+        if self.journal is not None:
+            self._journal_put(stored)
+            for file_id in deletes:
+                self._journal_delete(file_id)
+        else:
+            for record in stored:
+                db["files"][record["file_id"]] = record
+            for file_id in deletes:
+                del db["files"][file_id]
+            if not self.save_database(db):
+                raise IOError(f"데이터베이스 저장 실패: {self.db_path}")
+        for file_id in deletes:
+            self.row_shards.delete(file_id)
+            self._search_delete(file_id)
+        self._search_put(full_records)
     
     def save_database(self, data: Dict[str, Any]) -> bool:
-        """데이터베이스 저장 (강화된 버전)"""
+        """데이터베이스 저장 (강화된 버전, 쓰기 잠금 안에서 전체 교체)"""
+        with self.write_lock:
+            return self._write_database(data)
+    
+    def _write_database(self, data: Dict[str, Any]) -> bool:
+        if self.store is None and any(self._needs_derived_fields(record)
+                                      for record in data.get("files", {}).values()):
+            # 롤업/값 집합 기록 이전 레코드는 전체 저장 때 채움
+            data = dict(data, files={
+                file_id: self._with_derived_fields(record) if self._needs_derived_fields(record) else record
+                for file_id, record in data["files"].items()
+            })
+        if self.shards:
+            data = dict(data, files={file_id: self.row_shards.split(record)
+                                     for file_id, record in data.get("files", {}).items()})
+        if self.store is not None:
+            try:
+                self.store.replace_all(data)
+                return True
+            except sqlite3.Error as e:
+                print(f"데이터베이스 저장 오류: {e}")
+                return False
+        if self.journal is not None:
+            # 전체 저장은 스냅샷 교체 (원자적 교체이므로 백업 복사/재검증 불필요)
+            try:
+                self.journal.write_snapshot(data)
+                return True
+            except OSError as e:
+                print(f"데이터베이스 저장 오류: {e}")
+                return False
+            finally:
+                self.cache.invalidate(self._cache_key)
         try:
             # 백업 생성
             backup_path = self.db_path.with_suffix('.json.backup')
@@ -60,10 +246,13 @@ class DatabaseManager:
             with open(self.db_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, ensure_ascii=False, indent=2)
             
-            # 저장 검증
+            # 저장 검증 (검증용으로 읽은 사본을 캐시에 넣어 다음 조회의 재파싱 생략)
+            self.cache.invalidate(self._cache_key)
             try:
+                signature = self.cache.signature(self._cache_paths)
                 with open(self.db_path, 'r', encoding='utf-8') as f:
-                    json.load(f)
+                    verified = json.load(f)
+                self.cache.store(self._cache_key, signature, verified)
                 print("데이터베이스 저장 및 검증 완료")
                 return True
             except json.JSONDecodeError:
@@ -75,35 +264,113 @@ class DatabaseManager:
                 return False
                 
         except Exception as e:
+            self.cache.invalidate(self._cache_key)
             print(f"데이터베이스 저장 오류: {e}")
             import traceback
             traceback.print_exc()
             return False
     
     def save_analysis_result(self, file_name: str, test_results: List, 
-                           client: str = "미지정", project_name: str = None, upload_time: datetime = None) -> str:
-        """분석 결과 저장"""
-        db = self.load_database()
+                           client: str = "미지정", project_name: str = None, upload_time: datetime = None,
+                           upload_session=None, ingest_state: Dict[str, Any] = None) -> str:
+        """분석 결과 저장 (upload_session을 넘기면 원본 파일 크기/해시를 함께 기록,
+        ingest_state는 증분 재수집용 행 해시 정보, 저장 실패 시 IOError)"""
+        file_record = self._build_file_record(file_name, test_results, client, project_name, upload_time,
+                                              upload_session)
+        if ingest_state:
+            file_record.update(ingest_state)
+        file_id = file_record["file_id"]
+        if self.store is not None:
+            self.store.write_records([file_record])
+            return file_id
+        self._submit(lambda changes: changes.put(file_record))
+        return file_id
+    
+    def save_analysis_results(self, entries: List[Dict[str, Any]]) -> List[str]:
+        """여러 분석 결과를 한 번의 로드/저장으로 일괄 저장
+        
+        Args:
+            entries: save_analysis_result 인자와 같은 키(file_name, test_results,
+                     client, project_name, upload_time, upload_session)를 가진 딕셔너리 목록
+            
+        Returns:
+            저장된 file_id 목록 (entries 순서)
+        """
+        if not entries:
+            return []
+        
+        records = [
+            self._build_file_record(
+                entry["file_name"],
+                entry["test_results"],
+                entry.get("client") or "미지정",
+                entry.get("project_name"),
+                entry.get("upload_time"),
+                entry.get("upload_session")
+            )
+            for entry in entries
+        ]
+        file_ids = [record["file_id"] for record in records]
+        
+        if self.store is not None:
+            try:
+                self.store.write_records(records)
+            except sqlite3.Error as e:
+                raise IOError(f"데이터베이스 일괄 저장 실패: {self.db_path} - {e}") from e
+            return file_ids
+        
+        def save(changes: PendingChanges) -> None:
+            for record in records:
+                changes.put(record)
         
+        self._submit(save)
+        return file_ids
+    
+    @staticmethod
+    def _needs_derived_fields(record: Dict[str, Any]) -> bool:
+        return "test_results" in record and (ROLLUP_FIELD not in record or VALUE_SETS_FIELD not in record)
+    
+    @staticmethod
+    def _with_derived_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+        """행에서 계산하는 롤업/값 집합을 채운 레코드 사본"""
+        return dict(record, **{ROLLUP_FIELD: item_rollup(record["test_results"]),
+                               VALUE_SETS_FIELD: value_sets(record["test_results"])})
+    
+    def _build_file_record(self, file_name: str, test_results: List, client: str = "미지정",
+                           project_name: str = None, upload_time: datetime = None,
+                           upload_session=None) -> Dict[str, Any]:
+        """분석 결과 → 파일 레코드 (요약 + 직렬화된 결과) 생성"""
         file_id = str(uuid.uuid4())
         processed_at = (upload_time or datetime.now()).isoformat()
         
         # 분석 결과 요약 계산
         total_items = len(test_results)
-        fail_items = len([r for r in test_results if r.is_non_conforming()])
+        if isinstance(test_results, TestResultBatch):
+            # 컬럼형 배치는 배열 연산으로 집계
+            violation_mask = test_results.is_non_conforming
+            fail_items = int(violation_mask.sum())
+            violation_by_item = test_results.value_counts('test_item', violation_mask)
+            total_samples = test_results.nunique('sample_name')
+            violation_sample_count = test_results.nunique('sample_name', violation_mask)
+            serialized_results = self._serialize_batch(test_results)
+            prefixes = analysis_prefixes(test_results.column('analysis_number'))
+        else:
+            fail_items = len([r for r in test_results if r.is_non_conforming()])
+            
+            # 부적합 항목별 집계
+            violation_by_item = {}
+            for result in test_results:
+                if result.is_non_conforming():
+                    item = result.test_item
+                    violation_by_item[item] = violation_by_item.get(item, 0) + 1
+            
+            # 시료별 집계
+            total_samples = len(set(r.sample_name for r in test_results))
+            violation_sample_count = len(set(r.sample_name for r in test_results if r.is_non_conforming()))
+            serialized_results = [self._serialize_test_result(r) for r in test_results]
+            prefixes = analysis_prefixes(r.get('analysis_number', '') for r in serialized_results)
         failure_rate = (fail_items / total_items * 100) if total_items > 0 else 0
         
-        # 부적합 항목별 집계
-        violation_by_item = {}
-        for result in test_results:
-            if result.is_non_conforming():
-                item = result.test_item
-                violation_by_item[item] = violation_by_item.get(item, 0) + 1
-        
-        # 시료별 집계
-        samples = list(set(r.sample_name for r in test_results))
-        violation_samples = list(set(r.sample_name for r in test_results if r.is_non_conforming()))
-        
         # 보고서 파일명 생성
         date_str = (upload_time or datetime.now()).strftime('%Y%m%d')
         file_stem = file_name.replace('.xlsx', '').replace('.xls', '')
@@ -120,18 +387,25 @@ class DatabaseManager:
                 "total_items": total_items,
                 "fail_items": fail_items,
                 "failure_rate": round(failure_rate, 2),
-                "total_samples": len(samples),
-                "violation_samples": len(violation_samples),
+                "total_samples": total_samples,
+                "violation_samples": violation_sample_count,
                 "violation_by_item": violation_by_item,
                 "top_violation_item": max(violation_by_item.items(), key=lambda x: x[1])[0] if violation_by_item else None
             },
-            "test_results": [self._serialize_test_result(r) for r in test_results]
+            "test_results": serialized_results,
+            # 증분 재수집 시 같은 프로젝트의 이전 내보내기를 찾는 접수번호 접두
+            "analysis_prefixes": prefixes,
+            # 기간 분석용 시험항목별 누적값
+            ROLLUP_FIELD: item_rollup(serialized_results),
+            # 결과 교차 조회의 후보 파일 선별용 시험자/시료명 값 집합
+            VALUE_SETS_FIELD: value_sets(serialized_results)
         }
         
-        db["files"][file_id] = file_record
-        self.save_database(db)
+        # 원본 파일 정보 (업로드 세션이 이미 가진 바이트에서 계산, 파일을 다시 읽지 않음)
+        if upload_session is not None:
+            file_record["source"] = upload_session.source_info()
         
-        return file_id
+        return file_record
     
     def _serialize_test_result(self, test_result) -> Dict[str, Any]:
         """TestResult 객체를 직렬화"""
@@ -141,6 +415,7 @@ class DatabaseManager:
         
         # TestResult 객체인 경우 직렬화
         try:
+            result_value, detection_status, _ = decode_result_value(getattr(test_result, 'result_report', ''))
             return {
                 "no": getattr(test_result, 'no', 0),
                 "sample_name": getattr(test_result, 'sample_name', ''),
@@ -168,7 +443,9 @@ class DatabaseManager:
                 "kolas_status": getattr(test_result, 'kolas_status', ''),
                 "test_lab_group": getattr(test_result, 'test_lab_group', ''),
                 "test_set": getattr(test_result, 'test_set', ''),
-                "is_non_conforming": test_result.is_non_conforming() if hasattr(test_result, 'is_non_conforming') else False
+                "is_non_conforming": test_result.is_non_conforming() if hasattr(test_result, 'is_non_conforming') else False,
+                "result_value": result_value,
+                "detection_status": int(detection_status)
             }
         except Exception as e:
             # 직렬화 실패 시 기본 딕셔너리 반환
@@ -199,55 +476,323 @@ class DatabaseManager:
                 "kolas_status": "",
                 "test_lab_group": "",
                 "test_set": "",
-                "is_non_conforming": False
+                "is_non_conforming": False,
+                "result_value": None,
+                "detection_status": int(DetectionStatus.NON_NUMERIC)
             }
     
-    def get_files_by_period(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """기간별 파일 조회"""
-        db = self.load_database()
-        filtered_files = []
+    def _serialize_batch(self, batch: TestResultBatch) -> List[Dict[str, Any]]:
+        """TestResultBatch를 컬럼 단위로 직렬화 (_serialize_test_result와 동일한 형식)"""
+        now = datetime.now().isoformat()
+        input_datetimes = [
+            now if value is None or value != value else value.isoformat()
+            for value in pd.Series(batch.column('input_datetime')).dt.to_pydatetime()
+        ]
         
-        for file_record in db["files"].values():
-            processed_at = datetime.fromisoformat(file_record["processed_at"])
-            if start_date <= processed_at <= end_date:
-                filtered_files.append(file_record)
+        columns = {}
+        for field in ("no", "sample_name", "analysis_number", "test_item", "test_unit",
+                      "result_report", "tester_input_value", "standard_excess", "tester",
+                      "test_standard", "standard_criteria", "text_digits", "processing_method",
+                      "result_display_digits", "result_type", "tester_group"):
+            columns[field] = batch.column(field).tolist()
+        columns["input_datetime"] = input_datetimes
+        for field in ("approval_request", "test_result_display_limit", "quantitative_limit_processing",
+                      "test_equipment", "judgment_status", "report_output", "kolas_status",
+                      "test_lab_group", "test_set"):
+            columns[field] = batch.column(field).tolist()
+        columns["is_non_conforming"] = batch.is_non_conforming.tolist()
+        # 해석된 결과값 (검출이 아니면 None)
+        columns["result_value"] = [
+            None if value != value else value for value in batch.numeric_result.tolist()
+        ]
+        columns["detection_status"] = batch.detection_status.tolist()
         
-        return sorted(filtered_files, key=lambda x: x["processed_at"], reverse=True)
+        keys = list(columns.keys())
+        return [dict(zip(keys, row)) for row in zip(*columns.values())]
+    
+    def get_files_by_period(self, start_date: datetime, end_date: datetime,
+                            include_results: bool = True) -> List[Dict[str, Any]]:
+        """기간별 파일 조회 (include_results=False면 행 없이 요약 인덱스만)"""
+        if self.store is not None:
+            return self.store.get_records(start_date, end_date, include_results=include_results)
+        db = self.load_database()
+        files = db["files"]
+        return self._with_results([files[file_id] for file_id in self._time_index(db).range(start_date, end_date)],
+                                  include_results)
+    
+    def _time_index(self, db: Dict[str, Any]) -> TimeIndex:
+        """로드된 데이터마다 한 번 만든 처리 시각 인덱스 (이진 탐색, 최신 순)"""
+        return self.cache.derived(self._cache_key, "time_index", db,
+                                  lambda data: TimeIndex(data["files"].values()))
     
-    def get_all_files(self) -> List[Dict[str, Any]]:
-        """모든 파일 조회"""
+    def get_all_files(self, include_results: bool = True) -> List[Dict[str, Any]]:
+        """모든 파일 조회 (include_results=False면 행 없이 요약 인덱스만)"""
         try:
+            if self.store is not None:
+                return self.store.get_records(include_results=include_results)
             db = self.load_database()
             files = list(db.get("files", {}).values())
             # 최신 순으로 정렬
-            return sorted(files, key=lambda x: x.get('processed_at', ''), reverse=True)
+            return self._with_results(sorted(files, key=lambda x: x.get('processed_at', ''), reverse=True),
+                                      include_results)
         except Exception as e:
             print(f"파일 조회 오류: {e}")
             return []
     
+    def _with_results(self, records: List[Dict[str, Any]], include_results: bool) -> List[Dict[str, Any]]:
+        """인덱스 레코드 → 행 포함 레코드 (샤드에서 읽음) 또는 행 없는 레코드"""
+        if include_results:
+            return [self.row_shards.hydrate(record) for record in records]
+        return [self.row_shards.index_only(record) for record in records]
+    
+    def get_file_rows(self, file_id: str) -> List[Dict[str, Any]]:
+        """파일 하나의 행만 조회 (보고서/상세 조회용)"""
+        record = self.get_file_by_id(file_id)
+        return record.get("test_results", []) if record else []
+    
     def get_file_by_id(self, file_id: str) -> Optional[Dict[str, Any]]:
         """파일 ID로 조회"""
+        if self.store is not None:
+            return self.store.get_record(file_id)
         db = self.load_database()
-        return db["files"].get(file_id)
+        record = db["files"].get(file_id)
+        return self.row_shards.hydrate(record) if record else None
     
     def delete_file(self, file_id: str) -> bool:
         """파일 삭제"""
-        db = self.load_database()
-        if file_id in db["files"]:
-            del db["files"][file_id]
-            self.save_database(db)
-            return True
-        return False
+        if self.store is not None:
+            return self.store.delete_record(file_id)
+        return self._submit(lambda changes: self._delete_change(changes, file_id))
     
+    @staticmethod
+    def _delete_change(changes: PendingChanges, file_id: str) -> bool:
+        if file_id not in changes:
+            return False
+        changes.delete(file_id)
+        return True
+
+    def find_related_record(self, prefixes: List[str]) -> Optional[Dict[str, Any]]:
+        """접수번호 접두가 가장 많이 겹치는 기존 파일 레코드 (동률이면 최신 처리분)"""
+        if not prefixes:
+            return None
+        if self.store is not None:
+            file_id = self.store.find_related(prefixes)
+            return self.store.get_record(file_id) if file_id else None
+        wanted = set(prefixes)
+        db = self.load_database()
+
+        best, best_key = None, (0, '')
+        for file_record in db["files"].values():
+            record_prefixes = file_record.get("analysis_prefixes")
+            if record_prefixes is None:
+                # 접두 기록 이전 레코드는 저장된 행에서 계산
+                record_prefixes = analysis_prefixes(
+                    row.get("analysis_number", "") for row in file_record.get("test_results", [])
+                )
+            key = (len(wanted.intersection(record_prefixes)), file_record.get("processed_at", ""))
+            if key[0] > 0 and key > best_key:
+                best, best_key = file_record, key
+        return self.row_shards.hydrate(best) if best else None
+
+    def merge_analysis_rows(self, file_id: str, test_results, targets: List[Optional[int]],
+                            row_hashes: List[str], file_name: str = None, upload_time: datetime = None,
+                            upload_session=None, ingest_stats: Dict[str, int] = None,
+                            row_hash_version: str = None) -> str:
+        """기존 파일 레코드에 신규/변경 행 병합 (증분 재수집)
+
+        Args:
+            file_id: 병합 대상 레코드
+            test_results: 신규/변경 행 (TestResultBatch 또는 TestResult 목록)
+            targets: 행별 대상 위치 (None이면 추가, 정수면 해당 위치 교체)
+            row_hashes: 행별 원본 해시
+            ingest_stats: 이력에 남길 inserted/updated/unchanged 건수
+        """
+        if isinstance(test_results, TestResultBatch):
+            serialized = self._serialize_batch(test_results) if len(test_results) else []
+        else:
+            serialized = [self._serialize_test_result(r) for r in test_results]
+
+        def merge(file_record: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[int]]:
+            """커밋 시점의 레코드 → 병합한 새 레코드와 바뀐 위치 (레코드와 행 목록은 공유되므로 복사본에 병합)"""
+            if file_record is None:
+                raise KeyError(f"파일 레코드를 찾을 수 없습니다: {file_id}")
+            file_record = dict(file_record)
+            rows = file_record["test_results"] = list(file_record.get("test_results", []))
+            hashes = list(file_record.get("row_hashes") or [])
+            if not hashes or len(hashes) != len(rows) or file_record.get("row_hash_version") != row_hash_version:
+                hashes = [None] * len(rows)
+            positions = []
+            for target, row, row_hash in zip(targets, serialized, row_hashes):
+                if target is None:
+                    positions.append(len(rows))
+                    rows.append(row)
+                    hashes.append(row_hash)
+                else:
+                    positions.append(target)
+                    rows[target] = row
+                    hashes[target] = row_hash
+
+            processed_at = (upload_time or datetime.now()).isoformat()
+            file_record["row_hashes"] = hashes
+            file_record["row_hash_version"] = row_hash_version
+            file_record["summary"] = self._summarize_serialized(rows)
+            file_record[ROLLUP_FIELD] = item_rollup(rows)
+            file_record[VALUE_SETS_FIELD] = value_sets(rows)
+            file_record["analysis_prefixes"] = sorted(
+                set(file_record.get("analysis_prefixes") or [])
+                | set(analysis_prefixes(row.get("analysis_number", "") for row in serialized))
+            )
+            file_record["processed_at"] = processed_at
+            if file_name:
+                file_record["file_name"] = file_name
+            if upload_session is not None:
+                file_record["source"] = upload_session.source_info()
+            file_record["ingest_history"] = file_record.get("ingest_history", []) + [
+                dict({"file_name": file_name or file_record.get("file_name"), "processed_at": processed_at},
+                     **(ingest_stats or {}))
+            ]
+            return file_record, positions
+
+        if self.store is not None:
+            # 읽고 다시 쓰는 사이에 다른 세션의 병합이 끼어들지 않도록 잠금 안에서 (바뀐 위치의 행만 다시 씀)
+            with self.write_lock:
+                file_record, positions = merge(self.store.get_record(file_id))
+                self.store.update_record(file_record, positions)
+            return file_id
+
+        def merge_change(changes: PendingChanges) -> None:
+            file_record = changes.get(file_id)
+            changes.put(merge(self.row_shards.hydrate(file_record) if file_record else None)[0])
+
+        self._submit(merge_change)
+        return file_id
+
+    def _summarize_serialized(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """직렬화된 행 목록 → 파일 레코드 요약 (_build_file_record와 같은 형식)"""
+        total_items = len(rows)
+        violations = [row for row in rows if row.get("is_non_conforming")]
+        violation_by_item = {}
+        for row in violations:
+            item = row.get("test_item", "")
+            violation_by_item[item] = violation_by_item.get(item, 0) + 1
+        failure_rate = (len(violations) / total_items * 100) if total_items > 0 else 0
+
+        return {
+            "total_items": total_items,
+            "fail_items": len(violations),
+            "failure_rate": round(failure_rate, 2),
+            "total_samples": len(set(row.get("sample_name", "") for row in rows)),
+            "violation_samples": len(set(row.get("sample_name", "") for row in violations)),
+            "violation_by_item": violation_by_item,
+            "top_violation_item": max(violation_by_item.items(), key=lambda x: x[1])[0] if violation_by_item else None
+        }
+
     def get_storage_folder_path(self) -> str:
         """저장 폴더 경로 반환"""
         return str(self.db_path.parent.absolute())
+
+    def migrate_from_json(self, json_path) -> int:
+        """JSON 데이터베이스를 SQLite 백엔드로 한 번만 이전 (이전한 파일 레코드 수 반환)"""
+        if self.store is None:
+            raise ValueError("JSON 이전은 SQLite 백엔드에서만 사용할 수 있습니다")
+        json_path = Path(json_path)
+        data = None
+        if json_path.with_name(json_path.name + '.journal').exists():
+            # 저널 모드로 쓰던 데이터베이스는 저널까지 적용한 내용을 옮김
+            data = JsonJournal(json_path).load(self._empty_database)
+        shard_store = RowShardStore(json_path.parent / f"{json_path.stem}_shards")
+        if shard_store.folder.exists():
+            # 샤드로 나눈 행을 다시 합쳐서 옮김
+            if data is None and json_path.exists():
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            if data is not None:
+                data["files"] = {file_id: shard_store.hydrate(record)
+                                 for file_id, record in data.get("files", {}).items()}
+        return self.store.migrate_from_json(json_path, data=data)
+    
+    def export_archive(self, folder) -> Dict[str, Any]:
+        """전체 이력을 처리 월 × 의뢰 기관 Parquet 보관본으로 내보내기 (parquet_archive 참고)
+        
+        Returns:
+            files, rows, partitions, bytes
+        """
+        if self.store is not None:
+            metadata, reports = self.store.load_metadata()
+            database = {"metadata": metadata, "reports": reports}
+        else:
+            database = self.load_database()
+        return write_archive(folder, self.get_all_files(include_results=False), self.get_file_by_id, database)
+    
+    def import_archive(self, folder, replace: bool = False) -> int:
+        """Parquet 보관본 가져오기 (가져온 파일 레코드 수 반환)
+        
+        replace=True면 기존 내용을 보관본으로 교체하고, 아니면 없는 file_id만
+        한 번에 병합한다 (이미 있는 파일은 기존 레코드 유지).
+        """
+        manifest = read_manifest(folder)
+        records = list(read_archive(folder))
+        if replace:
+            data = {"files": {record["file_id"]: record for record in records},
+                    "reports": manifest.get("reports") or {}, "metadata": manifest.get("metadata") or {}}
+            if not self.save_database(data):
+                raise IOError(f"보관본 복원 실패: {self.db_path}")
+            if self.store is None:
+                self._search_put(records)
+        elif self.store is not None:
+            with self.write_lock:
+                existing = {record["file_id"] for record in self.store.get_records(include_results=False)}
+                records = [record for record in records if record["file_id"] not in existing]
+                self.store.write_records(records)
+        else:
+            def merge(changes: PendingChanges) -> List[Dict[str, Any]]:
+                # 롤업/값 집합이 없는 보관본 레코드는 채워서 저장
+                added = [self._with_derived_fields(record) if self._needs_derived_fields(record) else record
+                         for record in records if record["file_id"] not in changes]
+                for record in added:
+                    changes.put(record)
+                return added
+            
+            records = self._submit(merge)
+        return len(records)
     
-    def get_integrated_analysis_data(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
-        """통합 분석용 데이터 조회"""
-        files = self.get_files_by_period(start_date, end_date)
+    def compact_journal(self) -> None:
+        """저널을 스냅샷에 반영 (저널 모드가 아니면 아무것도 하지 않음)"""
+        if self.journal is not None:
+            try:
+                with self.write_lock:
+                    self.journal.compact(self._empty_database)
+            finally:
+                self.cache.invalidate(self._cache_key)
+    
+    def get_period_rollup(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """기간 집계 (일별 롤업 범위 합산, 행을 읽지 않음)
         
-        if not files:
+        Returns:
+            total_files, total_tests, total_violations, client_files(기관별 파일 수),
+            conforming_items, non_conforming_items, monthly_stats,
+            item_stats(시험항목별 건수/부적합/수치 건수·합·최소·최대)
+        """
+        if self.store is not None:
+            return self.store.period_rollup(start_date, end_date)
+        db = self.load_database()
+        daily = self.cache.derived(self._cache_key, "daily_rollups", db, self._build_daily_rollups)
+        return daily.query(start_date, end_date)
+    
+    def _build_daily_rollups(self, db: Dict[str, Any]) -> DailyRollups:
+        return DailyRollups(db.get("files", {}).values(),
+                            rows_loader=lambda record: self.row_shards.hydrate(record).get("test_results", []))
+    
+    def get_integrated_analysis_data(self, start_date: datetime, end_date: datetime,
+                                     include_files: bool = True) -> Dict[str, Any]:
+        """통합 분석용 데이터 조회
+        
+        집계는 일별 롤업, files는 기간 내 파일 레코드 (include_files=False면 행 없이 요약만),
+        violation_rows는 차트용 기간 내 부적합 행 (파일 문맥 포함, 부적합이 있는 파일의 행만 읽음)
+        """
+        rollup = self.get_period_rollup(start_date, end_date)
+        
+        if not rollup["total_files"]:
             return {
                 "total_files": 0,
                 "total_tests": 0,
@@ -261,84 +806,15 @@ class DatabaseManager:
                 "summary_text": "선택된 기간에 분석된 데이터가 없습니다."
             }
         
-        # 집계 데이터 계산 (안전한 처리)
-        total_files = len(files)
-        total_tests = 0
-        total_violations = 0
-        
-        for f in files:
-            try:
-                if isinstance(f, dict) and "summary" in f:
-                    summary = f["summary"]
-                    if isinstance(summary, dict):
-                        total_tests += summary.get("total_items", 0)
-                        total_violations += summary.get("fail_items", 0)
-            except Exception:
-                continue
-                
+        total_files = rollup["total_files"]
+        total_tests = rollup["total_tests"]
+        total_violations = rollup["total_violations"]
         violation_rate = (total_violations / total_tests * 100) if total_tests > 0 else 0
         
-        # 의뢰 기관별 집계 (안전한 처리)
-        client_stats = {}
-        for file_record in files:
-            try:
-                if isinstance(file_record, dict):
-                    client = file_record.get("client", "미지정")
-                    if client:
-                        client_stats[client] = client_stats.get(client, 0) + 1
-            except Exception:
-                continue
-        
-        top_clients = sorted(client_stats.items(), key=lambda x: x[1], reverse=True)[:3]
-        
-        # 부적합 항목별 집계
-        violation_items = {}
-        conforming_items = {}
-        
-        for file_record in files:
-            # test_results가 리스트인지 확인
-            test_results = file_record.get("test_results", [])
-            if not isinstance(test_results, list):
-                continue
-                
-            for result in test_results:
-                # result가 딕셔너리인지 확인
-                if not isinstance(result, dict):
-                    continue
-                    
-                item = result.get("test_item", "")
-                if not item:
-                    continue
-                    
-                # is_non_conforming 값 안전하게 확인
-                is_non_conforming = result.get("is_non_conforming", False)
-                if isinstance(is_non_conforming, str):
-                    is_non_conforming = is_non_conforming.lower() in ['true', '1', 'yes']
-                
-                if is_non_conforming:
-                    violation_items[item] = violation_items.get(item, 0) + 1
-                else:
-                    conforming_items[item] = conforming_items.get(item, 0) + 1
-        
+        top_clients = sorted(rollup["client_files"].items(), key=lambda x: x[1], reverse=True)[:3]
+        violation_items = rollup["non_conforming_items"]
         top_violation_items = sorted(violation_items.items(), key=lambda x: x[1], reverse=True)[:5]
         
-        # 월별 통계
-        monthly_stats = {}
-        for file_record in files:
-            processed_date = datetime.fromisoformat(file_record["processed_at"])
-            month_key = processed_date.strftime("%Y-%m")
-            
-            if month_key not in monthly_stats:
-                monthly_stats[month_key] = {
-                    "files": 0,
-                    "tests": 0,
-                    "violations": 0
-                }
-            
-            monthly_stats[month_key]["files"] += 1
-            monthly_stats[month_key]["tests"] += file_record["summary"]["total_items"]
-            monthly_stats[month_key]["violations"] += file_record["summary"]["fail_items"]
-        
         # 요약 텍스트 생성
         summary_text = self._generate_summary_text(
             start_date, end_date, total_files, total_tests, 
@@ -352,13 +828,114 @@ class DatabaseManager:
             "violation_rate": round(violation_rate, 1),
             "top_clients": top_clients,
             "top_violation_items": top_violation_items,
-            "conforming_items": conforming_items,
+            "conforming_items": rollup["conforming_items"],
             "non_conforming_items": violation_items,
-            "monthly_stats": monthly_stats,
+            "monthly_stats": rollup["monthly_stats"],
+            "item_stats": rollup["item_stats"],
             "summary_text": summary_text,
-            "files": files
+            "files": self.get_files_by_period(start_date, end_date, include_results=include_files),
+            "violation_rows": list(self.iter_results(period=(start_date, end_date), non_conforming=True))
         }
     
+    def query_results(self, test_item: str = None, tester: str = None, sample: str = None,
+                      client: str = None, period: Tuple[Optional[datetime], Optional[datetime]] = None,
+                      non_conforming: bool = None, offset: int = 0, limit: int = 100) -> ResultPage:
+        """파일을 가로지르는 결과 행 조회 한 페이지 (조건은 모두 AND, None이면 조건 없음)
+        
+        Args:
+            test_item, tester, sample, client: 시험항목 / 시험자 / 시료명 / 의뢰 기관 (정확히 일치)
+            period: (시작, 끝) 처리 시각 범위 (한쪽이 None이면 열린 범위)
+            non_conforming: True면 부적합 행만, False면 적합 행만
+            offset, limit: 페이지 (다음 페이지는 ResultPage.next_offset)
+        
+        Returns:
+            ResultPage - 행은 직렬화된 결과 + file_id/file_name/client/processed_at,
+            최신 파일부터 파일 내 행 순서 (to_frame()으로 컬럼형 DataFrame)
+        """
+        query = self._result_query(test_item, tester, sample, client, period, non_conforming)
+        if self.store is not None:
+            rows = list(self.store.iter_results(query, offset, limit + 1))
+        else:
+            rows = list(islice(self._iter_json_results(query), offset, offset + limit + 1))
+        return ResultPage(rows=rows[:limit], offset=offset, limit=limit, has_more=len(rows) > limit)
+    
+    def iter_results(self, test_item: str = None, tester: str = None, sample: str = None,
+                     client: str = None, period: Tuple[Optional[datetime], Optional[datetime]] = None,
+                     non_conforming: bool = None) -> Iterator[Dict[str, Any]]:
+        """query_results와 같은 조건/순서의 결과 행을 끝까지 지연 순회 (내보내기용)"""
+        query = self._result_query(test_item, tester, sample, client, period, non_conforming)
+        if self.store is not None:
+            return self.store.iter_results(query)
+        return self._iter_json_results(query)
+    
+    @staticmethod
+    def _result_query(test_item, tester, sample, client, period, non_conforming) -> ResultQuery:
+        start, end = period if period is not None else (None, None)
+        return ResultQuery(test_item=test_item, tester=tester, sample_name=sample, client=client,
+                           start=start, end=end, non_conforming=non_conforming)
+    
+    def _iter_json_results(self, query: ResultQuery) -> Iterator[Dict[str, Any]]:
+        """역색인으로 고른 후보 파일만 최신 순으로 읽어 행을 거름 (나머지 파일의 행/샤드는 읽지 않음)"""
+        db = self.load_database()
+        files = db["files"]
+        time_index = self._time_index(db)
+        candidates = self.cache.derived(self._cache_key, "value_index", db,
+                                        lambda data: FileValueIndex(data["files"].values())).candidates(query)
+        if candidates is not None:
+            ordered = time_index.select(candidates, query.start, query.end)
+        elif query.start is None and query.end is None:
+            ordered = time_index.file_ids[::-1]
+        else:
+            ordered = time_index.range(query.start or datetime.min, query.end or datetime.max)
+        for file_id in ordered:
+            record = files[file_id]
+            if not query.may_match_file(record):
+                continue
+            for row in self.row_shards.hydrate(record).get("test_results", []):
+                if query.matches_row(row):
+                    yield with_file_context(row, record)
+    
+    def search_results(self, term: str, offset: int = 0, limit: int = 100) -> ResultPage:
+        """전체 이력에서 시료명/분석번호/시험항목/시험자에 term을 포함하는 결과 행 한 페이지
+        
+        대소문자를 무시한 부분 문자열 검색이며, 행 형식과 순서는 query_results와 같다
+        (최신 파일부터 파일 내 행 순서).
+        """
+        if self.store is not None:
+            rows = self.store.search_results(term, offset, limit + 1)
+        else:
+            db = self.load_database()
+            # 다른 프로세스의 저장, 전체 저장 등 색인되지 않은 변경을 데이터베이스 버전마다 한 번 맞춤
+            self.cache.derived(self._cache_key, "search_sync", db,
+                               lambda data: self.search_index.sync(data["files"], self.row_shards.hydrate))
+            files = db["files"]
+            hits = self.search_index.search(term, offset, limit + 1)
+            hydrated: Dict[str, Dict[str, Any]] = {}
+            rows = []
+            for file_id, position in hits:
+                record = files.get(file_id)
+                if record is None:
+                    continue
+                if file_id not in hydrated:
+                    hydrated[file_id] = self.row_shards.hydrate(record)
+                file_rows = hydrated[file_id].get("test_results", [])
+                if position < len(file_rows):
+                    rows.append(with_file_context(file_rows[position], record))
+        return ResultPage(rows=rows[:limit], offset=offset, limit=limit, has_more=len(rows) > limit)
+    
+    def _search_put(self, records: List[Dict[str, Any]]) -> None:
+        """저장한 파일의 행을 검색 인덱스에 반영 (실패해도 다음 검색 때 sync로 맞춤)"""
+        try:
+            self.search_index.put(records)
+        except sqlite3.Error as e:
+            print(f"검색 인덱스 갱신 오류: {e}")
+    
+    def _search_delete(self, file_id: str) -> None:
+        try:
+            self.search_index.delete(file_id)
+        except sqlite3.Error as e:
+            print(f"검색 인덱스 갱신 오류: {e}")
+    
     def _generate_summary_text(self, start_date: datetime, end_date: datetime,
                              total_files: int, total_tests: int, total_violations: int,
                              violation_rate: float, top_clients: List, top_violation_items: List) -> str:
@@ -387,8 +964,8 @@ class DatabaseManager:
         return " ".join(summary_parts)
     
     def get_client_statistics(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
-        """기간별 의뢰 기관 통계"""
-        files = self.get_files_by_period(start_date, end_date)
+        """기간별 의뢰 기관 통계 (요약 인덱스만 사용)"""
+        files = self.get_files_by_period(start_date, end_date, include_results=False)
         
         client_stats = {}
         for file_record in files:
@@ -411,31 +988,19 @@ class DatabaseManager:
     def delete_analysis_result(self, file_id: str) -> bool:
         """분석 결과 삭제 (강화된 버전)"""
         try:
-            # 데이터베이스 로드
-            db = self.load_database()
+            if self.store is not None:
+                deleted = self.store.delete_record(file_id)
+                if not deleted:
+                    print(f"파일 ID {file_id}가 데이터베이스에 존재하지 않습니다.")
+                return deleted
             
-            # 파일 ID가 존재하는지 확인
-            if file_id not in db["files"]:
+            # 커밋 시점에 파일 ID가 존재하는지 확인 (저장 실패 시 파일은 그대로 남음)
+            if not self._submit(lambda changes: self._delete_change(changes, file_id)):
                 print(f"파일 ID {file_id}가 데이터베이스에 존재하지 않습니다.")
                 return False
             
-            # 삭제 전 백업 (선택적)
-            deleted_file = db["files"][file_id].copy()
-            
-            # 파일 삭제
-            del db["files"][file_id]
-            
-            # 데이터베이스 저장
-            success = self.save_database(db)
-            
-            if success:
-                print(f"파일 ID {file_id} 삭제 완료")
-                return True
-            else:
-                # 삭제 실패 시 복원
-                db["files"][file_id] = deleted_file
-                print(f"파일 ID {file_id} 삭제 실패 - 데이터 복원됨")
-                return False
+            print(f"파일 ID {file_id} 삭제 완료")
+            return True
                 
         except Exception as e:
             print(f"데이터베이스 삭제 오류: {e}")
@@ -446,10 +1011,46 @@ class DatabaseManager:
     def get_file_by_id(self, file_id: str) -> Optional[Dict[str, Any]]:
         """파일 ID로 분석 결과 조회"""
         try:
+            if self.store is not None:
+                return self.store.get_record(file_id)
             db = self.load_database()
-            return db["files"].get(file_id)
+            record = db["files"].get(file_id)
+            return self.row_shards.hydrate(record) if record else None
         except Exception:
             return None
 
+def open_database(folder, backend: str = "json", timeout: float = 30.0) -> DatabaseManager:
+    """저장 폴더의 분석 데이터베이스 열기
+    
+    backend가 "sqlite"이면 analysis_database.db를 열고, 같은 폴더의
+    analysis_database.json이 아직 이전되지 않았으면 한 번 옮겨 온다.
+    "journal"이면 analysis_database.json을 저널 모드로 열고 행은 파일별 샤드에 둔다.
+    """
+    folder = Path(folder)
+    json_path = folder / "analysis_database.json"
+    if backend == "journal":
+        return DatabaseManager(str(json_path), journal=True, shards=True)
+    if backend != "sqlite":
+        return DatabaseManager(str(json_path))
+    
+    manager = DatabaseManager(str(folder / "analysis_database.db"), backend="sqlite", timeout=timeout)
+    migrated = manager.migrate_from_json(json_path)
+    if migrated:
+        print(f"JSON 데이터베이스 {migrated}건을 SQLite로 이전했습니다: {manager.db_path}")
+    return manager
+
+
+def open_configured_database(folder=DEFAULT_DATABASE_FOLDER, backend: str = None) -> DatabaseManager:
+    """설정(DB_TYPE, DB_CONNECTION_TIMEOUT)대로 저장 폴더의 데이터베이스 열기
+    
+    앱과 명령행 도구(bulk_importer, watch_folder, parquet_archive)가 모두 이것으로 열어
+    같은 백엔드(SQLite / JSON / 저널 + 샤드)의 같은 파일에 쓴다. backend를 주면 설정 대신 사용.
+    """
+    from config.app_config import get_config
+    
+    settings = get_config().database
+    return open_database(folder, backend=backend or settings.type, timeout=settings.connection_timeout)
+
+
 # 전역 인스턴스
 db_manager = DatabaseManager()
\ No newline at end of file
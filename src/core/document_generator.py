@@ -6,15 +6,18 @@ HTML 템플릿 기반 성적서 생성, 데이터 바인딩, 기준 초과 항
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import json
-import re
 from pathlib import Path
 import base64
 from io import BytesIO
 
+import numpy as np
+
 try:
-    from .data_models import TestResult, ProjectSummary, Standard
+    from .data_models import TestResult, TestResultBatch, ProjectSummary, DecodedResults, decode_result_values
+    from .criteria_parser import parse_criteria
 except ImportError:
-    from data_models import TestResult, ProjectSummary, Standard
+    from data_models import TestResult, TestResultBatch, ProjectSummary, DecodedResults, decode_result_values
+    from criteria_parser import parse_criteria
 
 
 class DocumentGenerator:
@@ -125,14 +128,15 @@ class DocumentGenerator:
             하이라이트 정보가 포함된 결과 리스트
         """
         highlighted_results = []
+        decoded = self._decode_results(test_results)
         
-        for result in test_results:
+        for result, numeric_result, display_result in zip(test_results, decoded.value, decoded.display):
             result_data = {
                 'original': result,
                 'sample_name': result.sample_name,
                 'analysis_number': result.analysis_number,
                 'test_item': result.test_item,
-                'result_display': result.get_display_result(),
+                'result_display': display_result,
                 'unit': result.test_unit,
                 'criteria': result.standard_criteria,
                 'status': self._normalize_status(result.standard_excess),
@@ -146,7 +150,7 @@ class DocumentGenerator:
             
             # 초과 배수 계산 (부적합인 경우)
             if result.is_non_conforming():
-                excess_ratio = self._calculate_excess_ratio(result)
+                excess_ratio = self._calculate_excess_ratio(result, numeric_result)
                 result_data['excess_ratio'] = excess_ratio
                 result_data['risk_level'] = self._determine_risk_level(excess_ratio)
             else:
@@ -407,8 +411,10 @@ class DocumentGenerator:
             """
         
         violation_rows = []
-        for i, violation in enumerate(violations, 1):
-            excess_ratio = self._calculate_excess_ratio(violation)
+        decoded = self._decode_results(violations)
+        for i, (violation, numeric_result, display_result) in enumerate(
+                zip(violations, decoded.value, decoded.display), 1):
+            excess_ratio = self._calculate_excess_ratio(violation, numeric_result)
             risk_level = self._determine_risk_level(excess_ratio)
             
             violation_rows.append(f"""
@@ -417,7 +423,7 @@ class DocumentGenerator:
                 <td>{violation.sample_name}</td>
                 <td>{violation.test_item}</td>
                 <td class="text-right font-bold violation-value">
-                    {violation.get_display_result()} {violation.test_unit}
+                    {display_result} {violation.test_unit}
                 </td>
                 <td>{violation.standard_criteria}</td>
                 <td class="text-right">{excess_ratio:.2f}배</td>
@@ -558,19 +564,27 @@ class DocumentGenerator:
         else:
             return '적합'  # 기본값
     
-    def _calculate_excess_ratio(self, result: TestResult) -> float:
-        """초과 배수 계산"""
+    @staticmethod
+    def _decode_results(test_results: List[TestResult]) -> DecodedResults:
+        """결과(성적서) 값 일괄 해석 (배치는 생성 시 해석된 배열 사용)"""
+        if isinstance(test_results, TestResultBatch):
+            return test_results.decoded_results()
+        return decode_result_values([result.result_report for result in test_results])
+    
+    def _calculate_excess_ratio(self, result: TestResult, numeric_result: Optional[float] = None) -> float:
+        """초과 배수 계산 (numeric_result: 미리 해석한 수치, NaN이면 수치 아님)"""
         try:
-            numeric_result = result.get_numeric_result()
             if numeric_result is None:
+                numeric_result = result.get_numeric_result()
+            if numeric_result is None or np.isnan(numeric_result):
                 return 0.0
             
-            # 기준값 추출
-            standard = Standard.from_test_result(result)
-            if standard.limit_value <= 0:
+            # 기준값 (기준 텍스트별로 한 번만 해석)
+            limit_value = parse_criteria(result.standard_criteria).limit_value
+            if limit_value <= 0:
                 return 0.0
             
-            return numeric_result / standard.limit_value
+            return float(numeric_result / limit_value)
         except (ValueError, ZeroDivisionError):
             return 0.0
     
@@ -9,8 +9,8 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from typing import List, Dict, Any, Optional, Tuple
-from src.core.data_models import TestResult, ProjectSummary, Standard
+from typing import List, Dict, Any, Optional, Tuple, Union
+from src.core.data_models import TestResult, TestResultBatch, ProjectSummary, Standard
 from src.core.data_processor import DataProcessor
 from src.utils.performance_optimizer import optimize_performance, cache_result, global_optimizer
 from src.components.optimized_chart_renderer import optimized_chart_renderer
@@ -105,12 +105,12 @@ class DynamicDashboardEngine:
     
     @cache_result(ttl=900)  # 15분 캐시
     @optimize_performance("generate_kpi_cards")
-    def generate_kpi_cards(self, data: List[TestResult]) -> Dict[str, Any]:
+    def generate_kpi_cards(self, data: Union[List[TestResult], TestResultBatch]) -> Dict[str, Any]:
         """
         KPI 카드 데이터 생성 (성능 최적화 적용)
         
         Args:
-            data: 시험 결과 데이터
+            data: 시험 결과 데이터 (리스트 또는 TestResultBatch)
             
         Returns:
             KPI 카드 데이터 딕셔너리
@@ -124,6 +124,19 @@ class DynamicDashboardEngine:
                 'non_conforming_samples': 0
             }
         
+        # 컬럼형 배치는 배열 연산으로 바로 집계
+        if isinstance(data, TestResultBatch):
+            total_tests = len(data)
+            non_conforming_tests = int(data.is_non_conforming.sum())
+            non_conforming_rate = non_conforming_tests / total_tests * 100
+            return {
+                'total_tests': total_tests,
+                'non_conforming_tests': non_conforming_tests,
+                'non_conforming_rate': round(non_conforming_rate, 1),
+                'total_samples': data.nunique('sample_name'),
+                'non_conforming_samples': data.nunique('sample_name', data.is_non_conforming)
+            }
+        
         # 벡터화된 계산으로 성능 최적화
         total_tests = len(data)
         
@@ -0,0 +1,188 @@
+"""
+증분 재수집 (Incremental Ingest)
+LIMS 누적 내보내기(시험현황_시험항목_<timestamp>.xlsx)는 전날 행을 반복하고 새 행을 덧붙인다.
+(분석번호, 시험항목) 키와 원본 행 해시로 이전 내보내기와 비교하여 신규/변경 행만
+변환·저장하고, 기존 파일 레코드에 병합한다.
+
+같은 프로젝트의 이전 내보내기는 파일명이 아니라 분석번호 접두(접수번호, 예: 25A00009)로
+찾는다. 내보내기 파일명은 프로젝트와 무관하게 시각만 다르기 때문이다.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+try:
+    from src.core.column_plan import convert_series
+    from src.core.data_models import TestResultBatch
+except ImportError:
+    from column_plan import convert_series
+    from data_models import TestResultBatch
+
+try:
+    from src.utils.upload_session import UploadSession
+except ImportError:
+    from upload_session import UploadSession
+
+logger = logging.getLogger(__name__)
+
+# 행 해시 규칙 버전 (레코드에 기록, 다르면 기존 행을 모두 변경으로 간주)
+ROW_HASH_VERSION = "2"
+
+# 키 구성 요소 구분자
+_KEY_SEP = '\x1f'
+
+
+def analysis_prefix(analysis_number: Any) -> str:
+    """분석번호 → 접수번호 접두 ("25A00009-001" → "25A00009")"""
+    return str(analysis_number).split('-', 1)[0].strip()
+
+
+def analysis_prefixes(analysis_numbers: Iterable) -> List[str]:
+    """분석번호 목록 → 정렬된 접수번호 접두 목록 (빈 값 제외)"""
+    uniques = pd.unique(pd.Series(list(analysis_numbers), dtype=object).dropna())
+    return sorted({prefix for prefix in (analysis_prefix(value) for value in uniques) if prefix})
+
+
+def row_keys(analysis_numbers: Iterable, test_items: Iterable) -> List[str]:
+    """(분석번호, 시험항목) 행 키 (같은 키가 반복되면 등장 순번을 붙여 구분)"""
+    keys = (pd.Series(list(analysis_numbers), dtype=object).astype(str) + _KEY_SEP
+            + pd.Series(list(test_items), dtype=object).astype(str))
+    occurrence = keys.groupby(keys, sort=False).cumcount()
+    repeated = occurrence > 0
+    if repeated.any():
+        keys = keys.where(~repeated, keys + _KEY_SEP + occurrence.astype(str))
+    return keys.tolist()
+
+
+def row_hashes(df: pd.DataFrame) -> List[str]:
+    """원본 행 내용 해시 (컬럼 순서/dtype 계획과 무관, 수치 컬럼은 float로 정규화)"""
+    if len(df) == 0:
+        return []
+    normalized = {}
+    for column in sorted(df.columns, key=str):
+        series = df[column]
+        if isinstance(series.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+            # 읽기 dtype 계획(카테고리/Arrow 문자열)과 무관하게 같은 값이면 같은 해시
+            series = series.astype(object).where(series.notna(), np.nan)
+        elif is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype):
+            # 전날은 정수, 오늘은 결측 포함으로 float가 되어도 같은 값이면 같은 해시
+            series = series.astype(np.float64)
+        normalized[str(column)] = series.reset_index(drop=True)
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(normalized), index=False).to_numpy()
+    return [format(value, '016x') for value in hashes.tolist()]
+
+
+@dataclass
+class IngestReport:
+    """증분 재수집 결과"""
+    file_id: str
+    file_name: str
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    base_file_id: Optional[str] = None   # 병합 대상 이전 레코드 (없으면 새 레코드)
+
+    @property
+    def total_rows(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def converted_rows(self) -> int:
+        """이번 수집에서 변환·저장한 행 수"""
+        return self.inserted + self.updated
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class IncrementalIngestor:
+    """누적 내보내기 증분 재수집기
+
+    1. 원본 DataFrame에서 (분석번호, 시험항목) 키와 행 해시를 계산
+    2. 분석번호 접두가 겹치는 이전 레코드를 찾음 (없으면 전체를 새 레코드로 저장)
+    3. 새 키 → 신규, 해시가 다른 키 → 변경, 같은 해시 → 동일
+    4. 신규/변경 행만 TestResult 필드로 변환하여 기존 레코드에 병합
+    """
+
+    def __init__(self, data_processor, db_manager):
+        self.data_processor = data_processor
+        self.db_manager = db_manager
+
+    def ingest(self, source: Union[UploadSession, pd.DataFrame], file_name: Optional[str] = None,
+               client: str = "미지정", project_name: Optional[str] = None,
+               upload_time: Optional[datetime] = None) -> IngestReport:
+        """업로드 세션(또는 원본 DataFrame) 증분 반영"""
+        session = source if isinstance(source, UploadSession) else None
+        df = self.data_processor.upload_frame(session) if session is not None else source
+        file_name = file_name or (session.name if session is not None else "upload.xlsx")
+
+        validation = self.data_processor.validate_data_structure(df)
+        if not validation['is_valid']:
+            raise ValueError(f"데이터 구조 검증 실패: {validation['errors']}")
+
+        plan = self.data_processor.build_column_plan(df.columns)
+        analysis_numbers = convert_series('analysis_number', plan.resolve(df, 'analysis_number'), len(df))
+        keys = row_keys(analysis_numbers, convert_series('test_item', plan.resolve(df, 'test_item'), len(df)))
+        hashes = row_hashes(df)
+        prefixes = analysis_prefixes(analysis_numbers)
+
+        base = self.db_manager.find_related_record(prefixes)
+        if base is None:
+            batch = self._convert_rows(df, plan, np.arange(len(df)))
+            file_id = self.db_manager.save_analysis_result(
+                file_name, batch, client, project_name, upload_time, upload_session=session,
+                ingest_state={'row_hashes': hashes, 'row_hash_version': ROW_HASH_VERSION}
+            )
+            report = IngestReport(file_id=file_id, file_name=file_name, inserted=len(df))
+            logger.info(f"증분 수집 (새 레코드): {report.to_dict()}")
+            return report
+
+        # 이전 레코드의 키 → 위치, 해시 (해시 규칙이 다르거나 없으면 비교 불가 → 변경으로 처리)
+        base_rows = base.get('test_results', [])
+        base_keys = row_keys([row.get('analysis_number', '') for row in base_rows],
+                             [row.get('test_item', '') for row in base_rows])
+        position = {key: index for index, key in enumerate(base_keys)}
+        base_hashes = base.get('row_hashes')
+        if base.get('row_hash_version') != ROW_HASH_VERSION or not base_hashes or len(base_hashes) != len(base_rows):
+            base_hashes = [None] * len(base_rows)
+
+        delta_rows, targets = [], []
+        inserted = updated = unchanged = 0
+        for row_index, (key, row_hash) in enumerate(zip(keys, hashes)):
+            target = position.get(key)
+            if target is None:
+                inserted += 1
+            elif base_hashes[target] != row_hash:
+                updated += 1
+            else:
+                unchanged += 1
+                continue
+            delta_rows.append(row_index)
+            targets.append(target)
+
+        batch = self._convert_rows(df, plan, np.asarray(delta_rows, dtype=np.intp))
+        file_id = self.db_manager.merge_analysis_rows(
+            base['file_id'], batch, targets, [hashes[index] for index in delta_rows],
+            file_name=file_name, upload_time=upload_time, upload_session=session,
+            ingest_stats={'inserted': inserted, 'updated': updated, 'unchanged': unchanged},
+            row_hash_version=ROW_HASH_VERSION
+        )
+        report = IngestReport(file_id=file_id, file_name=file_name, inserted=inserted, updated=updated,
+                              unchanged=unchanged, base_file_id=base['file_id'])
+        logger.info(f"증분 수집 (병합): {report.to_dict()}")
+        return report
+
+    def _convert_rows(self, df: pd.DataFrame, plan, positions: np.ndarray) -> TestResultBatch:
+        """선택한 행만 TestResultBatch로 변환 (파일마다 성능 모니터를 띄우지 않는 변환 경로)"""
+        if len(positions) == 0:
+            return TestResultBatch.from_test_results([])
+        subset = df.iloc[positions]
+        return TestResultBatch.from_columns(
+            self.data_processor._convert_dataframe_to_columns(subset, plan, datetime_arrays=True)
+        )
@@ -5,9 +5,15 @@
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Tuple, Optional
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
+try:
+    from src.core.data_models import decode_result_values
+except ImportError:
+    from data_models import decode_result_values
+
 class IntegratedAnalysisEngine:
     """통합 분석 엔진 클래스"""
     
@@ -39,7 +45,8 @@ class IntegratedAnalysisEngine:
             from database_manager import db_manager
             self.db_manager = db_manager
         
-        return self.db_manager.get_integrated_analysis_data(start_date, end_date)
+        # 차트는 부적합 행과 파일 요약만 사용하므로 기간 내 전체 행은 읽지 않음
+        return self.db_manager.get_integrated_analysis_data(start_date, end_date, include_files=False)
     
     def create_conforming_chart(self, conforming_items: Dict[str, int]) -> go.Figure:
         """적합 항목 도넛 차트 생성"""
@@ -267,9 +274,59 @@ class IntegratedAnalysisEngine:
         
         return fig
     
-    def create_contamination_level_chart(self, files_data: List[Dict]) -> go.Figure:
-        """실험별 오염수준 분포 차트 생성"""
-        if not files_data:
+    @staticmethod
+    def _is_non_conforming_record(result: Dict) -> bool:
+        """직렬화된 결과 행의 부적합 여부"""
+        is_non_conforming = result.get("is_non_conforming", False)
+        if isinstance(is_non_conforming, str):
+            return is_non_conforming.lower() in ['true', '1', 'yes', '부적합']
+        if not isinstance(is_non_conforming, bool):
+            return result.get("standard_excess", "적합") == "부적합"
+        return is_non_conforming
+    
+    @staticmethod
+    def _result_values(results: List[Dict]) -> np.ndarray:
+        """직렬화된 결과 행들의 수치 결과 배열 (검출이 아니면 NaN)
+        
+        저장 시 해석된 result_value를 우선 사용하고, 이전 형식의 행은
+        결과(성적서) 컬럼을 한 번에 해석한다.
+        """
+        if all("result_value" in result for result in results):
+            return np.array(
+                [np.nan if result["result_value"] is None else result["result_value"] for result in results],
+                dtype=np.float64
+            )
+        return decode_result_values(
+            [result.get("test_value", result.get("result_report", "")) for result in results]
+        ).value
+    
+    @classmethod
+    def _violation_groups(cls, files_data: List[Dict], violation_rows: Optional[List[Dict]]) -> List[List[Dict]]:
+        """부적합 행 묶음 - violation_rows가 있으면 그대로, 없으면 파일 레코드의 행에서 고름"""
+        if violation_rows is not None:
+            return [violation_rows] if violation_rows else []
+        groups = []
+        for file_record in files_data or []:
+            if not isinstance(file_record, dict):
+                continue
+            test_results = file_record.get("test_results", [])
+            if not isinstance(test_results, list):
+                continue
+            violations = [
+                result for result in test_results
+                if isinstance(result, dict) and cls._is_non_conforming_record(result)
+            ]
+            if violations:
+                groups.append(violations)
+        return groups
+    
+    def create_contamination_level_chart(self, files_data: List[Dict],
+                                         violation_rows: Optional[List[Dict]] = None) -> go.Figure:
+        """실험별 오염수준 분포 차트 생성
+        
+        violation_rows(query_results/iter_results의 부적합 행)가 있으면 그 행만 사용
+        """
+        if not files_data and not violation_rows:
             fig = go.Figure()
             fig.add_annotation(
                 text="데이터 없음",
@@ -287,57 +344,17 @@ class IntegratedAnalysisEngine:
         # 실험별 오염 농도 데이터 수집
         contamination_data = []
         
-        for file_record in files_data:
+        for violations in self._violation_groups(files_data, violation_rows):
             try:
-                if not isinstance(file_record, dict):
-                    continue
-                    
-                test_results = file_record.get("test_results", [])
-                if not isinstance(test_results, list):
-                    continue
-                
-                for result in test_results:
-                    try:
-                        if not isinstance(result, dict):
-                            continue
-                            
-                        # 부적합 항목만 처리
-                        is_non_conforming = result.get("is_non_conforming", False)
-                        if isinstance(is_non_conforming, str):
-                            is_non_conforming = is_non_conforming.lower() in ['true', '1', 'yes', '부적합']
-                        elif not isinstance(is_non_conforming, bool):
-                            standard_excess = result.get("standard_excess", "적합")
-                            is_non_conforming = standard_excess == "부적합"
-                        
-                        if is_non_conforming:
-                            test_item = result.get("test_item", "")
-                            test_value = result.get("test_value", "")
-                            
-                            # 숫자 값 추출 시도
-                            try:
-                                if isinstance(test_value, (int, float)):
-                                    value = float(test_value)
-                                elif isinstance(test_value, str):
-                                    # 문자열에서 숫자 추출
-                                    import re
-                                    numbers = re.findall(r'-?\d+\.?\d*', test_value)
-                                    if numbers:
-                                        value = float(numbers[0])
-                                    else:
-                                        continue
-                                else:
-                                    continue
-                                
-                                contamination_data.append({
-                                    'test_item': test_item,
-                                    'value': value,
-                                    'sample': result.get("sample_name", "")
-                                })
-                            except (ValueError, TypeError):
-                                continue
-                                
-                    except Exception:
+                # 묶음 단위로 결과값을 한 번에 해석 (검출된 수치만 사용)
+                for result, value in zip(violations, self._result_values(violations)):
+                    if np.isnan(value):
                         continue
+                    contamination_data.append({
+                        'test_item': result.get("test_item", ""),
+                        'value': float(value),
+                        'sample': result.get("sample_name", "")
+                    })
             except Exception:
                 continue
         
@@ -391,8 +408,13 @@ class IntegratedAnalysisEngine:
         
         return fig
     
-    def create_file_trend_chart(self, files_data: List[Dict]) -> go.Figure:
-        """시험/시료별 추이 차트 생성"""
+    def create_file_trend_chart(self, files_data: List[Dict],
+                                violation_rows: Optional[List[Dict]] = None) -> go.Figure:
+        """시험/시료별 추이 차트 생성
+        
+        violation_rows가 있으면 files_data는 행 없는 요약 레코드여도 됨
+        (검사 수는 summary, 부적합 수/농도는 file_id별 부적합 행)
+        """
         if not files_data:
             fig = go.Figure()
             fig.add_annotation(
@@ -410,56 +432,43 @@ class IntegratedAnalysisEngine:
         
         # 파일별 부적합률과 평균 농도 계산
         file_stats = []
+        violations_by_file = None
+        if violation_rows is not None:
+            violations_by_file = {}
+            for row in violation_rows:
+                violations_by_file.setdefault(row.get("file_id"), []).append(row)
         
         for file_record in files_data:
             try:
                 if not isinstance(file_record, dict):
                     continue
                 
-                filename = file_record.get("filename", "")
-                upload_time = file_record.get("upload_time", "")
-                test_results = file_record.get("test_results", [])
+                # 데이터베이스 레코드는 file_name/processed_at
+                filename = file_record.get("filename", file_record.get("file_name", ""))
+                upload_time = file_record.get("upload_time", file_record.get("processed_at", ""))
                 
-                if not isinstance(test_results, list) or not test_results:
-                    continue
+                if violations_by_file is not None:
+                    total_tests = file_record.get("summary", {}).get("total_items", 0)
+                    file_violations = violations_by_file.get(file_record.get("file_id"), [])
+                else:
+                    test_results = file_record.get("test_results", [])
+                    if not isinstance(test_results, list):
+                        continue
+                    total_tests = len(test_results)
+                    file_violations = [
+                        result for result in test_results
+                        if isinstance(result, dict) and self._is_non_conforming_record(result)
+                    ]
                 
-                total_tests = len(test_results)
-                violations = 0
-                total_concentration = 0
-                concentration_count = 0
+                if not total_tests:
+                    continue
+                violations = len(file_violations)
                 
-                for result in test_results:
-                    try:
-                        if not isinstance(result, dict):
-                            continue
-                        
-                        # 부적합 여부 확인
-                        is_non_conforming = result.get("is_non_conforming", False)
-                        if isinstance(is_non_conforming, str):
-                            is_non_conforming = is_non_conforming.lower() in ['true', '1', 'yes', '부적합']
-                        elif not isinstance(is_non_conforming, bool):
-                            standard_excess = result.get("standard_excess", "적합")
-                            is_non_conforming = standard_excess == "부적합"
-                        
-                        if is_non_conforming:
-                            violations += 1
-                            
-                            # 농도 값 추출
-                            test_value = result.get("test_value", "")
-                            try:
-                                if isinstance(test_value, (int, float)):
-                                    total_concentration += float(test_value)
-                                    concentration_count += 1
-                                elif isinstance(test_value, str):
-                                    import re
-                                    numbers = re.findall(r'-?\d+\.?\d*', test_value)
-                                    if numbers:
-                                        total_concentration += float(numbers[0])
-                                        concentration_count += 1
-                            except (ValueError, TypeError):
-                                pass
-                    except Exception:
-                        continue
+                # 농도 값 (검출된 수치만)
+                values = self._result_values(file_violations)
+                values = values[~np.isnan(values)]
+                total_concentration = float(values.sum())
+                concentration_count = len(values)
                 
                 violation_rate = (violations / total_tests * 100) if total_tests > 0 else 0
                 avg_concentration = (total_concentration / concentration_count) if concentration_count > 0 else 0
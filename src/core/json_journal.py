@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+JSON 데이터베이스 추가 전용 저널 (Write-Ahead Journal)
+파일 레코드 저장/삭제를 매번 전체 JSON 재작성(백업 복사 → 들여쓰기 저장 → 재검증 읽기)
+하지 않고 <db>.journal 파일에 한 줄짜리 압축 레코드로 덧붙인 뒤 fsync 한다.
+
+- 쓰기 비용은 레코드 크기에 비례 (스냅샷 크기와 무관)
+- 저널이 스냅샷만큼 커지면 스냅샷으로 압축 (임시 파일 + os.replace로 원자적 교체)
+- 로드 시 스냅샷 위에 저널을 다시 적용, 중단된 마지막 줄은 열 때 잘라낸다
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List
+
+# 저널이 이 크기보다 작으면 스냅샷이 작아도 압축하지 않음
+DEFAULT_COMPACT_MIN_BYTES = 1024 * 1024
+
+_COMPACT_SEPARATORS = (',', ':')
+
+
+class JsonJournal:
+    """스냅샷(JSON) + 추가 전용 저널(JSON Lines)
+
+    저널 항목은 {"op": "put", "record": {...}} 또는 {"op": "delete", "file_id": ...}
+    이며 같은 순서로 다시 적용하면 항상 같은 결과가 된다 (압축 도중 중단되어도 안전).
+    """
+
+    def __init__(self, snapshot_path, compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = self.snapshot_path.with_name(self.snapshot_path.name + '.journal')
+        self.compact_min_bytes = compact_min_bytes
+        self._lock = threading.RLock()
+        self.recover()
+
+    # ---- 복구/로드 ----
+
+    def recover(self) -> int:
+        """중단된 쓰기로 잘린 저널 끝부분 제거 (남은 항목 수 반환)"""
+        with self._lock:
+            if not self.journal_path.exists():
+                return 0
+            entries, valid_bytes = self._read_entries()
+            if valid_bytes != self.journal_path.stat().st_size:
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+            return len(entries)
+
+    def _read_entries(self):
+        """저널 항목 목록과 온전한 줄까지의 바이트 수"""
+        entries: List[Dict[str, Any]] = []
+        valid_bytes = 0
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break
+                valid_bytes += len(line)
+        return entries, valid_bytes
+
+    def load(self, default_factory: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """스냅샷 + 저널 적용 결과"""
+        with self._lock:
+            try:
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = default_factory()
+            if self.journal_path.exists():
+                entries, _ = self._read_entries()
+                self._apply(data, entries)
+            return data
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], entries: Iterable[Dict[str, Any]]) -> None:
+        files = data.setdefault("files", {})
+        for entry in entries:
+            if entry.get("op") == "put":
+                record = entry["record"]
+                files[record["file_id"]] = record
+            elif entry.get("op") == "delete":
+                files.pop(entry["file_id"], None)
+
+    # ---- 쓰기 ----
+
+    def put(self, records: Iterable[Dict[str, Any]]) -> None:
+        """레코드 저장 (여러 건이면 한 번의 fsync)"""
+        self._append([{"op": "put", "record": record} for record in records])
+
+    def delete(self, file_id: str) -> None:
+        """레코드 삭제"""
+        self._append([{"op": "delete", "file_id": file_id}])
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+        if not entries:
+            return
+        payload = b''.join(
+            json.dumps(entry, ensure_ascii=False, separators=_COMPACT_SEPARATORS).encode('utf-8') + b'\n'
+            for entry in entries
+        )
+        with self._lock:
+            with open(self.journal_path, 'ab') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            if self._should_compact():
+                self.compact()
+
+    def _should_compact(self) -> bool:
+        """저널이 스냅샷 크기(최소 compact_min_bytes) 이상이면 압축 (분할 상환 O(레코드))"""
+        journal_bytes = self.journal_path.stat().st_size
+        try:
+            snapshot_bytes = self.snapshot_path.stat().st_size
+        except FileNotFoundError:
+            snapshot_bytes = 0
+        return journal_bytes >= max(self.compact_min_bytes, snapshot_bytes)
+
+    def compact(self, default_factory: Callable[[], Dict[str, Any]] = dict) -> None:
+        """저널을 스냅샷에 반영하고 비움"""
+        with self._lock:
+            self.write_snapshot(self.load(default_factory))
+
+    def write_snapshot(self, data: Dict[str, Any]) -> None:
+        """스냅샷을 원자적으로 교체하고 저널 비움 (교체 후 중단되어도 저널 재적용은 무해)"""
+        with self._lock:
+            temp_path = self.snapshot_path.with_name(self.snapshot_path.name + '.tmp')
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=_COMPACT_SEPARATORS)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            if self.journal_path.exists():
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(0)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def stats(self) -> Dict[str, int]:
+        """저널/스냅샷 크기 (모니터링용)"""
+        with self._lock:
+            entries = self._read_entries()[0] if self.journal_path.exists() else []
+            return {
+                "journal_entries": len(entries),
+                "journal_bytes": self.journal_path.stat().st_size if self.journal_path.exists() else 0,
+                "snapshot_bytes": self.snapshot_path.stat().st_size if self.snapshot_path.exists() else 0,
+            }
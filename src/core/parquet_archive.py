@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+분석 이력 Parquet 보관 (내보내기 / 가져오기)
+백업은 JSON 파일 하나를 통째로 복사한 것(analysis_database.json.backup)뿐이라
+이력을 옮기거나 나누려면 그 파일 전체를 옮겨야 한다. 전체 이력을 처리 월 ×
+의뢰 기관으로 나눈 Parquet 데이터셋으로 내보내고, 새 인스턴스로 한 번에 복원하거나
+병합한다. 앱 없이 pandas로도 바로 열 수 있다.
+
+    <보관 폴더>/
+        manifest.json                                   # 형식 버전, 건수, 데이터베이스 metadata/reports
+        files/month=2025-01/client=<기관>/part-0.parquet    # 파일 레코드 (요약/기타 키는 JSON 문자열)
+        results/month=2025-01/client=<기관>/part-0.parquet  # 결과 행 (file_id, position + 직렬화 필드)
+
+    pd.read_parquet("<보관 폴더>/results")  # month, client 파티션 컬럼 포함
+
+- 값 종류가 적은 문자열 컬럼은 딕셔너리 인코딩 (pandas에서는 category), zstd 압축
+- 파티션 값은 URI 인코딩 (pyarrow hive 파티션과 같은 방식), 빈 의뢰 기관은 null 파티션
+- 파티션마다 같은 스키마 (결과 컬럼 타입은 SQLite 저장소와 같은 구분), 컬럼 타입과
+  맞지 않는 값과 컬럼에 없는 키는 행의 extra JSON에 원래 값으로 보관해 가져올 때 되돌린다
+- manifest.json은 마지막에 쓰므로 manifest가 있는 폴더만 완성된 보관본이다
+
+명령행:
+    python -m src.core.parquet_archive export --archive backups/2025
+    python -m src.core.parquet_archive import --archive backups/2025 [--replace] [--db-folder 폴더] [--backend sqlite]
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+try:
+    from src.core.sqlite_store import FILE_COLUMNS, RESULT_FIELDS
+except ImportError:
+    from sqlite_store import FILE_COLUMNS, RESULT_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 미설치 시 보관 기능 비활성화
+    pa = None
+    pq = None
+
+ARCHIVE_VERSION = "1"
+MANIFEST_NAME = "manifest.json"
+FILES_DATASET = "files"
+RESULTS_DATASET = "results"
+PART_NAME = "part-0.parquet"
+
+# pyarrow hive 파티션의 null 값
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+# 파일 레코드 중 files 테이블 컬럼 (client는 파티션, 나머지 키는 extra JSON)
+_FILE_TABLE_COLUMNS = tuple(column for column in FILE_COLUMNS if column != "client")
+_FILE_RECORD_KEYS = frozenset(FILE_COLUMNS + ("summary", "test_results"))
+
+# 결과 행 컬럼 타입 (SQLite 저장소의 test_results 컬럼과 같은 구분, 나머지는 문자열)
+_INTEGER_FIELDS = frozenset(("no", "result_display_digits", "detection_status"))
+_REAL_FIELDS = frozenset(("tester_input_value", "test_result_display_limit", "result_value"))
+_BOOL_FIELDS = frozenset(("is_non_conforming",))
+# 값 종류가 많아 딕셔너리 인코딩하지 않는 문자열 컬럼
+_PLAIN_TEXT_FIELDS = frozenset(("analysis_number", "result_report", "input_datetime"))
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("Parquet 보관에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def partition_of(record: Dict[str, Any]) -> Tuple[str, str]:
+    """파일 레코드 → (처리 월, 의뢰 기관)"""
+    return str(record["processed_at"])[:7], record.get("client") or ""
+
+
+def partition_path(month: str, client: str) -> str:
+    return f"month={quote(month, safe='')}/client={quote(client, safe='') if client else NULL_PARTITION}"
+
+
+def _parse_partition(relative: Path) -> Tuple[str, str]:
+    values = dict(part.split("=", 1) for part in relative.parts if "=" in part)
+    client = values.get("client", NULL_PARTITION)
+    return unquote(values.get("month", "")), "" if client == NULL_PARTITION else unquote(client)
+
+
+def _field_type(name: str):
+    if name in _INTEGER_FIELDS or name == "position":
+        return pa.int64()
+    if name in _REAL_FIELDS:
+        return pa.float64()
+    if name in _BOOL_FIELDS:
+        return pa.bool_()
+    if name in _PLAIN_TEXT_FIELDS or name == "extra":
+        return pa.string()
+    return pa.dictionary(pa.int32(), pa.string())
+
+
+def _fits(value: Any, arrow_type) -> bool:
+    """값이 컬럼 타입에 그대로 들어가는지 (아니면 extra JSON에 원래 값으로 보관)"""
+    if value is None:
+        return True
+    if pa.types.is_int64(arrow_type):
+        return isinstance(value, int) and not isinstance(value, bool) and -2 ** 63 <= value < 2 ** 63
+    if pa.types.is_float64(arrow_type):
+        return isinstance(value, float)
+    if pa.types.is_boolean(arrow_type):
+        return isinstance(value, bool)
+    return isinstance(value, str)
+
+
+def _result_schema():
+    """모든 파티션이 같은 스키마를 갖도록 컬럼 타입 고정 (pandas에서 데이터셋 전체로 읽을 수 있게)"""
+    return pa.schema([(name, _field_type(name)) for name in ("file_id", "position") + RESULT_FIELDS + ("extra",)])
+
+
+def _file_schema():
+    """파일 레코드는 파일마다 값이 달라 모두 일반 문자열"""
+    return pa.schema([(name, pa.string()) for name in _FILE_TABLE_COLUMNS + ("summary", "extra")])
+
+
+def _table(columns: Dict[str, List[Any]], schema):
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(columns[field.name], type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(columns[field.name], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _split_row(row: Dict[str, Any], names: Iterable[str], known: frozenset,
+               schema) -> Tuple[List[Any], Optional[str]]:
+    """행 → (컬럼 값, extra JSON) - 컬럼에 없는 키와 타입이 맞지 않는 값은 extra로"""
+    values = []
+    extra = {key: value for key, value in row.items() if key not in known}
+    for name in names:
+        value = row.get(name)
+        if _fits(value, schema.field(name).type):
+            values.append(value)
+        else:
+            values.append(None)
+            extra[name] = value
+    return values, json.dumps(extra, ensure_ascii=False, default=str) if extra else None
+
+
+def _file_table(records: List[Dict[str, Any]]):
+    names = _FILE_TABLE_COLUMNS + ("summary",)
+    schema = _file_schema()
+    columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+    for record in records:
+        row = dict(record, summary=json.dumps(record.get("summary") or {}, ensure_ascii=False))
+        values, extra = _split_row(row, names, _FILE_RECORD_KEYS, schema)
+        for name, value in zip(names, values):
+            columns[name].append(value)
+        columns["extra"].append(extra)
+    return _table(columns, schema)
+
+
+def _result_table(records: List[Dict[str, Any]]):
+    schema = _result_schema()
+    known = frozenset(RESULT_FIELDS)
+    columns: Dict[str, List[Any]] = {name: [] for name in schema.names}
+    for record in records:
+        for position, row in enumerate(record.get("test_results") or []):
+            values, extra = _split_row(row, RESULT_FIELDS, known, schema)
+            columns["file_id"].append(record["file_id"])
+            columns["position"].append(position)
+            for name, value in zip(RESULT_FIELDS, values):
+                columns[name].append(value)
+            columns["extra"].append(extra)
+    return _table(columns, schema)
+
+
+def write_archive(folder, index_records: Iterable[Dict[str, Any]],
+                  load_record: Callable[[str], Optional[Dict[str, Any]]],
+                  database: Dict[str, Any], compression: str = "zstd") -> Dict[str, Any]:
+    """파일 레코드를 월 × 의뢰 기관 파티션으로 내보냄
+
+    Args:
+        folder: 보관 폴더 (비어 있지 않으면 FileExistsError)
+        index_records: 행 없는 파일 레코드 (파티션 구분용)
+        load_record: file_id → 행 포함 레코드 (파티션 하나씩 읽어 메모리 사용을 제한)
+        database: 데이터베이스의 metadata / reports
+
+    Returns:
+        files, rows, partitions, bytes
+    """
+    _require_pyarrow()
+    folder = Path(folder)
+    if folder.exists() and any(folder.iterdir()):
+        raise FileExistsError(f"보관 폴더가 비어 있지 않습니다: {folder}")
+
+    partitions: Dict[Tuple[str, str], List[str]] = {}
+    for record in index_records:
+        partitions.setdefault(partition_of(record), []).append(record["file_id"])
+
+    stats = {"files": 0, "rows": 0, "partitions": len(partitions), "bytes": 0}
+    for (month, client), file_ids in sorted(partitions.items()):
+        records = [record for record in map(load_record, file_ids) if record is not None]
+        relative = partition_path(month, client)
+        for dataset, table in ((FILES_DATASET, _file_table(records)), (RESULTS_DATASET, _result_table(records))):
+            path = folder / dataset / relative / PART_NAME
+            path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table, path, compression=compression, use_dictionary=True)
+            stats["bytes"] += path.stat().st_size
+        stats["files"] += len(records)
+        stats["rows"] += sum(len(record.get("test_results") or []) for record in records)
+
+    manifest = {
+        "version": ARCHIVE_VERSION,
+        "exported_at": datetime.now().isoformat(),
+        "files": stats["files"],
+        "rows": stats["rows"],
+        "partitions": stats["partitions"],
+        "metadata": database.get("metadata") or {},
+        "reports": database.get("reports") or {},
+    }
+    manifest_path = folder / MANIFEST_NAME
+    folder.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+    stats["bytes"] += manifest_path.stat().st_size
+    return stats
+
+
+def read_manifest(folder) -> Dict[str, Any]:
+    path = Path(folder) / MANIFEST_NAME
+    if not path.exists():
+        raise FileNotFoundError(f"보관본이 아니거나 내보내기가 끝나지 않은 폴더입니다: {folder}")
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if manifest.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"지원하지 않는 보관본 형식입니다: {manifest.get('version')}")
+    return manifest
+
+
+def read_archive(folder) -> Iterator[Dict[str, Any]]:
+    """보관본 → 행 포함 파일 레코드 (파티션 하나씩 읽음)"""
+    _require_pyarrow()
+    folder = Path(folder)
+    read_manifest(folder)
+    files_root = folder / FILES_DATASET
+    for files_path in sorted(files_root.rglob(PART_NAME)):
+        relative = files_path.parent.relative_to(files_root)
+        _, client = _parse_partition(relative)
+        rows_by_file: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        results_path = folder / RESULTS_DATASET / relative / PART_NAME
+        if results_path.exists():
+            for row in pq.read_table(results_path).to_pylist():
+                file_id, position, extra = row.pop("file_id"), row.pop("position"), row.pop("extra")
+                if extra:
+                    row.update(json.loads(extra))
+                rows_by_file.setdefault(file_id, []).append((position, row))
+
+        for file_row in pq.read_table(files_path).to_pylist():
+            extra = file_row.pop("extra")
+            if extra:
+                file_row.update(json.loads(extra))
+            record = dict(file_row, client=client)
+            record["summary"] = json.loads(record["summary"]) if isinstance(record["summary"], str) \
+                else record["summary"] or {}
+            record["test_results"] = [row for _, row in sorted(rows_by_file.get(record["file_id"], []),
+                                                                key=lambda item: item[0])]
+            yield record
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (Parquet 보관본 내보내기 / 가져오기)"""
+    parser = argparse.ArgumentParser(description="분석 이력 Parquet 보관본 내보내기/가져오기")
+    parser.add_argument("command", choices=("export", "import"))
+    parser.add_argument("--archive", required=True, help="보관 폴더")
+    parser.add_argument("--replace", action="store_true", help="가져오기 시 기존 내용을 보관본으로 교체")
+    try:
+        from src.core.database_manager import DEFAULT_DATABASE_FOLDER, open_configured_database
+    except ImportError:
+        from database_manager import DEFAULT_DATABASE_FOLDER, open_configured_database
+    parser.add_argument("--db-folder", default=str(DEFAULT_DATABASE_FOLDER), help="데이터베이스 저장 폴더")
+    parser.add_argument("--backend", choices=("sqlite", "json", "journal"), default=None,
+                        help="데이터베이스 종류 (sqlite | json | journal, 기본: 설정의 DB_TYPE)")
+    args = parser.parse_args(argv)
+
+    manager = open_configured_database(args.db_folder, args.backend)
+    if args.command == "export":
+        stats = manager.export_archive(args.archive)
+        print(f"내보내기 {stats['files']}건 / 행 {stats['rows']}개 / 파티션 {stats['partitions']}개, "
+              f"{stats['bytes'] / 1024:.1f}KB: {args.archive}")
+    else:
+        imported = manager.import_archive(args.archive, replace=args.replace)
+        print(f"가져오기 {imported}건: {manager.db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
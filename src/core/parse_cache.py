@@ -0,0 +1,271 @@
+"""
+파싱 결과 캐시 (Parse Cache)
+업로드 파일 내용의 SHA-256 + 파서 버전을 키로, 변환된 TestResultBatch를
+Arrow IPC 파일로 디스크에 저장하여 같은 파일을 다시 올릴 때 재파싱을 생략
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+try:
+    from src.core.data_models import TestResultBatch
+except ImportError:
+    from data_models import TestResultBatch
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pyarrow 미설치 시 캐시 비활성화
+    pa = None
+    pa_ipc = None
+
+logger = logging.getLogger(__name__)
+
+# 캐시 파일 확장자
+CACHE_SUFFIX = '.arrow'
+
+# 스키마 메타데이터 키
+_META_KEY = b'aqua_parse_cache'
+
+# 문자열이 아닌 카테고리 값 복원용 타입
+_SCALAR_TYPES = {'int': int, 'float': float, 'bool': lambda value: value == 'True'}
+
+
+def content_key(content: bytes, parser_version: str) -> str:
+    """파일 내용 + 파서 버전 → 캐시 키 (SHA-256)"""
+    digest = hashlib.sha256()
+    digest.update(content)
+    digest.update(b'\0parser=')
+    digest.update(str(parser_version).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def file_key(file_path: Union[str, Path], parser_version: str, block_size: int = 1024 * 1024) -> str:
+    """파일 경로 → 캐시 키 (내용을 블록 단위로 읽어 해시, content_key와 동일한 값)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    digest.update(b'\0parser=')
+    digest.update(str(parser_version).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def batch_to_table(batch: TestResultBatch, metadata: Optional[Dict[str, Any]] = None) -> 'pa.Table':
+    """TestResultBatch → Arrow 테이블 (문자열 필드는 dictionary 인코딩 유지)"""
+    arrays, names = [], []
+    scalar_categories = {}
+
+    for field in batch.FIELDS:
+        if field in batch.CATEGORICAL_FIELDS:
+            categories = batch.categories(field).tolist()
+            non_str = {}
+            for index, value in enumerate(categories):
+                if isinstance(value, str):
+                    continue
+                # 결과(성적서)처럼 수치가 섞인 필드는 문자열로 저장하고 타입을 메타데이터에 기록
+                if isinstance(value, (bool, np.bool_)):
+                    non_str[index] = 'bool'
+                elif isinstance(value, (int, np.integer)):
+                    non_str[index] = 'int'
+                elif isinstance(value, (float, np.floating)):
+                    non_str[index] = 'float'
+                else:
+                    raise TypeError(f"캐시할 수 없는 값 유형: {field}={type(value).__name__}")
+                categories[index] = repr(value.item() if hasattr(value, 'item') else value)
+            if non_str:
+                scalar_categories[field] = non_str
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(batch.codes(field).astype(np.int32)),
+                pa.array(categories, type=pa.string())
+            ))
+        else:
+            arrays.append(pa.array(batch.column(field)))
+        names.append(field)
+
+    table_metadata = dict(metadata or {})
+    table_metadata['scalar_categories'] = scalar_categories
+    return pa.Table.from_arrays(arrays, names=names).replace_schema_metadata(
+        {_META_KEY: json.dumps(table_metadata, ensure_ascii=False).encode('utf-8')}
+    )
+
+
+def table_to_batch(table: 'pa.Table') -> TestResultBatch:
+    """Arrow 테이블 → TestResultBatch"""
+    metadata = json.loads((table.schema.metadata or {}).get(_META_KEY, b'{}'))
+    scalar_categories = metadata.get('scalar_categories', {})
+    codes, categories, numeric, datetimes = {}, {}, {}, {}
+
+    for field in TestResultBatch.FIELDS:
+        column = table.column(field)
+        if field in TestResultBatch.CATEGORICAL_FIELDS:
+            column = column.combine_chunks() if column.num_chunks else pa.array([], type=column.type)
+            values = column.dictionary.to_pylist()
+            for index, type_name in scalar_categories.get(field, {}).items():
+                values[int(index)] = _SCALAR_TYPES[type_name](values[int(index)])
+            field_codes = column.indices.to_numpy(zero_copy_only=False)
+            codes[field] = field_codes.astype(np.min_scalar_type(max(len(values) - 1, 0)))
+            category_array = np.empty(len(values), dtype=object)
+            category_array[:] = values
+            categories[field] = category_array
+        elif field in TestResultBatch.DATETIME_FIELDS:
+            datetimes[field] = column.to_numpy().astype('datetime64[ns]')
+        else:
+            numeric[field] = column.to_numpy()
+
+    return TestResultBatch(codes, categories, numeric, datetimes)
+
+
+class ParseCache:
+    """내용 해시 기반 파싱 결과 디스크 캐시
+
+    - 키: SHA-256(파일 내용) + 파서 버전 (파서 변환 규칙이 바뀌면 자동으로 다른 키)
+    - 값: TestResultBatch를 Arrow IPC 파일(<key>.arrow)로 저장, 조회 시 메모리 맵으로 읽음
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = "data/cache/parse", max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if pa is None:
+            logger.warning("pyarrow가 설치되지 않아 파싱 캐시를 사용하지 않습니다")
+        else:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return pa is not None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Optional[TestResultBatch]:
+        """캐시 조회 (없거나 손상된 경우 None)"""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with pa.memory_map(str(path), 'r') as source:
+                table = pa_ipc.open_file(source).read_all()
+            batch = table_to_batch(table)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            logger.warning(f"손상된 파싱 캐시 삭제: {path.name} ({e})")
+            self.invalidate(key)
+            self.misses += 1
+            return None
+
+        # LRU 정리를 위해 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return batch
+
+    def put(self, key: str, batch: TestResultBatch, source_name: Optional[str] = None) -> bool:
+        """캐시 저장 (원자적 교체 후 용량 초과분 정리)"""
+        if not self.enabled:
+            return False
+
+        try:
+            table = batch_to_table(batch, {
+                'source_name': source_name,
+                'rows': len(batch),
+                'created_at': time.time(),
+            })
+        except TypeError as e:
+            logger.info(f"파싱 캐시 저장 생략: {e}")
+            return False
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as sink:
+                with pa_ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, self._path(key))
+        except Exception as e:
+            logger.warning(f"파싱 캐시 저장 실패: {e}")
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return False
+
+        self._evict(keep=key)
+        return True
+
+    def invalidate(self, key: str) -> bool:
+        """캐시 항목 하나 삭제"""
+        try:
+            self._path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def invalidate_content(self, content: bytes, parser_version: str) -> bool:
+        """파일 내용 기준으로 캐시 항목 삭제"""
+        return self.invalidate(content_key(content, parser_version))
+
+    def clear(self) -> int:
+        """전체 캐시 삭제 (삭제한 항목 수 반환)"""
+        removed = 0
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _evict(self, keep: Optional[str] = None):
+        """용량 초과 시 사용 시각이 오래된 항목부터 삭제 (방금 저장한 항목은 유지)"""
+        with self._lock:
+            entries = []
+            for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if keep is not None and path.stem == keep:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                    logger.debug(f"파싱 캐시 제거: {path.name}")
+                except FileNotFoundError:
+                    total -= size
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        sizes = [path.stat().st_size for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}")] if self.enabled else []
+        total_requests = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'entries': len(sizes),
+            'total_bytes': sum(sizes),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total_requests * 100) if total_requests > 0 else 0,
+        }
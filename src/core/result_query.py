@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+과거 시험 결과 교차 조회 (시험항목 / 시험자 / 시료명 / 의뢰 기관 / 기간 / 부적합 여부)
+"2분기 X 기관의 아크릴로나이트릴 부적합 결과" 같은 질의를 위해 모든 파일을 읽고
+행을 순회하지 않도록 조건에 맞을 수 있는 파일만 골라 그 행만 거른다.
+
+- JSON 백엔드: 저장 시 레코드에 기록한 값 집합(시험자, 시료명)과 롤업의 시험항목,
+  의뢰 기관으로 값 → file_id 역색인을 만든다 (로드된 데이터마다 한 번).
+  후보 파일은 처리 시각 인덱스 순으로 읽고, 롤업으로 부적합 조건을 미리 거른다.
+- SQLite 백엔드: test_results 보조 인덱스(시험항목, 시험자, 시료명, 부적합 여부)로 조회.
+
+결과 행은 직렬화된 행에 file_id, file_name, client, processed_at을 더한 딕셔너리이며
+최신 파일부터 파일 내 행 순서로 나온다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+try:
+    from src.core.rollups import ROLLUP_FIELD, TOTAL, VIOLATIONS, is_violation
+except ImportError:
+    from rollups import ROLLUP_FIELD, TOTAL, VIOLATIONS, is_violation
+
+# 파일 레코드의 행 값 집합 키 ({"tester": [...], "sample_name": [...]})
+VALUE_SETS_FIELD = "value_sets"
+
+# 값 집합을 기록하는 행 필드 (시험항목은 롤업 키로 대신함)
+VALUE_SET_ROW_FIELDS = ("tester", "sample_name")
+
+# 결과 행에 더하는 파일 레코드 필드
+FILE_CONTEXT_FIELDS = ("file_id", "file_name", "client", "processed_at")
+
+
+def value_sets(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """직렬화된 행 → 필드별 고유값 목록 (파일 후보 선별용)"""
+    sets: Dict[str, Set[str]] = {name: set() for name in VALUE_SET_ROW_FIELDS}
+    for row in rows:
+        for name in VALUE_SET_ROW_FIELDS:
+            value = row.get(name)
+            if value:
+                sets[name].add(str(value))
+    return {name: sorted(values) for name, values in sets.items()}
+
+
+@dataclass
+class ResultQuery:
+    """결과 조회 조건 (None이면 조건 없음, 문자열은 정확히 일치)"""
+    test_item: Optional[str] = None
+    tester: Optional[str] = None
+    sample_name: Optional[str] = None
+    client: Optional[str] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    non_conforming: Optional[bool] = None
+
+    def row_conditions(self) -> List[Tuple[str, str]]:
+        """행 필드 조건 (필드, 값)"""
+        return [(name, getattr(self, name)) for name in ("test_item", "tester", "sample_name")
+                if getattr(self, name) is not None]
+
+    def matches_row(self, row: Dict[str, Any]) -> bool:
+        for name, value in self.row_conditions():
+            if row.get(name) != value:
+                return False
+        if self.non_conforming is not None:
+            return is_violation(row.get("is_non_conforming", False)) == self.non_conforming
+        return True
+
+    def may_match_file(self, record: Dict[str, Any]) -> bool:
+        """파일 레코드의 요약/롤업만으로 제외할 수 있으면 False"""
+        if self.client is not None and record.get("client") != self.client:
+            return False
+        if self.non_conforming is None:
+            return True
+        rollup = record.get(ROLLUP_FIELD)
+        if self.test_item is not None and rollup is not None:
+            stats = rollup.get(self.test_item)
+            if not stats:
+                return False
+            matching = stats[VIOLATIONS] if self.non_conforming else stats[TOTAL] - stats[VIOLATIONS]
+            return matching > 0
+        if self.non_conforming:
+            return (record.get("summary") or {}).get("fail_items", 1) > 0
+        return True
+
+
+@dataclass
+class ResultPage:
+    """결과 한 페이지 (has_more면 next_offset으로 다음 페이지)"""
+    rows: List[Dict[str, Any]]
+    offset: int
+    limit: int
+    has_more: bool = False
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        return self.offset + len(self.rows) if self.has_more else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """컬럼형 DataFrame"""
+        return pd.DataFrame(self.rows)
+
+
+class FileValueIndex:
+    """값 → file_id 역색인 (시험항목, 시험자, 시료명, 의뢰 기관)
+
+    값 집합이 기록되기 전의 레코드는 해당 필드에서 항상 후보로 남긴다.
+    """
+
+    FIELDS = ("test_item",) + VALUE_SET_ROW_FIELDS + ("client",)
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self.postings: Dict[str, Dict[str, Set[str]]] = {name: {} for name in self.FIELDS}
+        self.unindexed: Dict[str, Set[str]] = {name: set() for name in self.FIELDS}
+        for record in records:
+            self.add(record)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        file_id = record["file_id"]
+        rollup = record.get(ROLLUP_FIELD)
+        sets = record.get(VALUE_SETS_FIELD)
+        values = {
+            "test_item": None if rollup is None else rollup.keys(),
+            "client": [record.get("client")],
+        }
+        for name in VALUE_SET_ROW_FIELDS:
+            values[name] = None if sets is None else sets.get(name, [])
+        for name, field_values in values.items():
+            if field_values is None:
+                self.unindexed[name].add(file_id)
+                continue
+            for value in field_values:
+                self.postings[name].setdefault(value, set()).add(file_id)
+
+    def candidates(self, query: ResultQuery) -> Optional[Set[str]]:
+        """조건에 맞을 수 있는 file_id (색인 조건이 없으면 None)"""
+        matched_sets = []
+        for name in self.FIELDS:
+            value = getattr(query, name)
+            if value is None:
+                continue
+            matched = self.postings[name].get(value, set())
+            if self.unindexed[name]:
+                matched = matched | self.unindexed[name]
+            matched_sets.append(matched)
+        if not matched_sets:
+            return None
+        matched_sets.sort(key=len)
+        result = set(matched_sets[0])
+        for matched in matched_sets[1:]:
+            result &= matched
+        return result
+
+
+def with_file_context(row: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    """결과 행 사본 + 파일 레코드 필드"""
+    result = dict(row)
+    for name in FILE_CONTEXT_FIELDS:
+        result[name] = record.get(name)
+    return result
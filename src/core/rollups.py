@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+기간 분석용 일별 롤업 (일자 × 의뢰 기관 × 시험항목)
+통합 분석은 기간 안의 모든 파일의 모든 행을 매번 다시 세어 항목별 적합/부적합,
+월별 통계, 의뢰 기관 집계를 만든다. 파일을 저장할 때 시험항목별 누적값
+(건수, 부적합 건수, 수치 건수/합/최소/최대)을 레코드에 함께 기록해 두고,
+기간 조회는 일별 버킷 범위만 합친다 (행 수와 무관).
+
+시험항목 누적값은 [건수, 부적합, 수치 건수, 수치 합, 최소, 최대] 목록이다.
+기간 경계가 하루 중간이면 그 날짜만 파일 단위로 처리 시각을 비교한다.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 파일 레코드의 시험항목별 누적값 키
+ROLLUP_FIELD = "rollup"
+
+# 시험항목 누적값 위치
+TOTAL, VIOLATIONS, NUMERIC_COUNT, NUMERIC_SUM, NUMERIC_MIN, NUMERIC_MAX = range(6)
+
+
+def is_violation(value) -> bool:
+    """is_non_conforming 값 해석 (문자열 'true'/'1'/'yes'도 부적합)"""
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
+def item_rollup(rows: Iterable[Dict[str, Any]]) -> Dict[str, List]:
+    """직렬화된 행 → 시험항목별 누적값 (시험항목이 빈 행은 제외)"""
+    items: Dict[str, List] = {}
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        item = row.get("test_item", "")
+        if not item:
+            continue
+        stats = items.get(item)
+        if stats is None:
+            stats = items[item] = [0, 0, 0, 0.0, None, None]
+        stats[TOTAL] += 1
+        if is_violation(row.get("is_non_conforming", False)):
+            stats[VIOLATIONS] += 1
+        value = row.get("result_value")
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and not math.isnan(value):
+            stats[NUMERIC_COUNT] += 1
+            stats[NUMERIC_SUM] += value
+            stats[NUMERIC_MIN] = value if stats[NUMERIC_MIN] is None else min(stats[NUMERIC_MIN], value)
+            stats[NUMERIC_MAX] = value if stats[NUMERIC_MAX] is None else max(stats[NUMERIC_MAX], value)
+    return items
+
+
+def merge_item_stats(target: List, stats: List) -> None:
+    """시험항목 누적값 합치기 (target에 더함)"""
+    for index in (TOTAL, VIOLATIONS, NUMERIC_COUNT, NUMERIC_SUM):
+        target[index] += stats[index] or 0
+    if stats[NUMERIC_MIN] is not None:
+        target[NUMERIC_MIN] = stats[NUMERIC_MIN] if target[NUMERIC_MIN] is None \
+            else min(target[NUMERIC_MIN], stats[NUMERIC_MIN])
+    if stats[NUMERIC_MAX] is not None:
+        target[NUMERIC_MAX] = stats[NUMERIC_MAX] if target[NUMERIC_MAX] is None \
+            else max(target[NUMERIC_MAX], stats[NUMERIC_MAX])
+
+
+def full_day_range(start: datetime, end: datetime) -> Optional[Tuple[date, date]]:
+    """[start, end]에 하루 전체가 들어가는 첫 날짜와 마지막 날짜 (없으면 None)"""
+    first = start.date() if start.time() == datetime.min.time() else start.date() + timedelta(days=1)
+    last = end.date() if end.time() == datetime.max.time() else end.date() - timedelta(days=1)
+    return (first, last) if first <= last else None
+
+
+class PeriodRollup:
+    """기간 집계 누적기 - 일별 버킷과 파일 단위 기여분을 같은 방식으로 더함"""
+
+    def __init__(self):
+        self.total_files = 0
+        self.total_tests = 0
+        self.total_violations = 0
+        self.client_files: Dict[str, int] = {}
+        self.items: Dict[str, List] = {}
+        self.monthly: Dict[str, Dict[str, int]] = {}
+
+    def add_files(self, day: str, client: str, files: int, tests: int, violations: int) -> None:
+        self.total_files += files
+        self.total_tests += tests or 0
+        self.total_violations += violations or 0
+        if client:
+            self.client_files[client] = self.client_files.get(client, 0) + files
+        month = self.monthly.setdefault(day[:7], {"files": 0, "tests": 0, "violations": 0})
+        month["files"] += files
+        month["tests"] += tests or 0
+        month["violations"] += violations or 0
+
+    def add_items(self, items: Dict[str, List]) -> None:
+        for item, stats in items.items():
+            target = self.items.get(item)
+            if target is None:
+                target = self.items[item] = [0, 0, 0, 0.0, None, None]
+            merge_item_stats(target, stats)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_files": self.total_files,
+            "total_tests": self.total_tests,
+            "total_violations": self.total_violations,
+            "client_files": self.client_files,
+            "conforming_items": {item: stats[TOTAL] - stats[VIOLATIONS] for item, stats in self.items.items()
+                                 if stats[TOTAL] > stats[VIOLATIONS]},
+            "non_conforming_items": {item: stats[VIOLATIONS] for item, stats in self.items.items()
+                                     if stats[VIOLATIONS]},
+            "monthly_stats": self.monthly,
+            "item_stats": {
+                item: {
+                    "total": stats[TOTAL],
+                    "violations": stats[VIOLATIONS],
+                    "numeric_count": stats[NUMERIC_COUNT],
+                    "sum": stats[NUMERIC_SUM] if stats[NUMERIC_COUNT] else None,
+                    "min": stats[NUMERIC_MIN],
+                    "max": stats[NUMERIC_MAX],
+                }
+                for item, stats in self.items.items()
+            },
+        }
+
+
+class DailyRollups:
+    """파일 레코드의 롤업 → 날짜순 일별 버킷 (JSON 백엔드용, 로드된 데이터마다 한 번 생성)
+
+    버킷은 일자 → 의뢰 기관 → {"files", "tests", "violations", "items"}이다.
+    롤업이 없는 이전 레코드는 rows_loader로 행을 읽어 계산한다.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]],
+                 rows_loader: Optional[Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = None):
+        self.buckets: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # 경계 날짜용 파일 단위 기여분 (처리 시각, 의뢰 기관, 검사 수, 부적합 수, 항목 롤업)
+        self.entries: Dict[str, List[Tuple[datetime, str, int, int, Dict[str, List]]]] = {}
+        for record in records:
+            self.add(record, rows_loader)
+        self.days = sorted(self.buckets)
+
+    def add(self, record: Dict[str, Any], rows_loader=None) -> None:
+        processed_at = datetime.fromisoformat(record["processed_at"])
+        day = processed_at.date().isoformat()
+        client = record.get("client") or ""
+        summary = record.get("summary") or {}
+        tests, violations = summary.get("total_items", 0), summary.get("fail_items", 0)
+        items = record.get(ROLLUP_FIELD)
+        if items is None:
+            rows = record.get("test_results")
+            if rows is None and rows_loader is not None:
+                rows = rows_loader(record)
+            items = item_rollup(rows or [])
+
+        bucket = self.buckets.setdefault(day, {}).setdefault(
+            client, {"files": 0, "tests": 0, "violations": 0, "items": {}})
+        bucket["files"] += 1
+        bucket["tests"] += tests
+        bucket["violations"] += violations
+        for item, stats in items.items():
+            target = bucket["items"].get(item)
+            if target is None:
+                target = bucket["items"][item] = [0, 0, 0, 0.0, None, None]
+            merge_item_stats(target, stats)
+        self.entries.setdefault(day, []).append((processed_at, client, tests, violations, items))
+
+    def query(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        """[start, end] 기간 집계 (하루 전체가 들어가는 날짜는 버킷, 경계 날짜는 파일 단위)"""
+        result = PeriodRollup()
+        full = full_day_range(start, end)
+        low = bisect_left(self.days, start.date().isoformat())
+        high = bisect_right(self.days, end.date().isoformat())
+        for day in self.days[low:high]:
+            if full is not None and full[0].isoformat() <= day <= full[1].isoformat():
+                for client, bucket in self.buckets[day].items():
+                    result.add_files(day, client, bucket["files"], bucket["tests"], bucket["violations"])
+                    result.add_items(bucket["items"])
+                continue
+            for processed_at, client, tests, violations, items in self.entries[day]:
+                if start <= processed_at <= end:
+                    result.add_files(day, client, 1, tests, violations)
+                    result.add_items(items)
+        return result.to_dict()
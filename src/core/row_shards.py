@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+파일별 행 샤드 - JSON 데이터베이스의 요약 인덱스와 행 데이터 분리
+목록/기간 조회는 요약(summary/client/processed_at)만 필요하지만, 행까지 한 파일에
+있으면 매번 모든 레코드의 test_results를 역직렬화해야 한다.
+행(test_results)과 행 해시(row_hashes)는 file_id마다 gzip 압축 JSON 파일 하나로
+따로 저장하고, 인덱스 레코드에는 샤드 이름만 남긴다. 행은 특정 보고서나
+상세 조회가 필요할 때만 읽는다.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 인덱스에서 빼서 샤드로 옮기는 레코드 키
+SHARD_KEYS = ("test_results", "row_hashes")
+
+# 인덱스 레코드의 샤드 이름 키
+SHARD_FIELD = "shard"
+
+SHARD_SUFFIX = ".json.gz"
+
+
+class RowShardStore:
+    """file_id별 행 샤드 폴더"""
+
+    def __init__(self, folder, compresslevel: int = 5):
+        self.folder = Path(folder)
+        self.compresslevel = compresslevel
+
+    def path(self, file_id: str) -> Path:
+        return self.folder / f"{file_id}{SHARD_SUFFIX}"
+
+    def split(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """레코드의 행을 샤드에 쓰고 인덱스 레코드 반환 (행이 없으면 그대로)"""
+        if "test_results" not in record:
+            return record
+        payload = {key: record[key] for key in SHARD_KEYS if key in record}
+        self.write(record["file_id"], payload)
+        index_record = {key: value for key, value in record.items() if key not in SHARD_KEYS}
+        index_record[SHARD_FIELD] = self.path(record["file_id"]).name
+        return index_record
+
+    def hydrate(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """인덱스 레코드 + 샤드 행 → 전체 레코드 (샤드가 없는 레코드는 그대로)"""
+        if SHARD_FIELD not in record:
+            return record
+        full = {key: value for key, value in record.items() if key != SHARD_FIELD}
+        full.update(self.read(record["file_id"]) or {"test_results": []})
+        return full
+
+    @staticmethod
+    def index_only(record: Dict[str, Any]) -> Dict[str, Any]:
+        """행을 뺀 인덱스 레코드 (샤드 여부와 무관하게 같은 형식)"""
+        return {key: value for key, value in record.items() if key not in SHARD_KEYS and key != SHARD_FIELD}
+
+    def write(self, file_id: str, payload: Dict[str, Any]) -> None:
+        """샤드 원자적 쓰기 (인덱스/저널이 가리키기 전에 디스크에 반영)"""
+        self.folder.mkdir(parents=True, exist_ok=True)
+        path = self.path(file_id)
+        temp_path = path.with_name(path.name + ".tmp")
+        data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(temp_path, 'wb') as f:
+            f.write(gzip.compress(data, compresslevel=self.compresslevel, mtime=0))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    def read(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """샤드 읽기 (없으면 None)"""
+        try:
+            with open(self.path(file_id), 'rb') as f:
+                return json.loads(gzip.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+
+    def delete(self, file_id: str) -> None:
+        try:
+            self.path(file_id).unlink()
+        except FileNotFoundError:
+            pass
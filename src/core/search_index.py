@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+전체 이력 부분 문자열 검색 인덱스 (시료명 / 분석번호 / 시험항목 / 시험자)
+표의 검색은 현재 파일의 행마다 네 필드를 소문자로 바꿔 `in`으로 비교한다.
+저장된 모든 파일의 행을 SQLite FTS5 trigram 인덱스에 넣어 두고, 검색어의
+3글자 조각으로 후보 행을 찾은 뒤 instr()로 확인한다.
+
+- search_rows: 행 문서 (file_id, 위치, 처리 시각) - rowid가 search_text의 rowid
+- search_text: 행의 검색 필드를 소문자로 이은 텍스트 (FTS5 trigram)
+- 파일 단위로 넣고 지우므로 저장/병합/삭제 때 바뀐 파일만 갱신한다
+
+SQLite 백엔드는 같은 데이터베이스의 쓰기 트랜잭션에서 갱신하고, JSON 백엔드는
+<이름>_search.db 보조 파일(SearchIndex)에 두고 indexed_files로 어긋난 파일을 맞춘다.
+검색어에 3글자 이상 조각이 없거나 FTS5 trigram을 쓸 수 없는 SQLite면 텍스트 전체를 훑는다
+(텍스트만 담은 테이블이라 행 전체를 훑는 것보다는 가볍다).
+"""
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 검색 대상 행 필드
+SEARCH_FIELDS = ("sample_name", "analysis_number", "test_item", "tester")
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_rows (
+    id INTEGER PRIMARY KEY,
+    file_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    processed_at TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_search_rows_file ON search_rows(file_id, position);
+"""
+
+_CREATE_FTS = "CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5(text, tokenize='trigram')"
+# FTS5 trigram이 없는 SQLite (3.34 미만 등)
+_CREATE_PLAIN = "CREATE TABLE IF NOT EXISTS search_text (text TEXT)"
+
+# trigram 인덱스는 LIKE 패턴에 와일드카드(%, _) 사이의 3글자 이상 조각이 있어야 쓸 수 있다
+_TRIGRAM_RUN = re.compile(r"[^%_]{3,}")
+
+
+def search_text(row: Dict[str, Any]) -> str:
+    """행 → 검색 텍스트 (필드를 줄바꿈으로 이음 - 줄바꿈이 든 검색어는 찾지 않으므로 필드 경계를 넘는 일치 없음)"""
+    return "\n".join(str(row.get(name) or "").replace("\n", " ") for name in SEARCH_FIELDS).lower()
+
+
+def normalize_term(term: str) -> str:
+    return (term or "").strip().lower()
+
+
+def match_clause(term: str, column: str = "s.text") -> Tuple[str, Tuple[str, ...]]:
+    """정규화된 검색어 → (WHERE 조건, 인자)
+
+    LIKE는 trigram 인덱스로 후보를 줄이는 용도이고 (%, _는 와일드카드라 후보가 넓어짐)
+    일치 여부는 instr()로 확인한다. 3글자 조각이 없으면 instr()만으로 훑는다.
+    """
+    if _TRIGRAM_RUN.search(term):
+        return f"{column} LIKE ? AND instr({column}, ?) > 0", (f"%{term}%", term)
+    return f"instr({column}, ?) > 0", (term,)
+
+
+def create_search_tables(conn: sqlite3.Connection) -> None:
+    conn.executescript(SEARCH_SCHEMA)
+    try:
+        conn.execute(_CREATE_FTS)
+    except sqlite3.OperationalError:
+        conn.execute(_CREATE_PLAIN)
+
+
+def index_rows(conn: sqlite3.Connection, file_id: str, processed_at: str,
+               rows: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+    """(위치, 행)을 검색 인덱스에 넣음 (같은 위치의 기존 문서는 호출자가 먼저 delete_rows로 지움)"""
+    texts = {position: search_text(row) for position, row in rows}
+    if not texts:
+        return
+    conn.executemany("INSERT INTO search_rows (file_id, position, processed_at) VALUES (?, ?, ?)",
+                     [(file_id, position, processed_at) for position in texts])
+    # 방금 넣은 문서의 id (같은 트랜잭션 안이라 (file_id, position)으로 찾음)
+    ids = dict(conn.execute("SELECT position, id FROM search_rows WHERE file_id = ?", (file_id,)))
+    conn.executemany("INSERT INTO search_text (rowid, text) VALUES (?, ?)",
+                     [(ids[position], text) for position, text in texts.items()])
+
+
+def delete_rows(conn: sqlite3.Connection, file_id: str, positions: Optional[List[int]] = None) -> None:
+    """파일의 행 문서 삭제 (positions가 None이면 파일 전체)"""
+    if positions is None:
+        ids = [row[0] for row in conn.execute("SELECT id FROM search_rows WHERE file_id = ?", (file_id,))]
+    else:
+        ids = [row[0] for position in positions for row in conn.execute(
+            "SELECT id FROM search_rows WHERE file_id = ? AND position = ?", (file_id, position))]
+    conn.executemany("DELETE FROM search_text WHERE rowid = ?", [(row_id,) for row_id in ids])
+    conn.executemany("DELETE FROM search_rows WHERE id = ?", [(row_id,) for row_id in ids])
+
+
+def search_hits(conn: sqlite3.Connection, term: str, offset: int = 0,
+                limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """검색어를 포함하는 행의 (file_id, 위치) - 최신 파일부터 파일 내 행 순서"""
+    term = normalize_term(term)
+    if not term or "\n" in term:
+        return []
+    where, params = match_clause(term)
+    return conn.execute(
+        "SELECT r.file_id, r.position FROM search_text s JOIN search_rows r ON r.id = s.rowid "
+        f"WHERE {where} ORDER BY r.processed_at DESC, r.file_id, r.position LIMIT ? OFFSET ?",
+        params + (-1 if limit is None else limit, offset)).fetchall()
+
+
+class SearchIndex:
+    """JSON 백엔드용 검색 인덱스 보조 파일
+
+    indexed_files에 파일별로 색인할 때의 처리 시각을 두고, sync()가 데이터베이스의
+    레코드와 비교해 새로 생기거나 바뀐 파일은 다시 넣고 없어진 파일은 지운다
+    (다른 프로세스의 저장, 전체 저장, 색인 전에 중단된 저장을 맞춤).
+    연결은 스레드마다 하나씩 유지한다.
+    """
+
+    def __init__(self, path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                create_search_tables(conn)
+                conn.execute("CREATE TABLE IF NOT EXISTS indexed_files "
+                             "(file_id TEXT PRIMARY KEY, processed_at TEXT NOT NULL)")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def put(self, records: Iterable[Dict[str, Any]]) -> None:
+        """행을 포함한 파일 레코드 색인 (파일의 기존 문서는 교체, 한 트랜잭션)"""
+        conn = self._connect()
+        with conn:
+            for record in records:
+                self._put(conn, record)
+
+    @staticmethod
+    def _put(conn: sqlite3.Connection, record: Dict[str, Any]) -> None:
+        delete_rows(conn, record["file_id"])
+        index_rows(conn, record["file_id"], record["processed_at"],
+                   enumerate(record.get("test_results") or []))
+        conn.execute("INSERT OR REPLACE INTO indexed_files (file_id, processed_at) VALUES (?, ?)",
+                     (record["file_id"], record["processed_at"]))
+
+    def delete(self, file_id: str) -> None:
+        conn = self._connect()
+        with conn:
+            delete_rows(conn, file_id)
+            conn.execute("DELETE FROM indexed_files WHERE file_id = ?", (file_id,))
+
+    def sync(self, records: Dict[str, Dict[str, Any]],
+             hydrate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> int:
+        """데이터베이스 레코드와 색인을 맞춤 (다시 색인한 파일 수 반환, 바뀐 파일의 행만 읽음)"""
+        conn = self._connect()
+        indexed = dict(conn.execute("SELECT file_id, processed_at FROM indexed_files"))
+        stale = [file_id for file_id in indexed if file_id not in records]
+        changed = [record for file_id, record in records.items() if indexed.get(file_id) != record["processed_at"]]
+        if not stale and not changed:
+            return 0
+        with conn:
+            for file_id in stale:
+                delete_rows(conn, file_id)
+                conn.execute("DELETE FROM indexed_files WHERE file_id = ?", (file_id,))
+            for record in changed:
+                self._put(conn, hydrate(record))
+        return len(changed)
+
+    def search(self, term: str, offset: int = 0, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        return search_hits(self._connect(), term, offset, limit)
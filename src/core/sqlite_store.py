@@ -0,0 +1,658 @@
+#!/usr/bin/env python3
+"""
+SQLite 저장소 - DatabaseManager의 SQLite 백엔드
+파일 레코드 하나에 모든 직렬화 결과를 담던 JSON 데이터베이스를 정규화된
+files / test_results 테이블로 나누어 저장한다.
+
+- files: 파일 레코드 요약 (처리 시각·의뢰 기관 인덱스)
+- test_results: 행 단위 결과 (파일의 처리 시각·순번을 함께 두고, 시험항목·시험자·시료명·부적합 여부별로
+  결과 조회 순서(최신 파일부터 파일 내 행 순서)대로 정렬된 인덱스 - 페이지 조회가 정렬 없이 LIMIT에서 멈춤)
+- analysis_prefixes: 증분 재수집용 접수번호 접두 (접두 인덱스)
+- file_rollups / daily_*_rollups: 기간 분석용 파일별·일별 누적값 (쓰기 트랜잭션에서 갱신)
+- search_rows / search_text: 시료명·분석번호·시험항목·시험자 부분 문자열 검색 (FTS5 trigram)
+- WAL 모드로 읽기와 쓰기가 서로 막지 않는다
+
+JSON 데이터베이스에서 한 번에 옮기기:
+    python -m src.core.sqlite_store --json data/analysis_database.json --db data/lab_dashboard.db
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    from src.core.rollups import PeriodRollup, full_day_range
+except ImportError:
+    from rollups import PeriodRollup, full_day_range
+
+try:
+    from src.core.search_index import (SEARCH_FIELDS, create_search_tables, delete_rows, index_rows,
+                                       match_clause, normalize_term)
+except ImportError:
+    from search_index import (SEARCH_FIELDS, create_search_tables, delete_rows, index_rows,
+                              match_clause, normalize_term)
+
+# 2: 롤업 테이블 추가 (1에서 열면 기존 행으로 채움)
+# 3: 부분 문자열 검색 인덱스 추가 (2 이하에서 열면 기존 행으로 채움)
+# 4: test_results에 processed_at/file_seq와 조회 순서 인덱스 추가 (3 이하에서 열면 files에서 채움)
+SCHEMA_VERSION = "4"
+
+# files 테이블에 컬럼으로 두는 레코드 키 (나머지는 extra JSON)
+FILE_COLUMNS = ("file_id", "file_name", "project_name", "client", "processed_at", "report_path")
+
+# test_results 컬럼 (DatabaseManager 직렬화 형식과 같은 순서)
+RESULT_FIELDS = (
+    "no", "sample_name", "analysis_number", "test_item", "test_unit", "result_report",
+    "tester_input_value", "standard_excess", "tester", "test_standard", "standard_criteria",
+    "text_digits", "processing_method", "result_display_digits", "result_type", "tester_group",
+    "input_datetime", "approval_request", "test_result_display_limit",
+    "quantitative_limit_processing", "test_equipment", "judgment_status", "report_output",
+    "kolas_status", "test_lab_group", "test_set", "is_non_conforming", "result_value",
+    "detection_status",
+)
+_RESULT_FIELD_SET = frozenset(RESULT_FIELDS)
+_RECORD_KEYS = frozenset(FILE_COLUMNS + ("summary", "test_results", "analysis_prefixes"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS files (
+    file_id TEXT PRIMARY KEY,
+    file_name TEXT,
+    project_name TEXT,
+    client TEXT,
+    processed_at TEXT NOT NULL,
+    report_path TEXT,
+    summary TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_files_processed_at ON files(processed_at);
+CREATE INDEX IF NOT EXISTS idx_files_client ON files(client);
+CREATE TABLE IF NOT EXISTS test_results (
+    file_id TEXT NOT NULL REFERENCES files(file_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    processed_at TEXT,
+    file_seq INTEGER,
+    no INTEGER,
+    sample_name TEXT,
+    analysis_number TEXT,
+    test_item TEXT,
+    test_unit TEXT,
+    result_report TEXT,
+    tester_input_value REAL,
+    standard_excess TEXT,
+    tester TEXT,
+    test_standard TEXT,
+    standard_criteria TEXT,
+    text_digits TEXT,
+    processing_method TEXT,
+    result_display_digits INTEGER,
+    result_type TEXT,
+    tester_group TEXT,
+    input_datetime TEXT,
+    approval_request TEXT,
+    test_result_display_limit REAL,
+    quantitative_limit_processing TEXT,
+    test_equipment TEXT,
+    judgment_status TEXT,
+    report_output TEXT,
+    kolas_status TEXT,
+    test_lab_group TEXT,
+    test_set TEXT,
+    is_non_conforming INTEGER NOT NULL DEFAULT 0,
+    result_value REAL,
+    detection_status INTEGER,
+    extra TEXT,
+    PRIMARY KEY (file_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_results_order ON test_results(processed_at DESC, file_seq, position);
+CREATE INDEX IF NOT EXISTS idx_results_test_item ON test_results(test_item, processed_at DESC, file_seq, position);
+CREATE INDEX IF NOT EXISTS idx_results_sample_name ON test_results(sample_name, processed_at DESC, file_seq, position);
+CREATE INDEX IF NOT EXISTS idx_results_tester ON test_results(tester, processed_at DESC, file_seq, position);
+CREATE INDEX IF NOT EXISTS idx_results_non_conforming
+    ON test_results(is_non_conforming, processed_at DESC, file_seq, position);
+CREATE TABLE IF NOT EXISTS analysis_prefixes (
+    prefix TEXT NOT NULL,
+    file_id TEXT NOT NULL REFERENCES files(file_id) ON DELETE CASCADE,
+    PRIMARY KEY (prefix, file_id)
+);
+CREATE INDEX IF NOT EXISTS idx_prefixes_file_id ON analysis_prefixes(file_id);
+CREATE TABLE IF NOT EXISTS file_rollups (
+    file_id TEXT NOT NULL REFERENCES files(file_id) ON DELETE CASCADE,
+    test_item TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    violations INTEGER NOT NULL,
+    numeric_count INTEGER NOT NULL,
+    numeric_sum REAL,
+    numeric_min REAL,
+    numeric_max REAL,
+    PRIMARY KEY (file_id, test_item)
+);
+CREATE TABLE IF NOT EXISTS daily_file_rollups (
+    day TEXT NOT NULL,
+    client TEXT NOT NULL,
+    files INTEGER NOT NULL,
+    tests INTEGER NOT NULL,
+    violations INTEGER NOT NULL,
+    PRIMARY KEY (day, client)
+);
+CREATE TABLE IF NOT EXISTS daily_item_rollups (
+    day TEXT NOT NULL,
+    client TEXT NOT NULL,
+    test_item TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    violations INTEGER NOT NULL,
+    numeric_count INTEGER NOT NULL,
+    numeric_sum REAL,
+    numeric_min REAL,
+    numeric_max REAL,
+    PRIMARY KEY (day, client, test_item)
+);
+"""
+
+# REPLACE는 기존 행을 지워 test_results까지 연쇄 삭제하므로 UPSERT 사용
+_INSERT_FILE = (
+    f"INSERT INTO files ({', '.join(FILE_COLUMNS)}, summary, extra) "
+    f"VALUES ({', '.join('?' * (len(FILE_COLUMNS) + 2))}) "
+    f"ON CONFLICT(file_id) DO UPDATE SET "
+    + ", ".join(f"{column} = excluded.{column}" for column in FILE_COLUMNS[1:] + ("summary", "extra"))
+)
+_INSERT_RESULT = (
+    f"INSERT OR REPLACE INTO test_results (file_id, position, processed_at, file_seq, {', '.join(RESULT_FIELDS)}, "
+    f"extra) VALUES ({', '.join('?' * (len(RESULT_FIELDS) + 5))})"
+)
+# 스키마 4 이전 인덱스 (같은 이름으로 조회 순서 컬럼을 붙여 다시 만듦)
+_OLD_RESULT_INDEXES = ("idx_results_test_item", "idx_results_sample_name", "idx_results_tester",
+                       "idx_results_non_conforming")
+_SELECT_RESULTS = f"SELECT file_id, {', '.join(RESULT_FIELDS)}, extra FROM test_results"
+_SELECT_FILES = f"SELECT {', '.join(FILE_COLUMNS)}, summary, extra FROM files"
+# 결과 행 + 파일 필드 (test_results r, files f 조인)
+_RESULT_WITH_FILE_COLUMNS = ", ".join(
+    f"r.{name}" for name in ("file_id",) + RESULT_FIELDS + ("extra",)) + ", f.file_name, f.client, f.processed_at"
+
+# 행 → 파일별 시험항목 누적값 (_INSERT_FILE_ROLLUP은 파일 하나, _INSERT_ALL_FILE_ROLLUPS는 전체)
+_ROLLUP_SELECT = (
+    "SELECT file_id, test_item, COUNT(*), SUM(is_non_conforming), "
+    "COUNT(result_value), SUM(result_value), MIN(result_value), MAX(result_value) FROM test_results "
+)
+_INSERT_FILE_ROLLUP = (
+    f"INSERT INTO file_rollups {_ROLLUP_SELECT}"
+    "WHERE file_id = ? AND test_item IS NOT NULL AND test_item != '' GROUP BY test_item"
+)
+_INSERT_ALL_FILE_ROLLUPS = (
+    f"INSERT INTO file_rollups {_ROLLUP_SELECT}"
+    "WHERE test_item IS NOT NULL AND test_item != '' GROUP BY file_id, test_item"
+)
+# 하루 × 의뢰 기관 버킷 재계산 (파라미터: day, client, 하루 시작, 다음날 시작, client)
+_INSERT_DAILY_FILES = (
+    "INSERT INTO daily_file_rollups SELECT ?, ?, COUNT(*), "
+    "IFNULL(SUM(json_extract(summary, '$.total_items')), 0), "
+    "IFNULL(SUM(json_extract(summary, '$.fail_items')), 0) FROM files WHERE processed_at >= ? AND processed_at < ? AND IFNULL(client, '') = ? HAVING COUNT(*) > 0"
+)
+_INSERT_DAILY_ITEMS = (
+    "INSERT INTO daily_item_rollups SELECT ?, ?, r.test_item, SUM(r.total), SUM(r.violations), "
+    "SUM(r.numeric_count), SUM(r.numeric_sum), MIN(r.numeric_min), MAX(r.numeric_max) "
+    "FROM file_rollups r JOIN files f ON f.file_id = r.file_id "
+    "WHERE f.processed_at >= ? AND f.processed_at < ? AND IFNULL(f.client, '') = ? GROUP BY r.test_item"
+)
+
+
+def _sql_value(value: Any) -> Any:
+    """SQLite에 바로 넣을 수 없는 값은 문자열로"""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return str(value)
+
+
+class SQLiteStore:
+    """파일 레코드 SQLite 저장소
+
+    DatabaseManager의 파일 레코드 딕셔너리를 그대로 받아 저장하고, 읽을 때
+    같은 형식의 딕셔너리로 되돌린다. 연결은 스레드마다 하나씩 유지한다.
+    """
+
+    def __init__(self, db_path, timeout: float = 30.0):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self._local = threading.local()
+
+        conn = self._connect()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            existing = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'files'").fetchone()
+            upgrade = existing is not None and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'file_rollups'").fetchone() is None
+            search_upgrade = existing is not None and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_rows'").fetchone() is None
+            if existing is not None and "file_seq" not in {
+                    row[1] for row in conn.execute("PRAGMA table_info(test_results)")}:
+                self._add_result_order(conn)
+            conn.executescript(_SCHEMA)
+            create_search_tables(conn)
+            if upgrade:
+                self._rebuild_rollups(conn)
+            if search_upgrade:
+                self._rebuild_search(conn)
+            conn.execute("INSERT OR IGNORE INTO metadata (key, value) VALUES (?, ?)",
+                         ("created_at", json.dumps(datetime.now().isoformat())))
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                         ("schema_version", json.dumps(SCHEMA_VERSION)))
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=self.timeout)
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ---- 쓰기 ----
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        """파일 레코드 저장 (같은 file_id가 있으면 행까지 모두 교체, 한 트랜잭션)"""
+        conn = self._connect()
+        with conn:
+            self._write_records(conn, records)
+
+    def _write_records(self, conn: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> None:
+        buckets: Set[Tuple[str, str]] = set()
+        for record in records:
+            buckets |= self._file_buckets(conn, [record["file_id"]])
+            self._write_file_row(conn, record)
+            conn.execute("DELETE FROM test_results WHERE file_id = ?", (record["file_id"],))
+            self._write_result_rows(conn, record, enumerate(record.get("test_results") or []))
+            delete_rows(conn, record["file_id"])
+            index_rows(conn, record["file_id"], str(record["processed_at"]),
+                       enumerate(record.get("test_results") or []))
+            self._write_file_rollup(conn, record["file_id"])
+            buckets.add(self._bucket_of(record))
+        self._refresh_daily_rollups(conn, buckets)
+
+    def update_record(self, record: Dict[str, Any], positions: Iterable[int]) -> None:
+        """파일 레코드 요약과 지정 위치의 행만 갱신 (증분 병합)"""
+        rows = record.get("test_results") or []
+        conn = self._connect()
+        with conn:
+            buckets = self._file_buckets(conn, [record["file_id"]])
+            self._write_file_row(conn, record)
+            positions = list(positions)
+            # 병합으로 처리 시각이 바뀌면 기존 행의 조회 순서도 함께 옮김
+            conn.execute("UPDATE test_results SET processed_at = ? WHERE file_id = ? AND processed_at IS NOT ?",
+                         (str(record["processed_at"]), record["file_id"], str(record["processed_at"])))
+            self._write_result_rows(conn, record, ((i, rows[i]) for i in positions))
+            delete_rows(conn, record["file_id"], positions)
+            index_rows(conn, record["file_id"], str(record["processed_at"]), ((i, rows[i]) for i in positions))
+            conn.execute("UPDATE search_rows SET processed_at = ? WHERE file_id = ?",
+                         (str(record["processed_at"]), record["file_id"]))
+            self._write_file_rollup(conn, record["file_id"])
+            self._refresh_daily_rollups(conn, buckets | {self._bucket_of(record)})
+
+    def _write_file_row(self, conn: sqlite3.Connection, record: Dict[str, Any]) -> None:
+        extra = {key: value for key, value in record.items() if key not in _RECORD_KEYS}
+        conn.execute(_INSERT_FILE, tuple(_sql_value(record.get(key)) for key in FILE_COLUMNS) + (
+            json.dumps(record.get("summary") or {}, ensure_ascii=False),
+            json.dumps(extra, ensure_ascii=False) if extra else None,
+        ))
+        conn.execute("DELETE FROM analysis_prefixes WHERE file_id = ?", (record["file_id"],))
+        conn.executemany("INSERT OR IGNORE INTO analysis_prefixes (prefix, file_id) VALUES (?, ?)",
+                         [(prefix, record["file_id"]) for prefix in record.get("analysis_prefixes") or []])
+
+    def _write_result_rows(self, conn: sqlite3.Connection, record: Dict[str, Any],
+                           rows: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+        """행 저장 (파일의 처리 시각과 files 행 순번을 조회 순서 컬럼으로 함께 기록)"""
+        file_id = record["file_id"]
+        file_seq = conn.execute("SELECT rowid FROM files WHERE file_id = ?", (file_id,)).fetchone()[0]
+        params = []
+        for position, row in rows:
+            extra = {key: value for key, value in row.items() if key not in _RESULT_FIELD_SET}
+            params.append(
+                (file_id, position, str(record["processed_at"]), file_seq)
+                + tuple(_sql_value(row.get(field)) for field in RESULT_FIELDS)
+                + (json.dumps(extra, ensure_ascii=False, default=str) if extra else None,)
+            )
+        conn.executemany(_INSERT_RESULT, params)
+
+    # ---- 롤업 ----
+
+    @staticmethod
+    def _bucket_of(record: Dict[str, Any]) -> Tuple[str, str]:
+        return str(record["processed_at"])[:10], record.get("client") or ""
+
+    @staticmethod
+    def _file_buckets(conn: sqlite3.Connection, file_ids: List[str]) -> Set[Tuple[str, str]]:
+        """파일들이 현재 속한 (일자, 의뢰 기관) 버킷"""
+        return {(processed_at[:10], client) for processed_at, client in conn.execute(
+            "SELECT processed_at, IFNULL(client, '') FROM files WHERE file_id IN (SELECT value FROM json_each(?))",
+            (json.dumps(file_ids, ensure_ascii=False),))}
+
+    @staticmethod
+    def _write_file_rollup(conn: sqlite3.Connection, file_id: str) -> None:
+        conn.execute("DELETE FROM file_rollups WHERE file_id = ?", (file_id,))
+        conn.execute(_INSERT_FILE_ROLLUP, (file_id,))
+
+    @staticmethod
+    def _refresh_daily_rollups(conn: sqlite3.Connection, buckets: Iterable[Tuple[str, str]]) -> None:
+        """바뀐 (일자, 의뢰 기관) 버킷만 파일별 롤업에서 다시 합산"""
+        for day, client in buckets:
+            next_day = (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+            conn.execute("DELETE FROM daily_file_rollups WHERE day = ? AND client = ?", (day, client))
+            conn.execute("DELETE FROM daily_item_rollups WHERE day = ? AND client = ?", (day, client))
+            conn.execute(_INSERT_DAILY_FILES, (day, client, day, next_day, client))
+            conn.execute(_INSERT_DAILY_ITEMS, (day, client, day, next_day, client))
+
+    def _rebuild_rollups(self, conn: sqlite3.Connection) -> None:
+        """롤업 테이블 전체 재계산 (스키마 업그레이드/전체 교체)"""
+        conn.execute("DELETE FROM file_rollups")
+        conn.execute("DELETE FROM daily_file_rollups")
+        conn.execute("DELETE FROM daily_item_rollups")
+        conn.execute(_INSERT_ALL_FILE_ROLLUPS)
+        self._refresh_daily_rollups(conn, {
+            (processed_at[:10], client) for processed_at, client in
+            conn.execute("SELECT processed_at, IFNULL(client, '') FROM files")
+        })
+
+    @staticmethod
+    def _add_result_order(conn: sqlite3.Connection) -> None:
+        """test_results에 조회 순서 컬럼 추가 후 files에서 채움 (스키마 업그레이드, 새 인덱스는 _SCHEMA가 생성)"""
+        for name in _OLD_RESULT_INDEXES:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        conn.execute("ALTER TABLE test_results ADD COLUMN processed_at TEXT")
+        conn.execute("ALTER TABLE test_results ADD COLUMN file_seq INTEGER")
+        conn.execute(
+            "UPDATE test_results SET "
+            "processed_at = (SELECT f.processed_at FROM files f WHERE f.file_id = test_results.file_id), "
+            "file_seq = (SELECT f.rowid FROM files f WHERE f.file_id = test_results.file_id)")
+
+    @staticmethod
+    def _rebuild_search(conn: sqlite3.Connection) -> None:
+        """검색 인덱스를 test_results에서 다시 채움 (스키마 업그레이드)"""
+        conn.execute("DELETE FROM search_rows")
+        conn.execute("DELETE FROM search_text")
+        rows = conn.execute(
+            f"SELECT r.file_id, r.position, f.processed_at, {', '.join(f'r.{name}' for name in SEARCH_FIELDS)} "
+            "FROM test_results r JOIN files f ON f.file_id = r.file_id ORDER BY r.file_id, r.position").fetchall()
+        for file_id, position, processed_at, *values in rows:
+            index_rows(conn, file_id, processed_at, [(position, dict(zip(SEARCH_FIELDS, values)))])
+
+    def delete_record(self, file_id: str) -> bool:
+        """파일 레코드와 행 삭제 (삭제 여부 반환)"""
+        conn = self._connect()
+        with conn:
+            buckets = self._file_buckets(conn, [file_id])
+            cursor = conn.execute("DELETE FROM files WHERE file_id = ?", (file_id,))
+            self._refresh_daily_rollups(conn, buckets)
+            delete_rows(conn, file_id)
+        return cursor.rowcount > 0
+
+    def replace_all(self, data: Dict[str, Any]) -> None:
+        """JSON 데이터베이스 형식 전체로 교체 (save_database 호환)"""
+        files = data.get("files", {})
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM daily_file_rollups")
+            conn.execute("DELETE FROM daily_item_rollups")
+            conn.execute("DELETE FROM search_rows")
+            conn.execute("DELETE FROM search_text")
+            self._write_metadata(conn, data)
+            self._write_records(conn, files.values())
+
+    def _write_metadata(self, conn: sqlite3.Connection, data: Dict[str, Any]) -> None:
+        for key, value in (data.get("metadata") or {}).items():
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                         (key, json.dumps(value, ensure_ascii=False)))
+        conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                     ("reports", json.dumps(data.get("reports") or {}, ensure_ascii=False)))
+
+    # ---- 읽기 ----
+
+    def get_record(self, file_id: str) -> Optional[Dict[str, Any]]:
+        """파일 ID로 레코드 조회"""
+        records = self._select_records("WHERE file_id = ?", (file_id,))
+        return records[0] if records else None
+
+    def get_records(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    include_results: bool = True) -> List[Dict[str, Any]]:
+        """처리 시각 범위의 레코드 (최신 순, 범위를 주지 않으면 전체, include_results=False면 행 제외)"""
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("processed_at >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("processed_at <= ?")
+            params.append(end.isoformat())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._select_records(f"{where} ORDER BY processed_at DESC", tuple(params), include_results)
+
+    def find_related(self, prefixes: List[str]) -> Optional[str]:
+        """접수번호 접두가 가장 많이 겹치는 file_id (동률이면 최신 처리분)"""
+        if not prefixes:
+            return None
+        row = self._connect().execute(
+            "SELECT p.file_id FROM analysis_prefixes p JOIN files f ON f.file_id = p.file_id "
+            "WHERE p.prefix IN (SELECT value FROM json_each(?)) "
+            "GROUP BY p.file_id ORDER BY COUNT(*) DESC, f.processed_at DESC LIMIT 1",
+            (json.dumps(list(prefixes), ensure_ascii=False),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def period_rollup(self, start: datetime, end: datetime) -> Dict[str, Any]:
+        """[start, end] 기간 집계 (하루 전체가 들어가는 날짜는 일별 버킷, 경계 날짜는 파일별 롤업)"""
+        conn = self._connect()
+        result = PeriodRollup()
+        full = full_day_range(start, end)
+        # 버킷으로 처리하지 않는 경계 구간 (하한 포함, 상한 포함 여부)
+        edges = [(start.isoformat(), end.isoformat(), True)]
+        if full is not None:
+            first, last = full[0].isoformat(), full[1].isoformat()
+            for day, client, files, tests, violations in conn.execute(
+                    "SELECT day, client, files, tests, violations FROM daily_file_rollups "
+                    "WHERE day BETWEEN ? AND ?", (first, last)):
+                result.add_files(day, client, files, tests, violations)
+            result.add_items(self._item_stats(conn.execute(
+                "SELECT test_item, total, violations, numeric_count, numeric_sum, numeric_min, numeric_max "
+                "FROM daily_item_rollups WHERE day BETWEEN ? AND ?", (first, last))))
+            # 버킷 밖 경계: [start, 첫날) 과 [마지막 날 다음날, end]
+            edges = [(start.isoformat(), first, False),
+                     ((full[1] + timedelta(days=1)).isoformat(), end.isoformat(), True)]
+
+        for low, high, inclusive in edges:
+            where = f"f.processed_at >= ? AND f.processed_at {'<=' if inclusive else '<'} ?"
+            for processed_at, client, tests, violations in conn.execute(
+                    "SELECT f.processed_at, IFNULL(f.client, ''), json_extract(f.summary, '$.total_items'), "
+                    f"json_extract(f.summary, '$.fail_items') FROM files f WHERE {where}", (low, high)):
+                result.add_files(processed_at[:10], client, 1, tests, violations)
+            result.add_items(self._item_stats(conn.execute(
+                "SELECT r.test_item, r.total, r.violations, r.numeric_count, r.numeric_sum, r.numeric_min, "
+                f"r.numeric_max FROM file_rollups r JOIN files f ON f.file_id = r.file_id WHERE {where}",
+                (low, high))))
+        return result.to_dict()
+
+    def iter_results(self, query, offset: int = 0, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """조건에 맞는 결과 행 (최신 파일부터 파일 내 행 순서)
+
+        정렬과 기간 조건은 test_results의 processed_at/file_seq를 쓰므로 조회 순서 인덱스를
+        그대로 따라 읽고, 페이지는 전체 결과를 정렬하지 않고 limit 행에서 멈춘다.
+
+        Args:
+            query: result_query.ResultQuery
+            offset, limit: SQL 페이지 (limit이 None이면 끝까지 커서로 읽음)
+        """
+        clauses, params = [], []
+        for name, value in query.row_conditions():
+            clauses.append(f"r.{name} = ?")
+            params.append(value)
+        if query.client is not None:
+            clauses.append("f.client = ?")
+            params.append(query.client)
+        if query.start is not None:
+            clauses.append("r.processed_at >= ?")
+            params.append(query.start.isoformat())
+        if query.end is not None:
+            clauses.append("r.processed_at <= ?")
+            params.append(query.end.isoformat())
+        if query.non_conforming is not None:
+            clauses.append("r.is_non_conforming = ?")
+            params.append(int(query.non_conforming))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        page = ""
+        if limit is not None or offset:
+            page = " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else limit, offset])
+        cursor = self._connect().execute(
+            f"SELECT {_RESULT_WITH_FILE_COLUMNS} FROM test_results r "
+            f"JOIN files f ON f.file_id = r.file_id {where} "
+            f"ORDER BY r.processed_at DESC, r.file_seq, r.position{page}", tuple(params))
+        for row in cursor:
+            yield self._result_with_file(row)
+
+    def search_results(self, term: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """시료명/분석번호/시험항목/시험자에 term을 포함하는 결과 행 (대소문자 무시, iter_results와 같은 형식)"""
+        term = normalize_term(term)
+        if not term or "\n" in term:
+            return []
+        where, params = match_clause(term)
+        return [self._result_with_file(row) for row in self._connect().execute(
+            f"SELECT {_RESULT_WITH_FILE_COLUMNS} FROM search_text s JOIN search_rows d ON d.id = s.rowid "
+            "JOIN test_results r ON r.file_id = d.file_id AND r.position = d.position "
+            f"JOIN files f ON f.file_id = r.file_id WHERE {where} "
+            "ORDER BY d.processed_at DESC, d.file_id, d.position LIMIT ? OFFSET ?",
+            params + (-1 if limit is None else limit, offset))]
+
+    def _result_with_file(self, row: Tuple) -> Dict[str, Any]:
+        """_RESULT_WITH_FILE_COLUMNS 행 → 결과 행 + 파일 필드"""
+        result = self._result_row_to_dict(row[:-3])
+        result["file_id"] = row[0]
+        result["file_name"], result["client"], result["processed_at"] = row[-3:]
+        return result
+
+    @staticmethod
+    def _item_stats(rows: Iterable[Tuple]) -> Dict[str, List]:
+        """(시험항목, 누적값...) 행 → 시험항목별 누적값 (같은 항목은 합침)"""
+        merged = PeriodRollup()
+        for row in rows:
+            merged.add_items({row[0]: list(row[1:])})
+        return merged.items
+
+    def count_files(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def load_all(self) -> Dict[str, Any]:
+        """JSON 데이터베이스와 같은 형식 전체 (load_database 호환)"""
+        metadata, reports = self.load_metadata()
+        files = {record["file_id"]: record for record in self._select_records("ORDER BY processed_at", ())}
+        return {"files": files, "reports": reports, "metadata": metadata}
+
+    def load_metadata(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """(metadata, reports) - 파일 레코드는 읽지 않음"""
+        metadata = {key: json.loads(value) for key, value in
+                    self._connect().execute("SELECT key, value FROM metadata")}
+        return metadata, metadata.pop("reports", {})
+
+    def _select_records(self, tail: str, params: Tuple, include_results: bool = True) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        records = [self._file_row_to_record(row) for row in conn.execute(f"{_SELECT_FILES} {tail}", params)]
+        if not records:
+            return []
+        if not include_results:
+            for record in records:
+                del record["test_results"]
+                record.pop("row_hashes", None)
+        by_id = {record["file_id"]: record for record in records}
+        file_ids = json.dumps(list(by_id), ensure_ascii=False)
+
+        for file_id, prefix in conn.execute(
+                "SELECT file_id, prefix FROM analysis_prefixes "
+                "WHERE file_id IN (SELECT value FROM json_each(?)) ORDER BY prefix", (file_ids,)):
+            by_id[file_id]["analysis_prefixes"].append(prefix)
+        if not include_results:
+            return records
+        for row in conn.execute(
+                f"{_SELECT_RESULTS} WHERE file_id IN (SELECT value FROM json_each(?)) "
+                f"ORDER BY file_id, position", (file_ids,)):
+            by_id[row[0]]["test_results"].append(self._result_row_to_dict(row))
+        return records
+
+    def _file_row_to_record(self, row: Tuple) -> Dict[str, Any]:
+        record = dict(zip(FILE_COLUMNS, row))
+        record["summary"] = json.loads(row[len(FILE_COLUMNS)]) if row[len(FILE_COLUMNS)] else {}
+        record["test_results"] = []
+        record["analysis_prefixes"] = []
+        extra = row[len(FILE_COLUMNS) + 1]
+        if extra:
+            record.update(json.loads(extra))
+        return record
+
+    def _result_row_to_dict(self, row: Tuple) -> Dict[str, Any]:
+        result = dict(zip(RESULT_FIELDS, row[1:-1]))
+        result["is_non_conforming"] = bool(result["is_non_conforming"])
+        if row[-1]:
+            result.update(json.loads(row[-1]))
+        return result
+
+    # ---- 이전 ----
+
+    def migrate_from_json(self, json_path, data: Optional[Dict[str, Any]] = None) -> int:
+        """JSON 데이터베이스를 한 번만 옮겨 옴 (옮긴 파일 레코드 수 반환)
+
+        이미 옮긴 파일이나 이미 있는 file_id는 다시 쓰지 않는다. data를 주면
+        (저널을 적용한 내용 등) 파일을 다시 읽지 않고 그 내용을 옮긴다.
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+        marker = f"migrated_from:{json_path.resolve()}"
+        conn = self._connect()
+        if conn.execute("SELECT 1 FROM metadata WHERE key = ?", (marker,)).fetchone():
+            return 0
+
+        if data is None:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        existing = {row[0] for row in conn.execute("SELECT file_id FROM files")}
+        records = [record for file_id, record in data.get("files", {}).items() if file_id not in existing]
+
+        with conn:
+            self._write_records(conn, records)
+            if data.get("reports"):
+                conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                             ("reports", json.dumps(data["reports"], ensure_ascii=False)))
+            conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                         (marker, json.dumps({"migrated_at": datetime.now().isoformat(),
+                                              "files": len(records)})))
+        return len(records)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점 (JSON → SQLite 이전)"""
+    parser = argparse.ArgumentParser(description="JSON 분석 데이터베이스를 SQLite로 이전")
+    parser.add_argument("--json", required=True, help="기존 JSON 데이터베이스 경로")
+    parser.add_argument("--db", required=True, help="SQLite 데이터베이스 경로")
+    args = parser.parse_args(argv)
+
+    store = SQLiteStore(args.db)
+    migrated = store.migrate_from_json(args.json)
+    print(f"이전 {migrated}건, 전체 {store.count_files()}건: {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,8 +6,8 @@ HTML 템플릿과 실제 데이터 통합 모듈
 import json
 from typing import List, Dict, Any
 from data_models import TestResult, ProjectSummary
+from criteria_parser import parse_criteria
 from datetime import datetime
-import re
 
 class TemplateIntegrator:
     """HTML 템플릿과 데이터 통합 클래스"""
@@ -107,15 +107,8 @@ class TemplateIntegrator:
         return standards
     
     def _extract_limit_value(self, criteria_text: str) -> float:
-        """기준 텍스트에서 수치값 추출"""
-        if not criteria_text or criteria_text.strip() == "":
-            return 0.0
-        
-        # "0.0006 mg/L 이하" 형태에서 숫자 추출
-        numbers = re.findall(r'\d+\.?\d*', criteria_text)
-        if numbers:
-            return float(numbers[0])
-        return 0.0
+        """기준 텍스트에서 대표 기준값 추출"""
+        return parse_criteria(criteria_text).limit_value
     
     def inject_data_into_template(self, html_template: str, test_results: List[TestResult], project_name: str) -> str:
         """HTML 템플릿에 실제 데이터 주입"""
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+처리 시각 정렬 인덱스 - JSON 백엔드의 기간 조회용
+기간 조회마다 모든 레코드의 processed_at을 datetime으로 바꾸고 걸러서 다시
+정렬하던 것을, 로드된 데이터마다 한 번 (processed_at, file_id) 순으로 정렬해 두고
+이진 탐색으로 범위를 잘라 최신 순으로 돌려준다 - O(log n + k).
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class TimeIndex:
+    """processed_at 오름차순 (file_id 목록과 같은 위치)
+
+    같은 처리 시각이면 저장 순서를 유지하도록 최신 순 결과에서 먼저 저장된 것이 앞에 온다
+    (기존 sorted(..., reverse=True)와 같은 순서).
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        entries = [
+            (datetime.fromisoformat(record["processed_at"]), -position, record["file_id"])
+            for position, record in enumerate(records)
+        ]
+        entries.sort()
+        self.times: List[datetime] = [entry[0] for entry in entries]
+        self.file_ids: List[str] = [entry[2] for entry in entries]
+        self._rank: Dict[str, int] = {file_id: rank for rank, file_id in enumerate(self.file_ids)}
+
+    def __len__(self) -> int:
+        return len(self.file_ids)
+
+    def range(self, start: datetime, end: datetime) -> List[str]:
+        """start <= processed_at <= end 인 file_id (최신 순)"""
+        low = bisect_left(self.times, start)
+        high = bisect_right(self.times, end)
+        return self.file_ids[low:high][::-1]
+
+    def select(self, file_ids: Iterable[str], start: Optional[datetime] = None,
+               end: Optional[datetime] = None) -> List[str]:
+        """file_ids 중 [start, end] 안의 것 (최신 순, 후보가 기간보다 훨씬 적을 때 사용)"""
+        ranks = sorted((self._rank[file_id] for file_id in file_ids if file_id in self._rank), reverse=True)
+        return [self.file_ids[rank] for rank in ranks
+                if (start is None or self.times[rank] >= start) and (end is None or self.times[rank] <= end)]
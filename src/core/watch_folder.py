@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+감시 폴더 수집 서비스 (Watch-Folder Ingestion)
+uploads/pending 폴더를 주기적으로 확인하여 새로 들어온 엑셀/CSV 파일을 제한된 크기의
+작업 큐에 넣고, 워커 스레드가 파싱·저장 후 processed 폴더로 이동한다.
+브라우저를 열어 두지 않아도 대량 투입분이 UI 스레드 밖에서 처리된다.
+
+- 복사 중인 파일을 읽지 않도록 크기/수정 시각이 연속 두 번 같을 때만 큐에 넣는다
+- 큐가 가득 차면 파일을 폴더에 그대로 두고 다음 주기에 다시 시도한다 (백프레셔)
+- 실패한 파일은 failed 폴더로 옮겨 같은 파일을 반복 처리하지 않는다
+- 큐 길이, 처리 지연, 실패 수를 MetricsRegistry에 기록한다
+
+사용 예:
+    python -m src.core.watch_folder --workers 2 --interval 5
+"""
+
+import argparse
+import logging
+import queue
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.bulk_importer import IMPORT_SUFFIXES, parse_session
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DEFAULT_DATABASE_FOLDER, DatabaseManager, open_configured_database
+from src.core.incremental_ingest import IncrementalIngestor
+from src.utils.metrics import MetricsRegistry, get_metrics_registry
+from src.utils.upload_session import UploadSession
+
+logger = logging.getLogger(__name__)
+
+# 워커 종료 신호
+_STOP = object()
+
+# 중지 후 워커가 빈 큐를 기다리는 간격 (초) - 종료 신호를 넣지 못해도 이 간격 안에 종료
+_STOP_CHECK_INTERVAL = 0.2
+
+
+@dataclass(frozen=True)
+class PendingFile:
+    """큐에 들어간 파일 하나"""
+    path: Path
+    detected_at: float      # 처음 발견한 시각 (time.monotonic)
+    queued_at: float        # 큐에 넣은 시각 (time.monotonic)
+
+
+class WatchFolderService:
+    """감시 폴더 수집 서비스
+
+    poll()이 폴더를 한 번 확인하여 안정된 파일을 큐에 넣고, 워커 스레드가
+    파싱 → 데이터베이스 저장 → processed 폴더 이동을 수행한다.
+    start()는 poll()을 주기적으로 호출하는 감시 스레드와 워커를 함께 띄운다.
+    """
+
+    def __init__(self, pending_path, processed_path, db_manager: DatabaseManager,
+                 failed_path=None, workers: int = 2, queue_size: int = 32,
+                 interval: float = 5.0, client: str = "미지정", incremental: bool = False,
+                 metrics: Optional[MetricsRegistry] = None):
+        self.pending_path = Path(pending_path)
+        self.processed_path = Path(processed_path)
+        self.failed_path = Path(failed_path) if failed_path else self.pending_path.parent / "failed"
+        self.db_manager = db_manager
+        self.workers = max(1, workers)
+        self.interval = interval
+        self.client = client
+        self.metrics = metrics or get_metrics_registry()
+
+        self.data_processor = DataProcessor()
+        self.ingestor = IncrementalIngestor(self.data_processor, db_manager) if incremental else None
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size))
+        self._observed: Dict[Path, Tuple[int, int, float]] = {}  # 경로 → (크기, 수정 시각, 발견 시각)
+        self._in_flight = set()
+        self._state_lock = threading.Lock()
+        self._db_lock = threading.Lock()     # JSON 데이터베이스는 로드/저장 단위로 직렬화
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._stats = {'queued': 0, 'processed': 0, 'failed': 0, 'queue_full': 0, 'rows': 0}
+
+        for folder in (self.pending_path, self.processed_path, self.failed_path):
+            folder.mkdir(parents=True, exist_ok=True)
+
+    # ---- 감시 ----
+
+    def poll(self) -> int:
+        """폴더를 한 번 확인하여 안정된 새 파일을 큐에 넣음 (큐에 넣은 파일 수 반환)"""
+        now = time.monotonic()
+        seen = set()
+        enqueued = 0
+        queue_full = False
+
+        for path in sorted(self.pending_path.iterdir()):
+            if (not path.is_file() or path.suffix.lower() not in IMPORT_SUFFIXES
+                    or path.name.startswith(('~$', '.'))):
+                continue
+            seen.add(path)
+            if queue_full:
+                continue  # 큐가 찼으면 나머지는 목록만 확인 (관찰 기록 유지, 다음 주기에 이어서)
+            with self._state_lock:
+                if path in self._in_flight:
+                    continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            previous = self._observed.get(path)
+            self._observed[path] = (stat.st_size, stat.st_mtime_ns, previous[2] if previous else now)
+            if previous is None or previous[:2] != (stat.st_size, stat.st_mtime_ns):
+                continue  # 복사 중일 수 있으므로 다음 주기에 다시 확인
+
+            item = PendingFile(path=path, detected_at=previous[2], queued_at=now)
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self._count('queue_full')
+                self.metrics.counter('watch_folder_queue_full_total')
+                queue_full = True
+                continue
+            with self._state_lock:
+                self._in_flight.add(path)
+            del self._observed[path]
+            self._count('queued')
+            enqueued += 1
+
+        # 사라진 파일 정리
+        for path in set(self._observed) - seen:
+            del self._observed[path]
+        self.metrics.gauge('watch_folder_queue_depth', self._queue.qsize())
+        return enqueued
+
+    # ---- 처리 ----
+
+    def process_file(self, item: PendingFile) -> bool:
+        """파일 하나 파싱·저장 후 이동 (성공 여부 반환)"""
+        start = time.monotonic()
+        self.metrics.histogram('watch_folder_queue_wait_seconds', start - item.queued_at)
+        try:
+            session = UploadSession.from_path(item.path)
+            upload_time = datetime.now()
+            if self.ingestor is not None:
+                with self._db_lock:
+                    report = self.ingestor.ingest(session, client=self.client, upload_time=upload_time)
+                rows = report.total_rows
+            else:
+                batch = parse_session(session, self.data_processor)
+                with self._db_lock:
+                    self.db_manager.save_analysis_result(session.name, batch, self.client,
+                                                         upload_time=upload_time, upload_session=session)
+                rows = len(batch)
+            destination = self._move(item.path, self.processed_path, upload_time)
+        except Exception as e:
+            logger.error(f"감시 폴더 파일 처리 실패: {item.path.name} - {e}")
+            self._count('failed')
+            self.metrics.counter('watch_folder_failures_total', labels={'error_type': type(e).__name__})
+            try:
+                self._move(item.path, self.failed_path, datetime.now())
+            except OSError as move_error:
+                logger.error(f"실패 파일 이동 실패: {item.path.name} - {move_error}")
+            return False
+        finally:
+            with self._state_lock:
+                self._in_flight.discard(item.path)
+
+        finished = time.monotonic()
+        self._count('processed')
+        self._count('rows', rows)
+        self.metrics.counter('watch_folder_files_total')
+        self.metrics.histogram('watch_folder_processing_seconds', finished - start)
+        self.metrics.histogram('watch_folder_latency_seconds', finished - item.detected_at)
+        logger.info(f"감시 폴더 파일 처리 완료: {item.path.name} ({rows}행) → {destination.name}")
+        return True
+
+    def _move(self, path: Path, folder: Path, moved_at: datetime) -> Path:
+        """날짜 접두를 붙여 폴더로 이동 (같은 이름이 있으면 번호 추가)"""
+        stem = f"{moved_at.strftime('%Y%m%d')}_{path.stem}"
+        destination = folder / f"{stem}{path.suffix}"
+        counter = 1
+        while destination.exists():
+            destination = folder / f"{stem}_{counter}{path.suffix}"
+            counter += 1
+        shutil.move(str(path), str(destination))
+        return destination
+
+    def _worker(self) -> None:
+        """큐에서 파일을 꺼내 처리하는 워커 스레드"""
+        while True:
+            try:
+                item = self._queue.get(timeout=_STOP_CHECK_INTERVAL)
+            except queue.Empty:
+                if self._stop_event.is_set():
+                    return
+                continue
+            try:
+                if item is _STOP:
+                    return
+                self.process_file(item)
+            finally:
+                self._queue.task_done()
+                self.metrics.gauge('watch_folder_queue_depth', self._queue.qsize())
+
+    def _watch(self) -> None:
+        """감시 스레드 (interval마다 poll)"""
+        while not self._stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"감시 폴더 확인 오류: {e}")
+            self._stop_event.wait(self.interval)
+
+    # ---- 수명 주기 ----
+
+    def start(self, watch: bool = True) -> None:
+        """워커 (및 감시 스레드) 시작"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"watch-folder-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        if watch:
+            thread = threading.Thread(target=self._watch, name="watch-folder-poller", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"감시 폴더 수집 시작: {self.pending_path} (워커 {self.workers}개, 주기 {self.interval}초)")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """감시 중지, 큐에 남은 파일 처리 후 워커 종료"""
+        self._stop_event.set()
+        if self._threads:
+            # 큐가 차 있으면 신호를 넣지 않음 (워커는 남은 파일을 처리하고 빈 큐에서 _stop_event를 보고 종료)
+            for _ in range(self.workers):
+                try:
+                    self._queue.put_nowait(_STOP)
+                except queue.Full:
+                    break
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        logger.info("감시 폴더 수집 중지")
+
+    def wait_idle(self) -> None:
+        """큐에 들어간 파일이 모두 처리될 때까지 대기"""
+        self._queue.join()
+
+    def drain(self) -> Dict[str, Any]:
+        """현재 폴더에 있는 파일을 모두 처리하고 종료 (일회성 실행)"""
+        self.start(watch=False)
+        try:
+            self.poll()                 # 첫 관찰
+            while True:
+                time.sleep(min(self.interval, 1.0))
+                self.poll()             # 안정된 파일 큐 투입
+                self.wait_idle()
+                if not self._observed:
+                    break
+        finally:
+            self.stop()
+        return self.stats()
+
+    # ---- 상태 ----
+
+    def _count(self, key: str, value: int = 1) -> None:
+        with self._state_lock:
+            self._stats[key] += value
+
+    def stats(self) -> Dict[str, Any]:
+        """처리 현황 (UI/헬스 체크용)"""
+        with self._state_lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._in_flight)
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 진입점"""
+    from config.app_config import get_config
+
+    settings = get_config().file_processing
+    parser = argparse.ArgumentParser(description="감시 폴더(uploads/pending) 시험 결과 자동 수집")
+    parser.add_argument("--pending", default=settings.upload_path, help="감시할 폴더")
+    parser.add_argument("--processed", default=settings.processed_path, help="처리 완료 파일 이동 폴더")
+    parser.add_argument("--failed", default=settings.failed_path, help="처리 실패 파일 이동 폴더")
+    parser.add_argument("--db-folder", default=str(DEFAULT_DATABASE_FOLDER), help="데이터베이스 저장 폴더")
+    parser.add_argument("--backend", choices=("sqlite", "json", "journal"), default=None,
+                        help="데이터베이스 종류 (sqlite | json | journal, 기본: 설정의 DB_TYPE)")
+    parser.add_argument("--workers", type=int, default=settings.watch_workers, help="워커 스레드 수")
+    parser.add_argument("--queue-size", type=int, default=settings.watch_queue_size, help="작업 큐 크기")
+    parser.add_argument("--interval", type=float, default=settings.watch_interval, help="폴더 확인 주기(초)")
+    parser.add_argument("--client", default="미지정", help="의뢰 기관명")
+    parser.add_argument("--incremental", action="store_true", help="누적 내보내기 증분 반영")
+    parser.add_argument("--once", action="store_true", help="현재 파일만 처리하고 종료")
+    args = parser.parse_args(argv)
+
+    service = WatchFolderService(
+        args.pending, args.processed, open_configured_database(args.db_folder, args.backend),
+        failed_path=args.failed,
+        workers=args.workers, queue_size=args.queue_size, interval=args.interval,
+        client=args.client, incremental=args.incremental,
+    )
+    if args.once:
+        stats = service.drain()
+        print(f"처리 {stats['processed']}개, 실패 {stats['failed']}개, {stats['rows']}행")
+        return 0 if not stats['failed'] else 1
+
+    service.start()
+    try:
+        while True:
+            time.sleep(60)
+            logger.info(f"감시 폴더 현황: {service.stats()}")
+    except KeyboardInterrupt:
+        service.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
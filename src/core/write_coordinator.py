@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+여러 세션/프로세스의 데이터베이스 쓰기 조정
+JSON 백엔드의 저장은 로드 → 수정 → 전체 재작성이라 두 세션이 동시에 저장하면
+나중에 쓴 쪽이 먼저 쓴 쪽의 변경을 덮어쓴다.
+
+- FileLock: <db>.lock 파일의 배타 잠금 (프로세스 사이) + 스레드 잠금 (프로세스 안)
+- WriteCoalescer: 짧은 창 안에 들어온 변경을 모아 잠금 한 번, 로드 한 번, 저장 한 번으로 커밋
+  (그룹 커밋 - 먼저 온 스레드가 대표로 커밋하고 나머지는 결과만 받음)
+- PendingChanges: 커밋 한 번에 적용할 파일 레코드 변경 (나중 변경이 이김)
+
+변경 함수는 커밋할 때의 최신 상태를 받으므로 다른 세션이 그 사이에 저장한 내용을 잃지 않는다.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 대표 스레드가 다른 변경을 기다리는 시간 (초)
+DEFAULT_WRITE_WINDOW = 0.005
+
+# 잠금 재시도 간격 (초)
+_POLL_INTERVAL = 0.005
+
+# 삭제 표시
+_DELETED = object()
+
+
+class FileLock:
+    """프로세스 사이 배타 잠금 (같은 스레드는 다시 잡을 수 있음)
+
+    잠금 파일은 지우지 않는다 (지우면 다른 프로세스가 연 파일과 새 파일을 따로 잠글 수 있음).
+    """
+
+    def __init__(self, path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def acquire(self) -> None:
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise TimeoutError(f"쓰기 잠금 대기 시간 초과: {self.path}")
+        if self._depth == 0:
+            try:
+                self._file = self._lock_file()
+            except BaseException:
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock_file(self._file)
+            finally:
+                self._file.close()
+                self._file = None
+        self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    def _lock_file(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(self.path, 'a+b')
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                return handle
+            except OSError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    raise TimeoutError(f"쓰기 잠금 대기 시간 초과: {self.path}")
+                time.sleep(_POLL_INTERVAL)
+
+    @staticmethod
+    def _unlock_file(handle) -> None:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class PendingChanges:
+    """파일 레코드 맵 위의 변경 모음 (조회는 변경을 반영한 값)"""
+
+    def __init__(self, files: Dict[str, Dict[str, Any]]):
+        self.files = files
+        self._changes: Dict[str, Any] = {}
+
+    def get(self, file_id: str) -> Optional[Dict[str, Any]]:
+        record = self._changes.get(file_id, self.files.get(file_id))
+        return None if record is _DELETED else record
+
+    def __contains__(self, file_id: str) -> bool:
+        return self.get(file_id) is not None
+
+    def __bool__(self) -> bool:
+        return bool(self._changes)
+
+    def put(self, record: Dict[str, Any]) -> None:
+        self._changes[record["file_id"]] = record
+
+    def delete(self, file_id: str) -> None:
+        self._changes[file_id] = _DELETED
+
+    @property
+    def puts(self) -> List[Dict[str, Any]]:
+        return [record for record in self._changes.values() if record is not _DELETED]
+
+    @property
+    def deletes(self) -> List[str]:
+        return [file_id for file_id, record in self._changes.items()
+                if record is _DELETED and file_id in self.files]
+
+
+class _Ticket:
+    __slots__ = ("mutation", "result", "error", "done")
+
+    def __init__(self, mutation: Callable[[Any], Any]):
+        self.mutation = mutation
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.done = False
+
+
+class WriteCoalescer:
+    """그룹 커밋
+
+    submit(mutation, commit)은 변경 함수를 대기열에 넣고 커밋될 때까지 기다린다. 커밋 중인
+    스레드가 없으면 대표가 되어 window초 동안 다른 변경을 기다린 뒤 잠금을 잡고 자신의
+    commit(apply)을 부른다. commit은 최신 상태를 읽어 apply(state)로 모든 변경
+    함수를 적용하고 한 번에 저장한다. 변경 함수의 예외는 그 호출자에게만,
+    저장 실패는 묶인 모든 호출자에게 전달된다.
+    """
+
+    def __init__(self, lock: FileLock, window: float = DEFAULT_WRITE_WINDOW):
+        self.lock = lock
+        self.window = window
+        self._pending: List[_Ticket] = []
+        self._pending_lock = threading.Lock()
+        self._leader = threading.Lock()
+        self.commits = 0
+
+    def submit(self, mutation: Callable[[Any], Any], commit: Callable[[Callable[[Any], None]], None]) -> Any:
+        ticket = _Ticket(mutation)
+        with self._pending_lock:
+            self._pending.append(ticket)
+        with self._leader:
+            if not ticket.done:
+                if self.window > 0:
+                    time.sleep(self.window)
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                self._run(batch, commit)
+        if ticket.error is not None:
+            raise ticket.error
+        return ticket.result
+
+    def _run(self, batch: List[_Ticket], commit: Callable[[Callable[[Any], None]], None]) -> None:
+        def apply(state) -> None:
+            for ticket in batch:
+                try:
+                    ticket.result = ticket.mutation(state)
+                except Exception as e:
+                    ticket.error = e
+
+        try:
+            with self.lock:
+                commit(apply)
+            self.commits += 1
+        except Exception as e:
+            for ticket in batch:
+                if ticket.error is None:
+                    ticket.error = e
+        finally:
+            for ticket in batch:
+                ticket.done = True
+
+
+# 프로세스 안에서 경로별로 하나씩 공유 (세션마다 DatabaseManager가 따로 있어도 같은 잠금과 대기열을 씀)
+_shared: Dict[str, Any] = {}
+_shared_lock = threading.Lock()
+
+
+def _shared_instance(key: str, factory: Callable[[], Any]) -> Any:
+    with _shared_lock:
+        instance = _shared.get(key)
+        if instance is None:
+            instance = _shared[key] = factory()
+        return instance
+
+
+def shared_lock(path, timeout: float = 30.0) -> FileLock:
+    """경로별 FileLock (같은 프로세스의 다른 인스턴스가 같은 파일을 따로 잠가 교착되지 않도록)"""
+    path = Path(path).resolve()
+    return _shared_instance(f"lock:{path}", lambda: FileLock(path, timeout))
+
+
+def shared_coalescer(key: str, factory: Callable[[], WriteCoalescer]) -> WriteCoalescer:
+    return _shared_instance(f"coalescer:{key}", factory)
@@ -0,0 +1,179 @@
+"""
+CSV 고속 읽기 (CSV Reader)
+협력 기관의 대용량 CSV 내보내기를 읽기 위한 경로.
+
+- 인코딩은 앞부분 바이트 표본에서 한 번만 판별한다 (BOM → utf-8 → cp949 → euc-kr → latin1)
+- 모든 컬럼을 문자열로 명시해 읽는다 (타입 추론 비용 제거, 분석번호 앞자리 0 보존).
+  수치/일시 변환은 이후 컬럼 단위 벡터 변환(ColumnPlan)에서 처리한다
+- pyarrow가 있으면 멀티스레드 pyarrow.csv 파서, 없으면 pandas C 엔진을 사용한다
+- 결측 문자열은 pandas.read_excel과 같은 집합을 사용해 엑셀 경로와 결과를 맞춘다
+"""
+
+import codecs
+import csv
+import io
+import logging
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+
+try:
+    from .performance_optimizer import EXCEL_NA_STRINGS, _unique_headers
+except ImportError:
+    from performance_optimizer import EXCEL_NA_STRINGS, _unique_headers
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow 미설치 시 pandas C 엔진 사용
+    pa = None
+    pa_csv = None
+
+logger = logging.getLogger(__name__)
+
+# 판별 후보 인코딩 (우선순위 순, latin1은 항상 성공하는 마지막 후보)
+CSV_ENCODINGS = ('utf-8', 'cp949', 'euc-kr', 'latin1')
+
+# 인코딩 판별에 사용하는 앞부분 표본 크기
+SNIFF_BYTES = 64 * 1024
+
+
+def sniff_encoding(content: bytes, sample_size: int = SNIFF_BYTES) -> str:
+    """바이트 표본으로 CSV 인코딩 판별 (표본 끝에서 잘린 멀티바이트 문자는 허용)"""
+    sample = content[:sample_size]
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    final = len(content) <= len(sample)
+    for encoding in CSV_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return CSV_ENCODINGS[-1]
+
+
+def sniff_file_encoding(file_path: Union[str, Path], sample_size: int = SNIFF_BYTES) -> str:
+    """파일 앞부분만 읽어 인코딩 판별"""
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_size + 1)
+    return sniff_encoding(sample, sample_size)
+
+
+def _fallback_encodings(encoding: str) -> List[str]:
+    """판별한 인코딩으로 전체를 읽다 실패했을 때 시도할 순서"""
+    candidates = [encoding] + [candidate for candidate in CSV_ENCODINGS if candidate != encoding]
+    if encoding == 'utf-8-sig':
+        candidates.remove('utf-8')
+    return candidates
+
+
+def _to_utf8(content: bytes, encoding: str) -> bytes:
+    """pyarrow 입력용 UTF-8 바이트 (UTF-8이면 복사하지 않음)"""
+    if encoding == 'utf-8':
+        content.decode('utf-8')  # 표본 이후 구간 검증 (실패 시 다음 후보로)
+        return content
+    if encoding == 'utf-8-sig':
+        content = content[len(codecs.BOM_UTF8):] if content.startswith(codecs.BOM_UTF8) else content
+        content.decode('utf-8')
+        return content
+    return content.decode(encoding).encode('utf-8')
+
+
+def _read_header(data: bytes) -> List[str]:
+    """첫 레코드(헤더) 해석 (따옴표 안 줄바꿈 포함 헤더 지원)"""
+    sample = data[:SNIFF_BYTES].decode('utf-8', errors='ignore')
+    try:
+        return next(csv.reader(io.StringIO(sample, newline='')))
+    except StopIteration:
+        return []
+
+
+def _read_with_pyarrow(data: bytes) -> pd.DataFrame:
+    """pyarrow.csv 멀티스레드 파서로 전체 읽기 (모든 컬럼 문자열)"""
+    header = _read_header(data)
+    if not header:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+
+    table = pa_csv.read_csv(
+        pa.py_buffer(data),
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in header},
+            null_values=sorted(EXCEL_NA_STRINGS),
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+        ),
+    )
+    df = table.to_pandas()
+    # 빈/중복 헤더는 pandas와 같은 이름 규칙 (Unnamed: i, 이름.n)
+    df.columns = _unique_headers(header)
+    return df
+
+
+def _read_with_pandas(content: bytes, encoding: str, nrows: Optional[int]) -> pd.DataFrame:
+    """pandas C 엔진으로 읽기 (모든 컬럼 문자열)"""
+    return pd.read_csv(
+        io.BytesIO(content), encoding=encoding, nrows=nrows, dtype=str,
+        keep_default_na=False, na_values=sorted(EXCEL_NA_STRINGS),
+    )
+
+
+def read_csv_bytes(content: bytes, encoding: Optional[str] = None,
+                   nrows: Optional[int] = None, engine: Optional[str] = None) -> pd.DataFrame:
+    """
+    CSV 바이트 → DataFrame (모든 컬럼 문자열, 결측은 NaN)
+
+    Args:
+        content: 파일 내용
+        encoding: 인코딩 (None이면 앞부분 표본으로 판별)
+        nrows: 앞부분 행 수만 읽기 (미리보기용, pandas 엔진 사용)
+        engine: 'pyarrow' 또는 'c' (None이면 pyarrow 사용 가능 시 pyarrow)
+
+    Returns:
+        DataFrame (attrs['encoding']에 실제 사용한 인코딩 기록)
+    """
+    if engine is None:
+        engine = 'pyarrow' if pa_csv is not None and nrows is None else 'c'
+    if engine == 'pyarrow' and pa_csv is None:
+        raise ImportError("pyarrow가 설치되지 않아 pyarrow 엔진을 사용할 수 없습니다")
+
+    encoding = encoding or sniff_encoding(content)
+    last_error = None
+    for candidate in _fallback_encodings(encoding):
+        try:
+            if engine == 'pyarrow':
+                df = _read_with_pyarrow(_to_utf8(content, candidate))
+            else:
+                df = _read_with_pandas(content, candidate, nrows)
+        except UnicodeError as e:
+            last_error = e
+            continue
+        except Exception as e:
+            # pyarrow는 잘못된 UTF-8을 ArrowInvalid로 알림
+            if pa is not None and isinstance(e, pa.lib.ArrowInvalid) and 'UTF8' in str(e):
+                last_error = e
+                continue
+            raise
+        if candidate != encoding:
+            logger.info(f"CSV 인코딩 재판별: {encoding} → {candidate}")
+        df.attrs['encoding'] = candidate
+        return df
+
+    raise UnicodeError(f"CSV 파일의 인코딩을 감지할 수 없습니다: {last_error}")
+
+
+def read_csv_file(file_path: Union[str, Path], encoding: Optional[str] = None,
+                  nrows: Optional[int] = None, engine: Optional[str] = None) -> pd.DataFrame:
+    """CSV 파일 → DataFrame (read_csv_bytes와 동일 규칙, 미리보기는 앞부분만 읽음)"""
+    if nrows is None:
+        return read_csv_bytes(Path(file_path).read_bytes(), encoding=encoding, engine=engine)
+
+    encoding = encoding or sniff_file_encoding(file_path)
+    df = pd.read_csv(file_path, encoding=encoding, nrows=nrows, dtype=str,
+                     keep_default_na=False, na_values=sorted(EXCEL_NA_STRINGS))
+    df.attrs['encoding'] = encoding
+    return df
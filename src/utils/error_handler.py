@@ -18,6 +18,11 @@ import pandas as pd
 from datetime import datetime
 import re
 
+try:
+    from .header_schema_cache import header_fingerprint, header_schema_cache
+except ImportError:
+    from header_schema_cache import header_fingerprint, header_schema_cache
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -155,90 +160,136 @@ class DataProcessingErrorHandler:
     # 권장 컬럼 목록
     RECOMMENDED_COLUMNS = ['tester', 'standard_excess', 'standard_criteria']
     
+    # 컬럼 매핑 규칙 버전 (규칙을 바꾸면 올려서 헤더 스키마 캐시 무효화)
+    COLUMN_MAPPING_VERSION = "1"
+    
     def __init__(self):
         """에러 핸들러 초기화"""
         self.error_log = []
         self.column_mapping_cache = {}
         
+    def _column_mapping_namespace(self) -> str:
+        """헤더 스키마 캐시 네임스페이스 (매핑 테이블/필수·권장 컬럼이 바뀌면 달라짐)"""
+        rules = header_fingerprint(
+            [f"{original}\x00{standard}" for original, standard in self.COLUMN_MAPPING_TABLE.items()]
+            + ['required'] + list(self.REQUIRED_COLUMNS) + ['recommended'] + list(self.RECOMMENDED_COLUMNS)
+        )
+        return f"column_mapping:{self.COLUMN_MAPPING_VERSION}:{rules}"
+    
+    def _resolve_column_mapping(self, columns: Tuple) -> Dict[str, Any]:
+        """헤더만으로 결정되는 컬럼 매핑/경고/제안 (헤더 스키마 캐시 대상, 컬럼은 인덱스로 기록)"""
+        issues = []
+        
+        def add_issue(severity: ErrorSeverity, message: str, details: str,
+                      suggested_fix: str, column: Optional[int] = None) -> None:
+            issues.append({
+                'severity': severity.value,
+                'message': message,
+                'details': details,
+                'column': column,
+                'suggested_fix': suggested_fix,
+            })
+        
+        # 1. 컬럼명 정규화 (공백, 특수문자 제거, 중복 컬럼은 첫 번째만)
+        normalized_columns = {}
+        for index, col in enumerate(columns):
+            if col not in normalized_columns:
+                normalized_columns[col] = (index, self._normalize_column_name(col))
+        
+        # 2. 컬럼 매핑 시도
+        mapped = []
+        unmapped = []
+        
+        for original_col, (index, normalized_col) in normalized_columns.items():
+            # 직접 매핑 시도
+            if original_col in self.COLUMN_MAPPING_TABLE:
+                mapped.append([index, self.COLUMN_MAPPING_TABLE[original_col]])
+            # 정규화된 이름으로 매핑 시도
+            elif normalized_col in self.COLUMN_MAPPING_TABLE:
+                mapped.append([index, self.COLUMN_MAPPING_TABLE[normalized_col]])
+            # 유사도 기반 매핑 시도
+            else:
+                similar_mapping = self._find_similar_column_mapping(original_col)
+                if similar_mapping:
+                    mapped.append([index, similar_mapping])
+                    add_issue(
+                        ErrorSeverity.WARNING,
+                        f"컬럼명 유사도 매핑: '{original_col}' -> '{similar_mapping}'",
+                        "컬럼명이 정확히 일치하지 않아 유사도 기반으로 매핑했습니다.",
+                        "컬럼명을 표준 형식으로 수정하는 것을 권장합니다.",
+                        column=index
+                    )
+                else:
+                    unmapped.append(index)
+        
+        unmapped_columns = [columns[index] for index in unmapped]
+        
+        # 3. 필수 컬럼 확인
+        mapped_standard_columns = set(standard for _, standard in mapped)
+        missing_required = [col for col in self.REQUIRED_COLUMNS if col not in mapped_standard_columns]
+        
+        for missing_col in missing_required:
+            # 대체 가능한 컬럼 제안
+            suggestions = self._suggest_column_alternatives(missing_col, unmapped_columns)
+            add_issue(
+                ErrorSeverity.CRITICAL,
+                f"필수 컬럼 누락: {missing_col}",
+                f"데이터 처리에 필요한 필수 컬럼이 없습니다.",
+                f"다음 컬럼 중 하나를 추가하거나 매핑하세요: {', '.join(suggestions) if suggestions else '해당 데이터를 포함한 컬럼'}"
+            )
+        
+        # 4. 권장 컬럼 확인
+        missing_recommended = [col for col in self.RECOMMENDED_COLUMNS if col not in mapped_standard_columns]
+        
+        for missing_col in missing_recommended:
+            suggestions = self._suggest_column_alternatives(missing_col, unmapped_columns)
+            add_issue(
+                ErrorSeverity.WARNING,
+                f"권장 컬럼 누락: {missing_col}",
+                "이 컬럼이 없으면 일부 기능이 제한될 수 있습니다.",
+                f"가능하면 다음 컬럼을 추가하세요: {', '.join(suggestions) if suggestions else '해당 데이터를 포함한 컬럼'}"
+            )
+        
+        # 5. 매핑되지 않은 컬럼 처리
+        for index in unmapped:
+            add_issue(
+                ErrorSeverity.INFO,
+                f"매핑되지 않은 컬럼: {columns[index]}",
+                "이 컬럼은 분석에 사용되지 않습니다.",
+                "필요한 경우 컬럼 매핑 테이블에 추가하세요.",
+                column=index
+            )
+        
+        return {'mapped': mapped, 'unmapped': unmapped, 'issues': issues}
+    
     def handle_column_mapping_errors(self, df: pd.DataFrame) -> ProcessingResult:
-        """컬럼 매핑 에러 처리 (요구사항: 성공 기준 1)"""
+        """컬럼 매핑 에러 처리 (요구사항: 성공 기준 1)
+        
+        정규화/유사도 매칭/제안은 헤더 지문별로 한 번만 수행하고
+        (헤더 스키마 캐시), 같은 양식의 파일은 캐시된 결과로 에러를 구성한다.
+        """
         result = ProcessingResult(success=True, total_rows=len(df))
         
         try:
-            # 1. 컬럼명 정규화 (공백, 특수문자 제거)
-            normalized_columns = {}
-            for col in df.columns:
-                normalized = self._normalize_column_name(col)
-                normalized_columns[col] = normalized
-            
-            # 2. 컬럼 매핑 시도
-            mapped_columns = {}
-            unmapped_columns = []
-            
-            for original_col, normalized_col in normalized_columns.items():
-                # 직접 매핑 시도
-                if original_col in self.COLUMN_MAPPING_TABLE:
-                    mapped_columns[original_col] = self.COLUMN_MAPPING_TABLE[original_col]
-                # 정규화된 이름으로 매핑 시도
-                elif normalized_col in self.COLUMN_MAPPING_TABLE:
-                    mapped_columns[original_col] = self.COLUMN_MAPPING_TABLE[normalized_col]
-                # 유사도 기반 매핑 시도
-                else:
-                    similar_mapping = self._find_similar_column_mapping(original_col)
-                    if similar_mapping:
-                        mapped_columns[original_col] = similar_mapping
-                        result.add_error(ProcessingError(
-                            category=ErrorCategory.COLUMN_MAPPING,
-                            severity=ErrorSeverity.WARNING,
-                            message=f"컬럼명 유사도 매핑: '{original_col}' -> '{similar_mapping}'",
-                            details="컬럼명이 정확히 일치하지 않아 유사도 기반으로 매핑했습니다.",
-                            column_name=original_col,
-                            suggested_fix="컬럼명을 표준 형식으로 수정하는 것을 권장합니다."
-                        ))
-                    else:
-                        unmapped_columns.append(original_col)
-            
-            # 3. 필수 컬럼 확인
-            mapped_standard_columns = set(mapped_columns.values())
-            missing_required = [col for col in self.REQUIRED_COLUMNS if col not in mapped_standard_columns]
-            
-            if missing_required:
-                for missing_col in missing_required:
-                    # 대체 가능한 컬럼 제안
-                    suggestions = self._suggest_column_alternatives(missing_col, unmapped_columns)
-                    
-                    result.add_error(ProcessingError(
-                        category=ErrorCategory.COLUMN_MAPPING,
-                        severity=ErrorSeverity.CRITICAL,
-                        message=f"필수 컬럼 누락: {missing_col}",
-                        details=f"데이터 처리에 필요한 필수 컬럼이 없습니다.",
-                        suggested_fix=f"다음 컬럼 중 하나를 추가하거나 매핑하세요: {', '.join(suggestions) if suggestions else '해당 데이터를 포함한 컬럼'}"
-                    ))
+            columns = tuple(df.columns)
+            spec, cached = header_schema_cache.get_or_compute(
+                self._column_mapping_namespace(), columns,
+                lambda: self._resolve_column_mapping(columns)
+            )
             
-            # 4. 권장 컬럼 확인
-            missing_recommended = [col for col in self.RECOMMENDED_COLUMNS if col not in mapped_standard_columns]
-            
-            for missing_col in missing_recommended:
-                suggestions = self._suggest_column_alternatives(missing_col, unmapped_columns)
-                
+            for issue in spec['issues']:
                 result.add_error(ProcessingError(
                     category=ErrorCategory.COLUMN_MAPPING,
-                    severity=ErrorSeverity.WARNING,
-                    message=f"권장 컬럼 누락: {missing_col}",
-                    details="이 컬럼이 없으면 일부 기능이 제한될 수 있습니다.",
-                    suggested_fix=f"가능하면 다음 컬럼을 추가하세요: {', '.join(suggestions) if suggestions else '해당 데이터를 포함한 컬럼'}"
+                    severity=ErrorSeverity(issue['severity']),
+                    message=issue['message'],
+                    details=issue['details'],
+                    column_name=columns[issue['column']] if issue['column'] is not None else None,
+                    suggested_fix=issue['suggested_fix']
                 ))
             
-            # 5. 매핑되지 않은 컬럼 처리
-            for unmapped_col in unmapped_columns:
-                result.add_error(ProcessingError(
-                    category=ErrorCategory.COLUMN_MAPPING,
-                    severity=ErrorSeverity.INFO,
-                    message=f"매핑되지 않은 컬럼: {unmapped_col}",
-                    details="이 컬럼은 분석에 사용되지 않습니다.",
-                    column_name=unmapped_col,
-                    suggested_fix="필요한 경우 컬럼 매핑 테이블에 추가하세요."
-                ))
+            mapped_columns = {columns[index]: standard for index, standard in spec['mapped']}
+            unmapped_columns = [columns[index] for index in spec['unmapped']]
+            result.metadata['header_cache_hit'] = cached
             
             # 결과 설정
             result.success = not result.has_critical_errors()
@@ -19,6 +19,15 @@ import logging
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from .header_schema_cache import header_schema_cache
+    from .upload_session import UploadSession
+    from .csv_reader import read_csv_bytes, read_csv_file
+except ImportError:
+    from header_schema_cache import header_schema_cache
+    from upload_session import UploadSession
+    from csv_reader import read_csv_bytes, read_csv_file
+
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
@@ -65,6 +74,12 @@ class FileValidator:
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
     MIN_FILE_SIZE = 1024  # 1KB
     
+    # Excel 내용 검증 시 확인하는 권장 컬럼
+    EXPECTED_EXCEL_COLUMNS = ('시료명', '시험항목', '결과(성적서)')
+    
+    # 헤더 확인 규칙 버전 (헤더 스키마 캐시 키에 포함)
+    HEADER_CHECK_VERSION = "1"
+    
     # 위험한 파일 확장자
     DANGEROUS_EXTENSIONS = {
         '.exe', '.bat', '.cmd', '.com', '.pif', '.scr', '.vbs', '.js',
@@ -255,13 +270,8 @@ class FileValidator:
                                result: ValidationResult, uploaded_file=None) -> None:
         """Excel 파일 내용 검증"""
         try:
-            # pandas로 파일 읽기 시도
-            if uploaded_file:
-                # Streamlit 업로드 파일인 경우
-                df = pd.read_excel(uploaded_file, nrows=5)  # 처음 5행만 읽어서 테스트
-            else:
-                # 로컬 파일인 경우
-                df = pd.read_excel(file_path, nrows=5)
+            # pandas로 파일 읽기 시도 (처음 5행만 읽어서 테스트)
+            df = self._read_preview(file_path, uploaded_file, nrows=5)
             
             # 기본 구조 검증
             if df.empty:
@@ -273,9 +283,12 @@ class FileValidator:
                     'column_names': list(df.columns)[:10]  # 처음 10개 컬럼명만
                 })
                 
-                # 필수 컬럼 존재 여부 확인 (선택사항)
-                expected_columns = ['시료명', '시험항목', '결과(성적서)']
-                missing_columns = [col for col in expected_columns if col not in df.columns]
+                # 필수 컬럼 존재 여부 확인 (선택사항, 같은 헤더는 헤더 스키마 캐시 재사용)
+                columns = tuple(df.columns)
+                missing_columns, _ = header_schema_cache.get_or_compute(
+                    f"excel_content:{self.HEADER_CHECK_VERSION}", columns,
+                    lambda: [col for col in self.EXPECTED_EXCEL_COLUMNS if col not in columns]
+                )
                 
                 if missing_columns:
                     result.warnings.append(
@@ -289,29 +302,39 @@ class FileValidator:
         except Exception as e:
             result.errors.append(f"Excel 파일 검증 실패: {str(e)}")
     
+    @staticmethod
+    def _read_preview(file_path: Union[str, Path], uploaded_file=None, nrows: int = 5) -> pd.DataFrame:
+        """Excel/CSV 앞부분 읽기 (업로드 세션이면 세션의 DataFrame을 재사용)"""
+        if isinstance(uploaded_file, UploadSession):
+            return uploaded_file.preview(nrows)
+        if Path(file_path).suffix.lower() == '.csv':
+            if uploaded_file:
+                return read_csv_bytes(uploaded_file.getvalue(), nrows=nrows)
+            return read_csv_file(file_path, nrows=nrows)
+        if uploaded_file:
+            # Streamlit 업로드 파일인 경우
+            return pd.read_excel(uploaded_file, nrows=nrows)
+        # 로컬 파일인 경우
+        return pd.read_excel(file_path, nrows=nrows)
+    
     def _validate_csv_content(self, file_path: Union[str, Path], 
                              result: ValidationResult, uploaded_file=None) -> None:
         """CSV 파일 내용 검증"""
         try:
-            # pandas로 파일 읽기 시도
-            if uploaded_file:
-                df = pd.read_csv(uploaded_file, nrows=5, encoding='utf-8')
-            else:
-                # 인코딩 자동 감지 시도
-                encodings = ['utf-8', 'cp949', 'euc-kr', 'latin1']
-                df = None
-                
-                for encoding in encodings:
-                    try:
-                        df = pd.read_csv(file_path, nrows=5, encoding=encoding)
-                        result.metadata['detected_encoding'] = encoding
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if df is None:
-                    result.errors.append("CSV 파일의 인코딩을 감지할 수 없습니다.")
-                    return
+            # 앞부분 바이트 표본으로 인코딩을 한 번 판별한 뒤 읽기 (업로드 세션이면 세션 결과 재사용)
+            try:
+                if isinstance(uploaded_file, UploadSession):
+                    df = uploaded_file.preview(5)
+                    result.metadata['detected_encoding'] = uploaded_file.encoding
+                elif uploaded_file:
+                    df = read_csv_bytes(uploaded_file.getvalue(), nrows=5)
+                    result.metadata['detected_encoding'] = df.attrs.get('encoding')
+                else:
+                    df = read_csv_file(file_path, nrows=5)
+                    result.metadata['detected_encoding'] = df.attrs.get('encoding')
+            except UnicodeError:
+                result.errors.append("CSV 파일의 인코딩을 감지할 수 없습니다.")
+                return
             
             # 기본 구조 검증
             if df.empty:
@@ -389,12 +412,9 @@ class FileValidator:
             try:
                 extension = Path(file_path).suffix.lower()
                 
-                if extension in ['.xlsx', '.xls']:
-                    # Excel 파일의 경우 필수 컬럼 검사
-                    if uploaded_file:
-                        df = pd.read_excel(uploaded_file, nrows=1)
-                    else:
-                        df = pd.read_excel(file_path, nrows=1)
+                if extension in ['.xlsx', '.xls', '.csv']:
+                    # Excel/CSV 파일의 경우 필수 컬럼 검사
+                    df = cls._read_preview(file_path, uploaded_file, nrows=1)
                     
                     required_columns = ['시료명', '시험항목']
                     missing_required = [col for col in required_columns if col not in df.columns]
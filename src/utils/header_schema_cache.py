@@ -0,0 +1,166 @@
+"""
+헤더 스키마 캐시 (Header Schema Cache)
+업로드 파일의 헤더(컬럼명 튜플) 지문을 키로, 헤더에만 의존하는 해석 결과
+(컬럼 매핑, 경고, 제안)를 프로세스 전체에서 공유한다. LIMS 내보내기 양식은
+거의 바뀌지 않으므로 같은 양식은 유사도 매칭 없이 캐시에서 바로 가져온다.
+
+캐시 값은 JSON으로 저장 가능한 형태여야 하며, 컬럼은 이름 대신 헤더 내
+위치(인덱스)로 기록한다. cache_path를 지정하면 디스크에도 보관한다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def header_fingerprint(columns: Iterable) -> str:
+    """헤더 튜플 지문 (컬럼명 + 타입 + 순서)"""
+    columns = tuple(columns)
+    try:
+        return _cached_fingerprint(columns)
+    except TypeError:  # 해시 불가능한 컬럼명
+        return _fingerprint(columns)
+
+
+@lru_cache(maxsize=256)
+def _cached_fingerprint(columns: Tuple) -> str:
+    return _fingerprint(columns)
+
+
+def _fingerprint(columns: Tuple) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for column in columns:
+        digest.update(type(column).__name__.encode('utf-8'))
+        digest.update(b'\x1e')
+        digest.update(str(column).encode('utf-8', 'surrogatepass'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class HeaderSchemaCache:
+    """헤더 지문 → 해석 결과 캐시
+
+    키는 (네임스페이스, 헤더 지문)이다. 네임스페이스에는 해석 규칙 버전을
+    포함시켜 규칙이 바뀌면 이전 항목을 쓰지 않도록 한다. 저장 시에는 복사본을
+    보관하고, 조회 결과는 캐시 객체를 그대로 돌려주므로(적중 시 복사 비용 없음)
+    호출 측에서 수정하지 않아야 한다.
+    """
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = None, max_entries: int = 512):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._loaded = False
+
+    @staticmethod
+    def _key(namespace: str, columns: Iterable) -> str:
+        return f"{namespace}:{header_fingerprint(columns)}"
+
+    def _load(self) -> None:
+        """디스크 캐시 최초 1회 로드 (손상 시 무시)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            for key, value in stored.items():
+                self._entries.setdefault(key, value)
+        except (OSError, ValueError) as e:
+            logger.warning(f"헤더 스키마 캐시 로드 실패: {e}")
+
+    def _save(self) -> None:
+        """디스크 캐시 원자적 저장"""
+        if self.cache_path is None:
+            return
+        tmp_path = None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"헤더 스키마 캐시 저장 실패: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def get(self, namespace: str, columns: Iterable) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+        key = self._key(namespace, columns)
+        with self._lock:
+            self._load()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+    def put(self, namespace: str, columns: Iterable, value: Any) -> None:
+        """캐시 저장 (항목 수 초과 시 오래 사용하지 않은 항목부터 제거)"""
+        key = self._key(namespace, columns)
+        with self._lock:
+            self._load()
+            self._entries[key] = copy.deepcopy(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._save()
+
+    def get_or_compute(self, namespace: str, columns: Iterable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """캐시 조회 후 없으면 계산하여 저장 → (값, 캐시 적중 여부)"""
+        columns = tuple(columns)
+        cached = self.get(namespace, columns)
+        if cached is not None:
+            return cached, True
+        value = compute()
+        self.put(namespace, columns, value)
+        return value, False
+
+    def clear(self) -> None:
+        """메모리/디스크 캐시 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            if self.cache_path is not None and self.cache_path.exists():
+                self.cache_path.unlink()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        total_requests = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total_requests * 100) if total_requests > 0 else 0,
+            'cache_path': str(self.cache_path) if self.cache_path else None,
+        }
+
+
+# 프로세스 전역 인스턴스 (앱에서 configure_header_schema_cache로 디스크 경로 지정)
+header_schema_cache = HeaderSchemaCache()
+
+
+def configure_header_schema_cache(cache_path: Optional[Union[str, Path]]) -> HeaderSchemaCache:
+    """전역 캐시의 디스크 저장 경로 설정 (기존 메모리 항목은 유지)"""
+    with header_schema_cache._lock:
+        header_schema_cache.cache_path = Path(cache_path) if cache_path else None
+        header_schema_cache._loaded = False
+    return header_schema_cache
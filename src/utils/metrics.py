@@ -142,7 +142,7 @@ class MetricsRegistry:
             upload_dir = 'uploads/pending'
             if os.path.exists(upload_dir):
                 upload_count = len([f for f in os.listdir(upload_dir) 
-                                  if f.endswith(('.xlsx', '.xls'))])
+                                  if f.endswith(('.xlsx', '.xls', '.csv'))])
                 self.gauge('pending_files_count', upload_count)
             
             # 처리된 파일 수
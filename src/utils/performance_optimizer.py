@@ -25,6 +25,18 @@ import weakref
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 전체 DataFrame 깊은 메모리 측정(memory_usage(deep=True))은 모든 문자열을 훑으므로 디버그 시에만 수행
+DEBUG_MEMORY = os.environ.get('AQUA_DEBUG_MEMORY', '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def log_memory_usage(df: pd.DataFrame, label: str) -> Optional[float]:
+    """DataFrame 깊은 메모리 사용량 기록 (DEBUG_MEMORY일 때만, MB 반환)"""
+    if not DEBUG_MEMORY:
+        return None
+    memory_mb = df.memory_usage(deep=True).sum() / 1024 / 1024
+    logger.info(f"{label} 메모리: {memory_mb:.1f}MB ({len(df)}행, {len(df.columns)}컬럼)")
+    return memory_mb
+
 
 @dataclass
 class PerformanceMetrics:
@@ -62,8 +74,10 @@ class MemoryMonitor:
     def stop_monitoring(self) -> float:
         """메모리 모니터링 중지 및 피크 메모리 반환"""
         self.monitoring = False
-        if self._monitor_thread:
-            self._monitor_thread.join(timeout=1.0)
+        # 다른 스레드가 막 생성한 (아직 시작되지 않은) 모니터 스레드는 join하지 않음
+        monitor_thread = self._monitor_thread
+        if monitor_thread and monitor_thread.is_alive():
+            monitor_thread.join(timeout=1.0)
         return self.peak_memory
     
     def _monitor_memory(self):
@@ -260,16 +274,21 @@ class ChunkedDataProcessor:
         file_path: str, 
         process_func: Callable[[pd.DataFrame], Any],
         combine_func: Callable[[List[Any]], Any] = None,
+        progress_callback: Callable[[int, Optional[int], float], None] = None,
         **read_kwargs
     ) -> Any:
         """
-        파일을 청크 단위로 읽어서 처리
+        파일을 청크 단위로 스트리밍하며 처리
+        
+        시트 전체를 메모리에 올리지 않고 chunk_size 행씩 읽어 바로
+        process_func에 전달하므로, 읽기 단계의 메모리는 시트 크기와 무관하다.
         
         Args:
             file_path: 파일 경로
             process_func: 각 청크에 적용할 함수
             combine_func: 결과를 결합하는 함수
-            **read_kwargs: pandas.read_excel 추가 인자
+            progress_callback: 진행 콜백 (처리 행 수, 전체 행 수(추정, 없으면 None), 행/초)
+            **read_kwargs: iter_excel_chunks 추가 인자 (sheet_name)
             
         Returns:
             처리된 결과
@@ -282,14 +301,13 @@ class ChunkedDataProcessor:
         try:
             results = []
             chunk_count = 0
+            rows_done = 0
+            total_rows = estimate_excel_rows(file_path, **read_kwargs)
             
-            # 파일을 청크 단위로 읽기
-            for chunk in pd.read_excel(
-                file_path, 
-                chunksize=self.chunk_size,
-                **read_kwargs
-            ):
+            # 파일을 청크 단위로 읽기 (읽기 전용 스트리밍)
+            for chunk in iter_excel_chunks(file_path, self.chunk_size, **read_kwargs):
                 chunk_count += 1
+                rows_done += len(chunk)
                 logger.debug(f"청크 {chunk_count} 처리 중 ({len(chunk)}행)")
                 
                 try:
@@ -298,6 +316,16 @@ class ChunkedDataProcessor:
                 except Exception as e:
                     logger.error(f"청크 {chunk_count} 처리 실패: {e}")
                     continue
+                finally:
+                    del chunk
+                
+                # 진행 상황 (행/초)
+                elapsed = time.time() - start_time
+                rows_per_sec = rows_done / elapsed if elapsed > 0 else 0.0
+                total_text = f"/{total_rows}" if total_rows else ""
+                logger.info(f"청크 {chunk_count}: {rows_done}{total_text}행 처리, {rows_per_sec:.0f}행/초")
+                if progress_callback:
+                    progress_callback(rows_done, total_rows, rows_per_sec)
                 
                 # 메모리 사용량 확인
                 current_memory = self.memory_monitor.get_current_memory()
@@ -316,7 +344,8 @@ class ChunkedDataProcessor:
             duration = time.time() - start_time
             peak_memory = self.memory_monitor.stop_monitoring()
             
-            logger.info(f"파일 청크 처리 완료: {chunk_count}개 청크, {duration:.2f}초, 피크 메모리: {peak_memory:.1f}MB")
+            logger.info(f"파일 청크 처리 완료: {chunk_count}개 청크, {rows_done}행, {duration:.2f}초 "
+                        f"({rows_done / duration if duration > 0 else 0:.0f}행/초), 피크 메모리: {peak_memory:.1f}MB")
             
             return final_result
             
@@ -326,6 +355,123 @@ class ChunkedDataProcessor:
             raise
 
 
+# openpyxl 읽기 전용 모드로 스트리밍 가능한 확장자 (.xls는 전체 읽기 후 분할)
+STREAMING_EXCEL_SUFFIXES = ('.xlsx', '.xlsm')
+
+# pandas.read_excel 기본 결측 문자열 (스트리밍 결과도 같은 값을 결측으로 처리)
+EXCEL_NA_STRINGS = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+])
+
+
+def _unique_headers(values) -> List[Any]:
+    """헤더 행을 pandas.read_excel과 같은 규칙으로 정리 (빈 헤더 → Unnamed: i, 중복 → 이름.n)"""
+    headers = []
+    seen = {}
+    for i, value in enumerate(values):
+        name = f"Unnamed: {i}" if value is None or (isinstance(value, str) and not value.strip()) else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        headers.append(name)
+    return headers
+
+
+def _records_to_frame(records: List[tuple], headers: List[Any], offset: int) -> pd.DataFrame:
+    """행 튜플 목록을 DataFrame으로 변환 (결측 문자열은 NaN 처리)"""
+    df = pd.DataFrame.from_records(records, columns=headers,
+                                   index=pd.RangeIndex(offset, offset + len(records)))
+    for column, dtype in df.dtypes.items():
+        if not pd.api.types.is_string_dtype(dtype):
+            continue
+        na_mask = df[column].isin(EXCEL_NA_STRINGS)
+        if na_mask.any():
+            df[column] = df[column].mask(na_mask)
+    return df
+
+
+def estimate_excel_rows(file_path: str, sheet_name: Any = 0) -> Optional[int]:
+    """시트 크기 정보(dimension)로 데이터 행 수 추정 (알 수 없으면 None)"""
+    if Path(file_path).suffix.lower() not in STREAMING_EXCEL_SUFFIXES:
+        return None
+    try:
+        from openpyxl import load_workbook
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+            return max(sheet.max_row - 1, 0) if sheet.max_row else None
+        finally:
+            workbook.close()
+    except Exception:
+        return None
+
+
+def iter_excel_chunks(file_path: str, chunk_size: int = 1000, sheet_name: Any = 0) -> Iterator[pd.DataFrame]:
+    """
+    엑셀 시트를 chunk_size 행 단위 DataFrame으로 스트리밍
+    
+    .xlsx/.xlsm은 openpyxl 읽기 전용 모드로 행을 하나씩 읽으므로 한 번에
+    최대 chunk_size 행만 메모리에 유지한다. 첫 행은 헤더로 사용하고,
+    값이 모두 비어 있는 행은 건너뛴다.
+    
+    Args:
+        file_path: 파일 경로
+        chunk_size: 청크당 최대 행 수
+        sheet_name: 시트 인덱스 또는 이름
+        
+    Yields:
+        청크 DataFrame (인덱스는 시트 내 데이터 행 번호 기준으로 연속)
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 1 이상이어야 합니다")
+    
+    if Path(file_path).suffix.lower() not in STREAMING_EXCEL_SUFFIXES:
+        # 구형 .xls는 스트리밍 파서가 없으므로 전체 읽기 후 분할
+        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+        return
+    
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        rows = sheet.iter_rows(values_only=True)
+        
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        # 헤더 뒤쪽의 빈 셀은 데이터가 없는 열로 보고 제외
+        width = len(header_row)
+        while width > 0 and header_row[width - 1] is None:
+            width -= 1
+        headers = _unique_headers(header_row[:width])
+        
+        buffer = []
+        offset = 0
+        for row in rows:
+            row = row[:width]
+            if all(value is None for value in row):
+                continue
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            buffer.append(row)
+            
+            if len(buffer) >= chunk_size:
+                yield _records_to_frame(buffer, headers, offset)
+                offset += len(buffer)
+                buffer = []
+        
+        if buffer:
+            yield _records_to_frame(buffer, headers, offset)
+    finally:
+        workbook.close()
+
+
 class PerformanceOptimizer:
     """성능 최적화 메인 클래스"""
     
@@ -445,16 +591,20 @@ class PerformanceOptimizer:
         return decorator
     
     def optimize_dataframe_memory(self, df: pd.DataFrame) -> pd.DataFrame:
-        """DataFrame 메모리 사용량 최적화"""
-        logger.info(f"DataFrame 메모리 최적화 시작: {df.memory_usage(deep=True).sum() / 1024 / 1024:.1f}MB")
+        """DataFrame 메모리 사용량 최적화 (스키마를 모르는 DataFrame용)
+
+        LIMS 업로드는 읽기 시점 dtype 계획(column_plan.apply_read_dtypes)을 사용하므로
+        이 함수를 거치지 않는다. 원본은 수정하지 않으며, 바뀌는 컬럼만 새 배열로 교체한다.
+        """
+        memory_before = log_memory_usage(df, "DataFrame 메모리 최적화 전")
         
-        optimized_df = df.copy()
+        optimized_df = df.copy(deep=False)
         
         for col in optimized_df.columns:
             col_type = optimized_df[col].dtype
             
-            if col_type == 'object':
-                # 문자열 컬럼 최적화
+            if col_type == 'object' or isinstance(col_type, pd.StringDtype):
+                # 문자열 컬럼 최적화 (pandas 3 기본 문자열 dtype 포함)
                 try:
                     # 카테고리로 변환 가능한지 확인
                     unique_ratio = optimized_df[col].nunique() / len(optimized_df)
@@ -487,11 +637,10 @@ class PerformanceOptimizer:
                 # 실수 컬럼 최적화
                 optimized_df[col] = pd.to_numeric(optimized_df[col], downcast='float')
         
-        memory_after = optimized_df.memory_usage(deep=True).sum() / 1024 / 1024
-        memory_before = df.memory_usage(deep=True).sum() / 1024 / 1024
-        reduction = (memory_before - memory_after) / memory_before * 100
-        
-        logger.info(f"DataFrame 메모리 최적화 완료: {memory_before:.1f}MB → {memory_after:.1f}MB ({reduction:.1f}% 감소)")
+        memory_after = log_memory_usage(optimized_df, "DataFrame 메모리 최적화 후")
+        if memory_before:
+            reduction = (memory_before - memory_after) / memory_before * 100
+            logger.info(f"DataFrame 메모리 최적화 완료: {memory_before:.1f}MB → {memory_after:.1f}MB ({reduction:.1f}% 감소)")
         
         return optimized_df
     
@@ -0,0 +1,174 @@
+"""
+업로드 세션 (Upload Session)
+업로드된 파일의 바이트를 한 번만 읽고, 워크북 디코딩 결과(헤더, 전체 DataFrame)를
+세션 객체에 보관하여 파일 검증 → 에러 처리 → 데이터 변환 → 저장 단계가 같은
+파싱 결과를 공유하도록 한다. 20MB 업로드도 pd.read_excel은 한 번만 수행된다.
+
+세션 객체는 Streamlit UploadedFile과 같은 name/type/size/getvalue()를 제공하므로
+기존 uploaded_file 인자 자리에 그대로 넘길 수 있다. frame은 모든 단계가 공유하므로
+호출 측에서 수정하지 말고 필요하면 복사해서 사용한다.
+"""
+
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import pandas as pd
+
+try:
+    from .csv_reader import read_csv_bytes, sniff_encoding
+except ImportError:
+    from csv_reader import read_csv_bytes, sniff_encoding
+
+try:
+    from src.core.column_plan import apply_read_dtypes, read_dtypes
+except ImportError:
+    from column_plan import apply_read_dtypes, read_dtypes
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSession:
+    """업로드 파일 1건의 읽기 결과 공유 객체
+
+    - content: 원본 바이트 (한 번만 읽음)
+    - frame: 첫 시트(CSV는 전체) DataFrame (최초 접근 시 1회 디코딩, 실패도 기억)
+    - header: 컬럼명 튜플 (frame에서 가져옴)
+    """
+
+    EXCEL_SUFFIXES = ('.xlsx', '.xls')
+    CSV_SUFFIXES = ('.csv',)
+
+    def __init__(self, content: bytes, name: str, mime_type: Optional[str] = None):
+        self.content = bytes(content)
+        self.name = name
+        self.type = mime_type
+        self.read_count = 0  # 워크북 디코딩 횟수 (검증/테스트용)
+        self._frame: Optional[pd.DataFrame] = None
+        self._read_error: Optional[Exception] = None
+        self._sha256: Optional[str] = None
+        self._encoding: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_uploaded_file(cls, uploaded_file) -> 'UploadSession':
+        """Streamlit 업로드 파일 → 세션 (이미 세션이면 그대로 반환)"""
+        if isinstance(uploaded_file, cls):
+            return uploaded_file
+        return cls(uploaded_file.getvalue(), uploaded_file.name, getattr(uploaded_file, 'type', None))
+
+    @classmethod
+    def from_path(cls, file_path: Union[str, Path]) -> 'UploadSession':
+        """로컬 파일 → 세션"""
+        file_path = Path(file_path)
+        return cls(file_path.read_bytes(), file_path.name)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix.lower()
+
+    @property
+    def is_excel(self) -> bool:
+        return self.suffix in self.EXCEL_SUFFIXES
+
+    @property
+    def is_csv(self) -> bool:
+        return self.suffix in self.CSV_SUFFIXES
+
+    @property
+    def encoding(self) -> Optional[str]:
+        """CSV 인코딩 (앞부분 표본으로 1회 판별, 전체 읽기 중 재판별되면 갱신, Excel이면 None)"""
+        if not self.is_csv:
+            return None
+        if self._encoding is None:
+            self._encoding = sniff_encoding(self.content)
+        return self._encoding
+
+    def getvalue(self) -> bytes:
+        """UploadedFile 호환 (원본 바이트)"""
+        return self.content
+
+    def getbuffer(self) -> memoryview:
+        """UploadedFile 호환 (복사 없는 버퍼)"""
+        return memoryview(self.content)
+
+    @property
+    def sha256(self) -> str:
+        """원본 바이트 SHA-256 (최초 1회 계산)"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.content).hexdigest()
+        return self._sha256
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """첫 시트 전체 DataFrame (공유 객체 - 수정 금지)"""
+        with self._lock:
+            if self._frame is None:
+                if self._read_error is not None:
+                    raise self._read_error
+                try:
+                    self._frame = self._read_frame()
+                except Exception as e:
+                    # 손상 파일을 단계마다 다시 디코딩하지 않도록 실패도 기억
+                    self._read_error = e
+                    raise
+            return self._frame
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._frame is not None
+
+    @property
+    def header(self) -> Tuple:
+        """컬럼명 튜플"""
+        return tuple(self.frame.columns)
+
+    def preview(self, nrows: int = 5) -> pd.DataFrame:
+        """앞 nrows행 (pd.read_excel(nrows=...) 대체)"""
+        return self.frame.head(nrows)
+
+    def _read_frame(self) -> pd.DataFrame:
+        self.read_count += 1
+        logger.info(f"워크북 디코딩: {self.name} ({self.size / 1024 / 1024:.1f}MB)")
+        if self.is_csv:
+            # 모든 컬럼 문자열로 읽음 (수치/일시 변환은 컬럼 단위 변환 단계에서 처리)
+            df = read_csv_bytes(self.content, encoding=self.encoding)
+            self._encoding = df.attrs.get('encoding', self._encoding)
+            return apply_read_dtypes(df)
+        # LIMS 텍스트 컬럼은 읽으면서 문자열 dtype으로, 이후 카테고리/정수 다운캐스트 (사후 최적화 복사 없음)
+        return apply_read_dtypes(pd.read_excel(io.BytesIO(self.content), sheet_name=0, dtype=read_dtypes()))
+
+    def save_to(self, path: Union[str, Path]) -> Path:
+        """원본 바이트를 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self.content)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+        return path
+
+    def source_info(self) -> Dict[str, object]:
+        """저장 레코드에 남길 원본 파일 정보"""
+        return {
+            'file_name': self.name,
+            'size': self.size,
+            'sha256': self.sha256,
+        }
+
+    def __repr__(self) -> str:
+        return f"UploadSession(name={self.name!r}, size={self.size}, loaded={self.is_loaded})"
@@ -25,6 +25,11 @@ except ImportError:
         FileValidator = None
         DataProcessingErrorHandler = None
 
+try:
+    from .upload_session import UploadSession
+except ImportError:
+    from upload_session import UploadSession
+
 
 def validate_test_result_data(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
@@ -306,20 +311,29 @@ class IntegratedValidator:
         
         Args:
             file_path: 파일 경로
-            uploaded_file: Streamlit 업로드 파일 객체
+            uploaded_file: Streamlit 업로드 파일 객체 또는 UploadSession
             
         Returns:
-            통합 검증 결과
+            통합 검증 결과 ('upload_session'에 이후 처리/저장 단계가 재사용할 세션 포함)
         """
         result = {
             'success': False,
             'file_validation': None,
             'data_processing': None,
             'formatted_messages': None,
-            'can_proceed': False
+            'can_proceed': False,
+            'upload_session': None
         }
         
         try:
+            # 파일 검증과 데이터 처리 검증이 같은 파싱 결과를 쓰도록 세션으로 감싸기
+            if uploaded_file is not None:
+                uploaded_file = UploadSession.from_uploaded_file(uploaded_file)
+            elif (Path(file_path).suffix.lower() in UploadSession.EXCEL_SUFFIXES + UploadSession.CSV_SUFFIXES
+                  and Path(file_path).is_file()):
+                uploaded_file = UploadSession.from_path(file_path)
+            result['upload_session'] = uploaded_file
+            
             # 1. 파일 검증
             if self.file_validator:
                 file_result = self.file_validator.validate_file(file_path, uploaded_file)
@@ -332,9 +346,9 @@ class IntegratedValidator:
             # 2. 데이터 처리 검증 (파일이 유효한 경우)
             if self.error_handler:
                 try:
-                    # 파일 읽기
+                    # 파일 읽기 (파일 검증 단계에서 디코딩한 DataFrame 재사용)
                     if uploaded_file:
-                        df = pd.read_excel(uploaded_file)
+                        df = uploaded_file.frame
                     else:
                         df = pd.read_excel(file_path)
                     
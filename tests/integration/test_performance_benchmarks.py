@@ -36,9 +36,13 @@ class TestPerformanceBenchmarks:
         'chart_render_small': 1.0,    # 소규모 차트 렌더링
         'chart_render_large': 3.0,    # 대규모 차트 렌더링
         'dashboard_update': 5.0,      # 대시보드 업데이트
-        'memory_limit_mb': 500        # 메모리 사용량 제한 (MB)
+        'memory_limit_mb': 500,       # 메모리 사용량 제한 (MB)
+        'conversion_speedup': 10.0    # 컬럼 단위 변환의 최소 속도 향상 배수
     }
     
+    # 행 단위 변환은 느리므로 표본으로 측정 후 선형 외삽
+    LEGACY_SAMPLE_ROWS = 2000
+    
     def generate_test_data(self, size: int) -> pd.DataFrame:
         """테스트 데이터 생성"""
         test_items = [
@@ -306,6 +310,1053 @@ class TestPerformanceBenchmarks:
             if os.path.exists(temp_file):
                 os.unlink(temp_file)
     
+    @pytest.mark.parametrize("data_size", [
+        10000,
+        100000,
+        pytest.param(1000000, marks=pytest.mark.skipif(
+            not os.environ.get('AQUA_FULL_BENCHMARK'),
+            reason="100만 행 벤치마크는 AQUA_FULL_BENCHMARK=1 설정 시에만 실행"
+        )),
+    ])
+    def test_vectorized_conversion_speedup(self, data_size):
+        """컬럼 단위 TestResult 변환 속도 향상 측정"""
+        print(f"\n⚡ 컬럼 단위 변환 벤치마크 - {data_size}행")
+        
+        test_data = self.generate_test_data(data_size)
+        processor = DataProcessor()
+        
+        # 기존 방식: 행마다 컬럼명 매칭 후 변환
+        sample = test_data.head(self.LEGACY_SAMPLE_ROWS)
+        start_time = time.time()
+        legacy_results = [processor._row_to_test_result(row) for _, row in sample.iterrows()]
+        legacy_rate = len(sample) / (time.time() - start_time)
+        legacy_estimate = data_size / legacy_rate
+        
+        # 새 방식: 컬럼 매핑 계획 1회 해석 + 컬럼 단위 변환
+        test_results, metrics = self.measure_performance(
+            processor._convert_dataframe_to_test_results, test_data
+        )
+        
+        assert len(test_results) == data_size, "변환 결과 수가 입력 행 수와 다릅니다"
+        assert test_results[:len(legacy_results)] == legacy_results, "행 단위 변환 결과와 다릅니다"
+        
+        speedup = legacy_estimate / max(metrics['execution_time'], 0.001)
+        assert speedup > self.PERFORMANCE_THRESHOLDS['conversion_speedup'], \
+            f"변환 속도 향상 부족: {speedup:.1f}배"
+        
+        print(f"   🐌 행 단위 (추정): {legacy_estimate:.2f}초 ({legacy_rate:.0f}행/초)")
+        print(f"   🚀 컬럼 단위: {metrics['execution_time']:.2f}초 "
+              f"({data_size / max(metrics['execution_time'], 0.001):.0f}행/초)")
+        print(f"   ⚡ 속도 향상: {speedup:.1f}배")
+    
+    def test_result_batch_memory_and_aggregation(self):
+        """컬럼형 TestResultBatch 메모리/집계 성능 비교"""
+        import tracemalloc
+        from src.core.data_models import ProjectSummary
+        
+        print(f"\n🧱 TestResultBatch 벤치마크 - 100000행")
+        
+        test_data = self.generate_test_data(100000)
+        processor = DataProcessor()
+        
+        # 객체 리스트 메모리
+        tracemalloc.start()
+        test_results = processor._convert_dataframe_to_test_results(test_data)
+        list_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        # 컬럼형 배치 메모리
+        tracemalloc.start()
+        batch = processor.convert_dataframe_to_batch(test_data)
+        batch_memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        _, list_metrics = self.measure_performance(ProjectSummary.from_test_results, "LIST", test_results)
+        _, batch_metrics = self.measure_performance(ProjectSummary.from_test_results, "BATCH", batch)
+        
+        assert len(batch) == len(test_results)
+        # 행마다 고유한 분석번호/결과 문자열은 양쪽에 동일하게 남으므로 2배 이상을 기준으로 함
+        assert batch_memory * 2 < list_memory, \
+            f"배치 메모리 절감 부족: {batch_memory / 1024 / 1024:.1f}MB vs {list_memory / 1024 / 1024:.1f}MB"
+        assert batch_metrics['execution_time'] < list_metrics['execution_time']
+        
+        print(f"   📦 List[TestResult]: {list_memory / 1024 / 1024:.1f}MB, "
+              f"요약 {list_metrics['execution_time']:.3f}초")
+        print(f"   🧱 TestResultBatch: {batch_memory / 1024 / 1024:.1f}MB, "
+              f"요약 {batch_metrics['execution_time']:.3f}초")
+
+    def test_compact_test_result_memory(self):
+        """실제 내보내기 파일 기준 CompactTestResult 행당 메모리 비교"""
+        import tracemalloc
+
+        sample_dir = Path(__file__).parent.parent.parent / 'data' / '개별파일 뭉탱이 전달'
+        sample_files = sorted(sample_dir.glob('*.xlsx'))
+        if not sample_files:
+            pytest.skip("샘플 내보내기 파일 없음")
+
+        print(f"\n🧬 CompactTestResult 벤치마크 - 샘플 파일 {len(sample_files)}개")
+
+        # 세션에 여러 파일 결과를 보관하는 상황과 동일하게 파일별로 변환
+        frames = [pd.read_excel(file_path, sheet_name=0) for file_path in sample_files]
+
+        bytes_per_row = {}
+        for label, compact in (('TestResult', False), ('CompactTestResult', True)):
+            processor = DataProcessor(compact_results=compact)
+            tracemalloc.start()
+            session_results = [processor._convert_dataframe_to_test_results(df) for df in frames]
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            total_rows = sum(len(results) for results in session_results)
+            assert total_rows > 0
+            bytes_per_row[label] = memory / total_rows
+            print(f"   📦 {label}: {total_rows}행, 행당 {bytes_per_row[label]:.0f}B")
+
+        reduction = 1 - bytes_per_row['CompactTestResult'] / bytes_per_row['TestResult']
+        print(f"   📉 행당 메모리 절감: {reduction:.0%}")
+        assert reduction > 0.25, f"행당 메모리 절감 부족: {reduction:.0%}"
+
+    def test_streaming_excel_reader_memory(self):
+        """스트리밍 엑셀 리더 - 시트 크기와 무관한 읽기 메모리"""
+        import tracemalloc
+        from src.utils.performance_optimizer import ChunkedDataProcessor, iter_excel_chunks
+
+        print(f"\n🌊 스트리밍 엑셀 리더 벤치마크")
+
+        # tracemalloc 환경에서는 읽기가 느리므로 작은 시트 두 개로 증가율을 비교
+        sizes = (1500, 6000)
+        chunk_size = 500
+        stream_peaks = {}
+        temp_files = {size: self.create_temp_excel_file(self.generate_test_data(size)) for size in sizes}
+
+        try:
+            for size in sizes:
+                tracemalloc.start()
+                max_chunk = 0
+                total_rows = 0
+                for chunk in iter_excel_chunks(temp_files[size], chunk_size):
+                    max_chunk = max(max_chunk, len(chunk))
+                    total_rows += len(chunk)
+                stream_peaks[size] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                assert total_rows == size
+                assert max_chunk <= chunk_size
+                print(f"   🌊 {size}행 스트리밍 피크: {stream_peaks[size] / 1024 / 1024:.1f}MB")
+
+            large = sizes[-1]
+            tracemalloc.start()
+            pd.read_excel(temp_files[large], sheet_name=0)
+            full_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"   📄 {large}행 전체 읽기 피크: {full_peak / 1024 / 1024:.1f}MB")
+
+            # 행 수가 4배가 되어도 읽기 메모리는 거의 일정해야 함 (공유 문자열 테이블만 증가)
+            assert stream_peaks[large] < stream_peaks[sizes[0]] * 2
+            assert stream_peaks[large] * 3 < full_peak
+
+            # 청크 파이프라인 처리량 (행/초 진행 보고)
+            progress = []
+            processor = DataProcessor()
+            chunked = ChunkedDataProcessor(chunk_size=chunk_size)
+            test_results, metrics = self.measure_performance(
+                chunked.process_file_chunks, temp_files[large],
+                processor._convert_dataframe_to_test_results,
+                lambda results_list: [r for results in results_list for r in results],
+                progress_callback=lambda rows, total, rate: progress.append((rows, total, rate))
+            )
+
+            assert len(test_results) == large
+            assert progress[-1][0] == large and progress[-1][1] == large
+            assert all(rate > 0 for _, _, rate in progress)
+            print(f"   📈 파이프라인 처리 속도: {large / metrics['execution_time']:.0f}행/초 "
+                  f"({len(progress)}개 청크)")
+        finally:
+            for temp_file in temp_files.values():
+                if os.path.exists(temp_file):
+                    os.unlink(temp_file)
+
+    def test_bulk_import_throughput(self):
+        """샘플 내보내기 폴더/ZIP 대량 가져오기 처리량"""
+        from src.core.bulk_importer import bulk_import, format_import_summary
+        from src.core.database_manager import DatabaseManager
+
+        data_dir = Path(__file__).parent.parent.parent / 'data'
+        sources = [data_dir / '개별파일 뭉탱이 전달', data_dir / '개별파일 뭉탱이 전달.zip']
+        if not all(source.exists() for source in sources):
+            pytest.skip("샘플 내보내기 폴더/ZIP 없음")
+
+        print(f"\n📥 대량 가져오기 벤치마크")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = DatabaseManager(os.path.join(tmp_dir, 'db.json'))
+            sequential = bulk_import(sources, workers=1, dry_run=True)
+            parallel = bulk_import(sources, db_manager=db, workers=os.cpu_count())
+
+            assert not parallel.failed
+            assert parallel.total_rows == sequential.total_rows
+            assert len(db.get_all_files()) == len(parallel.results)
+
+        print(format_import_summary(parallel))
+        print(f"   ⏱️ 순차 파싱 {sequential.parse_seconds:.2f}초 vs "
+              f"병렬({parallel.workers}) 파싱 {parallel.parse_seconds:.2f}초")
+
+    def test_parse_cache_hit_latency(self):
+        """내용 해시 파싱 캐시 - 재업로드 시 응답 시간"""
+        from src.core.parse_cache import ParseCache
+
+        print(f"\n🗃️ 파싱 캐시 벤치마크 - 5000행")
+
+        test_data = self.generate_test_data(5000)
+        temp_file = self.create_temp_excel_file(test_data)
+
+        try:
+            content = Path(temp_file).read_bytes()
+            with tempfile.TemporaryDirectory() as cache_dir:
+                processor = DataProcessor(parse_cache=ParseCache(cache_dir))
+
+                cold_results, cold_metrics = self.measure_performance(processor.parse_excel_bytes, content)
+                hit_batch, hit_metrics = self.measure_performance(
+                    processor.parse_excel_bytes, content, as_batch=True
+                )
+                hit_results, list_metrics = self.measure_performance(processor.parse_excel_bytes, content)
+
+            assert hit_results == cold_results
+            assert len(hit_batch) == len(cold_results)
+            assert hit_metrics['execution_time'] < 0.1, \
+                f"캐시 적중 시간 초과: {hit_metrics['execution_time']:.3f}초"
+            assert list_metrics['execution_time'] * 5 < cold_metrics['execution_time']
+
+            print(f"   🐌 최초 파싱: {cold_metrics['execution_time']:.3f}초")
+            print(f"   🚀 캐시 적중 (배치): {hit_metrics['execution_time'] * 1000:.1f}ms")
+            print(f"   🚀 캐시 적중 (리스트): {list_metrics['execution_time'] * 1000:.1f}ms")
+        finally:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+
+    def test_vectorized_datetime_parsing(self):
+        """컬럼 단위 일시 파싱 vs 행 단위 parse_datetime"""
+        from src.core.data_models import parse_datetime, parse_datetime_series
+
+        size = 100000
+        print(f"\n🕒 일시 파싱 벤치마크 - {size}행")
+
+        # 분 단위로 대부분 고유한 입력일시 + 일부 다른 형식/빈 값
+        values = pd.Series(pd.date_range('2025-01-01', periods=size, freq='min').strftime('%Y-%m-%d %H:%M'))
+        values[::500] = '2025/01/02'
+        values[::777] = ''
+
+        vectorized, vector_metrics = self.measure_performance(parse_datetime_series, values)
+        row_based, row_metrics = self.measure_performance(lambda: [parse_datetime(v) for v in values])
+
+        assert pd.DatetimeIndex(vectorized).equals(pd.DatetimeIndex(row_based))
+        speedup = row_metrics['execution_time'] / max(vector_metrics['execution_time'], 0.001)
+        assert speedup > 5, f"일시 파싱 속도 향상 부족: {speedup:.1f}배"
+
+        print(f"   🐌 행 단위: {row_metrics['execution_time']:.3f}초")
+        print(f"   🚀 컬럼 단위: {vector_metrics['execution_time']:.3f}초")
+        print(f"   ⚡ 속도 향상: {speedup:.1f}배")
+
+    def test_vectorized_result_decoding(self):
+        """결과(성적서) 컬럼 일괄 해석 vs 행 단위 get_numeric_result/get_display_result"""
+        from src.core.data_models import DetectionStatus, TestResult, decode_result_values
+
+        size = 100000
+        print(f"\n🔢 결과값 해석 벤치마크 - {size}행")
+
+        # 절반은 불검출, 일부 정량한계 미만, 나머지 수치
+        rng = np.random.default_rng(0)
+        values = np.empty(size, dtype=object)
+        values[:] = np.round(rng.random(size) * 0.1, 4).tolist()
+        values[::2] = '불검출'
+        values[::97] = '<0.001'
+        test_results = [TestResult(*([''] * 5 + [value] + [0] + [''] * 20)) for value in values]
+
+        decoded, vector_metrics = self.measure_performance(
+            lambda: decode_result_values([result.result_report for result in test_results])
+        )
+        row_based, row_metrics = self.measure_performance(
+            lambda: [(result.get_numeric_result(), result.get_display_result()) for result in test_results]
+        )
+
+        numeric = [np.nan if value is None else value for value, _ in row_based]
+        np.testing.assert_array_equal(decoded.value, numeric)
+        assert decoded.display.tolist() == [display for _, display in row_based]
+        assert int((decoded.status == DetectionStatus.BELOW_LOQ).sum()) == len(values[::97])
+
+        speedup = row_metrics['execution_time'] / max(vector_metrics['execution_time'], 0.001)
+        assert speedup > 2, f"결과값 해석 속도 향상 부족: {speedup:.1f}배"
+
+        print(f"   🐌 행 단위: {row_metrics['execution_time']:.3f}초")
+        print(f"   🚀 컬럼 단위: {vector_metrics['execution_time']:.3f}초")
+        print(f"   ⚡ 속도 향상: {speedup:.1f}배")
+
+    def test_criteria_limit_index(self):
+        """기준 텍스트 고유값 해석(limits_for) vs 행 단위 re.findall"""
+        import re
+        from src.core.criteria_parser import limits_for, parse_criteria
+
+        size = 100000
+        print(f"\n📏 기준값 해석 벤치마크 - {size}행")
+
+        # 파일당 수십 개 수준의 고유 기준 텍스트
+        distinct = [f"{0.0001 * (i + 1):.4f} mg/L 이하" for i in range(40)]
+        criteria = pd.Series(np.array(distinct, dtype=object)[np.arange(size) % len(distinct)])
+
+        def row_based():
+            return [float(re.findall(r'\d+\.?\d*', text)[0]) for text in criteria]
+
+        parse_criteria.cache_clear()
+        (_, upper), index_metrics = self.measure_performance(limits_for, criteria)
+        legacy, row_metrics = self.measure_performance(row_based)
+
+        np.testing.assert_array_equal(upper, legacy)
+        assert parse_criteria.cache_info().misses == len(distinct)
+        speedup = row_metrics['execution_time'] / max(index_metrics['execution_time'], 0.001)
+        assert speedup > 3, f"기준값 해석 속도 향상 부족: {speedup:.1f}배"
+
+        print(f"   🐌 행 단위: {row_metrics['execution_time']:.3f}초")
+        print(f"   🚀 고유값 해석: {index_metrics['execution_time']:.3f}초")
+        print(f"   ⚡ 속도 향상: {speedup:.1f}배")
+
+    def test_header_schema_cache(self):
+        """같은 양식 반복 업로드 시 헤더 매핑/검증 (캐시 미스 vs 적중)"""
+        from src.utils.error_handler import DataProcessingErrorHandler
+        from src.utils.header_schema_cache import header_schema_cache
+
+        repeats = 200
+        print(f"\n🧩 헤더 스키마 캐시 벤치마크 - {repeats}회")
+
+        # 실제 내보내기 양식 + 매핑되지 않는 비고 컬럼
+        columns = list(self.generate_test_data(1).columns) + [f'비고{i}' for i in range(20)]
+        df = pd.DataFrame(columns=columns)
+        processor = DataProcessor()
+        handler = DataProcessingErrorHandler()
+
+        def resolve_header(clear_cache: bool):
+            for _ in range(repeats):
+                if clear_cache:
+                    header_schema_cache.clear()
+                handler.handle_column_mapping_errors(df)
+                processor.build_column_plan(df.columns)
+
+        _, cold_metrics = self.measure_performance(resolve_header, True)
+        _, warm_metrics = self.measure_performance(resolve_header, False)
+
+        speedup = cold_metrics['execution_time'] / max(warm_metrics['execution_time'], 0.001)
+        assert speedup > 2, f"헤더 스키마 캐시 효과 부족: {speedup:.1f}배"
+
+        print(f"   🐌 캐시 미스: {cold_metrics['execution_time'] / repeats * 1000:.2f}ms/회")
+        print(f"   🚀 캐시 적중: {warm_metrics['execution_time'] / repeats * 1000:.2f}ms/회")
+        print(f"   ⚡ 속도 향상: {speedup:.1f}배")
+
+    def test_upload_session_single_decode(self):
+        """업로드 검증 + 처리 (단계별 read_excel vs 업로드 세션 1회 디코딩)"""
+        import io
+        from unittest import mock
+        from src.utils.upload_session import UploadSession
+        from src.utils.validation import IntegratedValidator
+
+        size = 3000
+        print(f"\n📦 업로드 세션 벤치마크 - {size}행")
+
+        buffer = io.BytesIO()
+        self.generate_test_data(size).to_excel(buffer, index=False)
+        content = buffer.getvalue()
+        validator = IntegratedValidator("strict")
+        processor = DataProcessor()
+
+        class UploadedFile:
+            """세션 도입 전 흐름 재현용 Streamlit UploadedFile 대역"""
+            name = 'upload.xlsx'
+            type = None
+
+            def getvalue(self):
+                return content
+
+            def read(self, *args):
+                return content
+
+            def seek(self, *args):
+                return 0
+
+        def per_stage_reads():
+            # 검증기마다 업로드 파일을 다시 읽던 기존 흐름 (세션으로 감싸지 않음)
+            uploaded_file = UploadedFile()
+            file_validation = validator.file_validator.validate_file(uploaded_file.name, uploaded_file)
+            df = pd.read_excel(io.BytesIO(content))
+            validator.error_handler.handle_column_mapping_errors(df)
+            return file_validation, processor.process_excel_data(pd.read_excel(io.BytesIO(content)), as_batch=True)
+
+        def single_session():
+            validation = validator.validate_uploaded_file('upload.xlsx', UploadSession(content, 'upload.xlsx'))
+            return validation, processor.parse_upload(validation['upload_session'], as_batch=True)
+
+        with mock.patch('pandas.read_excel', wraps=pd.read_excel) as read_excel:
+            (_, legacy_batch), legacy_metrics = self.measure_performance(per_stage_reads)
+            legacy_reads = read_excel.call_count
+            read_excel.reset_mock()
+            (validation, batch), session_metrics = self.measure_performance(single_session)
+            session_reads = read_excel.call_count
+
+        assert validation['can_proceed']
+        assert len(batch) == len(legacy_batch) == size
+        assert session_reads == 1, f"워크북 디코딩 {session_reads}회"
+        assert session_metrics['execution_time'] < legacy_metrics['execution_time']
+
+        print(f"   🐌 단계별 읽기: {legacy_reads}회 read_excel, {legacy_metrics['execution_time']:.3f}초")
+        print(f"   🚀 업로드 세션: {session_reads}회 read_excel, {session_metrics['execution_time']:.3f}초")
+
+    def test_csv_ingestion_vs_excel(self):
+        """같은 데이터의 엑셀 vs CSV 수집 (파싱 + 컬럼 단위 변환), CSV 엔진별 읽기 처리량"""
+        import io
+        from src.utils.csv_reader import pa_csv, read_csv_bytes
+
+        size = 5000
+        print(f"\n🧾 CSV 수집 벤치마크 - {size}행")
+
+        data = self.generate_test_data(size)
+        buffer = io.BytesIO()
+        data.to_excel(buffer, index=False)
+        excel_content = buffer.getvalue()
+        csv_content = data.to_csv(index=False).encode('cp949')
+        processor = DataProcessor()
+
+        excel_batch, excel_metrics = self.measure_performance(
+            processor.parse_excel_bytes, excel_content, 'upload.xlsx', as_batch=True
+        )
+        csv_batch, csv_metrics = self.measure_performance(
+            processor.parse_csv_bytes, csv_content, 'upload.csv', as_batch=True
+        )
+
+        # 생성 데이터의 결과는 엑셀에 텍스트 셀로 저장되므로 원본 대신 해석값으로 비교
+        pd.testing.assert_frame_equal(excel_batch.to_dataframe().drop(columns=['result_report']),
+                                      csv_batch.to_dataframe().drop(columns=['result_report']))
+        np.testing.assert_array_equal(excel_batch.numeric_result, csv_batch.numeric_result)
+        np.testing.assert_array_equal(excel_batch.detection_status, csv_batch.detection_status)
+        speedup = excel_metrics['execution_time'] / max(csv_metrics['execution_time'], 0.001)
+        assert speedup > 2, f"CSV 수집 속도 향상 부족: {speedup:.1f}배"
+
+        print(f"   🐌 엑셀: {excel_metrics['execution_time']:.3f}초")
+        print(f"   🚀 CSV: {csv_metrics['execution_time']:.3f}초 ({speedup:.1f}배)")
+
+        # 협력 기관의 대용량 내보내기 (엑셀 대비 10배 규모) 읽기만 비교
+        large_content = csv_content.split(b'\n', 1)[1] * 10
+        large_content = csv_content.split(b'\n', 1)[0] + b'\n' + large_content
+        engines = ['c'] + (['pyarrow'] if pa_csv is not None else [])
+        for engine in engines:
+            df, metrics = self.measure_performance(read_csv_bytes, large_content, engine=engine)
+            assert len(df) == size * 10
+            rows_per_second = len(df) / max(metrics['execution_time'], 0.001)
+            print(f"   📥 {engine} 엔진 ({len(df)}행): {metrics['execution_time']:.3f}초, {rows_per_second:,.0f}행/초")
+
+    def test_incremental_reingest(self):
+        """누적 내보내기 재업로드: 전체 변환·저장 vs 신규/변경 행만 반영"""
+        from src.core.database_manager import DatabaseManager
+        from src.core.incremental_ingest import IncrementalIngestor
+
+        size, new_rows, changed_rows = 20000, 200, 50
+        print(f"\n🔁 증분 재수집 벤치마크 - 누적 {size}행 (신규 {new_rows}, 변경 {changed_rows})")
+
+        data = self.generate_test_data(size)
+        data['분석번호'] = [f'25A00009-{i:05d}' for i in range(size)]
+        day1 = data.iloc[:size - new_rows].copy()
+        day2 = data.copy()
+        day2.loc[:changed_rows - 1, '결과(성적서)'] = '0.5'
+        processor = DataProcessor()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            full_db = DatabaseManager(str(Path(temp_dir) / 'full.json'))
+            incremental_db = DatabaseManager(str(Path(temp_dir) / 'incremental.json'))
+            ingestor = IncrementalIngestor(processor, incremental_db)
+            full_db.save_analysis_result('day1.xlsx', processor.convert_dataframe_to_batch(day1))
+            ingestor.ingest(day1, 'day1.xlsx')
+
+            def full_reingest():
+                return full_db.save_analysis_result('day2.xlsx', processor.convert_dataframe_to_batch(day2))
+
+            _, full_metrics = self.measure_performance(full_reingest)
+            report, incremental_metrics = self.measure_performance(ingestor.ingest, day2, 'day2.xlsx')
+
+            record = incremental_db.get_file_by_id(report.file_id)
+
+        assert (report.inserted, report.updated, report.unchanged) == (new_rows, changed_rows, size - new_rows - changed_rows)
+        assert len(record['test_results']) == size
+        assert incremental_metrics['execution_time'] < full_metrics['execution_time']
+
+        print(f"   🐌 전체 변환·저장: {full_metrics['execution_time']:.3f}초 ({size}행 변환)")
+        print(f"   🚀 증분 반영: {incremental_metrics['execution_time']:.3f}초 ({report.converted_rows}행 변환)")
+
+    def test_read_time_dtype_plan(self):
+        """읽기 시점 dtype 계획 vs 읽은 뒤 optimize_dataframe_memory (복사 + 고유값/깊은 메모리 스캔)"""
+        from src.core.column_plan import apply_read_dtypes
+
+        size = 20000
+        print(f"\n🧬 dtype 계획 벤치마크 - {size}행")
+
+        temp_file = self.create_temp_excel_file(self.generate_test_data(size))
+        try:
+            raw = pd.read_excel(temp_file)
+        finally:
+            os.unlink(temp_file)
+        optimizer = PerformanceOptimizer()
+
+        def post_hoc():
+            return optimizer.optimize_dataframe_memory(raw)
+
+        def read_time():
+            return apply_read_dtypes(raw.copy(deep=False))
+
+        post_hoc_df, post_hoc_metrics = self.measure_performance(post_hoc)
+        planned_df, planned_metrics = self.measure_performance(read_time)
+
+        raw_memory = raw.memory_usage(deep=True).sum() / 1024 / 1024
+        planned_memory = planned_df.memory_usage(deep=True).sum() / 1024 / 1024
+        post_hoc_memory = post_hoc_df.memory_usage(deep=True).sum() / 1024 / 1024
+        assert planned_memory < raw_memory / 2
+
+        print(f"   🐌 사후 최적화: {post_hoc_metrics['execution_time']:.3f}초, {raw_memory:.1f}MB → {post_hoc_memory:.1f}MB")
+        print(f"   🚀 dtype 계획: {planned_metrics['execution_time']:.3f}초, {raw_memory:.1f}MB → {planned_memory:.1f}MB")
+
+    def test_watch_folder_drain_throughput(self):
+        """감시 폴더 대량 투입분 처리량, 파일별 지연 (워커 스레드, 제한된 큐)"""
+        from src.core.database_manager import DatabaseManager
+        from src.core.watch_folder import WatchFolderService
+        from src.utils.metrics import MetricsRegistry
+
+        file_count, size = 12, 500
+        print(f"\n📂 감시 폴더 벤치마크 - {file_count}개 파일 x {size}행")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            pending = Path(temp_dir) / 'uploads' / 'pending'
+            pending.mkdir(parents=True)
+            for i in range(file_count):
+                self.generate_test_data(size).to_excel(pending / f'시험현황_{i:02d}.xlsx', index=False)
+
+            metrics = MetricsRegistry()
+            service = WatchFolderService(pending, Path(temp_dir) / 'processed',
+                                         DatabaseManager(str(Path(temp_dir) / 'db.json')),
+                                         workers=2, queue_size=4, interval=0.05, metrics=metrics)
+            stats, run_metrics = self.measure_performance(service.drain)
+            latencies = sorted(metrics.get_metrics_dict()['histograms']['watch_folder_latency_seconds'])
+
+        assert (stats['processed'], stats['failed']) == (file_count, 0)
+        assert stats['rows'] == file_count * size
+        files_per_second = file_count / max(run_metrics['execution_time'], 0.001)
+
+        print(f"   📥 처리: {run_metrics['execution_time']:.3f}초 ({files_per_second:.1f}파일/초, "
+              f"{stats['rows'] / max(run_metrics['execution_time'], 0.001):,.0f}행/초)")
+        print(f"   ⏱️ 파일별 지연: p50 {latencies[len(latencies) // 2]:.3f}초, 최대 {latencies[-1]:.3f}초 "
+              f"(큐 한도 4, 큐 초과 {stats['queue_full']}회)")
+
+    def test_sqlite_backend_vs_json(self):
+        """누적 데이터베이스에 파일 하나 저장 / 1주 기간 조회: JSON 파일 전체 재작성 vs SQLite 인덱스"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, size = 30, 400
+        print(f"\n🗄️ 저장소 백엔드 벤치마크 - 누적 {file_count}개 파일 x {size}행")
+
+        processor = DataProcessor()
+        batch = processor.convert_dataframe_to_batch(self.generate_test_data(size))
+        start = datetime(2025, 1, 1)
+        entries = [{'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': batch, 'client': f'기관_{i % 5}',
+                    'upload_time': start + timedelta(days=i)} for i in range(file_count)]
+        period = (start + timedelta(days=7), start + timedelta(days=13))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = {}
+            for name in ('json', 'db'):
+                db = DatabaseManager(str(Path(temp_dir) / f'analysis_database.{name}'))
+                db.save_analysis_results(entries)
+                _, save_metrics = self.measure_performance(
+                    db.save_analysis_result, '추가.xlsx', batch, '기관_0', upload_time=start + timedelta(days=60))
+                # JSON은 로드 캐시 없이 (다른 프로세스가 쓴 직후처럼) 파일을 다시 파싱하는 조회로 비교
+                db.cache.invalidate(db._cache_key)
+                files, query_metrics = self.measure_performance(db.get_files_by_period, *period)
+                results[db.backend] = (save_metrics, query_metrics, files)
+
+        json_save, json_query, json_files = results['json']
+        sqlite_save, sqlite_query, sqlite_files = results['sqlite']
+        assert len(sqlite_files) == len(json_files) == 7
+        assert sqlite_save['execution_time'] < json_save['execution_time']
+        assert sqlite_query['execution_time'] < json_query['execution_time']
+
+        print(f"   🐌 JSON: 저장 {json_save['execution_time']:.3f}초, 기간 조회 {json_query['execution_time']:.3f}초")
+        print(f"   🚀 SQLite: 저장 {sqlite_save['execution_time']:.3f}초, 기간 조회 {sqlite_query['execution_time']:.3f}초")
+
+    def test_journaled_json_writes(self):
+        """누적 JSON 데이터베이스에 업로드 10건 저장: 전체 재작성(백업·재검증) vs 저널 덧붙이기"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, size, uploads = 30, 400, 10
+        print(f"\n📓 저널 쓰기 벤치마크 - 누적 {file_count}개 파일 x {size}행, 업로드 {uploads}건")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(size))
+        entries = [{'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': batch} for i in range(file_count)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            results = {}
+            for journal in (False, True):
+                db = DatabaseManager(str(Path(temp_dir) / f'db_{journal}.json'), journal=journal)
+                db.save_analysis_results(entries)
+                if journal:
+                    db.compact_journal()
+
+                def upload_all():
+                    return [db.save_analysis_result(f'추가_{i}.xlsx', batch) for i in range(uploads)]
+
+                _, metrics = self.measure_performance(upload_all)
+                results[journal] = (metrics, len(db.get_all_files()))
+
+        (full_metrics, full_count), (journal_metrics, journal_count) = results[False], results[True]
+        assert full_count == journal_count == file_count + uploads
+        assert journal_metrics['execution_time'] < full_metrics['execution_time']
+
+        print(f"   🐌 전체 재작성: {full_metrics['execution_time']:.3f}초 "
+              f"({full_metrics['execution_time'] / uploads * 1000:.1f}ms/건)")
+        print(f"   🚀 저널 덧붙이기: {journal_metrics['execution_time']:.3f}초 "
+              f"({journal_metrics['execution_time'] / uploads * 1000:.1f}ms/건, fsync 포함)")
+
+    def test_summary_index_listing(self):
+        """누적 JSON 데이터베이스 목록 조회: 행 포함 전체 로드 vs 요약 인덱스만 (행 샤드 분리)"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, size = 30, 400
+        print(f"\n🗂️ 요약 인덱스 목록 조회 벤치마크 - 누적 {file_count}개 파일 x {size}행")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(size))
+        entries = [{'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': batch} for i in range(file_count)]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            inline = DatabaseManager(str(Path(temp_dir) / 'inline.json'))
+            inline.save_analysis_results(entries)
+            sharded = DatabaseManager(str(Path(temp_dir) / 'sharded.json'), shards=True)
+            sharded.save_analysis_results(entries)
+
+            # 로드 캐시 없이 (다른 프로세스가 쓴 직후처럼) 파일을 다시 읽는 조회로 비교
+            inline.cache.invalidate(inline._cache_key)
+            sharded.cache.invalidate(sharded._cache_key)
+            full, full_metrics = self.measure_performance(inline.get_all_files)
+            listed, index_metrics = self.measure_performance(sharded.get_all_files, include_results=False)
+            index_bytes = sharded.db_path.stat().st_size
+            inline_bytes = inline.db_path.stat().st_size
+
+        assert len(full) == len(listed) == file_count
+        assert index_metrics['execution_time'] < full_metrics['execution_time']
+
+        print(f"   🐌 행 포함 전체 로드: {full_metrics['execution_time']:.3f}초 (JSON {inline_bytes / 1024:.0f}KB)")
+        print(f"   🚀 요약 인덱스만: {index_metrics['execution_time']:.3f}초 (인덱스 {index_bytes / 1024:.0f}KB, "
+              f"{full_metrics['execution_time'] / max(index_metrics['execution_time'], 1e-6):.0f}배)")
+
+    def test_database_load_cache(self):
+        """화면 한 번 렌더링의 데이터베이스 조회 4회: 매번 JSON 파싱 vs 공유 로드 캐시 (stat만)"""
+        from src.core.database_cache import shared_cache
+        from src.core.database_manager import DatabaseManager
+
+        file_count, size, renders = 30, 400, 5
+        print(f"\n🧊 데이터베이스 로드 캐시 벤치마크 - 누적 {file_count}개 파일 x {size}행, 렌더링 {renders}회")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(size))
+        entries = [{'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': batch} for i in range(file_count)]
+        start, end = datetime(2000, 1, 1), datetime(2100, 1, 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = DatabaseManager(str(Path(temp_dir) / 'analysis_database.json'))
+            file_id = db.save_analysis_results(entries)[0]
+
+            def render_page(invalidate):
+                for _ in range(renders):
+                    for query in (db.get_all_files, lambda: db.get_files_by_period(start, end),
+                                  lambda: db.get_file_by_id(file_id),
+                                  lambda: db.get_integrated_analysis_data(start, end)):
+                        if invalidate:
+                            shared_cache.invalidate(db._cache_key)
+                        query()
+
+            _, parse_metrics = self.measure_performance(render_page, True)
+            _, cached_metrics = self.measure_performance(render_page, False)
+            shared_cache.invalidate(db._cache_key)
+
+        assert cached_metrics['execution_time'] < parse_metrics['execution_time']
+
+        print(f"   🐌 매번 파싱: {parse_metrics['execution_time']:.3f}초")
+        print(f"   🚀 공유 캐시: {cached_metrics['execution_time']:.3f}초 "
+              f"({parse_metrics['execution_time'] / max(cached_metrics['execution_time'], 1e-6):.1f}배)")
+
+    def test_period_rollup_year_query(self):
+        """'올해' 통합 분석 집계: 기간 내 모든 행 순회 vs 일별 롤업 합산 (SQLite)"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, size = 120, 300
+        print(f"\n📅 기간 롤업 벤치마크 - 1년간 {file_count}개 파일 x {size}행")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(size))
+        start = datetime(2025, 1, 1, 9)
+        entries = [{'file_name': f'시험현황_{i:03d}.xlsx', 'test_results': batch, 'client': f'기관_{i % 7}',
+                    'upload_time': start + timedelta(days=3 * i)} for i in range(file_count)]
+        year = (datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59))
+
+        def walk_rows(db):
+            items = {}
+            for record in db.get_files_by_period(*year):
+                for row in record['test_results']:
+                    key = (row['test_item'], bool(row['is_non_conforming']))
+                    items[key] = items.get(key, 0) + 1
+            return items
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = DatabaseManager(str(Path(temp_dir) / 'analysis_database.db'))
+            db.save_analysis_results(entries)
+            walked, walk_metrics = self.measure_performance(walk_rows, db)
+            rollup, rollup_metrics = self.measure_performance(db.get_period_rollup, *year)
+            db.store.close()
+
+        assert rollup['total_files'] == file_count
+        assert sum(rollup['non_conforming_items'].values()) == sum(
+            count for (_, violation), count in walked.items() if violation)
+        assert rollup_metrics['execution_time'] < walk_metrics['execution_time']
+        assert rollup_metrics['execution_time'] < 0.1
+
+        print(f"   🐌 행 순회: {walk_metrics['execution_time']:.3f}초 ({file_count * size:,}행)")
+        print(f"   🚀 일별 롤업: {rollup_metrics['execution_time'] * 1000:.1f}ms")
+
+    def test_integrated_analysis_page(self):
+        """'올해' 통합 분석 화면 데이터: 기간 내 전체 행 레코드 vs 요약 + 부적합 행 (SQLite, 차트 생성 포함)"""
+        from src.core.database_manager import DatabaseManager
+        from src.core.integrated_analysis_engine import IntegratedAnalysisEngine
+
+        file_count, size = 120, 300
+        print(f"\n📊 통합 분석 화면 벤치마크 - 1년간 {file_count}개 파일 x {size}행 (부적합 약 3%)")
+
+        df = self.generate_test_data(size)
+        df['기준대비 초과여부 (성적서)'] = np.where(np.random.random(size) < 0.03, '부적합', '적합')
+        batch = DataProcessor().convert_dataframe_to_batch(df)
+        start = datetime(2025, 1, 1, 9)
+        entries = [{'file_name': f'시험현황_{i:03d}.xlsx', 'test_results': batch, 'client': f'기관_{i % 7}',
+                    'upload_time': start + timedelta(days=3 * i)} for i in range(file_count)]
+        year = (datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59))
+        engine = IntegratedAnalysisEngine()
+
+        def full_rows(db):
+            data = db.get_integrated_analysis_data(*year)
+            engine.create_contamination_level_chart(data['files'])
+            engine.create_file_trend_chart(data['files'])
+            return data
+
+        def violation_rows(db):
+            engine.set_db_manager(db)
+            data = engine.analyze_period(*year)
+            engine.create_contamination_level_chart(data['files'], data['violation_rows'])
+            engine.create_file_trend_chart(data['files'], data['violation_rows'])
+            return data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = DatabaseManager(str(Path(temp_dir) / 'analysis_database.db'))
+            db.save_analysis_results(entries)
+            full, full_metrics = self.measure_performance(full_rows, db)
+            page, page_metrics = self.measure_performance(violation_rows, db)
+            db.store.close()
+
+        assert page['total_files'] == full['total_files'] == file_count
+        assert len(page['violation_rows']) == page['total_violations']
+        assert all('test_results' not in record for record in page['files'])
+        assert page_metrics['execution_time'] < full_metrics['execution_time']
+
+        print(f"   🐌 전체 행 레코드: {full_metrics['execution_time']:.3f}초 ({file_count * size:,}행)")
+        print(f"   🚀 요약 + 부적합 행: {page_metrics['execution_time']:.3f}초 ({len(page['violation_rows']):,}행)")
+
+    def test_result_page_latency_vs_archive_size(self):
+        """결과 교차 조회 첫 페이지: 보관 행 8배에서 지연 (SQLite, 조회 순서 인덱스 vs 전체 정렬)"""
+        from src.core.database_manager import DatabaseManager
+
+        sizes, rows_per_file, repeats, rounds = (40, 320), 250, 5, 5
+        print(f"\n📑 결과 페이지 벤치마크 - 파일 {sizes[0]}개 vs {sizes[1]}개 x {rows_per_file}행, "
+              f"첫 페이지 100행 (조회 3종 x {repeats}회, {rounds}회 중 최소)")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(rows_per_file))
+        start = datetime(2025, 1, 1, 9)
+        queries = [{'test_item': '벤젠'}, {'non_conforming': True}, {'tester': '김화빈', 'non_conforming': True}]
+        # 행에 처리 시각/순번을 두기 전의 조회 (조인한 files 컬럼으로 정렬 - 일치하는 행을 모두 정렬한 뒤 LIMIT)
+        sorted_join = ("SELECT r.file_id, r.position FROM test_results r JOIN files f ON f.file_id = r.file_id "
+                       "WHERE r.test_item = ? ORDER BY f.processed_at DESC, f.rowid, r.position LIMIT 100")
+
+        def first_pages(db):
+            for _ in range(repeats):
+                for query in queries:
+                    db.query_results(**query, limit=100)
+
+        def sorted_pages(conn):
+            for _ in range(repeats * len(queries)):
+                conn.execute(sorted_join, ('벤젠',)).fetchall()
+
+        timings = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for file_count in sizes:
+                db = DatabaseManager(str(Path(temp_dir) / f'archive_{file_count}.db'))
+                db.save_analysis_results([
+                    {'file_name': f'시험현황_{i:04d}.xlsx', 'test_results': batch, 'client': f'기관_{i % 7}',
+                     'upload_time': start + timedelta(hours=6 * i)} for i in range(file_count)])
+                first_pages(db)  # 캐시 예열
+                timings[file_count] = min(self.measure_performance(first_pages, db)[1]['execution_time']
+                                          for _ in range(rounds))
+                if file_count == sizes[-1]:
+                    sorted_time = min(self.measure_performance(sorted_pages, db.store._connect())[1]['execution_time']
+                                      for _ in range(rounds))
+                    page = db.query_results(test_item='벤젠', limit=100)
+                db.store.close()
+
+        small, large = (timings[size] for size in sizes)
+        assert len(page.rows) == 100 and page.has_more
+        assert large < small * 3
+        assert large < sorted_time
+
+        count = repeats * len(queries)
+        print(f"   ⏱️ {sizes[0] * rows_per_file:,}행: 페이지당 {small / count * 1000:.2f}ms")
+        print(f"   🚀 {sizes[1] * rows_per_file:,}행: 페이지당 {large / count * 1000:.2f}ms")
+        print(f"   🐌 전체 정렬 후 LIMIT ({sizes[1] * rows_per_file:,}행): "
+              f"페이지당 {sorted_time / count * 1000:.2f}ms")
+
+    def test_period_time_index(self):
+        """기간 프리셋 조회 5종 x 20회: 전체 순회·정렬 vs 처리 시각 인덱스 이진 탐색"""
+        from src.core.database_manager import DatabaseManager
+        from src.core.integrated_analysis_engine import IntegratedAnalysisEngine
+
+        file_count, repeats = 3000, 20
+        print(f"\n⏱️ 처리 시각 인덱스 벤치마크 - 요약 레코드 {file_count}개, 프리셋 5종 x {repeats}회")
+
+        now = datetime.now()
+        entries = [{'file_name': f'시험현황_{i:04d}.xlsx', 'test_results': [],
+                    'upload_time': now - timedelta(hours=3 * i)} for i in range(file_count)]
+        presets = list(IntegratedAnalysisEngine().get_period_presets().values())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = DatabaseManager(str(Path(temp_dir) / 'analysis_database.json'))
+            db.save_analysis_results(entries)
+            records = db.load_database()['files'].values()
+
+            def scan_presets():
+                for _ in range(repeats):
+                    for start, end in presets:
+                        filtered = [record for record in records
+                                    if start <= datetime.fromisoformat(record['processed_at']) <= end]
+                        sorted(filtered, key=lambda x: x['processed_at'], reverse=True)
+
+            def indexed_presets():
+                for _ in range(repeats):
+                    for start, end in presets:
+                        db.get_files_by_period(start, end)
+
+            _, scan_metrics = self.measure_performance(scan_presets)
+            _, index_metrics = self.measure_performance(indexed_presets)
+
+        assert index_metrics['execution_time'] < scan_metrics['execution_time']
+
+        print(f"   🐌 전체 순회·정렬: {scan_metrics['execution_time']:.3f}초")
+        print(f"   🚀 인덱스 이진 탐색: {index_metrics['execution_time']:.3f}초 "
+              f"({scan_metrics['execution_time'] / max(index_metrics['execution_time'], 1e-6):.1f}배)")
+
+    def test_query_results_flat_latency(self):
+        """시험자 x 부적합 교차 조회: 전체 파일 행 순회 vs 역색인 후보 파일 조회 (파일 수 4배에도 일정)"""
+        from src.core.database_manager import DatabaseManager
+
+        matching_files, repeats = 10, 20
+        print(f"\n⏱️ 결과 교차 조회 벤치마크 - 조건 일치 파일 {matching_files}개, 샤드 JSON, {repeats}회")
+
+        processor = DataProcessor()
+        frame = self.generate_test_data(100)
+        common = processor.convert_dataframe_to_batch(frame)
+        rare = processor.convert_dataframe_to_batch(frame.assign(시험자='신규시험자'))
+        now = datetime.now()
+
+        timings = {}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for file_count in (300, 1200):
+                stride = file_count // matching_files
+                db = DatabaseManager(str(Path(temp_dir) / f'db_{file_count}.json'), shards=True)
+                db.save_analysis_results([
+                    {'file_name': f'시험현황_{i:04d}.xlsx', 'test_results': rare if i % stride == 0 else common,
+                     'upload_time': now - timedelta(hours=i)} for i in range(file_count)
+                ])
+
+                def walk_all():
+                    return [row for record in db.get_all_files() for row in record['test_results']
+                            if row['tester'] == '신규시험자' and row['is_non_conforming']]
+
+                def indexed():
+                    for _ in range(repeats):
+                        page = db.query_results(tester='신규시험자', non_conforming=True, limit=1000)
+                    return page
+
+                walked, walk_metrics = self.measure_performance(walk_all)
+                page, query_metrics = self.measure_performance(indexed)
+                assert len(page.rows) == len(walked) and not page.has_more
+                timings[file_count] = (walk_metrics['execution_time'], query_metrics['execution_time'] / repeats)
+
+        for file_count, (walk_time, query_time) in timings.items():
+            assert query_time < walk_time
+            print(f"   파일 {file_count}개 - 🐌 전체 행 순회: {walk_time:.3f}초, "
+                  f"🚀 역색인 조회: {query_time:.4f}초 ({walk_time / max(query_time, 1e-6):.1f}배)")
+
+    def test_archive_search_index(self):
+        """전체 이력 부분 문자열 검색 3종 (첫 페이지): 모든 파일 행의 네 필드 비교 vs trigram 검색 인덱스"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, distinct, repeats = 600, 30, 10
+        terms = ['25b01700', '시료_17_3', '아크릴로']
+        print(f"\n⏱️ 검색 인덱스 벤치마크 - 파일 {file_count}개 x 100행, 샤드 JSON, 검색어 {len(terms)}종 x {repeats}회")
+
+        processor = DataProcessor()
+        frame = self.generate_test_data(100)
+        batches = [processor.convert_dataframe_to_batch(frame.assign(
+            시료명=[f'시료_{b}_{i % 10}' for i in range(100)],
+            분석번호=[f'25B{b:03d}{i:02d}' for i in range(100)])) for b in range(distinct)]
+        now = datetime.now()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db = DatabaseManager(str(Path(temp_dir) / 'analysis_database.json'), shards=True)
+            db.save_analysis_results([
+                {'file_name': f'시험현황_{i:04d}.xlsx', 'test_results': batches[i % distinct],
+                 'upload_time': now - timedelta(hours=i)} for i in range(file_count)
+            ])
+
+            def scan_all():
+                pages = []
+                for term in terms:
+                    found = [(record['file_id'], row['analysis_number'])
+                             for record in db.get_all_files() for row in record['test_results']
+                             if any(term in str(row[name]).lower()
+                                    for name in ('sample_name', 'analysis_number', 'test_item', 'tester'))]
+                    pages.append(found[:100])
+                return pages
+
+            def indexed():
+                for _ in range(repeats):
+                    pages = [[(row['file_id'], row['analysis_number']) for row in db.search_results(term).rows]
+                             for term in terms]
+                return pages
+
+            scanned, scan_metrics = self.measure_performance(scan_all)
+            found, index_metrics = self.measure_performance(indexed)
+
+        assert [sorted(page) for page in found[:2]] == [sorted(page) for page in scanned[:2]]
+        assert len(found[2]) == 100
+        index_time = index_metrics['execution_time'] / repeats
+        assert index_time < scan_metrics['execution_time']
+
+        print(f"   🐌 전체 행 비교: {scan_metrics['execution_time']:.3f}초")
+        print(f"   🚀 검색 인덱스: {index_time:.4f}초 "
+              f"({scan_metrics['execution_time'] / max(index_time, 1e-6):.1f}배)")
+
+    def test_parquet_archive_backup(self):
+        """전체 이력 백업: JSON 파일 복사(.backup) vs 월 x 의뢰 기관 Parquet 보관본 크기 / 복원 시간"""
+        from src.core.database_manager import DatabaseManager
+
+        file_count, distinct = 300, 20
+        print(f"\n⏱️ Parquet 보관본 벤치마크 - 파일 {file_count}개 x 100행")
+
+        processor = DataProcessor()
+        batches = [processor.convert_dataframe_to_batch(self.generate_test_data(100).assign(
+            분석번호=[f'25C{b:03d}{i:02d}' for i in range(100)])) for b in range(distinct)]
+        start = datetime(2025, 1, 1)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            db = DatabaseManager(str(root / 'analysis_database.json'))
+            db.save_analysis_results([
+                {'file_name': f'시험현황_{i:04d}.xlsx', 'test_results': batches[i % distinct],
+                 'client': f'기관_{i % 4}', 'upload_time': start + timedelta(days=i)} for i in range(file_count)
+            ])
+            json_bytes = db.db_path.stat().st_size
+
+            stats, export_metrics = self.measure_performance(db.export_archive, root / 'archive')
+            restored = DatabaseManager(str(root / 'restored.json'))
+            imported, import_metrics = self.measure_performance(restored.import_archive, root / 'archive', True)
+            assert imported == file_count
+            assert restored.get_file_by_id(db.get_all_files()[0]['file_id']) == db.get_all_files()[0]
+
+        ratio = json_bytes / stats['bytes']
+        assert ratio > 5, f"보관본 크기 감소가 부족합니다: {ratio:.1f}배"
+
+        print(f"   🐌 JSON 백업 크기: {json_bytes / 1024 / 1024:.1f}MB")
+        print(f"   🚀 Parquet 보관본: {stats['bytes'] / 1024 / 1024:.2f}MB ({ratio:.1f}배 작음, "
+              f"파티션 {stats['partitions']}개)")
+        print(f"   ⏱️ 내보내기 {export_metrics['execution_time']:.2f}초 / "
+              f"복원 {import_metrics['execution_time']:.2f}초")
+
+    def test_concurrent_writers_no_lost_updates(self):
+        """동시 저장 세션 N개: 잠금 없는 로드→수정→재작성(변경 유실) vs 파일 잠금 + 쓰기 병합기"""
+        import json
+        import threading
+        from src.core.database_manager import DatabaseManager
+
+        writers, saves, existing = 8, 6, 60
+        print(f"\n⏱️ 동시 쓰기 벤치마크 - 세션 {writers}개 x 저장 {saves}회, 기존 파일 {existing}개 (JSON)")
+
+        batch = DataProcessor().convert_dataframe_to_batch(self.generate_test_data(100))
+        start = datetime(2025, 1, 1)
+
+        def run_sessions(target):
+            threads = [threading.Thread(target=target, args=(index,)) for index in range(writers)]
+            began = time.perf_counter()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return time.perf_counter() - began
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            seed = [{'file_name': f'기존_{i:04d}.xlsx', 'test_results': batch,
+                     'upload_time': start + timedelta(hours=i)} for i in range(existing)]
+
+            # 잠금 없는 기존 방식 재현 (세션마다 전체 JSON을 읽고 레코드를 넣어 다시 씀)
+            naive_path = root / 'naive.json'
+            DatabaseManager(str(naive_path)).save_analysis_results(seed)
+
+            def naive_session(index):
+                for i in range(saves):
+                    try:
+                        with open(naive_path, 'r', encoding='utf-8') as f:
+                            data = json.load(f)
+                    except ValueError:
+                        continue  # 다른 세션이 쓰는 중인 파일을 읽음 - 이 저장은 유실
+                    data['files'][f'naive_{index}_{i}'] = dict(next(iter(data['files'].values())),
+                                                              file_id=f'naive_{index}_{i}')
+                    with open(naive_path, 'w', encoding='utf-8') as f:
+                        json.dump(data, f, ensure_ascii=False)
+
+            naive_time = run_sessions(naive_session)
+            try:
+                with open(naive_path, 'r', encoding='utf-8') as f:
+                    lost = existing + writers * saves - len(json.load(f)['files'])
+            except ValueError:
+                lost = existing + writers * saves  # 파일 손상
+
+            # 파일 잠금 + 쓰기 병합기 (세션마다 DatabaseManager가 따로 있음)
+            path = str(root / 'analysis_database.json')
+            DatabaseManager(path).save_analysis_results(seed)
+            saved = []
+
+            def session(index):
+                db = DatabaseManager(path)
+                for i in range(saves):
+                    saved.append(db.save_analysis_result(f'세션{index}_{i}.xlsx', batch,
+                                                         upload_time=start + timedelta(days=30, minutes=i)))
+
+            writer = DatabaseManager(path).writer
+            commits_before = writer.commits
+            coordinated_time = run_sessions(session)
+            commits = writer.commits - commits_before
+            stored = {record['file_id'] for record in DatabaseManager(path).get_all_files(include_results=False)}
+
+        assert len(saved) == writers * saves
+        assert set(saved) <= stored and len(stored) == existing + writers * saves, "변경 유실 발생"
+        assert commits < writers * saves
+
+        print(f"   🐌 잠금 없음: {writers * saves / naive_time:.1f}건/초, 유실 {lost}건")
+        print(f"   🚀 잠금 + 병합: {writers * saves / coordinated_time:.1f}건/초, 커밋 {commits}회 "
+              f"({commits / coordinated_time:.1f}커밋/초), 유실 0건")
+
     def test_caching_performance_impact(self):
         """캐싱 성능 영향 테스트"""
         print(f"\n🗄️ 캐싱 성능 영향 테스트")
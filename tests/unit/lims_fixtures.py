@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+테스트 공용 LIMS 데이터 생성 도우미
+"""
+
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+
+ITEMS = ['납', '벤젠', '납', '비소', '벤젠', '납']
+RESULTS = ['0.01', '불검출', '0.5', '0.002', '불검출', '0.003']
+JUDGMENTS = ['적합', '적합', '부적합', '적합', '적합', '적합']
+TESTERS = ['김화빈', '이현풍']
+
+
+def make_export(rows, unit: str = 'mg/L', criteria: str = '0.01 mg/L 이하', tester: str = '김화빈') -> pd.DataFrame:
+    """LIMS 내보내기 형식 (rows: (분석번호, 시험항목, 결과, 판정))"""
+    return pd.DataFrame({
+        '시료명': [f'시료_{number}' for number, _, _, _ in rows],
+        '분석번호': [number for number, _, _, _ in rows],
+        '시험항목': [item for _, item, _, _ in rows],
+        '시험단위': [unit] * len(rows),
+        '결과(성적서)': [result for _, _, result, _ in rows],
+        '기준대비 초과여부': [judgment for _, _, _, judgment in rows],
+        '시험자': [tester] * len(rows),
+        '기준': [criteria] * len(rows),
+    })
+
+
+def make_batch(offset: int, rows: int = 6, columns: Optional[Dict[str, Any]] = None):
+    """분석번호가 offset별로 다른 시험 결과 배치
+
+    columns: 컬럼 이름 → 값 목록 (행 수보다 짧으면 반복), (offset, i) → 값 함수, 또는 None (컬럼 제외)
+    """
+    values = {
+        '시료명': lambda offset, i: f'시료_{offset}_{i}',
+        '분석번호': lambda offset, i: f'25A{offset:03d}{i:02d}-001',
+        '시험항목': ITEMS,
+        '결과(성적서)': RESULTS,
+        '기준대비 초과여부': JUDGMENTS,
+        '시험자': TESTERS,
+    }
+    values.update(columns or {})
+    frame = {name: [value(offset, i) if callable(value) else value[i % len(value)] for i in range(rows)]
+             for name, value in values.items() if value is not None}
+    return DataProcessor().convert_dataframe_to_batch(pd.DataFrame(frame))
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+대량 가져오기 (폴더/ZIP 병렬 파싱 + 일괄 저장) 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.bulk_importer import bulk_import, collect_sources, format_import_summary
+from src.core.database_manager import DatabaseManager
+
+
+class CountingDatabaseManager(DatabaseManager):
+    """저장 횟수를 세는 DatabaseManager"""
+
+    def __init__(self, db_path):
+        self.save_count = 0
+        super().__init__(db_path)
+
+    def save_database(self, data):
+        self.save_count += 1
+        return super().save_database(data)
+
+
+class TestBulkImporter(unittest.TestCase):
+    """bulk_importer 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.export_dir = root / 'exports'
+        self.export_dir.mkdir()
+
+        for i in range(3):
+            pd.DataFrame({
+                'No.': [1, 2],
+                '시료명': [f'시료_{i}', f'시료_{i}'],
+                '분석번호': [f'25A0000{i}-001', f'25A0000{i}-002'],
+                '시험항목': ['벤젠', '톨루엔'],
+                '결과(성적서)': ['불검출', '0.5'],
+                '기준대비 초과여부 (성적서)': ['적합', '부적합'],
+                '시험자': ['김화빈', '이현풍'],
+            }).to_excel(self.export_dir / f'시험현황_{i}.xlsx', index=False)
+        (self.export_dir / 'readme.txt').write_text('무시됨', encoding='utf-8')
+
+        self.zip_path = root / 'bundle.zip'
+        with zipfile.ZipFile(self.zip_path, 'w') as archive:
+            archive.write(self.export_dir / '시험현황_0.xlsx', 'sub/시험현황_0.xlsx')
+            archive.writestr('__MACOSX/sub/._시험현황_0.xlsx', b'')
+            archive.writestr('broken.xlsx', b'not an excel file')
+
+        self.db = CountingDatabaseManager(str(root / 'db.json'))
+        self.db.save_count = 0
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_collect_sources(self):
+        """폴더/ZIP에서 엑셀 파일만 수집 (ZIP은 압축 해제 없이 멤버 참조)"""
+        sources = collect_sources([self.export_dir, self.zip_path])
+        self.assertEqual([source.file_name for source in sources],
+                         ['시험현황_0.xlsx', '시험현황_1.xlsx', '시험현황_2.xlsx',
+                          '시험현황_0.xlsx', 'broken.xlsx'])
+        self.assertEqual(sources[3].member, 'sub/시험현황_0.xlsx')
+        self.assertEqual(sources[3].read_bytes(), (self.export_dir / '시험현황_0.xlsx').read_bytes())
+
+    def test_bulk_import_single_batched_write(self):
+        """파싱 결과를 한 번의 저장으로 반영, 실패 파일은 요약에 표시"""
+        report = bulk_import([self.export_dir, self.zip_path], db_manager=self.db, workers=2)
+
+        self.assertEqual(len(report.results), 5)
+        self.assertEqual(len(report.succeeded), 4)
+        self.assertEqual(report.failed[0].source.file_name, 'broken.xlsx')
+        self.assertEqual(report.total_rows, 8)
+        self.assertEqual(self.db.save_count, 1)
+
+        files = self.db.get_all_files()
+        self.assertEqual(len(files), 4)
+        self.assertEqual({r.file_id for r in report.succeeded}, {f['file_id'] for f in files})
+        self.assertTrue(all(f['summary']['fail_items'] == 1 for f in files))
+
+        summary = format_import_summary(report)
+        self.assertIn('bundle.zip:broken.xlsx', summary)
+        self.assertIn('성공 4, 실패 1', summary)
+
+    def test_sequential_matches_parallel(self):
+        """순차(워커 1개) 처리와 병렬 처리 결과 동일"""
+        sequential = bulk_import([self.export_dir], workers=1, dry_run=True)
+        parallel = bulk_import([self.export_dir], workers=2, dry_run=True)
+        self.assertEqual([r.batch.fingerprint for r in sequential.results],
+                         [r.batch.fingerprint for r in parallel.results])
+        self.assertEqual(self.db.save_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+컬럼 매핑 계획 및 컬럼 단위 변환 테스트
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from src.core.column_plan import ColumnPlan, convert_series
+from src.core.data_processor import DataProcessor
+
+
+class TestColumnPlan(unittest.TestCase):
+    """ColumnPlan 테스트"""
+
+    def setUp(self):
+        self.processor = DataProcessor()
+        self.df = pd.DataFrame({
+            'No.': [1, 2, 3, 4],
+            '시료명': ['냉수탱크', '온수탱크', None, '유량센서'],
+            '분석번호': ['25A00009-001', '25A00009-002', '25A00009-003', '25A00009-004'],
+            '시험항목': ['아크릴로나이트릴', '아크릴로나이트릴', '벤젠', 'N-니트로조다이메틸아민'],
+            '시험단위': ['mg/L', 'mg/L', 'mg/L', 'ng/L'],
+            '결과(성적서)': ['불검출', '0.0007', '0.001', np.nan],
+            '시험자입력값': [0, 0.0007, 0.001, 2.5],
+            '기준대비 초과여부\n(성적서)': ['적합', '부적합', '적합', '부적합'],
+            '시험자': ['김화빈', '김화빈', '이현풍', '이현풍'],
+            '기준 텍스트': ['0.0006 mg/L 이하', '0.0006 mg/L 이하', '0.01 mg/L 이하', '2.0 ng/L 이하'],
+            '시험결과\n표시자리수': [4, 4, 0, np.nan],
+            '입력일시': ['2025-01-23 09:56', '2025/01/24', '2025-01-25', ''],
+        })
+
+    def test_plan_resolution(self):
+        """헤더 해석 결과 확인"""
+        plan = ColumnPlan.from_columns(self.df.columns)
+        self.assertEqual(plan.column_for('sample_name'), '시료명')
+        self.assertEqual(plan.column_for('standard_excess'), '기준대비 초과여부\n(성적서)')
+        self.assertEqual(plan.column_for('standard_criteria'), '기준 텍스트')
+        self.assertIsNone(plan.column_for('test_set'))
+        self.assertIn('test_set', plan.missing_fields)
+
+    def test_exact_column_falls_back_to_partial_match(self):
+        """정확 일치 컬럼 값이 비어 있으면 부분 일치 컬럼 값 사용"""
+        df = pd.DataFrame({'시료명(원본)': ['A', 'B'], '시료명': [None, 'C']})
+        plan = ColumnPlan.from_columns(df.columns)
+        self.assertEqual(plan.resolve(df, 'sample_name').tolist(), ['A', 'C'])
+
+    def test_convert_series_defaults(self):
+        """빈 값은 필드 기본값으로 변환"""
+        plan = ColumnPlan.from_columns(self.df.columns)
+        digits = convert_series('result_display_digits', plan.resolve(self.df, 'result_display_digits'), len(self.df))
+        self.assertEqual(digits.tolist(), [4, 4, 2, 2])
+        report = convert_series('result_report', plan.resolve(self.df, 'result_report'), len(self.df))
+        self.assertEqual(report.tolist(), ['불검출', '0.0007', '0.001', ''])
+        approval = convert_series('approval_request', None, len(self.df))
+        self.assertEqual(approval.tolist(), ['N'] * 4)
+
+    def test_vectorized_conversion_matches_row_conversion(self):
+        """컬럼 단위 변환 결과가 행 단위 변환과 동일"""
+        vectorized = self.processor._convert_dataframe_to_test_results(self.df)
+        row_based = [self.processor._row_to_test_result(row) for _, row in self.df.iterrows()]
+        row_based = [result for result in row_based if result]
+
+        self.assertEqual(len(vectorized), 3)
+        self.assertEqual(vectorized, row_based)
+        self.assertEqual(vectorized[0].input_datetime, datetime(2025, 1, 23, 9, 56))
+        self.assertIsNone(vectorized[2].input_datetime)
+        self.assertTrue(vectorized[1].is_non_conforming())
+
+    def test_conversion_with_categorical_columns(self):
+        """메모리 최적화(카테고리) 이후에도 동일하게 변환"""
+        optimized = self.processor.performance_optimizer.optimize_dataframe_memory(self.df)
+        key = lambda r: (r.sample_name, r.test_item, r.result_report, r.standard_excess, r.input_datetime)
+        self.assertEqual(
+            [key(r) for r in self.processor._convert_dataframe_to_test_results(optimized)],
+            [key(r) for r in self.processor._convert_dataframe_to_test_results(self.df)]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+CompactTestResult (메모리 절약형 시험 결과) 테스트
+"""
+
+import unittest
+import sys
+import os
+import pickle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_models import CompactTestResult, TestResult, TestResultBatch, ProjectSummary
+from src.core.data_processor import DataProcessor
+
+
+class TestCompactTestResult(unittest.TestCase):
+    """CompactTestResult 테스트"""
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'No.': [1, 2, 3],
+            '시료명': ['냉수탱크', '온수탱크', '냉수탱크'],
+            '분석번호': ['25A00009-001', '25A00009-002', '25A00011-003'],
+            '시험항목': ['아크릴로나이트릴', '아크릴로나이트릴', 'N-니트로조다이메틸아민'],
+            '시험단위': ['mg/L', 'mg/L', 'ng/L'],
+            '결과(성적서)': ['불검출', '0.0007', '2.29'],
+            '기준대비 초과여부 (성적서)': ['적합', '부적합', '부적합'],
+            '시험자': ['김화빈', '김화빈', '이현풍'],
+            '기준': ['0.0006 mg/L 이하', '0.0006 mg/L 이하', '2.0 ng/L 이하'],
+            '입력일시': ['2025-01-23 09:56', '2025-01-23 09:56', '2025-01-24 10:00'],
+        })
+        self.test_results = DataProcessor()._convert_dataframe_to_test_results(self.df)
+        self.compact_results = DataProcessor(compact_results=True)._convert_dataframe_to_test_results(self.df)
+
+    def test_slots_without_instance_dict(self):
+        """인스턴스 __dict__ 없음"""
+        result = self.compact_results[0]
+        self.assertIsInstance(result, CompactTestResult)
+        self.assertFalse(hasattr(result, '__dict__'))
+        with self.assertRaises(AttributeError):
+            result.extra_field = 1
+
+    def test_same_values_and_methods(self):
+        """TestResult와 동일한 값/메서드 결과"""
+        self.assertEqual([r.to_test_result() for r in self.compact_results], self.test_results)
+        for compact, original in zip(self.compact_results, self.test_results):
+            self.assertEqual(compact.is_non_conforming(), original.is_non_conforming())
+            self.assertEqual(compact.get_numeric_result(), original.get_numeric_result())
+            self.assertEqual(compact.get_display_result(), original.get_display_result())
+        self.assertEqual(CompactTestResult.from_test_result(self.test_results[1]), self.compact_results[1])
+
+    def test_categorical_strings_interned(self):
+        """파일이 달라도 범주형 문자열은 같은 객체 공유"""
+        other = DataProcessor(compact_results=True)._convert_dataframe_to_test_results(self.df.copy())
+        self.assertIs(other[0].tester, self.compact_results[0].tester)
+        self.assertIs(other[0].test_item, self.compact_results[0].test_item)
+        self.assertIs(other[2].standard_criteria, self.compact_results[2].standard_criteria)
+        self.assertIs(sys.intern('김화빈'), self.compact_results[0].tester)
+
+    def test_interoperates_with_existing_consumers(self):
+        """요약/배치/직렬화 호환"""
+        self.assertEqual(ProjectSummary.from_test_results('TEST', self.compact_results),
+                         ProjectSummary.from_test_results('TEST', self.test_results))
+        self.assertEqual(TestResultBatch.from_test_results(self.compact_results).to_test_results(),
+                         self.test_results)
+        self.assertEqual(pickle.loads(pickle.dumps(self.compact_results)), self.compact_results)
+
+
+if __name__ == '__main__':
+    unittest.main()
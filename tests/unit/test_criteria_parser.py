@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+기준 텍스트 해석 (parse_criteria / limits_for) 테스트
+"""
+
+import unittest
+import sys
+import os
+import math
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.core.criteria_parser import parse_criteria, limits_for
+from src.core.data_models import Standard
+from src.core.data_processor import DataProcessor
+
+
+class TestCriteriaParser(unittest.TestCase):
+    """parse_criteria 테스트"""
+
+    def assert_bounds(self, text, lower, upper, lower_inclusive=True, upper_inclusive=True, unit=None):
+        criteria = parse_criteria(text)
+        for actual, expected in ((criteria.lower, lower), (criteria.upper, upper)):
+            if expected is None:
+                self.assertTrue(math.isnan(actual), f"{text!r}: {actual}")
+            else:
+                self.assertAlmostEqual(actual, expected, msg=repr(text))
+        self.assertEqual(criteria.lower_inclusive, lower_inclusive, repr(text))
+        self.assertEqual(criteria.upper_inclusive, upper_inclusive, repr(text))
+        if unit is not None:
+            self.assertEqual(criteria.unit, unit, repr(text))
+
+    def test_qualifiers(self):
+        """이하/미만/이상/초과 및 부등호"""
+        self.assert_bounds('0.0006 mg/L 이하', None, 0.0006, unit='mg/L')
+        self.assert_bounds('0.01 mg/L이하', None, 0.01, unit='mg/L')
+        self.assert_bounds('1e-3 mg/L 미만', None, 0.001, upper_inclusive=False)
+        self.assert_bounds('0.5 이상', 0.5, None)
+        self.assert_bounds('0.5 초과', 0.5, None, lower_inclusive=False)
+        self.assert_bounds('≤ 0.5 mg/L', None, 0.5, unit='mg/L')
+        self.assert_bounds('1,000 CFU/mL 이하', None, 1000, unit='CFU/mL')
+
+    def test_ranges(self):
+        """범위 형식"""
+        self.assert_bounds('5.8 ~ 8.5', 5.8, 8.5)
+        self.assert_bounds('5.8-8.5', 5.8, 8.5)
+        self.assert_bounds('5.8 mg/L ~ 8.5 mg/L', 5.8, 8.5, unit='mg/L')
+        self.assert_bounds('1 이상 10 미만', 1, 10, upper_inclusive=False)
+
+    def test_negative_and_inverted_bounds(self):
+        """음수 경계 (범위 구분자 -와 구분), 큰 값을 먼저 쓴 범위"""
+        self.assert_bounds('-5 이상', -5, None)
+        self.assert_bounds('−0.5 초과', -0.5, None, lower_inclusive=False)
+        self.assert_bounds('-10 ~ -2', -10, -2)
+        self.assert_bounds('(-10 ~ -2) ℃', -10, -2)
+        self.assert_bounds('-2-5', -2, 5)
+        self.assert_bounds('5.8 - 8.5', 5.8, 8.5)
+        self.assert_bounds('5.8 -8.5', 5.8, 8.5)
+        self.assert_bounds('8.5 ~ 5.8', 5.8, 8.5)
+        self.assert_bounds('-2 ~ -10', -10, -2)
+        self.assertTrue(parse_criteria('-10 ~ -2').is_within(-5))
+
+    def test_special_and_empty(self):
+        """불검출 기준, 단위 안의 숫자, 빈 값"""
+        self.assert_bounds('불검출/100 mL', None, 0.0)
+        self.assert_bounds('', None, None)
+        self.assert_bounds(None, None, None)
+        self.assertEqual(parse_criteria('기준 없음').limit_value, 0.0)
+
+    def test_limit_value_and_within(self):
+        """대표 기준값은 상한 우선, 범위 판정"""
+        self.assertEqual(parse_criteria('0.0006 mg/L 이하').limit_value, 0.0006)
+        self.assertEqual(parse_criteria('5.8 ~ 8.5').limit_value, 8.5)
+        self.assertEqual(parse_criteria('0.5 이상').limit_value, 0.5)
+
+        criteria = parse_criteria('1 이상 10 미만')
+        self.assertTrue(criteria.is_within(1))
+        self.assertFalse(criteria.is_within(10))
+        self.assertIsNone(criteria.is_within(None))
+
+    def test_memoized(self):
+        """같은 텍스트는 한 번만 해석"""
+        parse_criteria.cache_clear()
+        for _ in range(100):
+            parse_criteria('0.002 mg/L 이하')
+        info = parse_criteria.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 99))
+
+    def test_limits_for(self):
+        """컬럼 단위 하한/상한 배열"""
+        series = pd.Series(['0.0006 mg/L 이하', None, '5.8 ~ 8.5', '0.0006 mg/L 이하'], dtype=object)
+        lower, upper = limits_for(series)
+        np.testing.assert_array_equal(lower, [np.nan, np.nan, 5.8, np.nan])
+        np.testing.assert_array_equal(upper, [0.0006, np.nan, 8.5, 0.0006])
+
+    def test_consumers_share_parser(self):
+        """Standard / TestResultBatch가 같은 해석 결과 사용"""
+        df = pd.DataFrame({
+            '시료명': ['A', 'B', 'C'],
+            '분석번호': ['1', '2', '3'],
+            '시험항목': ['벤젠', 'pH', '벤젠'],
+            '결과(성적서)': [0.02, 7.0, '불검출'],
+            '기준': ['0.01 mg/L 이하', '5.8 ~ 8.5', '0.01 mg/L 이하'],
+        })
+        batch = DataProcessor().convert_dataframe_to_batch(df)
+        lower, upper = batch.criteria_limits()
+        np.testing.assert_array_equal(upper, [0.01, 8.5, 0.01])
+        np.testing.assert_array_equal(lower, [np.nan, 5.8, np.nan])
+
+        standard = Standard.from_test_result(batch[1])
+        self.assertEqual(standard.limit_value, 8.5)
+        self.assertEqual(standard.criteria.lower, 5.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+CSV 수집 경로 (인코딩 판별, 문자열 명시 읽기, 엑셀 경로와 동일 변환) 테스트
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.bulk_importer import collect_sources, parse_source
+from src.core.data_processor import DataProcessor
+from src.utils.csv_reader import pa_csv, read_csv_bytes, sniff_encoding
+from src.utils.file_validator import FileValidator, ValidationLevel
+from src.utils.upload_session import UploadSession
+
+
+def make_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        '시료명': ['냉수탱크', '온수탱크', '유량센서', '정수기'],
+        '분석번호': ['0012-001', '0012-002', '0012-003', '0012-004'],
+        '시험항목': ['벤젠', '납', 'pH', '탁도'],
+        '시험단위': ['mg/L', 'mg/L', '', 'NTU'],
+        '결과(성적서)': ['불검출', 0.02, 7.1, '<0.001'],
+        '기준대비 초과여부\n(성적서)': ['적합', '부적합', '적합', '적합'],
+        '시험자': ['김화빈', '이현풍', '김화빈', '이현풍'],
+        '기준 텍스트': ['0.01 mg/L 이하', '0.01 mg/L 이하', '5.8 ~ 8.5', '0.5 NTU 이하'],
+        '입력일시': ['2025-01-23 09:56', '2025-01-23 10:10', '', '2025-01-24 08:00'],
+    })
+
+
+class TestCsvReader(unittest.TestCase):
+    """csv_reader 테스트"""
+
+    def test_sniff_encoding(self):
+        """BOM/UTF-8/CP949 판별, 표본 끝에서 잘린 멀티바이트 문자 허용"""
+        text = '시료명,결과\n냉수탱크,불검출\n'
+        self.assertEqual(sniff_encoding(text.encode('utf-8')), 'utf-8')
+        self.assertEqual(sniff_encoding(text.encode('utf-8-sig')), 'utf-8-sig')
+        self.assertEqual(sniff_encoding(text.encode('cp949')), 'cp949')
+        self.assertEqual(sniff_encoding(('가' * 100).encode('utf-8'), sample_size=31), 'utf-8')
+
+    def test_engines_read_all_columns_as_text(self):
+        """pyarrow/C 엔진 모두 문자열로 읽고 결측 처리 동일 (앞자리 0, 줄바꿈 헤더 유지)"""
+        content = make_frame().to_csv(index=False).encode('cp949')
+        engines = ['c'] + (['pyarrow'] if pa_csv is not None else [])
+        frames = [read_csv_bytes(content, engine=engine) for engine in engines]
+        for df in frames:
+            self.assertEqual(df.attrs['encoding'], 'cp949')
+            self.assertEqual(df['분석번호'].iloc[0], '0012-001')
+            self.assertEqual(df['결과(성적서)'].iloc[1], '0.02')
+            self.assertIn('기준대비 초과여부\n(성적서)', df.columns)
+            self.assertTrue(pd.isna(df['입력일시'].iloc[2]))
+        pd.testing.assert_frame_equal(frames[0], frames[-1], check_dtype=False)
+
+    def test_encoding_fallback_after_sample(self):
+        """표본 이후에 다른 인코딩 문자가 나오면 다음 후보로 재시도"""
+        content = ('sample\n' + 'a\n' * 100).encode('ascii') + '냉수탱크\n'.encode('cp949')
+        self.assertEqual(sniff_encoding(content, sample_size=64), 'utf-8')
+        df = read_csv_bytes(content, encoding='utf-8', engine='c')
+        self.assertEqual(df.attrs['encoding'], 'cp949')
+        self.assertEqual(df['sample'].iloc[-1], '냉수탱크')
+
+    def test_csv_matches_excel_path(self):
+        """CSV와 엑셀은 같은 TestResultBatch로 변환"""
+        df = make_frame()
+        buffer = io.BytesIO()
+        df.to_excel(buffer, index=False)
+
+        processor = DataProcessor()
+        from_excel = processor.parse_excel_bytes(buffer.getvalue(), 'sample.xlsx', as_batch=True)
+        from_csv = processor.parse_csv_bytes(df.to_csv(index=False).encode('cp949'), 'sample.csv', as_batch=True)
+        pd.testing.assert_frame_equal(from_excel.to_dataframe(), from_csv.to_dataframe())
+        self.assertEqual(from_csv.to_test_results()[1].result_report, 0.02)
+
+    def test_validator_and_bulk_import_accept_csv(self):
+        """파일 검증기 인코딩 메타데이터, 대량 가져오기 CSV 수집"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'partner.csv'
+            make_frame().to_csv(path, index=False, encoding='cp949')
+
+            result = FileValidator(ValidationLevel.STRICT).validate_file(path, UploadSession.from_path(path))
+            self.assertEqual(result.metadata['detected_encoding'], 'cp949')
+            self.assertEqual(result.metadata['preview_rows'], 4)
+
+            sources = collect_sources([temp_dir])
+            self.assertEqual([source.file_name for source in sources], ['partner.csv'])
+            imported = parse_source(sources[0])
+            self.assertIsNone(imported.error)
+            self.assertEqual(imported.rows, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+로드된 데이터베이스 캐시 (mtime/크기/세대 검증, 세션 간 공유) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+
+
+def make_batch(rows: int = 4):
+    return DataProcessor().convert_dataframe_to_batch(pd.DataFrame({
+        '시료명': [f'시료_{i}' for i in range(rows)],
+        '분석번호': [f'25A{i:05d}-001' for i in range(rows)],
+        '시험항목': ['벤젠'] * rows,
+        '결과(성적서)': ['불검출'] * rows,
+        '기준대비 초과여부': ['적합'] * rows,
+    }))
+
+
+class TestDatabaseCache(unittest.TestCase):
+    """DatabaseManager 로드 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / 'analysis_database.json'
+        self.batch = make_batch()
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def test_reads_share_one_parse(self):
+        """같은 파일의 반복 조회와 다른 인스턴스(세션)는 한 번 파싱한 데이터를 공유"""
+        writer = DatabaseManager(str(self.db_path))
+        file_id = writer.save_analysis_result('a.xlsx', self.batch, upload_time=datetime(2025, 1, 10))
+
+        session_a, session_b = DatabaseManager(str(self.db_path)), DatabaseManager(str(self.db_path))
+        with mock.patch('json.load', wraps=json.load) as load:
+            session_a.get_all_files()
+            session_a.get_files_by_period(datetime(2025, 1, 1), datetime(2025, 1, 31))
+            session_b.get_file_by_id(file_id)
+            session_b.get_integrated_analysis_data(datetime(2025, 1, 1), datetime(2025, 1, 31))
+        # 저장 검증 때 읽은 사본이 캐시에 들어가므로 조회는 파싱하지 않음
+        self.assertFalse(load.called)
+        self.assertIs(session_a.load_database(), session_b.load_database())
+
+    def test_invalidated_by_writes(self):
+        """이 프로세스의 쓰기(일반/저널)와 다른 프로세스의 파일 교체 모두 반영"""
+        reader = DatabaseManager(str(self.db_path))
+        first = DatabaseManager(str(self.db_path)).save_analysis_result('a.xlsx', self.batch)
+        self.assertEqual([record['file_id'] for record in reader.get_all_files()], [first])
+
+        # 다른 프로세스가 파일을 직접 다시 씀
+        data = json.loads(self.db_path.read_text(encoding='utf-8'))
+        data['files'][first]['client'] = '외부 수정'
+        self.db_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        self.assertEqual(reader.get_file_by_id(first)['client'], '외부 수정')
+
+        journal_path = Path(self.temp_dir.name) / 'journaled.json'
+        journal_reader = DatabaseManager(str(journal_path), journal=True)
+        self.assertEqual(journal_reader.get_all_files(), [])
+        second = DatabaseManager(str(journal_path), journal=True).save_analysis_result('b.xlsx', self.batch)
+        self.assertEqual([record['file_id'] for record in journal_reader.get_all_files()], [second])
+        self.assertTrue(journal_reader.delete_analysis_result(second))
+        self.assertEqual(journal_reader.get_all_files(), [])
+
+    def test_updates_do_not_mutate_shared_records(self):
+        """병합/삭제는 복사본을 고쳐 저장하므로 이미 받은 레코드는 그대로"""
+        db = DatabaseManager(str(self.db_path))
+        file_id = db.save_analysis_result('a.xlsx', self.batch)
+        other_id = db.save_analysis_result('b.xlsx', self.batch)
+        before = db.get_file_by_id(file_id)
+        snapshot = db.load_database()
+
+        extra = make_batch(1)
+        db.merge_analysis_rows(file_id, extra, [None], ['hash'], file_name='a_v2.xlsx',
+                               ingest_stats={'inserted': 1})
+        self.assertTrue(db.delete_analysis_result(other_id))
+
+        self.assertEqual((len(before['test_results']), before['file_name']), (4, 'a.xlsx'))
+        self.assertNotIn('ingest_history', before)
+        self.assertEqual(sorted(snapshot['files']), sorted([file_id, other_id]))
+        after = db.get_file_by_id(file_id)
+        self.assertEqual((len(after['test_results']), after['file_name']), (5, 'a_v2.xlsx'))
+        self.assertEqual(list(db.load_database()['files']), [file_id])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+컬럼 단위 일시 파싱 (parse_datetime_series) 테스트
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+from src.core.data_models import parse_datetime, parse_datetime_series
+from src.core.data_processor import DataProcessor
+
+
+class TestParseDatetimeSeries(unittest.TestCase):
+    """parse_datetime_series 테스트"""
+
+    def assert_matches_row_parser(self, values):
+        parsed = parse_datetime_series(values)
+        self.assertEqual(parsed.dtype, np.dtype('datetime64[ns]'))
+        for value, result in zip(values, parsed):
+            expected = parse_datetime(value)
+            if expected is None:
+                self.assertTrue(np.isnat(result), f"{value!r} → {result}")
+            else:
+                self.assertEqual(pd.Timestamp(result), pd.Timestamp(expected), f"{value!r}")
+
+    def test_mixed_formats_match_row_parser(self):
+        """형식이 섞여 있어도 행 단위 파싱과 동일"""
+        self.assert_matches_row_parser([
+            '2025-01-23 09:56', ' 2025-01-24 ', '2025/01/23 09:56', '2025/1/3',
+            '2025-01-23 09:56:30', '', None, np.nan, 'garbage', 20250101, '2025-13-01',
+            datetime(2024, 5, 1, 3, 4), pd.Timestamp('2024-02-02'), pd.NaT,
+        ])
+
+    def test_minority_format_outside_sample(self):
+        """표본에 없는 형식은 나머지 값 처리로 해석"""
+        values = ['2025-01-23 09:56'] * 10 + ['2025/02/01']
+        parsed = parse_datetime_series(values, sample_size=5)
+        self.assertEqual(pd.Timestamp(parsed[-1]), pd.Timestamp('2025-02-01'))
+        self.assert_matches_row_parser(values)
+
+    def test_datetime64_input_and_out_of_range(self):
+        """datetime64 컬럼은 그대로, ns 범위 밖 일시는 NaT"""
+        series = pd.Series(pd.to_datetime(['2025-01-01', None]))
+        self.assertTrue(np.array_equal(parse_datetime_series(series), series.to_numpy(), equal_nan=True))
+        self.assertTrue(np.isnat(parse_datetime_series(['0001-01-01'])[0]))
+
+    def test_batch_keeps_datetime64_arrays(self):
+        """배치 변환은 datetime64 배열을 그대로 사용 (시간 구간 집계에 바로 사용)"""
+        df = pd.DataFrame({
+            '시료명': ['A', 'B', 'C'],
+            '시험항목': ['벤젠', '벤젠', '톨루엔'],
+            '입력일시': ['2025-01-23 09:56', '', '2025/01/24'],
+        })
+        batch = DataProcessor().convert_dataframe_to_batch(df)
+        days = batch.column('input_datetime').astype('datetime64[D]')
+        self.assertEqual(str(days[0]), '2025-01-23')
+        self.assertTrue(np.isnat(days[1]))
+        self.assertEqual(batch[2].input_datetime, datetime(2025, 1, 24))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+읽기 시점 dtype 계획 (카테고리/Arrow 문자열/정수 다운캐스트, 디버그 시에만 깊은 메모리 측정) 테스트
+"""
+
+import unittest
+import sys
+import os
+import io
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.column_plan import LIMS_COLUMNS, TEXT_DTYPE, apply_read_dtypes
+from src.core.data_processor import DataProcessor
+from src.utils import performance_optimizer
+from src.utils.upload_session import UploadSession
+
+
+def make_frame(rows: int = 40) -> pd.DataFrame:
+    return pd.DataFrame({
+        'No.': list(range(1, rows + 1)),
+        '시료명': [f'시료_{i}' for i in range(rows)],
+        '분석번호': [f'25A{i:05d}-001' for i in range(rows)],
+        '시험항목': ['벤젠', '납'] * (rows // 2),
+        '시험단위': ['mg/L', None] * (rows // 2),
+        '결과(성적서)': ['불검출', 0.02] * (rows // 2),
+        '시험자입력값': [0.0007, 0.02] * (rows // 2),
+        '기준대비 초과여부 (성적서)': ['적합', '부적합'] * (rows // 2),
+        '시험자': ['김화빈'] * rows,
+        '기준': ['0.01 mg/L 이하', 5] * (rows // 2),   # 수치 셀이 섞인 텍스트 컬럼
+        '입력일시': ['2025-01-23 09:56'] * rows,
+    })
+
+
+class TestDtypePlan(unittest.TestCase):
+    """읽기 시점 dtype 계획 테스트"""
+
+    def setUp(self):
+        buffer = io.BytesIO()
+        make_frame().to_excel(buffer, index=False)
+        self.content = buffer.getvalue()
+        self.processor = DataProcessor()
+
+    def test_session_frame_typed_at_read(self):
+        """업로드 세션 DataFrame은 읽으면서 계획된 dtype으로 생성"""
+        df = UploadSession(self.content, 'sample.xlsx').frame
+        self.assertIs(DataProcessor.COLUMN_MAPPING, LIMS_COLUMNS)
+        for column in ('시험항목', '시험단위', '기준대비 초과여부 (성적서)', '시험자', '기준'):
+            self.assertIsInstance(df[column].dtype, pd.CategoricalDtype, column)
+        self.assertEqual(df['No.'].dtype, 'int8')
+        self.assertEqual(df['시험자입력값'].dtype, 'float64')
+        self.assertEqual(df['결과(성적서)'].dtype, object)
+        if TEXT_DTYPE is not None:
+            self.assertEqual(df['시료명'].dtype, TEXT_DTYPE)
+
+    def test_conversion_unchanged(self):
+        """dtype 계획 적용 전후 변환 결과 동일"""
+        plain = pd.read_excel(io.BytesIO(self.content))
+        typed = UploadSession(self.content, 'sample.xlsx').frame
+        pd.testing.assert_frame_equal(
+            self.processor.convert_dataframe_to_batch(typed).to_dataframe(),
+            self.processor.convert_dataframe_to_batch(plain).to_dataframe()
+        )
+        # 이미 적용된 DataFrame에 다시 적용해도 그대로
+        self.assertIs(apply_read_dtypes(typed)['시험항목'].dtype, typed['시험항목'].dtype)
+
+    def test_no_post_hoc_optimization(self):
+        """업로드 처리 경로는 사후 최적화/깊은 메모리 측정을 하지 않음 (디버그 플래그 시에만 측정)"""
+        session = UploadSession(self.content, 'sample.xlsx')
+        session.frame
+        with mock.patch.object(self.processor.performance_optimizer, 'optimize_dataframe_memory') as optimize, \
+                mock.patch.object(pd.DataFrame, 'memory_usage', autospec=True,
+                                  side_effect=pd.DataFrame.memory_usage) as memory_usage:
+            self.processor.process_excel_data(session, as_batch=True)
+            self.processor.export_to_dataframe(self.processor.process_excel_data(session))
+            self.assertFalse(optimize.called)
+            self.assertFalse(memory_usage.called)
+
+            with mock.patch.object(performance_optimizer, 'DEBUG_MEMORY', True):
+                self.processor.process_excel_data(session, as_batch=True)
+            self.assertTrue(memory_usage.called)
+
+    def test_optimize_dataframe_memory_keeps_input(self):
+        """스키마 없는 DataFrame 최적화는 원본을 바꾸지 않음"""
+        df = make_frame()
+        optimized = self.processor.performance_optimizer.optimize_dataframe_memory(df)
+        self.assertEqual(df['시험항목'].dtype, make_frame()['시험항목'].dtype)
+        self.assertIsInstance(optimized['시험항목'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(optimized.astype(object), df.astype(object), check_dtype=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+헤더 스키마 캐시 (헤더 지문 → 매핑/검증 결과) 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.column_plan import ColumnPlan
+from src.core.data_processor import DataProcessor
+from src.utils.error_handler import DataProcessingErrorHandler
+from src.utils.header_schema_cache import HeaderSchemaCache, header_fingerprint, header_schema_cache
+
+
+class TestHeaderSchemaCache(unittest.TestCase):
+    """HeaderSchemaCache 테스트"""
+
+    def setUp(self):
+        header_schema_cache.clear()
+        self.df = pd.DataFrame({
+            '시료명': ['냉수탱크', '온수탱크'],
+            '시험항목': ['벤젠', '납'],
+            '결과(성적서)': ['불검출', 0.02],
+            '시험자': ['김화빈', '이현풍'],
+            '검체 비고': ['', ''],
+            '기타': ['', ''],
+        })
+
+    def test_fingerprint_depends_on_order_and_type(self):
+        """컬럼 순서/타입이 다르면 다른 지문"""
+        self.assertEqual(header_fingerprint(['a', 'b']), header_fingerprint(('a', 'b')))
+        self.assertNotEqual(header_fingerprint(['a', 'b']), header_fingerprint(['b', 'a']))
+        self.assertNotEqual(header_fingerprint([1]), header_fingerprint(['1']))
+
+    def test_get_or_compute_stores_copy(self):
+        """두 번째 조회는 계산 없이 캐시, 계산 결과를 나중에 수정해도 캐시에 영향 없음"""
+        cache = HeaderSchemaCache()
+        compute = mock.Mock(return_value={'matched': [1, 2]})
+        first, first_hit = cache.get_or_compute('ns', ('a',), compute)
+        first['matched'].append(3)
+        second, second_hit = cache.get_or_compute('ns', ('a',), compute)
+
+        self.assertEqual((first_hit, second_hit), (False, True))
+        self.assertEqual(second, {'matched': [1, 2]})
+        compute.assert_called_once()
+        self.assertIsNone(cache.get('other', ('a',)))
+
+    def test_disk_persistence(self):
+        """디스크 경로 지정 시 새 인스턴스에서도 재사용, 손상 파일은 무시"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'header_schema.json'
+            HeaderSchemaCache(path).put('ns', ('a', 'b'), {'value': 1})
+            self.assertEqual(HeaderSchemaCache(path).get('ns', ('a', 'b')), {'value': 1})
+
+            path.write_text('{broken', encoding='utf-8')
+            self.assertIsNone(HeaderSchemaCache(path).get('ns', ('a', 'b')))
+
+    def test_validate_data_structure_uses_cache(self):
+        """같은 헤더의 두 번째 검증은 매칭을 다시 하지 않고 결과는 동일"""
+        processor = DataProcessor()
+        with mock.patch.object(DataProcessor, '_validate_header', wraps=processor._validate_header) as resolve:
+            first = processor.validate_data_structure(self.df)
+            second = processor.validate_data_structure(self.df.iloc[:1])
+        self.assertEqual(resolve.call_count, 1)
+        self.assertTrue(first['is_valid'])
+        self.assertEqual(first['matched_columns'], second['matched_columns'])
+        self.assertEqual(second['matched_columns']['결과'], '결과(성적서)')
+
+        missing = processor.validate_data_structure(self.df.drop(columns=['시험자']))
+        self.assertFalse(missing['is_valid'])
+        self.assertIn("필수 컬럼을 찾을 수 없습니다: ['시험자']", missing['errors'])
+
+    def test_column_mapping_errors_use_cache(self):
+        """컬럼 매핑 에러는 캐시 적중 시에도 같은 에러/메타데이터"""
+        handler = DataProcessingErrorHandler()
+        with mock.patch.object(DataProcessingErrorHandler, '_find_similar_column_mapping',
+                               wraps=handler._find_similar_column_mapping) as similar:
+            first = handler.handle_column_mapping_errors(self.df)
+            calls = similar.call_count
+            second = DataProcessingErrorHandler().handle_column_mapping_errors(self.df)
+        self.assertGreater(calls, 0)
+        self.assertEqual(similar.call_count, calls)
+
+        self.assertFalse(first.metadata['header_cache_hit'])
+        self.assertTrue(second.metadata['header_cache_hit'])
+        self.assertEqual(first.metadata['mapped_columns'], second.metadata['mapped_columns'])
+        self.assertEqual(first.metadata['mapped_columns']['검체 비고'], 'sample_name')
+        self.assertEqual(
+            [(e.severity, e.message, e.column_name) for e in first.warnings],
+            [(e.severity, e.message, e.column_name) for e in second.warnings]
+        )
+
+    def test_column_plan_spec_round_trip(self):
+        """ColumnPlan은 캐시 형식으로 저장 후 복원해도 같은 매핑"""
+        columns = tuple(self.df.columns)
+        plan = ColumnPlan.from_columns(columns)
+        restored = ColumnPlan.from_spec(columns, plan.to_spec())
+        self.assertEqual(restored.to_dict(), plan.to_dict())
+        self.assertEqual(restored.resolutions, plan.resolutions)
+
+        processor = DataProcessor()
+        self.assertEqual(processor.build_column_plan(columns).to_dict(), plan.to_dict())
+        self.assertEqual(processor.build_column_plan(columns).to_dict(), plan.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
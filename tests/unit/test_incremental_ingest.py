@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+증분 재수집 ((분석번호, 시험항목) 키 + 행 해시로 신규/변경 행만 반영) 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager
+from src.core.incremental_ingest import IncrementalIngestor, analysis_prefixes, row_hashes, row_keys
+from lims_fixtures import make_export
+
+
+DAY1 = [
+    ('25A00009-001', '벤젠', '불검출', '적합'),
+    ('25A00009-001', '납', '0.002', '적합'),
+    ('25A00009-002', '벤젠', '불검출', '적합'),
+]
+
+
+class TestIncrementalIngest(unittest.TestCase):
+    """IncrementalIngestor 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_manager = DatabaseManager(str(Path(self.temp_dir.name) / 'db.json'))
+        self.processor = DataProcessor()
+        self.ingestor = IncrementalIngestor(self.processor, self.db_manager)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_keys_and_hashes(self):
+        """반복 키는 순번으로 구분, 해시는 컬럼 순서/정수·실수 표현과 무관"""
+        self.assertEqual(analysis_prefixes(['25A00009-001', '25A00010-001', None]), ['25A00009', '25A00010'])
+        keys = row_keys(['A-1', 'A-1', 'A-1'], ['납', '납', '벤젠'])
+        self.assertEqual(len(set(keys)), 3)
+
+        df = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        reordered = pd.DataFrame({'b': ['x', 'y'], 'a': [1.0, 2.0]})
+        self.assertEqual(row_hashes(df), row_hashes(reordered))
+        self.assertNotEqual(row_hashes(df)[0], row_hashes(df)[1])
+
+    def test_cumulative_export(self):
+        """둘째 날 내보내기: 신규/변경 행만 변환하여 같은 레코드에 병합"""
+        first = self.ingestor.ingest(make_export(DAY1), '시험현황_시험항목_20250123.xlsx',
+                                     upload_time=datetime(2025, 1, 23, 9))
+        self.assertEqual((first.inserted, first.updated, first.unchanged), (3, 0, 0))
+        self.assertIsNone(first.base_file_id)
+
+        day2 = list(DAY1)
+        day2[1] = ('25A00009-001', '납', '0.02', '부적합')      # 재시험으로 결과 변경
+        day2.append(('25A00009-003', '납', '0.001', '적합'))    # 신규 시료
+        with mock.patch.object(self.processor, '_convert_dataframe_to_columns',
+                               wraps=self.processor._convert_dataframe_to_columns) as convert:
+            second = self.ingestor.ingest(make_export(day2), '시험현황_시험항목_20250124.xlsx',
+                                          upload_time=datetime(2025, 1, 24, 9))
+        self.assertEqual(len(convert.call_args[0][0]), 2)
+        self.assertEqual((second.inserted, second.updated, second.unchanged), (1, 1, 2))
+        self.assertEqual(second.file_id, first.file_id)
+
+        files = self.db_manager.load_database()['files']
+        self.assertEqual(len(files), 1)
+        record = files[first.file_id]
+        self.assertEqual(len(record['test_results']), 4)
+        self.assertEqual(record['test_results'][1]['result_value'], 0.02)
+        self.assertEqual(record['summary']['fail_items'], 1)
+        self.assertEqual(record['summary']['top_violation_item'], '납')
+        self.assertEqual(record['file_name'], '시험현황_시험항목_20250124.xlsx')
+        self.assertEqual(record['ingest_history'][-1]['inserted'], 1)
+
+        # 같은 내보내기 재업로드는 변환 없이 모두 동일
+        third = self.ingestor.ingest(make_export(day2), '시험현황_시험항목_20250124.xlsx')
+        self.assertEqual((third.inserted, third.updated, third.unchanged), (0, 0, 4))
+
+    def test_other_project_gets_new_record(self):
+        """접수번호가 겹치지 않으면 새 레코드, 해시가 없는 기존 레코드는 모두 변경으로 처리"""
+        self.db_manager.save_analysis_result('legacy.xlsx', self.processor.convert_dataframe_to_batch(make_export(DAY1)))
+        legacy = self.ingestor.ingest(make_export(DAY1), 'again.xlsx')
+        self.assertEqual((legacy.inserted, legacy.updated, legacy.unchanged), (0, 3, 0))
+
+        other = self.ingestor.ingest(make_export([('25B00001-001', '벤젠', '불검출', '적합')]), 'other.xlsx')
+        self.assertIsNone(other.base_file_id)
+        self.assertEqual(len(self.db_manager.load_database()['files']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+JSON 데이터베이스 추가 전용 저널 (fsync 덧붙이기, 스냅샷 압축, 중단 복구) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager, open_database
+
+
+def make_batch(rows: int = 5):
+    return DataProcessor().convert_dataframe_to_batch(pd.DataFrame({
+        '시료명': [f'시료_{i}' for i in range(rows)],
+        '분석번호': [f'25A{i:05d}-001' for i in range(rows)],
+        '시험항목': ['벤젠'] * rows,
+        '결과(성적서)': ['불검출'] * rows,
+        '기준대비 초과여부': ['적합'] * rows,
+    }))
+
+
+class TestJsonJournal(unittest.TestCase):
+    """저널 모드 DatabaseManager 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / 'analysis_database.json'
+        self.batch = make_batch()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_writes_append_without_rewrite(self):
+        """저장/삭제는 저널에 덧붙이기만 하고 스냅샷을 다시 쓰거나 백업하지 않음"""
+        db = DatabaseManager(str(self.db_path), journal=True)
+        snapshot = self.db_path.read_bytes()
+
+        with mock.patch.object(db, 'save_database') as save_database, \
+                mock.patch('os.fsync', wraps=os.fsync) as fsync:
+            first = db.save_analysis_result('a.xlsx', self.batch)
+            second, third = db.save_analysis_results([
+                {'file_name': 'b.xlsx', 'test_results': self.batch},
+                {'file_name': 'c.xlsx', 'test_results': self.batch},
+            ])
+            self.assertTrue(db.delete_analysis_result(second))
+            self.assertFalse(db.delete_file(second))
+        self.assertFalse(save_database.called)
+        self.assertEqual(fsync.call_count, 3)
+        self.assertEqual(self.db_path.read_bytes(), snapshot)
+        self.assertFalse(self.db_path.with_suffix('.json.backup').exists())
+        self.assertEqual(db.journal.stats()['journal_entries'], 4)
+
+        # 다른 인스턴스도 스냅샷 + 저널 적용 결과를 봄
+        reopened = DatabaseManager(str(self.db_path), journal=True)
+        self.assertEqual(sorted(reopened.load_database()['files']), sorted([first, third]))
+        self.assertEqual(reopened.get_file_by_id(first)['summary']['total_items'], 5)
+
+    def test_compaction_and_torn_tail_recovery(self):
+        """저널이 커지면 스냅샷으로 압축, 중단으로 잘린 마지막 줄은 버리고 이어 씀"""
+        db = DatabaseManager(str(self.db_path), journal=True)
+        db.journal.compact_min_bytes = 0
+        file_id = db.save_analysis_result('a.xlsx', self.batch)
+        # 스냅샷보다 저널이 커지면 압축되어 저널이 비워짐
+        self.assertEqual(db.journal.stats()['journal_bytes'], 0)
+        self.assertIn(file_id, json.loads(self.db_path.read_text(encoding='utf-8'))['files'])
+
+        db.journal.compact_min_bytes = 1 << 30
+        kept = db.save_analysis_result('b.xlsx', self.batch)
+        with open(db.journal.journal_path, 'ab') as f:
+            f.write(b'{"op":"put","record":{"file_id":"torn"')     # fsync 전에 중단된 쓰기
+
+        reopened = DatabaseManager(str(self.db_path), journal=True)
+        self.assertEqual(sorted(reopened.load_database()['files']), sorted([file_id, kept]))
+        after = reopened.save_analysis_result('c.xlsx', self.batch)
+        self.assertEqual(reopened.journal.stats()['journal_entries'], 2)
+
+        reopened.compact_journal()
+        plain = DatabaseManager(str(self.db_path))
+        self.assertEqual(sorted(plain.load_database()['files']), sorted([file_id, kept, after]))
+
+    def test_sqlite_migration_includes_journal(self):
+        """저널 모드로 쓰던 JSON을 SQLite로 이전하면 저널 내용까지 옮김"""
+        journaled = open_database(self.temp_dir.name, backend='journal')
+        file_id = journaled.save_analysis_result('a.xlsx', self.batch)
+
+        migrated = open_database(self.temp_dir.name, backend='sqlite')
+        self.assertEqual(list(migrated.load_database()['files']), [file_id])
+        migrated.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
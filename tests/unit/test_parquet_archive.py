@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Parquet 보관본 (월 × 의뢰 기관 파티션 내보내기, 복원/병합 가져오기) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager, open_database
+from src.core.parquet_archive import MANIFEST_NAME, main
+from lims_fixtures import make_batch
+
+
+def records_of(db):
+    return sorted(db.get_all_files(), key=lambda record: record['file_id'])
+
+
+class TestParquetArchive(unittest.TestCase):
+    """export_archive / import_archive 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def fill(self, db, count: int = 6, start: int = 0):
+        clients = ['기관/A', '기관 B', '']
+        return db.save_analysis_results([
+            {'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': make_batch(i, rows=5), 'client': clients[i % 3],
+             'upload_time': datetime(2025, 1, 20) + timedelta(days=9 * i)} for i in range(start, start + count)
+        ])
+
+    def test_round_trip_between_backends(self):
+        """내보낸 보관본을 다른 백엔드에 복원하면 레코드(행, 롤업, 증분 이력 포함)가 같음"""
+        source = DatabaseManager(str(self.root / 'source.json'), journal=True, shards=True)
+        file_ids = self.fill(source)
+        source.merge_analysis_rows(file_ids[0], make_batch(9, rows=5), [None, 2], ['h1', 'h2'],
+                                   upload_time=datetime(2025, 2, 1), ingest_stats={'inserted': 1, 'updated': 1})
+        stats = source.export_archive(self.root / 'archive')
+        self.assertEqual((stats['files'], stats['rows']), (6, 31))
+
+        archive = self.root / 'archive'
+        manifest = json.loads((archive / MANIFEST_NAME).read_text(encoding='utf-8'))
+        self.assertEqual(manifest['files'], 6)
+        months = {path.name for path in (archive / 'results').iterdir()}
+        self.assertEqual(months, {'month=2025-01', 'month=2025-02', 'month=2025-03'})
+        self.assertTrue((archive / 'results' / 'month=2025-02' / 'client=%EA%B8%B0%EA%B4%80%2FA').is_dir())
+
+        expected = records_of(source)
+        for name in ('plain.json', 'store.db'):
+            target = DatabaseManager(str(self.root / name))
+            with self.subTest(backend=name):
+                self.assertEqual(target.import_archive(archive, replace=True), 6)
+                self.assertEqual(records_of(target), expected)
+                self.assertEqual(target.search_results('25a009').rows[0]['file_id'], file_ids[0])
+
+    def test_merge_adds_only_new_files(self):
+        """병합 가져오기는 없는 file_id만 한 번에 추가"""
+        source = DatabaseManager(str(self.root / 'source.db'))
+        source_ids = self.fill(source, 4)
+        source.export_archive(self.root / 'archive')
+
+        for name in ('target.json', 'target.db'):
+            target = DatabaseManager(str(self.root / name))
+            own_ids = self.fill(target, 2, start=10)
+            with self.subTest(backend=name):
+                self.assertEqual(target.import_archive(self.root / 'archive'), 4)
+                self.assertEqual(target.import_archive(self.root / 'archive'), 0)
+                self.assertEqual({record['file_id'] for record in target.get_all_files()},
+                                 set(source_ids) | set(own_ids))
+                rollup = target.get_period_rollup(datetime(2025, 1, 1), datetime(2025, 12, 31))
+                self.assertEqual(rollup['total_files'], 6)
+
+    def test_pandas_reads_dataset(self):
+        """앱 없이 pandas로 결과 데이터셋 전체를 읽을 수 있고 반복 값 컬럼은 딕셔너리 인코딩"""
+        source = DatabaseManager(str(self.root / 'source.json'))
+        self.fill(source)
+        source.export_archive(self.root / 'archive')
+
+        frame = pd.read_parquet(self.root / 'archive' / 'results')
+        self.assertEqual(len(frame), 30)
+        self.assertEqual(set(frame['client'].dropna().astype(str)), {'기관/A', '기관 B', '미지정'})
+        self.assertEqual(str(frame['test_item'].dtype), 'category')
+        self.assertEqual(int(frame['is_non_conforming'].sum()), 6)
+        files = pd.read_parquet(self.root / 'archive' / 'files')
+        self.assertEqual(len(files), 6)
+
+        with self.assertRaises(FileExistsError):
+            source.export_archive(self.root / 'archive')
+
+    def test_cli_uses_app_database_folder(self):
+        """명령행은 앱과 같은 open_database 방식으로 저장 폴더의 데이터베이스를 엶 (저널 모드 포함)"""
+        source_folder, target_folder = self.root / 'source', self.root / 'target'
+        file_ids = self.fill(open_database(source_folder, backend='sqlite'), 3)
+        archive = str(self.root / 'archive')
+        self.assertEqual(main(['export', '--archive', archive, '--db-folder', str(source_folder),
+                               '--backend', 'sqlite']), 0)
+        self.assertEqual(main(['import', '--archive', archive, '--db-folder', str(target_folder),
+                               '--backend', 'journal']), 0)
+
+        shared_cache.clear()
+        target = open_database(target_folder, backend='journal')
+        self.assertEqual({record['file_id'] for record in target.get_all_files()}, set(file_ids))
+        self.assertGreater(target.journal.stats()['journal_entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
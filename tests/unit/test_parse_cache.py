@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+파싱 결과 캐시 (내용 해시 + Arrow IPC) 테스트
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_models import CompactTestResult, TestResultBatch
+from src.core.data_processor import DataProcessor
+from src.core.parse_cache import ParseCache, content_key, file_key
+
+
+class TestParseCache(unittest.TestCase):
+    """ParseCache 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ParseCache(Path(self.temp_dir.name) / 'parse')
+        self.df = pd.DataFrame({
+            'No.': [1, 2, 3],
+            '시료명': ['냉수탱크', '온수탱크', '냉수탱크'],
+            '분석번호': ['25A00009-001', '25A00009-002', '25A00011-003'],
+            '시험항목': ['아크릴로나이트릴', '아크릴로나이트릴', '벤젠'],
+            '결과(성적서)': ['불검출', 0.0007, 12],
+            '기준대비 초과여부 (성적서)': ['적합', '부적합', '부적합'],
+            '시험자': ['김화빈', '김화빈', '이현풍'],
+            '입력일시': ['2025-01-23 09:56', '', '2025-01-24 10:00'],
+        })
+        buffer = io.BytesIO()
+        self.df.to_excel(buffer, index=False)
+        self.content = buffer.getvalue()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip_preserves_values(self):
+        """저장 후 조회 시 값/타입 유지 (수치 결과, 빈 일시 포함)"""
+        test_results = DataProcessor()._convert_dataframe_to_test_results(self.df)
+        batch = TestResultBatch.from_test_results(test_results)
+        key = content_key(self.content, '1')
+
+        self.assertTrue(self.cache.put(key, batch, 'a.xlsx'))
+        cached = self.cache.get(key)
+        self.assertEqual(cached.to_test_results(), test_results)
+        self.assertIsInstance(cached[2].result_report, int)
+        self.assertIsNone(cached[1].input_datetime)
+        self.assertEqual(cached.fingerprint, batch.fingerprint)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_processor_uses_cache(self):
+        """같은 내용은 두 번째부터 캐시에서 반환, 파서 버전이 바뀌면 재파싱"""
+        processor = DataProcessor(compact_results=True, parse_cache=self.cache)
+        first = processor.parse_excel_bytes(self.content, 'a.xlsx')
+
+        with mock.patch('src.core.data_processor.pd.read_excel') as read_excel:
+            second = processor.parse_excel_bytes(self.content, 'b.xlsx')
+            read_excel.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertIsInstance(second[0], CompactTestResult)
+
+        with mock.patch.object(DataProcessor, 'PARSER_VERSION', 'next'):
+            processor.parse_excel_bytes(self.content)
+        self.assertEqual(self.cache.stats()['entries'], 2)
+
+    def test_file_key_matches_content_key(self):
+        """파일 경로 키와 내용 키가 동일"""
+        path = Path(self.temp_dir.name) / 'a.xlsx'
+        path.write_bytes(self.content)
+        self.assertEqual(file_key(path, '2', block_size=1000), content_key(self.content, '2'))
+
+        processor = DataProcessor(parse_cache=self.cache)
+        self.assertEqual(processor.parse_excel_file(str(path)), processor.parse_excel_bytes(self.content))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_size_bounded_eviction_and_invalidation(self):
+        """용량 초과 시 오래된 항목부터 제거, 명시적 무효화"""
+        batch = DataProcessor().convert_dataframe_to_batch(self.df)
+        self.cache.put('a', batch)
+        entry_size = self.cache.stats()['total_bytes']
+        self.cache.max_bytes = entry_size * 2
+        os.utime(self.cache._path('a'), (1, 1))
+        self.cache.put('b', batch)
+        self.cache.put('c', batch)
+
+        self.assertIsNone(self.cache.get('a'))
+        self.assertIsNotNone(self.cache.get('c'))
+        self.assertEqual(self.cache.stats()['entries'], 2)
+
+        self.assertTrue(self.cache.invalidate('b'))
+        self.assertFalse(self.cache.invalidate('b'))
+        self.assertEqual(self.cache.clear(), 1)
+
+    def test_corrupt_entry_is_dropped(self):
+        """손상된 캐시 파일은 삭제 후 미스 처리"""
+        self.cache._path('bad').write_bytes(b'not arrow')
+        self.assertIsNone(self.cache.get('bad'))
+        self.assertFalse(self.cache._path('bad').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+TestResultBatch (컬럼형 시험 결과 컨테이너) 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.core.data_models import TestResult, TestResultBatch, ProjectSummary
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager
+
+
+class TestTestResultBatch(unittest.TestCase):
+    """TestResultBatch 테스트"""
+
+    def setUp(self):
+        self.processor = DataProcessor()
+        self.df = pd.DataFrame({
+            'No.': [1, 2, 3, 4, 5],
+            '시료명': ['냉수탱크', '온수탱크', '냉수탱크', '제품#1', '제품#2'],
+            '분석번호': ['25A00009-001', '25A00009-002', '25A00011-003', '25A00089-002', '25A00089-003'],
+            '시험항목': ['아크릴로나이트릴', '아크릴로나이트릴', 'N-니트로조다이메틸아민', '아크릴로나이트릴', '벤젠'],
+            '시험단위': ['mg/L', 'mg/L', 'ng/L', 'mg/L', 'mg/L'],
+            '결과(성적서)': ['불검출', '0.0007', '2.29', '0.0007', 'N.D.'],
+            '시험자입력값': [0, 0.0007, 2.29, 0.0007, 0],
+            '기준대비 초과여부 (성적서)': ['적합', '부적합', '부적합', '부적합', '적합'],
+            '시험자': ['김화빈', '김화빈', '이현풍', '김화빈', '김화빈'],
+            '기준': ['0.0006 mg/L 이하', '0.0006 mg/L 이하', '2.0 ng/L 이하', '0.0006 mg/L 이하', '0.01 mg/L 이하'],
+            '입력일시': ['2025-01-23 09:56', '2025-01-23 09:56', '', '2025-02-01 10:00', '2025-02-03 11:30'],
+        })
+        self.test_results = self.processor._convert_dataframe_to_test_results(self.df)
+        self.batch = self.processor.convert_dataframe_to_batch(self.df)
+
+    def test_row_views_match_test_results(self):
+        """인덱싱/반복 결과가 TestResult 리스트와 동일"""
+        self.assertEqual(len(self.batch), 5)
+        self.assertEqual(list(self.batch), self.test_results)
+        self.assertIsInstance(self.batch[0], TestResult)
+        self.assertEqual(self.batch[-1], self.test_results[-1])
+        self.assertEqual(list(self.batch[1:3]), self.test_results[1:3])
+        self.assertIsNone(self.batch[2].input_datetime)
+
+    def test_precomputed_arrays(self):
+        """부적합 여부 / 수치 결과 배열"""
+        self.assertEqual(self.batch.is_non_conforming.tolist(), [False, True, True, True, False])
+        numeric = self.batch.numeric_result
+        self.assertTrue(np.isnan(numeric[0]))
+        self.assertAlmostEqual(numeric[2], 2.29)
+        self.assertTrue(np.isnan(numeric[4]))
+
+    def test_dictionary_encoding(self):
+        """문자열 필드 사전 인코딩"""
+        self.assertEqual(self.batch.categories('tester').tolist(), ['김화빈', '이현풍'])
+        self.assertEqual(self.batch.codes('tester').tolist(), [0, 0, 1, 0, 0])
+        self.assertEqual(self.batch.value_counts('test_item', self.batch.is_non_conforming),
+                         {'아크릴로나이트릴': 2, 'N-니트로조다이메틸아민': 1})
+        self.assertEqual(self.batch.nunique('sample_name'), 4)
+
+    def test_from_test_results_round_trip(self):
+        """TestResult 리스트 ↔ 배치 변환"""
+        batch = TestResultBatch.from_test_results(self.test_results)
+        self.assertEqual(batch.to_test_results(), self.test_results)
+        self.assertEqual(batch.fingerprint, self.batch.fingerprint)
+        self.assertNotEqual(batch[:4].fingerprint, self.batch.fingerprint)
+
+    def test_project_summary_matches_list(self):
+        """배치 요약이 리스트 요약과 동일"""
+        self.assertEqual(
+            ProjectSummary.from_test_results('TEST', self.batch),
+            ProjectSummary.from_test_results('TEST', self.test_results)
+        )
+
+    def test_database_serialization_matches_list(self):
+        """배치 저장 결과가 리스트 저장 결과와 동일"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = DatabaseManager(os.path.join(tmp_dir, 'db.json'))
+            list_record = db.get_file_by_id(db.save_analysis_result('a.xlsx', self.test_results))
+            batch_record = db.get_file_by_id(db.save_analysis_result('a.xlsx', self.batch))
+
+        self.assertEqual(list_record['summary'], batch_record['summary'])
+        # 일시가 없는 행은 저장 시각으로 채워지므로 제외하고 비교
+        for list_row, batch_row in zip(list_record['test_results'], batch_record['test_results']):
+            if list_row['test_item'] != 'N-니트로조다이메틸아민':
+                self.assertEqual(list_row, batch_row)
+
+    def test_empty_batch(self):
+        """빈 배치"""
+        batch = TestResultBatch.from_test_results([])
+        self.assertEqual(len(batch), 0)
+        self.assertFalse(batch)
+        self.assertEqual(batch.value_counts('test_item'), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
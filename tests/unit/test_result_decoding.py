@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+결과(성적서) 값 해석 (decode_result_value / decode_result_values) 테스트
+"""
+
+import unittest
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import numpy as np
+import pandas as pd
+
+from src.core.data_models import (
+    DetectionStatus, TestResultBatch, decode_result_value, decode_result_values
+)
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager
+from src.core.document_generator import DocumentGenerator
+from src.core.integrated_analysis_engine import IntegratedAnalysisEngine
+
+
+MIXED_VALUES = [
+    '불검출', '불검출(0.01)', 'N.D.', 'nd', '<0.001', '＜0.2', '0.5 미만', '< LOQ',
+    0.0007, 12, np.float64(0.1), np.int64(3), ' 0.5', '1e-3', '1_000', 'abc', '', 'NaN',
+    None, np.nan, True,
+]
+
+
+class TestResultDecoding(unittest.TestCase):
+    """결과값 해석 규칙 테스트"""
+
+    def test_status_codes(self):
+        """검출 / 불검출 / 정량한계 미만 / 해석 불가 구분"""
+        expected = {
+            '불검출': DetectionStatus.NOT_DETECTED,
+            'N.D.': DetectionStatus.NOT_DETECTED,
+            '<0.001': DetectionStatus.BELOW_LOQ,
+            '0.5 미만': DetectionStatus.BELOW_LOQ,
+            0.0007: DetectionStatus.DETECTED,
+            ' 0.5': DetectionStatus.DETECTED,
+            'abc': DetectionStatus.NON_NUMERIC,
+            '': DetectionStatus.NON_NUMERIC,
+        }
+        for value, status in expected.items():
+            self.assertEqual(decode_result_value(value)[1], status, repr(value))
+
+        self.assertEqual(decode_result_value('불검출(0.01)'), (None, DetectionStatus.NOT_DETECTED, '불검출'))
+        self.assertEqual(decode_result_value(12), (12.0, DetectionStatus.DETECTED, '12'))
+        self.assertEqual(decode_result_value(np.nan)[1], DetectionStatus.NON_NUMERIC)
+
+    def test_vectorized_matches_scalar(self):
+        """컬럼 단위 해석이 값 단위 해석과 동일"""
+        decoded = decode_result_values(MIXED_VALUES)
+        self.assertEqual(decoded.value.dtype, np.float64)
+        self.assertEqual(decoded.status.dtype, np.int8)
+
+        for index, value in enumerate(MIXED_VALUES):
+            number, status, display = decode_result_value(value)
+            if number is None:
+                self.assertTrue(np.isnan(decoded.value[index]), repr(value))
+            else:
+                self.assertEqual(decoded.value[index], number, repr(value))
+            self.assertEqual(decoded.status[index], status, repr(value))
+            self.assertEqual(decoded.display[index], display, repr(value))
+
+        self.assertEqual(len(decode_result_values(pd.Series([], dtype=object))), 0)
+
+    def test_test_result_methods(self):
+        """get_numeric_result / get_display_result는 해석 규칙을 따름"""
+        df = pd.DataFrame({
+            '시료명': ['A', 'B', 'C'],
+            '분석번호': ['1', '2', '3'],
+            '시험항목': ['벤젠'] * 3,
+            '결과(성적서)': ['불검출', '<0.001', 0.0007],
+            '기준대비 초과여부 (성적서)': ['적합', '적합', '부적합'],
+        })
+        results = DataProcessor()._convert_dataframe_to_test_results(df)
+
+        self.assertEqual([r.get_numeric_result() for r in results], [None, None, 0.0007])
+        self.assertEqual([r.get_display_result() for r in results], ['불검출', '<0.001', '0.0007'])
+        self.assertEqual(results[1].get_detection_status(), DetectionStatus.BELOW_LOQ)
+
+        batch = TestResultBatch.from_test_results(results)
+        np.testing.assert_array_equal(batch.detection_status, [1, 2, 0])
+        self.assertEqual(batch.result_display.tolist(), ['불검출', '<0.001', '0.0007'])
+        self.assertEqual(batch[1:].detection_status.tolist(), [2, 0])
+
+
+class TestDecodedConsumers(unittest.TestCase):
+    """해석 배열을 사용하는 소비자 테스트"""
+
+    def setUp(self):
+        df = pd.DataFrame({
+            '시료명': ['냉수', '온수', '냉수', '정수'],
+            '분석번호': ['1', '2', '3', '4'],
+            '시험항목': ['벤젠', '벤젠', '납', '납'],
+            '결과(성적서)': ['불검출', 0.03, '<0.001', 0.02],
+            '기준대비 초과여부 (성적서)': ['적합', '부적합', '부적합', '부적합'],
+            '기준': ['0.01 mg/L 이하'] * 4,
+        })
+        self.batch = DataProcessor().convert_dataframe_to_batch(df)
+
+    def test_serialized_records_carry_decoded_values(self):
+        """직렬화 결과에 result_value / detection_status 포함 (행/배치 경로 동일)"""
+        manager = DatabaseManager.__new__(DatabaseManager)
+        from_batch = manager._serialize_batch(self.batch)
+        from_rows = [manager._serialize_test_result(result) for result in self.batch]
+
+        self.assertEqual([r['result_value'] for r in from_batch], [None, 0.03, None, 0.02])
+        self.assertEqual([r['detection_status'] for r in from_batch], [1, 0, 2, 0])
+        for batch_row, row in zip(from_batch, from_rows):
+            self.assertEqual(batch_row['result_value'], row['result_value'])
+            self.assertEqual(batch_row['detection_status'], row['detection_status'])
+
+    def test_contamination_chart_uses_detected_values(self):
+        """오염수준 차트는 부적합 중 검출된 수치만 사용 (이전 형식 레코드 포함)"""
+        manager = DatabaseManager.__new__(DatabaseManager)
+        records = manager._serialize_batch(self.batch)
+        legacy = [{k: v for k, v in r.items() if k not in ('result_value', 'detection_status')} for r in records]
+
+        engine = IntegratedAnalysisEngine()
+        for rows in (records, legacy):
+            values = engine._result_values([r for r in rows if r['is_non_conforming']])
+            np.testing.assert_array_equal(np.isnan(values), [False, True, False])
+            fig = engine.create_contamination_level_chart([{"test_results": rows}])
+            plotted = sorted(float(v) for trace in fig.data for v in trace.x)
+            self.assertEqual(plotted, [0.02, 0.03])
+
+    def test_excess_ratio_reads_decoded_values(self):
+        """초과 배수는 해석된 수치 사용 (정량한계 미만은 0)"""
+        generator = DocumentGenerator()
+        highlighted = generator.highlight_violations(self.batch)
+        self.assertEqual([item['result_display'] for item in highlighted], ['불검출', '0.03', '<0.001', '0.02'])
+        self.assertAlmostEqual(highlighted[1]['excess_ratio'], 3.0)
+        self.assertEqual(highlighted[2]['excess_ratio'], 0.0)
+        from_list = generator.highlight_violations(list(self.batch))
+        self.assertEqual([item['excess_ratio'] for item in from_list], [item['excess_ratio'] for item in highlighted])
+
+
+if __name__ == '__main__':
+    unittest.main()
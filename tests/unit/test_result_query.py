@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+결과 교차 조회 (시험항목/시험자/시료명/의뢰 기관/기간/부적합 여부, 페이지 조회) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+from src.core.result_query import VALUE_SETS_FIELD
+from src.core.row_shards import RowShardStore
+from lims_fixtures import RESULTS, make_batch
+
+
+# 시료명/시험자가 파일끼리 겹치고 부적합 여부가 파일마다 다르도록 (교차 조회용)
+COLUMNS = {
+    '시료명': lambda offset, i: f'시료_{offset % 4}_{i % 2}',
+    '결과(성적서)': lambda offset, i: f'{offset + 1}' if i == 5 else RESULTS[i],
+    '기준대비 초과여부': lambda offset, i: '부적합' if i == 2 or (i == 4 and offset % 3 == 0) else '적합',
+    '시험자': lambda offset, i: f'시험자_{(offset + i) % 3}',
+}
+
+
+def walk_rows(db, test_item=None, tester=None, sample=None, client=None, period=None, non_conforming=None):
+    """색인 이전 방식 (모든 파일의 모든 행 순회)"""
+    start, end = period or (None, None)
+    found = []
+    for record in db.get_all_files():
+        processed_at = datetime.fromisoformat(record['processed_at'])
+        if (client is not None and record['client'] != client) or (start and processed_at < start) \
+                or (end and processed_at > end):
+            continue
+        for row in record['test_results']:
+            if (test_item is None or row['test_item'] == test_item) \
+                    and (tester is None or row['tester'] == tester) \
+                    and (sample is None or row['sample_name'] == sample) \
+                    and (non_conforming is None or bool(row['is_non_conforming']) == non_conforming):
+                found.append((record['file_id'], row['analysis_number']))
+    return found
+
+
+class TestResultQuery(unittest.TestCase):
+    """query_results / iter_results 테스트"""
+
+    QUERIES = [
+        {},
+        {'test_item': '납', 'non_conforming': True},
+        {'test_item': '벤젠', 'client': '기관_1', 'non_conforming': True},
+        {'tester': '시험자_2', 'non_conforming': False},
+        {'sample': '시료_3_1', 'test_item': '비소'},
+        {'client': '기관_0', 'period': (datetime(2025, 1, 2, 12), datetime(2025, 1, 5))},
+        {'test_item': '납', 'period': (datetime(2025, 1, 4), None)},
+        {'test_item': '수은'},
+        {'tester': '없는 시험자'},
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def fill(self, db, count: int = 12):
+        return db.save_analysis_results([
+            {'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': make_batch(i, columns=COLUMNS),
+             'client': f'기관_{i % 3}',
+             'upload_time': datetime(2025, 1, 1, 9) + timedelta(hours=13 * i)} for i in range(count)
+        ])
+
+    def test_matches_row_walk_on_all_backends(self):
+        """모든 백엔드에서 조건별 결과가 전체 행 순회와 같고, 최신 파일부터 나옴"""
+        for name, options in (('plain.json', {}), ('sharded.json', {'journal': True, 'shards': True}),
+                              ('store.db', {})):
+            db = DatabaseManager(str(self.root / name), **options)
+            self.fill(db)
+            for query in self.QUERIES:
+                with self.subTest(backend=name, query=query):
+                    rows = list(db.iter_results(**query))
+                    self.assertEqual([(row['file_id'], row['analysis_number']) for row in rows],
+                                     walk_rows(db, **query))
+                    self.assertTrue(all(row['file_name'].startswith('시험현황_') for row in rows))
+
+        rows = list(db.iter_results(test_item='납', non_conforming=True))
+        self.assertEqual(len(rows), 12)
+        self.assertTrue(all(row['is_non_conforming'] is True for row in rows))
+        self.assertEqual(rows[0]['processed_at'], max(row['processed_at'] for row in rows))
+
+    def test_pagination(self):
+        """페이지를 이어 붙이면 전체 결과와 같고, 마지막 페이지는 has_more가 False"""
+        for name in ('plain.json', 'store.db'):
+            db = DatabaseManager(str(self.root / name))
+            self.fill(db)
+            expected = list(db.iter_results(test_item='납'))
+            collected, offset = [], 0
+            while offset is not None:
+                page = db.query_results(test_item='납', offset=offset, limit=5)
+                collected.extend(page.rows)
+                offset = page.next_offset
+            with self.subTest(backend=name):
+                self.assertEqual(collected, expected)
+                self.assertEqual(len(collected), 36)
+                self.assertFalse(page.has_more)
+                frame = db.query_results(test_item='납', limit=4).to_frame()
+                self.assertEqual(len(frame), 4)
+                self.assertEqual(set(frame['test_item']), {'납'})
+                self.assertIn('client', frame.columns)
+                self.assertEqual(db.query_results(test_item='수은').rows, [])
+
+    def test_reads_only_candidate_files(self):
+        """JSON 백엔드는 역색인/롤업으로 걸러진 파일의 샤드를 읽지 않음"""
+        db = DatabaseManager(str(self.root / 'sharded.json'), shards=True)
+        self.fill(db)
+        real_read = RowShardStore.read
+        with mock.patch.object(RowShardStore, 'read', autospec=True, side_effect=real_read) as read:
+            rows = list(db.iter_results(tester='시험자_0', client='기관_1'))
+            self.assertTrue(rows)
+            self.assertEqual(read.call_count, 4)
+
+            read.reset_mock()
+            # 벤젠 부적합은 offset % 3 == 0 인 파일에만 있음 (롤업으로 나머지 제외)
+            rows = list(db.iter_results(test_item='벤젠', non_conforming=True))
+            self.assertEqual(len(rows), 4)
+            self.assertEqual(read.call_count, 4)
+
+            read.reset_mock()
+            self.assertEqual(db.query_results(sample='없는 시료').rows, [])
+            self.assertFalse(read.called)
+
+    def test_records_without_value_sets(self):
+        """값 집합 기록 이전 레코드도 후보로 남아 조회되고, 다음 전체 저장 때 채워짐"""
+        path = self.root / 'legacy.json'
+        self.fill(DatabaseManager(str(path)), 4)
+        data = json.loads(path.read_text(encoding='utf-8'))
+        for record in data['files'].values():
+            del record[VALUE_SETS_FIELD]
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+        legacy = DatabaseManager(str(path))
+        self.assertEqual([(row['file_id'], row['analysis_number'])
+                          for row in legacy.iter_results(tester='시험자_1')],
+                         walk_rows(legacy, tester='시험자_1'))
+        legacy.save_analysis_result('신규.xlsx', make_batch(5, columns=COLUMNS), upload_time=datetime(2025, 2, 1))
+        stored = json.loads(path.read_text(encoding='utf-8'))['files'].values()
+        self.assertTrue(all(VALUE_SETS_FIELD in record for record in stored))
+
+    def assert_ordered_index_plans(self, db):
+        """페이지 조회가 조회 순서 인덱스를 따라 읽음 (test_results 전체 스캔/정렬 없음)"""
+        conn = db.store._connect()
+        period = (datetime(2025, 1, 2), datetime(2025, 1, 5))
+        for query, index in (({'test_item': '납', 'non_conforming': True}, 'idx_results_'),
+                             ({'tester': '시험자_1'}, 'idx_results_tester'),
+                             ({'sample': '시료_1_0'}, 'idx_results_sample_name'),
+                             ({'non_conforming': True, 'period': period}, 'idx_results_non_conforming'),
+                             ({'period': period}, 'idx_results_order'),
+                             ({}, 'idx_results_order')):
+            statements = []
+            conn.set_trace_callback(statements.append)
+            db.query_results(**query, limit=5)
+            conn.set_trace_callback(None)
+            plan = ' '.join(str(row) for row in conn.execute(f"EXPLAIN QUERY PLAN {statements[-1]}"))
+            with self.subTest(query=query):
+                self.assertIn(index, plan)
+                self.assertNotIn('SCAN r', plan.replace('SCAN r USING INDEX', ''))
+                self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_sqlite_uses_result_indexes(self):
+        """SQLite 조회는 조회 순서대로 정렬된 결과 행 보조 인덱스를 사용"""
+        db = DatabaseManager(str(self.root / 'store.db'))
+        self.fill(db)
+        self.assert_ordered_index_plans(db)
+        db.store.close()
+
+    def test_sqlite_upgrade_adds_result_order(self):
+        """이전 스키마(행에 처리 시각/순번 없음)를 열면 files에서 채우고, 병합은 행의 처리 시각도 옮김"""
+        db_path = self.root / 'store.db'
+        db = DatabaseManager(str(db_path))
+        file_ids = self.fill(db)
+        db.store.close()
+        with sqlite3.connect(str(db_path)) as conn:
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                                        "AND name LIKE 'idx_results_%'").fetchall():
+                conn.execute(f"DROP INDEX {name}")
+            conn.executescript("ALTER TABLE test_results DROP COLUMN processed_at; "
+                               "ALTER TABLE test_results DROP COLUMN file_seq; "
+                               "CREATE INDEX idx_results_test_item ON test_results(test_item);")
+        shared_cache.clear()
+        upgraded = DatabaseManager(str(db_path))
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                self.assertEqual([(row['file_id'], row['analysis_number']) for row in upgraded.iter_results(**query)],
+                                 walk_rows(upgraded, **query))
+        self.assert_ordered_index_plans(upgraded)
+
+        upgraded.merge_analysis_rows(file_ids[0], make_batch(30, columns=COLUMNS), [None] * 6, ['h'] * 6,
+                                     upload_time=datetime(2025, 3, 1))
+        self.assertEqual(upgraded.query_results(limit=1).rows[0]['file_id'], file_ids[0])
+        self.assertEqual([(row['file_id'], row['analysis_number']) for row in upgraded.iter_results(test_item='납')],
+                         walk_rows(upgraded, test_item='납'))
+        upgraded.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
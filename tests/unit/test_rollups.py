@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+기간 분석 일별 롤업 (저장/병합/삭제 시 갱신, 기간 조회는 일별 버킷 합산) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+from src.core.integrated_analysis_engine import IntegratedAnalysisEngine
+from src.core.row_shards import RowShardStore
+from src.core.rollups import ROLLUP_FIELD
+from lims_fixtures import RESULTS, make_batch
+
+
+# 수치 결과와 부적합 여부가 파일마다 다르도록 (롤업 합산 비교용)
+COLUMNS = {
+    '결과(성적서)': lambda offset, i: (f'{0.01 * (offset + 1):.3f}' if i == 0
+                                   else f'{offset + 1}' if i == 5 else RESULTS[i]),
+    '기준대비 초과여부': lambda offset, i: '부적합' if i == 2 or (i == 5 and offset % 2) else '적합',
+}
+
+
+def walk_rows(files):
+    """롤업 이전 방식 (기간 내 모든 행을 직접 집계)"""
+    conforming, violations, clients, monthly = {}, {}, {}, {}
+    for record in files:
+        clients[record['client']] = clients.get(record['client'], 0) + 1
+        month = monthly.setdefault(record['processed_at'][:7], {'files': 0, 'tests': 0, 'violations': 0})
+        month['files'] += 1
+        month['tests'] += record['summary']['total_items']
+        month['violations'] += record['summary']['fail_items']
+        for row in record['test_results']:
+            target = violations if row['is_non_conforming'] else conforming
+            target[row['test_item']] = target.get(row['test_item'], 0) + 1
+    return conforming, violations, clients, monthly
+
+
+class TestRollups(unittest.TestCase):
+    """일별 롤업 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.start = datetime(2025, 1, 1, 9)
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def fill(self, db, count: int = 12):
+        return db.save_analysis_results([
+            {'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': make_batch(i, columns=COLUMNS),
+             'client': f'기관_{i % 3}',
+             'upload_time': self.start + timedelta(hours=13 * i)} for i in range(count)
+        ])
+
+    def assert_matches_rows(self, db, start, end):
+        analysis = db.get_integrated_analysis_data(start, end)
+        files = db.get_files_by_period(start, end)
+        conforming, violations, clients, monthly = walk_rows(files)
+        self.assertEqual(analysis.get('total_files', 0), len(files))
+        if not files:
+            return
+        self.assertEqual(analysis['conforming_items'], conforming)
+        self.assertEqual(analysis['non_conforming_items'], violations)
+        self.assertEqual(dict(analysis['top_clients']), dict(sorted(clients.items(), key=lambda x: -x[1])[:3]))
+        self.assertEqual(analysis['monthly_stats'], monthly)
+        self.assertEqual(analysis['total_tests'], sum(month['tests'] for month in monthly.values()))
+
+    def test_period_queries_match_row_walk(self):
+        """모든 백엔드에서 기간 집계가 행을 직접 센 결과와 같음 (하루 중간 경계 포함)"""
+        periods = [
+            (datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59, 999999)),
+            (datetime(2025, 1, 2, 12), datetime(2025, 1, 5, 20)),
+            (datetime(2025, 1, 3, 10, 30), datetime(2025, 1, 3, 23)),
+            (datetime(2025, 1, 4), datetime(2025, 1, 6)),
+            (datetime(2024, 1, 1), datetime(2024, 12, 31)),
+        ]
+        for name, options in (('plain.json', {}), ('journal.json', {'journal': True, 'shards': True}),
+                              ('store.db', {})):
+            db = DatabaseManager(str(self.root / name), **options)
+            self.fill(db)
+            for start, end in periods:
+                with self.subTest(backend=name, start=start, end=end):
+                    self.assert_matches_rows(db, start, end)
+
+        item_stats = db.get_period_rollup(*periods[0])['item_stats']
+        self.assertEqual(item_stats['벤젠']['numeric_count'], 0)
+        self.assertEqual(item_stats['납']['max'], 12.0)
+        self.assertAlmostEqual(item_stats['납']['min'], 0.01)
+
+    def test_integrated_charts_read_violation_rows_only(self):
+        """통합 분석은 행 없는 요약과 부적합 행만 읽고, 차트는 전체 행으로 그린 것과 같음"""
+        sharded = DatabaseManager(str(self.root / 'sharded.json'), shards=True)
+        self.fill(sharded, 6)
+        clean = sharded.save_analysis_result('적합.xlsx', make_batch(30, columns={'기준대비 초과여부': ['적합']}),
+                                             upload_time=self.start)
+        engine = IntegratedAnalysisEngine()
+        engine.set_db_manager(sharded)
+        period = (datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59))
+        shard_reads = []
+        read = RowShardStore.read
+        with mock.patch.object(RowShardStore, 'read', autospec=True,
+                               side_effect=lambda store, file_id: shard_reads.append(file_id) or read(store, file_id)):
+            analysis = engine.analyze_period(*period)
+        self.assertTrue(all('test_results' not in record for record in analysis['files']))
+        self.assertNotIn(clean, shard_reads)
+        self.assertEqual(len(analysis['violation_rows']), analysis['total_violations'])
+
+        files = sharded.get_files_by_period(*period)
+        for chart in (engine.create_contamination_level_chart, engine.create_file_trend_chart):
+            with self.subTest(chart=chart.__name__):
+                expected = chart(files)
+                actual = chart(analysis['files'], analysis['violation_rows'])
+                self.assertEqual([(trace.x, trace.y) for trace in actual.data],
+                                 [(trace.x, trace.y) for trace in expected.data])
+
+    def test_year_query_does_not_read_rows(self):
+        """기간 집계는 행(샤드, test_results 테이블)을 읽지 않음"""
+        sharded = DatabaseManager(str(self.root / 'sharded.json'), shards=True)
+        self.fill(sharded)
+        with mock.patch.object(RowShardStore, 'read') as read:
+            rollup = sharded.get_period_rollup(datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59))
+        self.assertFalse(read.called)
+        self.assertEqual(rollup['total_files'], 12)
+
+        store = DatabaseManager(str(self.root / 'store.db'))
+        self.fill(store)
+        statements = []
+        store.store._connect().set_trace_callback(statements.append)
+        store.get_period_rollup(datetime(2025, 1, 1), datetime(2025, 12, 31, 23, 59, 59))
+        self.assertFalse(any('test_results' in statement for statement in statements))
+
+    def test_merge_and_delete_update_rollups(self):
+        """증분 병합과 삭제가 일별 버킷에 반영됨"""
+        period = (datetime(2025, 1, 1), datetime(2025, 1, 31))
+        for name in ('plain.json', 'store.db'):
+            db = DatabaseManager(str(self.root / name))
+            file_ids = self.fill(db, 4)
+            db.merge_analysis_rows(file_ids[0], make_batch(7, columns=COLUMNS), [None] * 6, ['h'] * 6,
+                                   upload_time=datetime(2025, 1, 20, 8))
+            self.assertTrue(db.delete_analysis_result(file_ids[1]))
+            with self.subTest(backend=name):
+                self.assert_matches_rows(db, *period)
+                self.assertEqual(db.get_period_rollup(datetime(2025, 1, 20), datetime(2025, 1, 20, 23))
+                                 ['conforming_items'], {'납': 3, '벤젠': 4, '비소': 2})
+
+        # 일별 버킷 테이블도 파일별 롤업에서 다시 합산한 값과 같음
+        conn = db.store._connect()
+        self.assertEqual(conn.execute("SELECT SUM(files) FROM daily_file_rollups").fetchone()[0], 3)
+        self.assertEqual(conn.execute("SELECT SUM(total) FROM daily_item_rollups").fetchone()[0], 24)
+
+    def test_backfills_records_without_rollups(self):
+        """롤업 기록 이전의 JSON 레코드와 스키마 1 SQLite 데이터베이스도 집계됨"""
+        json_path = self.root / 'legacy.json'
+        self.fill(DatabaseManager(str(json_path)), 3)
+        data = json.loads(json_path.read_text(encoding='utf-8'))
+        for record in data['files'].values():
+            del record[ROLLUP_FIELD]
+        json_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        legacy = DatabaseManager(str(json_path))
+        self.assert_matches_rows(legacy, datetime(2025, 1, 1), datetime(2025, 1, 31))
+        legacy.save_analysis_result('신규.xlsx', make_batch(5, columns=COLUMNS), upload_time=datetime(2025, 1, 9))
+        stored = json.loads(json_path.read_text(encoding='utf-8'))['files'].values()
+        self.assertTrue(all(ROLLUP_FIELD in record for record in stored))
+
+        db_path = self.root / 'v1.db'
+        self.fill(DatabaseManager(str(db_path)), 3)
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.executescript("DROP TABLE file_rollups; DROP TABLE daily_file_rollups; "
+                               "DROP TABLE daily_item_rollups;")
+        upgraded = DatabaseManager(str(db_path))
+        self.assert_matches_rows(upgraded, datetime(2025, 1, 1), datetime(2025, 1, 31))
+        upgraded.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
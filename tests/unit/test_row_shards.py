@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+요약 인덱스와 파일별 행 샤드 분리 (목록/기간 조회는 인덱스만, 행은 필요할 때만 로드) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager, open_database
+from src.core.incremental_ingest import IncrementalIngestor
+from src.core.row_shards import RowShardStore
+from lims_fixtures import make_export
+
+
+ROWS = [
+    ('25A00009-001', '벤젠', '불검출', '적합'),
+    ('25A00009-001', '납', '0.02', '부적합'),
+    ('25A00010-001', '납', '0.001', '적합'),
+]
+
+
+class TestRowShards(unittest.TestCase):
+    """행 샤드 모드 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.processor = DataProcessor()
+        self.batch = self.processor.convert_dataframe_to_batch(make_export(ROWS))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_index_holds_summaries_only(self):
+        """JSON 인덱스에는 요약만, 행은 file_id별 압축 샤드에 저장"""
+        for journal in (False, True):
+            db_path = self.root / f'db_{journal}.json'
+            db = DatabaseManager(str(db_path), journal=journal, shards=True)
+            file_ids = db.save_analysis_results([
+                {'file_name': f'시험현황_{i}.xlsx', 'test_results': self.batch, 'client': f'기관_{i % 2}',
+                 'upload_time': datetime(2025, 1, 10 + i)} for i in range(3)
+            ])
+            db.compact_journal()
+
+            index = json.loads(db_path.read_text(encoding='utf-8'))['files']
+            self.assertTrue(all('test_results' not in record for record in index.values()))
+            self.assertEqual(len(list(db.row_shards.folder.glob('*.json.gz'))), 3)
+
+            with mock.patch.object(RowShardStore, 'read', wraps=db.row_shards.read) as read:
+                listed = db.get_all_files(include_results=False)
+                period = db.get_files_by_period(datetime(2025, 1, 11), datetime(2025, 1, 31),
+                                                include_results=False)
+                stats = db.get_client_statistics(datetime(2025, 1, 1), datetime(2025, 1, 31))
+                self.assertFalse(read.called)
+                self.assertEqual(len(db.get_file_rows(file_ids[0])), 3)
+                self.assertEqual(read.call_count, 1)
+
+            self.assertEqual([record['file_id'] for record in listed], file_ids[::-1])
+            self.assertTrue(all('test_results' not in record and 'shard' not in record for record in listed))
+            self.assertEqual(len(period), 2)
+            self.assertEqual(sum(row['total_tests'] for row in stats), 9)
+
+            full = db.get_all_files()
+            self.assertEqual([len(record['test_results']) for record in full], [3, 3, 3])
+            self.assertTrue(db.delete_analysis_result(file_ids[0]))
+            self.assertFalse(db.row_shards.path(file_ids[0]).exists())
+
+    def test_reads_legacy_inline_records(self):
+        """행이 인덱스에 들어 있던 기존 레코드도 같은 방식으로 조회, 다음 저장 때 샤드로 이동"""
+        db_path = self.root / 'analysis_database.json'
+        legacy_id = DatabaseManager(str(db_path)).save_analysis_result('기존.xlsx', self.batch)
+
+        db = DatabaseManager(str(db_path), shards=True)
+        self.assertNotIn('test_results', db.get_all_files(include_results=False)[0])
+        self.assertEqual(len(db.get_file_by_id(legacy_id)['test_results']), 3)
+
+        db.save_analysis_result('신규.xlsx', self.batch)
+        index = json.loads(db_path.read_text(encoding='utf-8'))['files']
+        self.assertTrue(all('test_results' not in record for record in index.values()))
+        self.assertEqual(len(db.get_file_rows(legacy_id)), 3)
+
+    def test_incremental_merge_and_sqlite_migration(self):
+        """증분 병합은 샤드를 다시 쓰고, SQLite 이전은 샤드 행까지 옮김"""
+        db = open_database(self.root, backend='journal')
+        ingestor = IncrementalIngestor(self.processor, db)
+        first = ingestor.ingest(make_export(ROWS), '누적_0123.xlsx', upload_time=datetime(2025, 1, 23, 9))
+        changed = list(ROWS) + [('25A00010-002', '벤젠', '불검출', '적합')]
+        second = ingestor.ingest(make_export(changed), '누적_0124.xlsx', upload_time=datetime(2025, 1, 24, 9))
+        self.assertEqual((second.base_file_id, second.inserted, second.unchanged), (first.file_id, 1, 3))
+
+        record = db.get_file_by_id(first.file_id)
+        self.assertEqual((len(record['test_results']), len(record['row_hashes'])), (4, 4))
+        self.assertNotIn('row_hashes', db.get_all_files(include_results=False)[0])
+
+        migrated = open_database(self.root, backend='sqlite')
+        self.assertEqual(len(migrated.get_file_rows(first.file_id)), 4)
+        self.assertNotIn('test_results', migrated.get_all_files(include_results=False)[0])
+        migrated.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
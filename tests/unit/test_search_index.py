@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+전체 이력 부분 문자열 검색 인덱스 (FTS5 trigram, 저장/병합/삭제 시 증분 갱신) 테스트
+"""
+
+import unittest
+import sys
+import os
+import json
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+from src.core.search_index import SEARCH_FIELDS
+from lims_fixtures import make_batch
+
+
+# 영문 대소문자, LIKE 특수문자(%, _), 긴 항목명이 섞이도록 (부분 문자열 검색용)
+COLUMNS = {
+    '시료명': lambda offset, i: f'Sample_{offset}_{i}' if i % 2 else f'먹는물%{offset}',
+    '시험항목': ['납', '벤젠', '아크릴로나이트릴', '비소', '벤젠'],
+    '시험자': lambda offset, i: '김화빈' if (offset + i) % 2 else 'Lee',
+}
+
+
+def scan(db, term):
+    """색인 이전 방식 (모든 파일의 모든 행에서 네 필드를 소문자로 비교)"""
+    term = term.strip().lower()
+    return sorted((record['file_id'], row['analysis_number']) for record in db.get_all_files()
+                  for row in record['test_results']
+                  if any(term in str(row[name]).lower() for name in SEARCH_FIELDS))
+
+
+def hits(db, term):
+    return sorted((row['file_id'], row['analysis_number']) for row in db.search_results(term, limit=1000).rows)
+
+
+class TestSearchIndex(unittest.TestCase):
+    """search_results 테스트"""
+
+    TERMS = ['납', '벤젠', '로나이', 'sample_1', 'SAMPLE', '25a003', '-001', '%3', '_', '김화', 'lee',
+             '물%1', '없는 검색어', '비소\n김']
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def fill(self, db, count: int = 8):
+        return db.save_analysis_results([
+            {'file_name': f'시험현황_{i:02d}.xlsx', 'test_results': make_batch(i, rows=5, columns=COLUMNS),
+             'client': f'기관_{i % 3}',
+             'upload_time': datetime(2025, 1, 1, 9) + timedelta(hours=13 * i)} for i in range(count)
+        ])
+
+    def test_matches_scan_on_all_backends(self):
+        """모든 백엔드에서 검색 결과가 네 필드 전체 순회와 같음 (대소문자 무시, %/_는 문자 그대로)"""
+        for name, options in (('plain.json', {}), ('sharded.json', {'journal': True, 'shards': True}),
+                              ('store.db', {})):
+            db = DatabaseManager(str(self.root / name), **options)
+            self.fill(db)
+            for term in self.TERMS:
+                with self.subTest(backend=name, term=term):
+                    self.assertEqual(hits(db, term), scan(db, term))
+
+            page = db.search_results('벤젠', limit=3)
+            self.assertEqual(len(page.rows), 3)
+            self.assertTrue(page.has_more)
+            self.assertEqual(page.rows[0]['file_name'], '시험현황_07.xlsx')
+            self.assertEqual(db.search_results('  ').rows, [])
+
+    def test_incremental_updates(self):
+        """저장/병합/삭제가 검색 인덱스에 바로 반영되고 삭제된 파일의 문서가 남지 않음"""
+        for name in ('plain.json', 'store.db'):
+            db = DatabaseManager(str(self.root / name))
+            file_ids = self.fill(db, 3)
+            added = db.save_analysis_result('추가.xlsx', make_batch(42, rows=5, columns=COLUMNS),
+                                            upload_time=datetime(2025, 2, 1))
+            db.merge_analysis_rows(file_ids[0], make_batch(77, rows=5, columns=COLUMNS), [None, 1, None, None, None],
+                                   ['h'] * 5, upload_time=datetime(2025, 2, 2))
+            self.assertTrue(db.delete_analysis_result(file_ids[1]))
+            with self.subTest(backend=name):
+                for term in ('25a042', '25a077', '25a001', 'sample_0', '김화빈'):
+                    self.assertEqual(hits(db, term), scan(db, term))
+                self.assertEqual({row['file_id'] for row in db.search_results('25a077').rows}, {file_ids[0]})
+                self.assertEqual(db.search_results('25a042').rows[0]['file_id'], added)
+
+            conn = db.store._connect() if db.store is not None else db.search_index._connect()
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM search_rows WHERE file_id = ?",
+                                          (file_ids[1],)).fetchone()[0], 0)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM search_rows").fetchone()[0],
+                             conn.execute("SELECT COUNT(*) FROM search_text").fetchone()[0])
+
+    def test_json_index_catches_up(self):
+        """인덱스 없이 쓰인 JSON 데이터베이스는 다음 검색 때 바뀐 파일만 색인"""
+        path = self.root / 'analysis_database.json'
+        db = DatabaseManager(str(path))
+        self.fill(db, 4)
+        db.search_index.close()
+        db.search_index.path.unlink()
+        for suffix in ('-wal', '-shm'):
+            Path(str(db.search_index.path) + suffix).unlink(missing_ok=True)
+
+        # 다른 프로세스가 쓴 것처럼 JSON만 바꿈 (파일 하나 삭제)
+        data = json.loads(path.read_text(encoding='utf-8'))
+        removed = next(iter(data['files']))
+        del data['files'][removed]
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+
+        fresh = DatabaseManager(str(path))
+        self.assertEqual(hits(fresh, '-001'), scan(fresh, '-001'))
+        self.assertEqual(len(hits(fresh, '-001')), 15)
+        self.assertEqual(fresh.search_index.sync(fresh.load_database()['files'], fresh.row_shards.hydrate), 0)
+
+    def test_sqlite_upgrade_and_index_use(self):
+        """스키마 2 SQLite 데이터베이스는 열 때 검색 인덱스를 채우고, 검색은 trigram 인덱스를 사용"""
+        db_path = self.root / 'v2.db'
+        self.fill(DatabaseManager(str(db_path)), 3)
+        with sqlite3.connect(str(db_path)) as conn:
+            conn.executescript("DROP TABLE search_rows; DROP TABLE search_text;")
+        upgraded = DatabaseManager(str(db_path))
+        self.assertEqual(hits(upgraded, '벤젠'), scan(upgraded, '벤젠'))
+        self.assertEqual(len(hits(upgraded, '벤젠')), 6)
+
+        conn = upgraded.store._connect()
+        plan = ' '.join(str(row) for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT rowid FROM search_text WHERE text LIKE '%로나이%'"))
+        self.assertIn('VIRTUAL TABLE INDEX', plan)
+        upgraded.store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DatabaseManager SQLite 백엔드 (정규화 테이블, 인덱스, WAL, JSON 일회 이전) 테스트
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager, open_database
+from src.core.incremental_ingest import IncrementalIngestor
+from lims_fixtures import make_export
+
+
+def without_input_time(record):
+    """입력일시가 없는 행은 저장 시각으로 채워지므로 비교에서 제외"""
+    return dict(record, test_results=[{k: v for k, v in row.items() if k != 'input_datetime'}
+                                      for row in record['test_results']])
+
+
+ROWS = [
+    ('25A00009-001', '벤젠', '불검출', '적합'),
+    ('25A00009-001', '납', '0.02', '부적합'),
+    ('25A00010-001', '납', '0.001', '적합'),
+]
+
+
+class TestSQLiteBackend(unittest.TestCase):
+    """SQLite 백엔드 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.processor = DataProcessor()
+        self.batch = self.processor.convert_dataframe_to_batch(make_export(ROWS))
+        self.json_db = DatabaseManager(str(self.root / 'db.json'))
+        self.sqlite_db = DatabaseManager(str(self.root / 'db.sqlite'))
+
+    def tearDown(self):
+        self.sqlite_db.store.close()
+        self.temp_dir.cleanup()
+
+    def test_same_records_as_json(self):
+        """같은 입력은 JSON 백엔드와 같은 파일 레코드로 저장/조회"""
+        self.assertEqual((self.json_db.backend, self.sqlite_db.backend), ('json', 'sqlite'))
+        upload_time = datetime(2025, 1, 23, 9)
+        json_id = self.json_db.save_analysis_result('시험현황.xlsx', self.batch, '수질팀', upload_time=upload_time)
+        sqlite_id = self.sqlite_db.save_analysis_result('시험현황.xlsx', self.batch, '수질팀',
+                                                        upload_time=upload_time)
+
+        expected = without_input_time(dict(self.json_db.get_file_by_id(json_id), file_id=sqlite_id))
+        self.assertEqual(without_input_time(self.sqlite_db.get_file_by_id(sqlite_id)), expected)
+        self.assertEqual(list(self.sqlite_db.load_database()['files']), [sqlite_id])
+
+        period = (datetime(2025, 1, 1), datetime(2025, 1, 31))
+        self.assertEqual(len(self.sqlite_db.get_files_by_period(*period)), 1)
+        self.assertEqual(self.sqlite_db.get_files_by_period(datetime(2025, 2, 1), datetime(2025, 2, 28)), [])
+        json_stats = self.json_db.get_integrated_analysis_data(*period)
+        sqlite_stats = self.sqlite_db.get_integrated_analysis_data(*period)
+        for key in ('total_tests', 'total_violations', 'non_conforming_items', 'conforming_items'):
+            self.assertEqual(sqlite_stats[key], json_stats[key], key)
+
+        self.assertTrue(self.sqlite_db.delete_analysis_result(sqlite_id))
+        self.assertEqual(self.sqlite_db.get_all_files(), [])
+        conn = self.sqlite_db.store._connect()
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM test_results").fetchone()[0], 0)
+
+    def test_schema_indexes_and_wal(self):
+        """정규화 테이블 인덱스와 WAL 모드"""
+        conn = sqlite3.connect(str(self.root / 'db.sqlite'))
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+        indexes = {row[0]: row[1] for row in conn.execute(
+            "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'")}
+        for name in ('idx_files_processed_at', 'idx_files_client', 'idx_results_order', 'idx_results_test_item',
+                     'idx_results_sample_name', 'idx_results_tester', 'idx_results_non_conforming'):
+            self.assertIn(name, indexes)
+        plan = ' '.join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM test_results WHERE is_non_conforming = 1 AND test_item = '납'"))
+        self.assertIn('idx_results_non_conforming', plan)
+        conn.close()
+
+    def test_incremental_merge(self):
+        """증분 병합은 같은 레코드의 바뀐 행만 갱신"""
+        ingestor = IncrementalIngestor(self.processor, self.sqlite_db)
+        first = ingestor.ingest(make_export(ROWS), '누적_0123.xlsx', upload_time=datetime(2025, 1, 23, 9))
+        changed = list(ROWS) + [('25A00010-002', '벤젠', '불검출', '적합')]
+        changed[0] = ('25A00009-001', '벤젠', '0.5', '부적합')
+        second = ingestor.ingest(make_export(changed), '누적_0124.xlsx', upload_time=datetime(2025, 1, 24, 9))
+
+        self.assertEqual(second.base_file_id, first.file_id)
+        self.assertEqual((second.inserted, second.updated, second.unchanged), (1, 1, 2))
+        record = self.sqlite_db.get_file_by_id(first.file_id)
+        self.assertEqual(len(record['test_results']), 4)
+        self.assertEqual(record['summary']['fail_items'], 2)
+        self.assertEqual(record['analysis_prefixes'], ['25A00009', '25A00010'])
+        self.assertEqual(len(record['ingest_history']), 1)
+
+    def test_json_migration_once(self):
+        """폴더의 JSON 데이터베이스는 처음 열 때 한 번만 이전"""
+        legacy = DatabaseManager(str(self.root / 'analysis_database.json'))
+        file_ids = legacy.save_analysis_results([
+            {'file_name': f'시험현황_{i}.xlsx', 'test_results': self.batch, 'client': '수질팀'} for i in range(3)
+        ])
+
+        migrated = open_database(self.root, backend='sqlite')
+        self.assertEqual(sorted(migrated.load_database()['files']), sorted(file_ids))
+        self.assertEqual(migrated.get_file_by_id(file_ids[0]), legacy.get_file_by_id(file_ids[0]))
+
+        migrated.delete_file(file_ids[0])
+        self.assertEqual(migrated.migrate_from_json(self.root / 'analysis_database.json'), 0)
+        self.assertEqual(len(open_database(self.root, backend='sqlite').get_all_files()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+스트리밍 엑셀 리더 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from src.utils.performance_optimizer import ChunkedDataProcessor, iter_excel_chunks, estimate_excel_rows
+from src.core.data_processor import DataProcessor
+
+
+class TestStreamingExcelReader(unittest.TestCase):
+    """iter_excel_chunks / process_file_chunks 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'sample.xlsx')
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['No.', '시료명', '시험항목', '결과(성적서)', '시험자', None, '시험자'])
+        for i in range(1, 12):
+            result = 'NaN' if i == 3 else f'0.00{i}'
+            sheet.append([i, f'시료_{i}', '벤젠', result, '김화빈', None, '이현풍'])
+        sheet.append([None] * 7)  # 빈 행은 건너뜀
+        sheet.append([12, '시료_12', '톨루엔', '불검출', '이현풍'])  # 짧은 행은 None으로 채움
+        workbook.save(self.file_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunks_match_read_excel(self):
+        """청크를 이어 붙이면 read_excel 결과와 동일"""
+        chunks = list(iter_excel_chunks(self.file_path, chunk_size=5))
+        self.assertEqual([len(chunk) for chunk in chunks], [5, 5, 2])
+        self.assertEqual(chunks[1].index[0], 5)
+
+        streamed = pd.concat(chunks)
+        expected = pd.read_excel(self.file_path).dropna(how='all').reset_index(drop=True)
+        self.assertEqual(list(streamed.columns), list(expected.columns))
+        self.assertEqual(list(streamed.columns)[5:], ['Unnamed: 5', '시험자.1'])
+        self.assertTrue(pd.isna(streamed['결과(성적서)'].iloc[2]))
+        self.assertEqual(streamed['시료명'].tolist(), expected['시료명'].tolist())
+
+    def test_estimate_rows(self):
+        """시트 크기 정보 기반 행 수 추정"""
+        self.assertEqual(estimate_excel_rows(self.file_path), 13)
+        self.assertIsNone(estimate_excel_rows(os.path.join(self.temp_dir.name, 'missing.xlsx')))
+
+    def test_process_file_chunks_reports_progress(self):
+        """청크 파이프라인 결과 및 진행 보고"""
+        progress = []
+        processor = DataProcessor()
+        results = ChunkedDataProcessor(chunk_size=4).process_file_chunks(
+            self.file_path,
+            processor._convert_dataframe_to_test_results,
+            lambda results_list: [r for results in results_list for r in results],
+            progress_callback=lambda rows, total, rate: progress.append(rows)
+        )
+        self.assertEqual(len(results), 12)
+        self.assertEqual(progress, [4, 8, 12])
+        self.assertEqual(results[-1].test_item, '톨루엔')
+        self.assertEqual(results[2].result_report, '')
+
+    def test_invalid_chunk_size(self):
+        """청크 크기 검증"""
+        with self.assertRaises(ValueError):
+            list(iter_excel_chunks(self.file_path, chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+처리 시각 정렬 인덱스 (기간 조회 이진 탐색) 테스트
+"""
+
+import unittest
+import sys
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+from src.core.time_index import TimeIndex
+
+
+def scan_period(records, start, end):
+    """인덱스 이전 방식 (전체 순회 후 정렬)"""
+    filtered = [record for record in records
+                if start <= datetime.fromisoformat(record['processed_at']) <= end]
+    return [record['file_id'] for record in sorted(filtered, key=lambda x: x['processed_at'], reverse=True)]
+
+
+class TestTimeIndex(unittest.TestCase):
+    """TimeIndex / get_files_by_period 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def test_range_matches_scan(self):
+        """경계 포함, 같은 처리 시각의 순서까지 전체 순회 결과와 같음"""
+        rng = random.Random(7)
+        base = datetime(2025, 1, 1)
+        records = [{'file_id': f'f{i:03d}',
+                    'processed_at': (base + timedelta(hours=rng.randrange(0, 24 * 60, 6))).isoformat()}
+                   for i in range(300)]
+        index = TimeIndex(records)
+        self.assertEqual(len(index), 300)
+
+        for _ in range(50):
+            start = base + timedelta(hours=rng.randrange(-48, 24 * 62, 3))
+            end = start + timedelta(hours=rng.randrange(0, 24 * 20, 6))
+            self.assertEqual(index.range(start, end), scan_period(records, start, end))
+        self.assertEqual(index.range(base + timedelta(days=90), base + timedelta(days=99)), [])
+
+    def test_built_once_per_database_version(self):
+        """반복 기간 조회는 인덱스를 다시 만들지 않고, 저장/삭제 후에는 새 내용으로 다시 만듦"""
+        db = DatabaseManager(str(Path(self.temp_dir.name) / 'analysis_database.json'))
+        file_ids = [db.save_analysis_result(f'{i}.xlsx', [], upload_time=datetime(2025, 1, 1 + i))
+                    for i in range(5)]
+        week = (datetime(2025, 1, 1), datetime(2025, 1, 7))
+
+        with mock.patch('src.core.database_manager.TimeIndex', wraps=TimeIndex) as build:
+            for _ in range(3):
+                self.assertEqual([record['file_id'] for record in db.get_files_by_period(*week)],
+                                 file_ids[::-1])
+            self.assertEqual(build.call_count, 1)
+
+            db.delete_analysis_result(file_ids[2])
+            added = db.save_analysis_result('new.xlsx', [], upload_time=datetime(2025, 1, 3, 12))
+            self.assertEqual([record['file_id'] for record in db.get_files_by_period(*week)],
+                             [file_ids[4], file_ids[3], added, file_ids[1], file_ids[0]])
+            self.assertEqual(build.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+업로드 세션 (워크북 1회 디코딩 후 검증/처리/저장 공유) 테스트
+"""
+
+import unittest
+import sys
+import os
+import io
+import tempfile
+from pathlib import Path
+from unittest import mock
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+from src.core.database_manager import DatabaseManager
+from src.utils.header_schema_cache import header_schema_cache
+from src.utils.upload_session import UploadSession
+from src.utils.validation import IntegratedValidator
+
+
+def make_excel_bytes(rows: int = 20) -> bytes:
+    df = pd.DataFrame({
+        '시료명': [f'시료_{i}' for i in range(rows)],
+        '분석번호': [f'25A{i:05d}' for i in range(rows)],
+        '시험항목': ['벤젠', '납'] * (rows // 2),
+        '시험단위': ['mg/L'] * rows,
+        '결과(성적서)': ['불검출', 0.02] * (rows // 2),
+        '기준대비 초과여부': ['적합', '부적합'] * (rows // 2),
+        '시험자': ['김화빈'] * rows,
+        '기준': ['0.01 mg/L 이하'] * rows,
+    })
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+class TestUploadSession(unittest.TestCase):
+    """UploadSession 테스트"""
+
+    def setUp(self):
+        header_schema_cache.clear()
+        self.content = make_excel_bytes()
+
+    def test_frame_decoded_once(self):
+        """frame/header/preview는 한 번만 디코딩"""
+        session = UploadSession(self.content, 'sample.xlsx')
+        self.assertFalse(session.is_loaded)
+        self.assertEqual(len(session.frame), 20)
+        self.assertEqual(session.header[0], '시료명')
+        self.assertEqual(len(session.preview(5)), 5)
+        self.assertEqual(session.read_count, 1)
+        self.assertEqual(session.size, len(self.content))
+        self.assertIs(UploadSession.from_uploaded_file(session), session)
+
+    def test_read_error_remembered(self):
+        """손상 파일은 실패도 기억하여 다시 디코딩하지 않음"""
+        session = UploadSession(b'not an excel file', 'broken.xlsx')
+        with self.assertRaises(Exception):
+            session.frame
+        with self.assertRaises(Exception):
+            session.frame
+        self.assertEqual(session.read_count, 1)
+
+    def test_pipeline_reads_workbook_once(self):
+        """검증 → 처리 → 저장 전체에서 pd.read_excel 1회"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_manager = DatabaseManager(str(Path(temp_dir) / 'db.json'))
+            with mock.patch('pandas.read_excel', wraps=pd.read_excel) as read_excel:
+                validation = IntegratedValidator("strict").validate_uploaded_file(
+                    'sample.xlsx', UploadSession(self.content, 'sample.xlsx')
+                )
+                session = validation['upload_session']
+                test_results = DataProcessor().parse_upload(session)
+                file_id = db_manager.save_analysis_result(session.name, test_results, upload_session=session)
+                session.save_to(Path(temp_dir) / 'processed' / session.name)
+
+            self.assertEqual(read_excel.call_count, 1)
+            self.assertTrue(validation['can_proceed'])
+            self.assertEqual(len(test_results), 20)
+
+            record = db_manager.load_database()['files'][file_id]
+            self.assertEqual(record['source']['size'], len(self.content))
+            self.assertEqual(record['source']['sha256'], session.sha256)
+            self.assertEqual((Path(temp_dir) / 'processed' / 'sample.xlsx').read_bytes(), self.content)
+
+    def test_parse_excel_bytes_unchanged(self):
+        """기존 parse_excel_bytes는 세션 경로와 같은 결과"""
+        processor = DataProcessor()
+        from_bytes = processor.parse_excel_bytes(self.content, 'sample.xlsx', as_batch=True)
+        from_session = processor.parse_upload(UploadSession(self.content, 'sample.xlsx'), as_batch=True)
+        pd.testing.assert_frame_equal(from_bytes.to_dataframe(), from_session.to_dataframe())
+
+
+if __name__ == '__main__':
+    unittest.main()
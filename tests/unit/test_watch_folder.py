@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+감시 폴더 수집 서비스 (제한된 작업 큐 + 워커, processed/failed 이동, 메트릭) 테스트
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.database_manager import DatabaseManager
+from src.core.watch_folder import WatchFolderService
+from src.utils.metrics import MetricsRegistry
+
+
+def write_export(path: Path, index: int) -> None:
+    pd.DataFrame({
+        '시료명': [f'시료_{index}', f'시료_{index}'],
+        '분석번호': [f'25A0000{index}-001', f'25A0000{index}-002'],
+        '시험항목': ['벤젠', '톨루엔'],
+        '결과(성적서)': ['불검출', '0.5'],
+        '기준대비 초과여부 (성적서)': ['적합', '부적합'],
+        '시험자': ['김화빈', '이현풍'],
+    }).to_excel(path, index=False)
+
+
+class TestWatchFolderService(unittest.TestCase):
+    """WatchFolderService 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.pending = root / 'uploads' / 'pending'
+        self.processed = root / 'processed'
+        self.pending.mkdir(parents=True)
+        self.db = DatabaseManager(str(root / 'db.json'))
+        self.metrics = MetricsRegistry()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_service(self, **kwargs) -> WatchFolderService:
+        return WatchFolderService(self.pending, self.processed, self.db, interval=0.01,
+                                  metrics=self.metrics, **kwargs)
+
+    def test_queue_only_stable_files(self):
+        """처음 본 파일은 다음 확인에서 크기가 같을 때만 큐에 넣고, 큐가 차면 폴더에 남김"""
+        for i in range(3):
+            write_export(self.pending / f'시험현황_{i}.xlsx', i)
+        (self.pending / '~$시험현황_0.xlsx').write_bytes(b'lock')
+        service = self.make_service(queue_size=2)
+
+        self.assertEqual(service.poll(), 0)
+        self.assertEqual(service.poll(), 2)
+        stats = service.stats()
+        self.assertEqual((stats['queue_depth'], stats['queue_full']), (2, 1))
+        self.assertEqual(self.metrics.get_metrics_dict()['gauges']['watch_folder_queue_depth'], 2)
+        # 이미 큐에 있는 파일은 다시 넣지 않음
+        self.assertEqual(service.poll(), 0)
+
+    def test_backpressure_keeps_stability_records(self):
+        """큐가 차도 뒤쪽 파일의 관찰 기록을 지우지 않아 큐가 비면 바로 큐에 넣음"""
+        for i in range(4):
+            write_export(self.pending / f'시험현황_{i}.xlsx', i)
+        service = self.make_service(queue_size=1)
+
+        self.assertEqual(service.poll(), 0)
+        self.assertEqual(service.poll(), 1)
+        self.assertEqual(len(service._observed), 3)
+        while not service._queue.empty():
+            service._queue.get_nowait()
+        self.assertEqual(service.poll(), 1)
+
+    def test_stop_does_not_block(self):
+        """시작하지 않았거나 큐가 가득 찬 상태에서도 stop()이 멈추지 않음"""
+        service = self.make_service(queue_size=1)
+        service.stop()
+        self.assertTrue(service._queue.empty())
+
+        write_export(self.pending / '시험현황_0.xlsx', 0)
+        service.poll()
+        service.poll()
+        self.assertTrue(service._queue.full())
+        service.stop()
+
+        service.start(watch=False)
+        service.stop(timeout=10)
+        self.assertEqual(service.stats()['processed'], 1)
+        self.assertEqual(service._threads, [])
+
+    def test_drain_persists_and_moves_files(self):
+        """파싱·저장 후 processed로 이동, 손상 파일은 failed로 이동 및 실패 메트릭 기록"""
+        for i in range(3):
+            write_export(self.pending / f'시험현황_{i}.xlsx', i)
+        (self.pending / 'broken.xlsx').write_bytes(b'not an excel file')
+
+        stats = self.make_service(workers=2, queue_size=2).drain()
+
+        self.assertEqual((stats['processed'], stats['failed'], stats['rows']), (3, 1, 6))
+        self.assertEqual(list(self.pending.glob('*.xlsx')), [])
+        self.assertEqual(len(list(self.processed.glob('*_시험현황_*.xlsx'))), 3)
+        self.assertEqual(len(list((self.pending.parent / 'failed').glob('*_broken.xlsx'))), 1)
+
+        files = self.db.load_database()['files']
+        self.assertEqual(len(files), 3)
+        self.assertTrue(all(record['source']['size'] > 0 for record in files.values()))
+
+        metrics = self.metrics.get_metrics_dict()
+        self.assertEqual(metrics['counters']['watch_folder_files_total'], 3)
+        failures = {key: value for key, value in metrics['counters'].items()
+                    if key.startswith('watch_folder_failures_total')}
+        self.assertEqual(sum(failures.values()), 1)
+        self.assertEqual(len(metrics['histograms']['watch_folder_latency_seconds']), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+동시 쓰기 조정 (파일 잠금, 쓰기 병합기) 테스트
+"""
+
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import pandas as pd
+
+from src.core.data_processor import DataProcessor
+from src.core.database_cache import shared_cache
+from src.core.database_manager import DatabaseManager
+from src.core.write_coordinator import FileLock, PendingChanges, WriteCoalescer
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def make_batch():
+    return DataProcessor().convert_dataframe_to_batch(pd.DataFrame({
+        '시료명': ['시료_1', '시료_2'],
+        '분석번호': ['25A00001-001', '25A00002-001'],
+        '시험항목': ['납', '벤젠'],
+        '결과(성적서)': ['0.01', '불검출'],
+        '기준대비 초과여부': ['적합', '부적합'],
+        '시험자': ['김화빈', '이현풍'],
+    }))
+
+
+def run_threads(count, target):
+    errors = []
+
+    def guarded(index):
+        try:
+            target(index)
+        except Exception as e:  # 스레드 예외는 테스트 스레드로 전달
+            errors.append(e)
+
+    threads = [threading.Thread(target=guarded, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+# 다른 프로세스에서 같은 파일에 저장/병합하는 작업자
+WORKER = """
+import sys
+sys.path.insert(0, {root!r})
+from src.core.database_manager import DatabaseManager
+from src.core.data_processor import DataProcessor
+import pandas as pd
+batch = DataProcessor().convert_dataframe_to_batch(pd.DataFrame({{'시료명': ['시료'], '분석번호': ['25B00001-001'],
+    '시험항목': ['납'], '결과(성적서)': ['0.1'], '기준대비 초과여부': ['적합'], '시험자': ['김화빈']}}))
+db = DatabaseManager({path!r})
+for i in range({count}):
+    db.save_analysis_result(f'p{{sys.argv[1]}}_{{i}}.xlsx', batch)
+    db.merge_analysis_rows({shared!r}, batch, [None], ['h'])
+"""
+
+
+class TestWriteCoordinator(unittest.TestCase):
+    """FileLock / WriteCoalescer / DatabaseManager 동시 저장 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.batch = make_batch()
+        shared_cache.clear()
+
+    def tearDown(self):
+        shared_cache.clear()
+        self.temp_dir.cleanup()
+
+    def test_file_lock_excludes_other_holders(self):
+        """같은 스레드는 다시 잡을 수 있고, 다른 잠금 객체(다른 프로세스)는 풀릴 때까지 못 잡음"""
+        path = self.root / 'db.json.lock'
+        lock, other = FileLock(path), FileLock(path, timeout=0.05)
+        with lock:
+            with lock:
+                with self.assertRaises(TimeoutError):
+                    other.acquire()
+            with self.assertRaises(TimeoutError):
+                other.acquire()
+        with other:
+            pass
+
+    def test_coalescer_batches_and_isolates_errors(self):
+        """동시에 들어온 변경은 한 번에 커밋되고, 변경 함수의 예외는 그 호출자에게만 전달"""
+        coalescer = WriteCoalescer(FileLock(self.root / 'state.lock'), window=0.05)
+        state = {}
+        results = {}
+
+        def commit(apply):
+            changes = PendingChanges(dict(state))
+            apply(changes)
+            for record in changes.puts:
+                state[record['file_id']] = record
+
+        def mutation(index):
+            def put(changes):
+                if index == 3:
+                    raise KeyError('없는 파일')
+                changes.put({'file_id': f'f{index}'})
+                return index
+            return put
+
+        def submit(index):
+            try:
+                results[index] = coalescer.submit(mutation(index), commit)
+            except KeyError:
+                results[index] = 'error'
+
+        run_threads(8, submit)
+        self.assertEqual(sorted(state), [f'f{i}' for i in range(8) if i != 3])
+        self.assertEqual(results[3], 'error')
+        self.assertEqual(results[5], 5)
+        self.assertLess(coalescer.commits, 8)
+
+    def test_sessions_lose_no_updates(self):
+        """세션마다 다른 DatabaseManager로 동시에 저장/병합/삭제해도 모든 변경이 남음"""
+        for name, options in (('plain.json', {}), ('sharded.json', {'journal': True, 'shards': True})):
+            path = str(self.root / name)
+            shared = DatabaseManager(path, **options).save_analysis_result('공유.xlsx', self.batch)
+            doomed = DatabaseManager(path, **options).save_analysis_result('삭제.xlsx', self.batch)
+            saved = []
+
+            def session(index):
+                db = DatabaseManager(path, **options)
+                for i in range(5):
+                    saved.append(db.save_analysis_result(f's{index}_{i}.xlsx', self.batch))
+                    db.merge_analysis_rows(shared, self.batch, [None], ['h'], upload_time=datetime(2025, 3, 1))
+                if index == 0:
+                    self.assertTrue(db.delete_analysis_result(doomed))
+
+            run_threads(6, session)
+            with self.subTest(backend=name):
+                db = DatabaseManager(path, **options)
+                self.assertEqual({record['file_id'] for record in db.get_all_files()}, set(saved) | {shared})
+                merged = db.get_file_by_id(shared)
+                self.assertEqual(len(merged['ingest_history']), 30)
+                self.assertEqual(len(merged['test_results']), 2 + 30)
+                self.assertLess(db.writer.commits, 2 + 6 * 5 * 2 + 1)
+                self.assertEqual(len(db.search_results('25a00001', limit=1000).rows), 30 + 31)
+
+    def test_processes_lose_no_updates(self):
+        """여러 프로세스가 같은 데이터베이스에 저장/병합해도 모든 변경이 남음"""
+        for name in ('plain.json', 'store.db'):
+            path = str(self.root / name)
+            shared = DatabaseManager(path).save_analysis_result('공유.xlsx', self.batch)
+            script = WORKER.format(root=str(ROOT), path=path, count=4, shared=shared)
+            workers = [subprocess.Popen([sys.executable, '-c', script, str(index)],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) for index in range(3)]
+            for worker in workers:
+                _, stderr = worker.communicate(timeout=120)
+                self.assertEqual(worker.returncode, 0, stderr.decode('utf-8', 'replace'))
+
+            shared_cache.clear()
+            with self.subTest(backend=name):
+                db = DatabaseManager(path)
+                self.assertEqual(len(db.get_all_files(include_results=False)), 1 + 3 * 4)
+                self.assertEqual(len(db.get_file_by_id(shared)['ingest_history']), 3 * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()